@@ -0,0 +1,103 @@
+"""fix: whatsapp batch outbox
+
+Revision ID: 0567030420b2
+Revises: 51169b442c2b
+Create Date: 2026-10-20 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0567030420b2'
+down_revision: Union[str, None] = '51169b442c2b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_enqueue(with_batch: bool) -> None:
+    batch_column = ", batch_id" if with_batch else ""
+    batch_value = ", m.batch_id" if with_batch else ""
+    batch_type = ", batch_id VARCHAR" if with_batch else ""
+
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION notifications_sp_enqueue_outbox(
+        p_messages JSONB,
+        p_user_create VARCHAR
+    )
+    RETURNS TABLE (outbox_id BIGINT)
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        RETURN QUERY
+        INSERT INTO notification_outbox (
+            channel, recipient, message, appointment_id, reminder_type, max_attempts, user_create{batch_column}
+        )
+        SELECT m.channel, m.recipient, m.message, m.appointment_id, m.reminder_type,
+               COALESCE(m.max_attempts, 5), p_user_create{batch_value}
+        FROM jsonb_to_recordset(p_messages) AS m(
+            channel VARCHAR, recipient VARCHAR, message TEXT,
+            appointment_id INTEGER, reminder_type VARCHAR, max_attempts INTEGER{batch_type}
+        )
+        RETURNING notification_outbox.id;
+    END;
+    $$;
+    """)
+
+
+def upgrade() -> None:
+    # Los envíos masivos asíncronos de WhatsApp se encolan en el outbox con un
+    # batch_id: el estado del job se consulta en la base desde cualquier réplica
+    op.add_column('notification_outbox', sa.Column('batch_id', sa.String(length=36), nullable=True))
+    op.create_index(
+        'ix_notification_outbox_batch_id',
+        'notification_outbox',
+        ['batch_id'],
+        unique=False,
+        postgresql_where=sa.text('batch_id IS NOT NULL'),
+    )
+
+    _create_enqueue(with_batch=True)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notifications_sp_get_outbox_batch(
+        p_batch_id VARCHAR
+    )
+    RETURNS TABLE (
+        outbox_id BIGINT,
+        recipient VARCHAR,
+        status VARCHAR,
+        attempts INTEGER,
+        last_error TEXT,
+        provider_response JSONB,
+        insert_date TIMESTAMPTZ,
+        update_date TIMESTAMPTZ
+    )
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        RETURN QUERY
+        SELECT o.id,
+               o.recipient::VARCHAR,
+               o.status::VARCHAR,
+               o.attempts,
+               o.last_error,
+               o.provider_response,
+               o.insert_date,
+               o.update_date
+        FROM notification_outbox o
+        WHERE o.batch_id = p_batch_id
+        ORDER BY o.id;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS notifications_sp_get_outbox_batch(VARCHAR)")
+    _create_enqueue(with_batch=False)
+    op.drop_index('ix_notification_outbox_batch_id', table_name='notification_outbox')
+    op.drop_column('notification_outbox', 'batch_id')
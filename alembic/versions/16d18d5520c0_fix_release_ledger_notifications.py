@@ -0,0 +1,46 @@
+"""fix: release ledger notifications
+
+Revision ID: 16d18d5520c0
+Revises: cafcb20cf9b2
+Create Date: 2026-10-20 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '16d18d5520c0'
+down_revision: Union[str, None] = 'cafcb20cf9b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # El envío directo reclama las citas en el ledger antes de enviar; las que fallan
+    # se liberan con esta función para que la próxima ejecución las reintente.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notifications_sp_release_notifications(
+        p_appointment_ids INTEGER[],
+        p_reminder_type VARCHAR
+    )
+    RETURNS INTEGER
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        v_released INTEGER;
+    BEGIN
+        DELETE FROM notification_ledger l
+        WHERE l.reminder_type = p_reminder_type
+          AND l.appointment_id = ANY(p_appointment_ids);
+
+        GET DIAGNOSTICS v_released = ROW_COUNT;
+        RETURN v_released;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS notifications_sp_release_notifications(INTEGER[], VARCHAR)")
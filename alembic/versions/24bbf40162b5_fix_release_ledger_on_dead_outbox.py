@@ -0,0 +1,139 @@
+"""fix: release ledger on dead outbox
+
+Revision ID: 24bbf40162b5
+Revises: 69d4a94dd58f
+Create Date: 2026-10-20 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '24bbf40162b5'
+down_revision: Union[str, None] = '69d4a94dd58f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# El ledger se registra al encolar para que dos ejecuciones no encolen la misma cita.
+# Cuando un mensaje queda 'dead' se libera su registro, así la próxima ejecución
+# vuelve a encolar el recordatorio en lugar de omitirlo para siempre.
+RELEASE_LEDGER = """
+        DELETE FROM notification_ledger l
+        USING dead d
+        WHERE l.appointment_id = d.appointment_id
+          AND l.reminder_type = d.reminder_type;
+"""
+
+
+def _create_claim(release_ledger: bool) -> None:
+    expire_exhausted = """
+        UPDATE notification_outbox o
+        SET status = 'dead',
+            last_error = COALESCE(o.last_error || ' | ', '') || 'Lease vencido sin confirmar el envío',
+            locked_by = NULL,
+            locked_until = NULL,
+            update_date = now(),
+            user_modify = p_worker_id
+        WHERE o.status = 'processing'
+          AND o.locked_until < now()
+          AND o.attempts >= o.max_attempts
+    """
+    if release_ledger:
+        expire_exhausted = (
+            f"WITH dead AS ({expire_exhausted} RETURNING o.appointment_id, o.reminder_type)"
+            + RELEASE_LEDGER
+        )
+    else:
+        expire_exhausted += ";"
+
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION notifications_sp_claim_outbox(
+        p_worker_id VARCHAR,
+        p_batch_size INTEGER,
+        p_lease_seconds INTEGER
+    )
+    RETURNS SETOF notification_outbox
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        {expire_exhausted}
+        RETURN QUERY
+        WITH claimable AS (
+            SELECT o.id
+            FROM notification_outbox o
+            WHERE (o.status = 'pending' AND o.next_attempt_at <= now())
+               OR (o.status = 'processing' AND o.locked_until < now() AND o.attempts < o.max_attempts)
+            ORDER BY o.next_attempt_at
+            LIMIT p_batch_size
+            FOR UPDATE SKIP LOCKED
+        )
+        UPDATE notification_outbox o
+        SET status = 'processing',
+            attempts = o.attempts + 1,
+            locked_by = p_worker_id,
+            locked_until = now() + make_interval(secs => p_lease_seconds),
+            update_date = now(),
+            user_modify = p_worker_id
+        FROM claimable
+        WHERE o.id = claimable.id
+        RETURNING o.*;
+    END;
+    $$;
+    """)
+
+
+def _create_mark_failed(release_ledger: bool) -> None:
+    mark = """
+        UPDATE notification_outbox
+        SET status = CASE WHEN p_next_attempt_at IS NULL THEN 'dead' ELSE 'pending' END,
+            next_attempt_at = COALESCE(p_next_attempt_at, next_attempt_at),
+            last_error = p_error,
+            locked_by = NULL,
+            locked_until = NULL,
+            update_date = now(),
+            user_modify = p_worker_id
+        WHERE id = p_outbox_id AND locked_by = p_worker_id
+    """
+    if release_ledger:
+        body = f"""
+        WITH marked AS ({mark} RETURNING appointment_id, reminder_type, status),
+        dead AS (
+            SELECT m.appointment_id, m.reminder_type FROM marked m WHERE m.status = 'dead'
+        ),
+        released AS ({RELEASE_LEDGER.rstrip().rstrip(';')} RETURNING l.appointment_id)
+        SELECT COUNT(*) > 0 INTO v_found FROM marked;
+        RETURN v_found;
+        """
+    else:
+        body = f"{mark};\n        RETURN FOUND;"
+
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION notifications_sp_mark_outbox_failed(
+        p_outbox_id BIGINT,
+        p_worker_id VARCHAR,
+        p_error TEXT,
+        p_next_attempt_at TIMESTAMPTZ
+    )
+    RETURNS BOOLEAN
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        v_found BOOLEAN;
+    BEGIN
+        {body}
+    END;
+    $$;
+    """)
+
+
+def upgrade() -> None:
+    _create_claim(release_ledger=True)
+    _create_mark_failed(release_ledger=True)
+
+
+def downgrade() -> None:
+    _create_mark_failed(release_ledger=False)
+    _create_claim(release_ledger=False)
@@ -0,0 +1,165 @@
+"""feat: notification outbox
+
+Revision ID: 2f399f6ad2f8
+Revises: 599e7fe6fccd
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f399f6ad2f8'
+down_revision: Union[str, None] = '599e7fe6fccd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('notification_outbox',
+    sa.Column('id', sa.BigInteger(), sa.Identity(), nullable=False),
+    sa.Column('channel', sa.String(length=20), nullable=False),
+    sa.Column('recipient', sa.String(length=255), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('appointment_id', sa.Integer(), nullable=True),
+    sa.Column('reminder_type', sa.String(length=50), nullable=True),
+    sa.Column('status', sa.String(length=20), server_default='pending', nullable=False),
+    sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('max_attempts', sa.Integer(), server_default='5', nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('locked_by', sa.String(length=100), nullable=True),
+    sa.Column('locked_until', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('provider_response', postgresql.JSONB(), nullable=True),
+    sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('insert_date', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('update_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('user_create', sa.String(length=255), nullable=False),
+    sa.Column('user_modify', sa.String(length=255), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # Índice parcial para que el worker encuentre rápido los mensajes pendientes
+    op.create_index('ix_notification_outbox_pending', 'notification_outbox', ['next_attempt_at'], unique=False, postgresql_where=sa.text("status IN ('pending', 'processing')"))
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notifications_sp_enqueue_outbox(
+        p_messages JSONB,
+        p_user_create VARCHAR
+    )
+    RETURNS TABLE (outbox_id BIGINT)
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        RETURN QUERY
+        INSERT INTO notification_outbox (
+            channel, recipient, message, appointment_id, reminder_type, max_attempts, user_create
+        )
+        SELECT m.channel, m.recipient, m.message, m.appointment_id, m.reminder_type,
+               COALESCE(m.max_attempts, 5), p_user_create
+        FROM jsonb_to_recordset(p_messages) AS m(
+            channel VARCHAR, recipient VARCHAR, message TEXT,
+            appointment_id INTEGER, reminder_type VARCHAR, max_attempts INTEGER
+        )
+        RETURNING notification_outbox.id;
+    END;
+    $$;
+    """)
+
+    # Reclama un lote de mensajes listos. FOR UPDATE SKIP LOCKED permite que varios
+    # workers (incluso en distintas réplicas) reclamen lotes disjuntos sin bloquearse.
+    # Los mensajes 'processing' cuyo lease venció se consideran huérfanos y se reclaman.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notifications_sp_claim_outbox(
+        p_worker_id VARCHAR,
+        p_batch_size INTEGER,
+        p_lease_seconds INTEGER
+    )
+    RETURNS SETOF notification_outbox
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        RETURN QUERY
+        WITH claimable AS (
+            SELECT o.id
+            FROM notification_outbox o
+            WHERE (o.status = 'pending' AND o.next_attempt_at <= now())
+               OR (o.status = 'processing' AND o.locked_until < now())
+            ORDER BY o.next_attempt_at
+            LIMIT p_batch_size
+            FOR UPDATE SKIP LOCKED
+        )
+        UPDATE notification_outbox o
+        SET status = 'processing',
+            attempts = o.attempts + 1,
+            locked_by = p_worker_id,
+            locked_until = now() + make_interval(secs => p_lease_seconds),
+            update_date = now(),
+            user_modify = p_worker_id
+        FROM claimable
+        WHERE o.id = claimable.id
+        RETURNING o.*;
+    END;
+    $$;
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notifications_sp_mark_outbox_sent(
+        p_outbox_id BIGINT,
+        p_worker_id VARCHAR,
+        p_provider_response JSONB
+    )
+    RETURNS VOID
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        UPDATE notification_outbox
+        SET status = 'sent',
+            sent_at = now(),
+            provider_response = p_provider_response,
+            last_error = NULL,
+            locked_by = NULL,
+            locked_until = NULL,
+            update_date = now(),
+            user_modify = p_worker_id
+        WHERE id = p_outbox_id AND locked_by = p_worker_id;
+    END;
+    $$;
+    """)
+
+    # p_next_attempt_at NULL indica que se agotaron los reintentos: el mensaje queda 'dead'
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notifications_sp_mark_outbox_failed(
+        p_outbox_id BIGINT,
+        p_worker_id VARCHAR,
+        p_error TEXT,
+        p_next_attempt_at TIMESTAMPTZ
+    )
+    RETURNS VOID
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        UPDATE notification_outbox
+        SET status = CASE WHEN p_next_attempt_at IS NULL THEN 'dead' ELSE 'pending' END,
+            next_attempt_at = COALESCE(p_next_attempt_at, next_attempt_at),
+            last_error = p_error,
+            locked_by = NULL,
+            locked_until = NULL,
+            update_date = now(),
+            user_modify = p_worker_id
+        WHERE id = p_outbox_id AND locked_by = p_worker_id;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS notifications_sp_mark_outbox_failed(BIGINT, VARCHAR, TEXT, TIMESTAMPTZ)")
+    op.execute("DROP FUNCTION IF EXISTS notifications_sp_mark_outbox_sent(BIGINT, VARCHAR, JSONB)")
+    op.execute("DROP FUNCTION IF EXISTS notifications_sp_claim_outbox(VARCHAR, INTEGER, INTEGER)")
+    op.execute("DROP FUNCTION IF EXISTS notifications_sp_enqueue_outbox(JSONB, VARCHAR)")
+    op.drop_index('ix_notification_outbox_pending', table_name='notification_outbox')
+    op.drop_table('notification_outbox')
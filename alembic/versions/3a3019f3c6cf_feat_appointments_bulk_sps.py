@@ -0,0 +1,118 @@
+"""feat: appointments bulk sps
+
+Revision ID: 3a3019f3c6cf
+Revises: c31f77d9cd3b
+Create Date: 2026-10-20 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a3019f3c6cf'
+down_revision: Union[str, None] = 'c31f77d9cd3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Columnas de cada ítem de p_items (ver _appointments_to_json en el repositorio)
+ITEM_COLUMNS = """
+            item_index INTEGER,
+            location_id INTEGER,
+            user_id INTEGER,
+            service_id INTEGER,
+            customer_id INTEGER,
+            status_maintable_id INTEGER,
+            start_datetime TIMESTAMP,
+            end_datetime TIMESTAMP
+"""
+
+
+def upgrade() -> None:
+    # Como máximo una cita existente en conflicto por ítem. El JOIN LATERAL consulta
+    # 'appointments_user_period_gist' una vez por ítem.
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION appointments_sp_find_overlaps_bulk(
+        p_items JSONB
+    )
+    RETURNS TABLE (
+        item_index INTEGER,
+        appointment_id INTEGER,
+        user_id INTEGER,
+        user_name VARCHAR,
+        start_datetime TIMESTAMP,
+        end_datetime TIMESTAMP
+    )
+    LANGUAGE plpgsql
+    STABLE
+    AS $$
+    BEGIN
+        RETURN QUERY
+        SELECT i.item_index,
+               c.appointment_id,
+               c.user_id,
+               u.user_name::VARCHAR,
+               c.start_datetime::TIMESTAMP,
+               c.end_datetime::TIMESTAMP
+        FROM jsonb_to_recordset(p_items) AS i({ITEM_COLUMNS})
+        CROSS JOIN LATERAL (
+            SELECT a.appointment_id, a.user_id, a.start_datetime, a.end_datetime
+            FROM appointments a
+            WHERE a.user_id = i.user_id
+              AND a.annulled = FALSE
+              AND tsrange(a.start_datetime, a.end_datetime) && tsrange(i.start_datetime, i.end_datetime)
+            ORDER BY a.start_datetime
+            LIMIT 1
+        ) c
+        LEFT JOIN users u ON u.id = c.user_id
+        ORDER BY i.item_index;
+    END;
+    $$;
+    """)
+
+    # Un único INSERT para todo el lote. Los IDs se toman de la secuencia antes de
+    # insertar para devolver cada uno junto a su item_index.
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION sp_create_appointments_bulk(
+        p_items JSONB,
+        p_user_create VARCHAR
+    )
+    RETURNS TABLE (
+        item_index INTEGER,
+        appointment_id INTEGER
+    )
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        RETURN QUERY
+        WITH items AS MATERIALIZED (
+            SELECT i.*,
+                   nextval(pg_get_serial_sequence('appointments', 'appointment_id'))::INTEGER AS new_id
+            FROM jsonb_to_recordset(p_items) AS i({ITEM_COLUMNS})
+        ),
+        inserted AS (
+            INSERT INTO appointments (
+                appointment_id, location_id, user_id, service_id, customer_id,
+                status_maintable_id, start_datetime, end_datetime, user_create
+            )
+            OVERRIDING SYSTEM VALUE
+            SELECT it.new_id, it.location_id, it.user_id, it.service_id, it.customer_id,
+                   it.status_maintable_id, it.start_datetime, it.end_datetime, p_user_create
+            FROM items it
+            ORDER BY it.item_index
+            RETURNING appointments.appointment_id
+        )
+        SELECT it.item_index, ins.appointment_id
+        FROM items it
+        JOIN inserted ins ON ins.appointment_id = it.new_id
+        ORDER BY it.item_index;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS sp_create_appointments_bulk(JSONB, VARCHAR)")
+    op.execute("DROP FUNCTION IF EXISTS appointments_sp_find_overlaps_bulk(JSONB)")
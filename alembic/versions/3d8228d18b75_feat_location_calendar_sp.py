@@ -0,0 +1,142 @@
+"""feat: location calendar sp
+
+Revision ID: 3d8228d18b75
+Revises: 3a3019f3c6cf
+Create Date: 2026-10-20 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d8228d18b75'
+down_revision: Union[str, None] = '3a3019f3c6cf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Calendario de la sede en un único JSONB (ver LocationImplementationRepository.
+    # get_location_calendar). El horario de atención se toma de 'get_sede_info' para
+    # no duplicar su armado. Turnos, días libres y citas se filtran por el rango
+    # semiabierto [p_start_date, p_end_date + 1). Un día libre sin horas ocupa días
+    # completos. Las citas incluyen las de otras sedes; las anuladas se excluyen.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION location_sp_get_calendar(
+        p_location_id INTEGER,
+        p_start_date DATE,
+        p_end_date DATE
+    )
+    RETURNS JSONB
+    LANGUAGE plpgsql
+    STABLE
+    AS $$
+    DECLARE
+        v_location_name VARCHAR;
+        v_range_start TIMESTAMP := p_start_date::TIMESTAMP;
+        v_range_end TIMESTAMP := (p_end_date + 1)::TIMESTAMP;
+    BEGIN
+        SELECT l.nombre_sede INTO v_location_name
+        FROM location l
+        WHERE l.id = p_location_id;
+
+        IF NOT FOUND THEN
+            RETURN NULL;
+        END IF;
+
+        RETURN jsonb_build_object(
+            'location_id', p_location_id,
+            'location_name', v_location_name,
+            'schedules', COALESCE(get_sede_info(p_location_id) -> 'horarios', '[]'::JSONB),
+            'staff', COALESCE((
+                SELECT jsonb_agg(
+                    jsonb_build_object(
+                        'user_id', u.id,
+                        'user_name', u.user_name,
+                        'email', u.email,
+                        'shifts', COALESCE((
+                            SELECT jsonb_agg(
+                                jsonb_build_object(
+                                    'shift_id', s.id,
+                                    'start_time', s.fecha_turno + s.hora_inicio,
+                                    'end_time', s.fecha_turno + s.hora_fin,
+                                    'sede_id', s.sede_id
+                                )
+                                ORDER BY s.fecha_turno, s.hora_inicio
+                            )
+                            FROM shifts s
+                            WHERE s.user_id = u.id
+                              AND s.annulled = FALSE
+                              AND s.fecha_turno BETWEEN p_start_date AND p_end_date
+                        ), '[]'::JSONB),
+                        'days_off', COALESCE((
+                            SELECT jsonb_agg(
+                                jsonb_build_object(
+                                    'day_off_id', d.day_off_id,
+                                    'start_time', d.start_time,
+                                    'end_time', d.end_time,
+                                    'description', d.motivo
+                                )
+                                ORDER BY d.start_time
+                            )
+                            FROM (
+                                SELECT dof.id AS day_off_id,
+                                       dof.motivo,
+                                       dof.fecha_inicio + COALESCE(dof.hora_inicio, TIME '00:00') AS start_time,
+                                       CASE WHEN dof.hora_fin IS NULL
+                                            THEN (dof.fecha_fin + 1)::TIMESTAMP
+                                            ELSE dof.fecha_fin + dof.hora_fin
+                                       END AS end_time
+                                FROM days_off dof
+                                WHERE dof.user_id = u.id
+                                  AND dof.annulled = FALSE
+                                  AND dof.fecha_inicio <= p_end_date
+                                  AND dof.fecha_fin >= p_start_date
+                            ) d
+                        ), '[]'::JSONB),
+                        'appointments', COALESCE((
+                            SELECT jsonb_agg(
+                                jsonb_build_object(
+                                    'appointment_id', a.appointment_id,
+                                    'location_id', a.location_id,
+                                    'start_datetime', a.start_datetime,
+                                    'end_datetime', a.end_datetime,
+                                    'service_id', a.service_id,
+                                    'service_name', sv.service_name,
+                                    'customer_id', a.customer_id,
+                                    'customer_name', c.name_customer,
+                                    'status_id', a.status_maintable_id,
+                                    'status_name', m.item_text
+                                )
+                                ORDER BY a.start_datetime
+                            )
+                            FROM appointments a
+                            LEFT JOIN services sv ON sv.service_id = a.service_id
+                            LEFT JOIN customer c ON c.id = a.customer_id
+                            LEFT JOIN maintable m ON m.maintable_id = a.status_maintable_id
+                            WHERE a.user_id = u.id
+                              AND a.annulled = FALSE
+                              AND tsrange(a.start_datetime, a.end_datetime)
+                                  && tsrange(v_range_start, v_range_end)
+                        ), '[]'::JSONB)
+                    )
+                    ORDER BY u.user_name, u.id
+                )
+                FROM users u
+                WHERE u.id IN (
+                    SELECT ul.user_id
+                    FROM user_locations ul
+                    WHERE ul.sede_id = p_location_id
+                      AND ul.annulled = FALSE
+                )
+            ), '[]'::JSONB)
+        );
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS location_sp_get_calendar(INTEGER, DATE, DATE)")
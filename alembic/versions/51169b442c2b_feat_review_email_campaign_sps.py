@@ -0,0 +1,160 @@
+"""feat: review email campaign sps
+
+Revision ID: 51169b442c2b
+Revises: 24bbf40162b5
+Create Date: 2026-10-20 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '51169b442c2b'
+down_revision: Union[str, None] = '24bbf40162b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Reclamo de un review por una campaña en curso: mientras no venza, otra ejecución
+    # (n8n o el scheduler) no lo vuelve a preparar ni a enviar
+    op.add_column('reviews', sa.Column('email_claimed_until', sa.DateTime(timezone=True), nullable=True))
+
+    # Las reglas de elegibilidad son las del flujo por cita: cada candidata se evalúa
+    # con 'sp_process_appointment_for_review_email', que crea el review y su token si
+    # faltan. El advisory lock serializa la preparación entre ejecuciones concurrentes
+    # y los reviews devueltos quedan reclamados hasta p_lease_seconds.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION sp_prepare_review_email_campaign(
+        p_days_after INTEGER,
+        p_limit INTEGER,
+        p_user_transaction VARCHAR,
+        p_lease_seconds INTEGER
+    )
+    RETURNS TABLE (
+        review_id INTEGER,
+        appointment_id INTEGER,
+        token VARCHAR,
+        customer_email VARCHAR,
+        customer_name VARCHAR,
+        service_name VARCHAR,
+        staff_name VARCHAR,
+        appointment_date TIMESTAMP,
+        location_name VARCHAR
+    )
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        v_candidate RECORD;
+        v_result RECORD;
+        v_count INTEGER := 0;
+    BEGIN
+        PERFORM pg_advisory_xact_lock(hashtext('reviews:email_campaign'));
+
+        FOR v_candidate IN
+            SELECT a.appointment_id AS candidate_id,
+                   a.start_datetime,
+                   s.service_name AS candidate_service,
+                   u.user_name AS candidate_staff,
+                   l.nombre_sede AS candidate_location
+            FROM appointments a
+            LEFT JOIN services s ON s.service_id = a.service_id
+            LEFT JOIN users u ON u.id = a.user_id
+            LEFT JOIN location l ON l.id = a.location_id
+            WHERE a.annulled = FALSE
+              AND a.end_datetime <= now()
+              AND a.start_datetime >= now() - make_interval(days => p_days_after)
+              AND NOT EXISTS (
+                  SELECT 1
+                  FROM reviews r
+                  WHERE r.appointment_id = a.appointment_id
+                    AND r.annulled = FALSE
+                    AND (r.email_sent_at IS NOT NULL
+                         OR r.reviewed_at IS NOT NULL
+                         OR r.email_claimed_until > now())
+              )
+            ORDER BY a.start_datetime, a.appointment_id
+        LOOP
+            EXIT WHEN v_count >= p_limit;
+
+            SELECT * INTO v_result
+            FROM sp_process_appointment_for_review_email(
+                v_candidate.candidate_id, p_days_after, p_user_transaction
+            );
+
+            CONTINUE WHEN v_result IS NULL OR NOT COALESCE(v_result.should_send_email, FALSE);
+
+            UPDATE reviews r
+            SET email_claimed_until = now() + make_interval(secs => p_lease_seconds)
+            WHERE r.review_id = v_result.review_id;
+
+            review_id := v_result.review_id;
+            appointment_id := v_candidate.candidate_id;
+            token := v_result.token::VARCHAR;
+            customer_email := v_result.customer_email::VARCHAR;
+            customer_name := v_result.customer_name::VARCHAR;
+            service_name := v_candidate.candidate_service::VARCHAR;
+            staff_name := v_candidate.candidate_staff::VARCHAR;
+            appointment_date := v_candidate.start_datetime::TIMESTAMP;
+            location_name := v_candidate.candidate_location::VARCHAR;
+            RETURN NEXT;
+            v_count := v_count + 1;
+        END LOOP;
+    END;
+    $$;
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION sp_mark_review_emails_sent_bulk(
+        p_review_ids INTEGER[],
+        p_user_transaction VARCHAR
+    )
+    RETURNS INTEGER
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        v_updated INTEGER;
+    BEGIN
+        UPDATE reviews r
+        SET email_sent_at = now(),
+            email_claimed_until = NULL,
+            update_date = now(),
+            user_modify = p_user_transaction
+        WHERE r.review_id = ANY(p_review_ids)
+          AND r.email_sent_at IS NULL;
+        GET DIAGNOSTICS v_updated = ROW_COUNT;
+        RETURN v_updated;
+    END;
+    $$;
+    """)
+
+    # Libera los reviews cuyo email falló para que la próxima campaña los reintente
+    op.execute("""
+    CREATE OR REPLACE FUNCTION sp_release_review_email_claims(
+        p_review_ids INTEGER[]
+    )
+    RETURNS INTEGER
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        v_updated INTEGER;
+    BEGIN
+        UPDATE reviews r
+        SET email_claimed_until = NULL
+        WHERE r.review_id = ANY(p_review_ids)
+          AND r.email_sent_at IS NULL;
+        GET DIAGNOSTICS v_updated = ROW_COUNT;
+        RETURN v_updated;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS sp_release_review_email_claims(INTEGER[])")
+    op.execute("DROP FUNCTION IF EXISTS sp_mark_review_emails_sent_bulk(INTEGER[], VARCHAR)")
+    op.execute("DROP FUNCTION IF EXISTS sp_prepare_review_email_campaign(INTEGER, INTEGER, VARCHAR, INTEGER)")
+    op.drop_column('reviews', 'email_claimed_until')
@@ -0,0 +1,127 @@
+"""feat: reports summary sp
+
+Revision ID: 67b45351a6b6
+Revises: c41d7e9b0f26
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '67b45351a6b6'
+down_revision: Union[str, None] = 'c41d7e9b0f26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Recibe los mismos filtros que 'appointments_get_all' (start_date, end_date,
+    # user_id, location_id, status_id). Un solo recorrido de las citas con
+    # GROUPING SETS arma los cuatro agrupamientos; GROUPING() indica a cuál
+    # pertenece cada fila (0 en la columna agrupada).
+    op.execute("""
+    CREATE OR REPLACE FUNCTION reports_sp_get_summary(
+        p_filters JSONB
+    )
+    RETURNS TABLE (
+        total_appointments INTEGER,
+        total_revenue NUMERIC,
+        average_rating NUMERIC,
+        total_reviews INTEGER,
+        by_barber JSON,
+        by_location JSON,
+        by_service JSON,
+        by_status JSON
+    )
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        RETURN QUERY
+        WITH filtered AS (
+            SELECT a.user_id, a.location_id, a.service_id, a.status_maintable_id,
+                   COALESCE(s.price, 0) AS price,
+                   r.rating
+            FROM appointments a
+            LEFT JOIN services s ON s.service_id = a.service_id
+            LEFT JOIN LATERAL (
+                SELECT rv.rating
+                FROM reviews rv
+                WHERE rv.appointment_id = a.appointment_id
+                  AND rv.annulled = FALSE
+                  AND rv.rating IS NOT NULL
+                LIMIT 1
+            ) r ON TRUE
+            WHERE a.annulled = FALSE
+              AND (p_filters->>'start_date' IS NULL OR a.start_datetime >= (p_filters->>'start_date')::TIMESTAMP)
+              AND (p_filters->>'end_date' IS NULL OR a.start_datetime <= (p_filters->>'end_date')::TIMESTAMP)
+              AND (p_filters->>'user_id' IS NULL OR a.user_id = (p_filters->>'user_id')::INTEGER)
+              AND (p_filters->>'location_id' IS NULL OR a.location_id = (p_filters->>'location_id')::INTEGER)
+              AND (p_filters->>'status_id' IS NULL OR a.status_maintable_id = (p_filters->>'status_id')::INTEGER)
+        ),
+        grouped AS (
+            SELECT GROUPING(f.user_id) AS g_user,
+                   GROUPING(f.location_id) AS g_location,
+                   GROUPING(f.service_id) AS g_service,
+                   f.user_id, f.location_id, f.service_id, f.status_maintable_id,
+                   COUNT(*)::INTEGER AS appointments,
+                   SUM(f.price) AS revenue,
+                   ROUND(AVG(f.rating), 2) AS rating
+            FROM filtered f
+            GROUP BY GROUPING SETS ((f.user_id), (f.location_id), (f.service_id), (f.status_maintable_id))
+        ),
+        named AS (
+            SELECT CASE
+                       WHEN g.g_user = 0 THEN 'barber'
+                       WHEN g.g_location = 0 THEN 'location'
+                       WHEN g.g_service = 0 THEN 'service'
+                       ELSE 'status'
+                   END AS dimension,
+                   COALESCE(g.user_id, g.location_id, g.service_id, g.status_maintable_id) AS group_id,
+                   CASE
+                       WHEN g.g_user = 0 THEN u.user_name
+                       WHEN g.g_location = 0 THEN l.nombre_sede
+                       WHEN g.g_service = 0 THEN s.service_name
+                       ELSE m.item_text
+                   END AS group_name,
+                   g.appointments, g.revenue, g.rating
+            FROM grouped g
+            LEFT JOIN users u ON g.g_user = 0 AND u.id = g.user_id
+            LEFT JOIN location l ON g.g_location = 0 AND l.id = g.location_id
+            LEFT JOIN services s ON g.g_service = 0 AND s.service_id = g.service_id
+            LEFT JOIN maintable m ON g.g_user = 1 AND g.g_location = 1 AND g.g_service = 1
+                                 AND m.maintable_id = g.status_maintable_id
+        ),
+        groups AS (
+            SELECT n.dimension,
+                   JSON_AGG(
+                       JSON_BUILD_OBJECT(
+                           'group_id', n.group_id,
+                           'group_name', n.group_name,
+                           'total_appointments', n.appointments,
+                           'total_revenue', n.revenue,
+                           'average_rating', n.rating
+                       )
+                       ORDER BY n.appointments DESC, n.group_id
+                   ) AS items
+            FROM named n
+            GROUP BY n.dimension
+        )
+        SELECT COUNT(*)::INTEGER,
+               COALESCE(SUM(f.price), 0),
+               ROUND(AVG(f.rating), 2),
+               COUNT(f.rating)::INTEGER,
+               (SELECT gr.items FROM groups gr WHERE gr.dimension = 'barber'),
+               (SELECT gr.items FROM groups gr WHERE gr.dimension = 'location'),
+               (SELECT gr.items FROM groups gr WHERE gr.dimension = 'service'),
+               (SELECT gr.items FROM groups gr WHERE gr.dimension = 'status')
+        FROM filtered f;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS reports_sp_get_summary(JSONB)")
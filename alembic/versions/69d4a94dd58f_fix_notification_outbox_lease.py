@@ -0,0 +1,162 @@
+"""fix: notification outbox lease
+
+Revision ID: 69d4a94dd58f
+Revises: 7c0b4f320aa2
+Create Date: 2026-10-20 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '69d4a94dd58f'
+down_revision: Union[str, None] = '7c0b4f320aa2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_claim(cap_attempts: bool) -> None:
+    # Con cap_attempts, los huérfanos solo se reclaman mientras les queden intentos;
+    # los que ya los agotaron pasan a 'dead' en lugar de reenviarse indefinidamente.
+    expire_exhausted = """
+        UPDATE notification_outbox o
+        SET status = 'dead',
+            last_error = COALESCE(o.last_error || ' | ', '') || 'Lease vencido sin confirmar el envío',
+            locked_by = NULL,
+            locked_until = NULL,
+            update_date = now(),
+            user_modify = p_worker_id
+        WHERE o.status = 'processing'
+          AND o.locked_until < now()
+          AND o.attempts >= o.max_attempts;
+    """ if cap_attempts else ""
+    orphan_filter = "AND o.attempts < o.max_attempts" if cap_attempts else ""
+
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION notifications_sp_claim_outbox(
+        p_worker_id VARCHAR,
+        p_batch_size INTEGER,
+        p_lease_seconds INTEGER
+    )
+    RETURNS SETOF notification_outbox
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        {expire_exhausted}
+        RETURN QUERY
+        WITH claimable AS (
+            SELECT o.id
+            FROM notification_outbox o
+            WHERE (o.status = 'pending' AND o.next_attempt_at <= now())
+               OR (o.status = 'processing' AND o.locked_until < now() {orphan_filter})
+            ORDER BY o.next_attempt_at
+            LIMIT p_batch_size
+            FOR UPDATE SKIP LOCKED
+        )
+        UPDATE notification_outbox o
+        SET status = 'processing',
+            attempts = o.attempts + 1,
+            locked_by = p_worker_id,
+            locked_until = now() + make_interval(secs => p_lease_seconds),
+            update_date = now(),
+            user_modify = p_worker_id
+        FROM claimable
+        WHERE o.id = claimable.id
+        RETURNING o.*;
+    END;
+    $$;
+    """)
+
+
+def _create_marks(return_found: bool) -> None:
+    # Con return_found devuelven FALSE si el worker ya no tiene el mensaje (lease perdido)
+    returns = "BOOLEAN" if return_found else "VOID"
+    found = "RETURN FOUND;" if return_found else ""
+
+    op.execute("DROP FUNCTION IF EXISTS notifications_sp_mark_outbox_sent(BIGINT, VARCHAR, JSONB)")
+    op.execute("DROP FUNCTION IF EXISTS notifications_sp_mark_outbox_failed(BIGINT, VARCHAR, TEXT, TIMESTAMPTZ)")
+
+    op.execute(f"""
+    CREATE FUNCTION notifications_sp_mark_outbox_sent(
+        p_outbox_id BIGINT,
+        p_worker_id VARCHAR,
+        p_provider_response JSONB
+    )
+    RETURNS {returns}
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        UPDATE notification_outbox
+        SET status = 'sent',
+            sent_at = now(),
+            provider_response = p_provider_response,
+            last_error = NULL,
+            locked_by = NULL,
+            locked_until = NULL,
+            update_date = now(),
+            user_modify = p_worker_id
+        WHERE id = p_outbox_id AND locked_by = p_worker_id;
+        {found}
+    END;
+    $$;
+    """)
+
+    op.execute(f"""
+    CREATE FUNCTION notifications_sp_mark_outbox_failed(
+        p_outbox_id BIGINT,
+        p_worker_id VARCHAR,
+        p_error TEXT,
+        p_next_attempt_at TIMESTAMPTZ
+    )
+    RETURNS {returns}
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        UPDATE notification_outbox
+        SET status = CASE WHEN p_next_attempt_at IS NULL THEN 'dead' ELSE 'pending' END,
+            next_attempt_at = COALESCE(p_next_attempt_at, next_attempt_at),
+            last_error = p_error,
+            locked_by = NULL,
+            locked_until = NULL,
+            update_date = now(),
+            user_modify = p_worker_id
+        WHERE id = p_outbox_id AND locked_by = p_worker_id;
+        {found}
+    END;
+    $$;
+    """)
+
+
+def upgrade() -> None:
+    _create_claim(cap_attempts=True)
+    _create_marks(return_found=True)
+
+    # Extiende el lease justo antes de enviar cada mensaje. Devuelve FALSE si otro
+    # worker reclamó el mensaje mientras este esperaba turno.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notifications_sp_renew_outbox_lease(
+        p_outbox_id BIGINT,
+        p_worker_id VARCHAR,
+        p_lease_seconds INTEGER
+    )
+    RETURNS BOOLEAN
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        UPDATE notification_outbox
+        SET locked_until = now() + make_interval(secs => p_lease_seconds)
+        WHERE id = p_outbox_id
+          AND status = 'processing'
+          AND locked_by = p_worker_id;
+        RETURN FOUND;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS notifications_sp_renew_outbox_lease(BIGINT, VARCHAR, INTEGER)")
+    _create_marks(return_found=False)
+    _create_claim(cap_attempts=False)
@@ -0,0 +1,103 @@
+"""feat: appointments keyset page
+
+Revision ID: 7c0b4f320aa2
+Revises: 67b45351a6b6
+Create Date: 2026-10-20 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c0b4f320aa2'
+down_revision: Union[str, None] = '67b45351a6b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_appointments_start_id',
+        'appointments',
+        ['start_datetime', 'appointment_id'],
+        postgresql_where=sa.text('annulled = false'),
+    )
+
+    # Página siguiente a la clave (p_after_start, p_after_id); con la clave en NULL
+    # devuelve la primera página. Las columnas son las de 'appointments_get_all'.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION appointments_sp_get_page_after(
+        p_start_datetime TIMESTAMP,
+        p_end_datetime TIMESTAMP,
+        p_location_id INTEGER,
+        p_after_start TIMESTAMP,
+        p_after_id INTEGER,
+        p_limit INTEGER
+    )
+    RETURNS TABLE (
+        appointment_id INTEGER,
+        start_datetime TIMESTAMP,
+        end_datetime TIMESTAMP,
+        location_id INTEGER,
+        location_name VARCHAR,
+        user_id INTEGER,
+        user_name VARCHAR,
+        service_id INTEGER,
+        service_name VARCHAR,
+        service_price NUMERIC,
+        service_duration FLOAT8,
+        customer_id INTEGER,
+        customer_name VARCHAR,
+        customer_phone VARCHAR,
+        status_id INTEGER,
+        status_name VARCHAR,
+        insert_date TIMESTAMPTZ,
+        update_date TIMESTAMPTZ
+    )
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        RETURN QUERY
+        SELECT a.appointment_id,
+               a.start_datetime::TIMESTAMP,
+               a.end_datetime::TIMESTAMP,
+               a.location_id,
+               l.nombre_sede::VARCHAR,
+               a.user_id,
+               u.user_name::VARCHAR,
+               a.service_id,
+               s.service_name::VARCHAR,
+               s.price::NUMERIC,
+               s.duration_minutes::FLOAT8,
+               a.customer_id,
+               c.name_customer::VARCHAR,
+               c.phone_customer::VARCHAR,
+               a.status_maintable_id,
+               m.item_text::VARCHAR,
+               a.insert_date::TIMESTAMPTZ,
+               a.update_date::TIMESTAMPTZ
+        FROM appointments a
+        LEFT JOIN location l ON l.id = a.location_id
+        LEFT JOIN users u ON u.id = a.user_id
+        LEFT JOIN services s ON s.service_id = a.service_id
+        LEFT JOIN customer c ON c.id = a.customer_id
+        LEFT JOIN maintable m ON m.maintable_id = a.status_maintable_id
+        WHERE a.annulled = FALSE
+          AND a.start_datetime >= p_start_datetime
+          AND a.start_datetime <= p_end_datetime
+          AND (p_location_id IS NULL OR a.location_id = p_location_id)
+          AND (p_after_start IS NULL
+               OR (a.start_datetime, a.appointment_id) > (p_after_start, p_after_id))
+        ORDER BY a.start_datetime, a.appointment_id
+        LIMIT p_limit;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS appointments_sp_get_page_after(TIMESTAMP, TIMESTAMP, INTEGER, TIMESTAMP, INTEGER, INTEGER)")
+    op.drop_index('ix_appointments_start_id', table_name='appointments')
@@ -0,0 +1,57 @@
+"""feat: appointments find busy intervals
+
+Revision ID: 7df8c03e67bd
+Revises: d201b680750a
+Create Date: 2026-10-20 15:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7df8c03e67bd'
+down_revision: Union[str, None] = 'd201b680750a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Citas activas del personal que se superponen con [p_start_datetime, p_end_datetime),
+    # en cualquier sede. El unnest equivale a 'a.user_id = ANY(p_user_ids)', pero cada
+    # empleado se busca con la igualdad y el rango del índice GiST
+    # 'appointments_user_period_gist', que no acepta ANY como condición de índice.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION appointments_sp_find_busy_intervals(
+        p_user_ids INTEGER[],
+        p_start_datetime TIMESTAMP,
+        p_end_datetime TIMESTAMP
+    )
+    RETURNS TABLE (
+        appointment_id INTEGER,
+        user_id INTEGER,
+        start_datetime TIMESTAMP,
+        end_datetime TIMESTAMP
+    )
+    LANGUAGE plpgsql
+    STABLE
+    AS $$
+    BEGIN
+        RETURN QUERY
+        SELECT a.appointment_id,
+               a.user_id,
+               a.start_datetime::TIMESTAMP,
+               a.end_datetime::TIMESTAMP
+        FROM (SELECT DISTINCT u.staff_id FROM unnest(p_user_ids) AS u(staff_id)) s
+        JOIN appointments a ON a.user_id = s.staff_id
+        WHERE a.annulled = FALSE
+          AND tsrange(a.start_datetime, a.end_datetime) && tsrange(p_start_datetime, p_end_datetime)
+        ORDER BY a.user_id, a.start_datetime;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS appointments_sp_find_busy_intervals(INTEGER[], TIMESTAMP, TIMESTAMP)")
@@ -0,0 +1,233 @@
+"""fix: review campaign set based
+
+Revision ID: 8a82c072413a
+Revises: 16d18d5520c0
+Create Date: 2026-10-20 14:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a82c072413a'
+down_revision: Union[str, None] = '16d18d5520c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Vigencia del token de los reviews que crea la campaña
+TOKEN_VALIDITY = "30 days"
+
+RETURNS = """
+    RETURNS TABLE (
+        review_id INTEGER,
+        appointment_id INTEGER,
+        token VARCHAR,
+        customer_email VARCHAR,
+        customer_name VARCHAR,
+        service_name VARCHAR,
+        staff_name VARCHAR,
+        appointment_date TIMESTAMP,
+        location_name VARCHAR
+    )
+"""
+
+# Citas terminadas dentro de la ventana de la campaña
+CAMPAIGN_WINDOW = """
+              a.annulled = FALSE
+              AND a.end_datetime <= now()
+              AND a.start_datetime >= now() - make_interval(days => p_days_after)
+"""
+
+
+def upgrade() -> None:
+    # Citas descartadas por la campaña: no se vuelven a evaluar en las siguientes
+    op.create_table('review_email_exclusions',
+    sa.Column('appointment_id', sa.Integer(), nullable=False),
+    sa.Column('reason', sa.String(length=50), nullable=False),
+    sa.Column('insert_date', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('user_create', sa.String(length=255), nullable=False),
+    sa.PrimaryKeyConstraint('appointment_id')
+    )
+
+    # Un review activo por cita: es el árbitro del ON CONFLICT de la campaña
+    op.execute("""
+    CREATE UNIQUE INDEX IF NOT EXISTS reviews_appointment_active_uq
+    ON reviews (appointment_id)
+    WHERE annulled = FALSE
+    """)
+
+    # Dos sentencias en lugar de un SP por cita: primero se registran las citas sin
+    # email del cliente; después un único INSERT ... ON CONFLICT crea los reviews que
+    # faltan (o renueva el token vencido de los existentes), los reclama hasta
+    # p_lease_seconds y devuelve los datos del email. p_limit cuenta solo reviews
+    # reclamados. El advisory lock serializa la preparación entre ejecuciones.
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION sp_prepare_review_email_campaign(
+        p_days_after INTEGER,
+        p_limit INTEGER,
+        p_user_transaction VARCHAR,
+        p_lease_seconds INTEGER
+    )
+    {RETURNS}
+    LANGUAGE plpgsql
+    AS $$
+    -- El índice parcial del ON CONFLICT se infiere por columna, que comparte nombre
+    -- con la columna de salida appointment_id
+    #variable_conflict use_column
+    BEGIN
+        PERFORM pg_advisory_xact_lock(hashtext('reviews:email_campaign'));
+
+        INSERT INTO review_email_exclusions (appointment_id, reason, user_create)
+        SELECT a.appointment_id, 'NO_EMAIL', p_user_transaction
+        FROM appointments a
+        LEFT JOIN customer c ON c.id = a.customer_id
+        WHERE {CAMPAIGN_WINDOW}
+          AND NULLIF(btrim(c.email_customer), '') IS NULL
+        ON CONFLICT ON CONSTRAINT review_email_exclusions_pkey DO NOTHING;
+
+        RETURN QUERY
+        WITH candidates AS MATERIALIZED (
+            SELECT a.appointment_id AS candidate_id,
+                   a.start_datetime AS candidate_start,
+                   c.email_customer AS candidate_email,
+                   c.name_customer AS candidate_customer,
+                   s.service_name AS candidate_service,
+                   u.user_name AS candidate_staff,
+                   l.nombre_sede AS candidate_location
+            FROM appointments a
+            JOIN customer c ON c.id = a.customer_id
+            LEFT JOIN services s ON s.service_id = a.service_id
+            LEFT JOIN users u ON u.id = a.user_id
+            LEFT JOIN location l ON l.id = a.location_id
+            WHERE {CAMPAIGN_WINDOW}
+              AND NULLIF(btrim(c.email_customer), '') IS NOT NULL
+              AND NOT EXISTS (
+                  SELECT 1
+                  FROM review_email_exclusions x
+                  WHERE x.appointment_id = a.appointment_id
+              )
+              AND NOT EXISTS (
+                  SELECT 1
+                  FROM reviews r
+                  WHERE r.appointment_id = a.appointment_id
+                    AND r.annulled = FALSE
+                    AND (r.email_sent_at IS NOT NULL
+                         OR r.reviewed_at IS NOT NULL
+                         OR r.email_claimed_until > now())
+              )
+            ORDER BY a.start_datetime, a.appointment_id
+            LIMIT p_limit
+        ),
+        claimed AS (
+            INSERT INTO reviews AS r (
+                appointment_id, token, token_expires_at, email_claimed_until, user_create
+            )
+            SELECT cd.candidate_id,
+                   md5(gen_random_uuid()::TEXT),
+                   now() + INTERVAL '{TOKEN_VALIDITY}',
+                   now() + make_interval(secs => p_lease_seconds),
+                   p_user_transaction
+            FROM candidates cd
+            ON CONFLICT (appointment_id) WHERE annulled = FALSE
+            DO UPDATE SET
+                token = CASE WHEN r.token_expires_at < now() THEN EXCLUDED.token ELSE r.token END,
+                token_expires_at = CASE WHEN r.token_expires_at < now()
+                                        THEN EXCLUDED.token_expires_at
+                                        ELSE r.token_expires_at END,
+                email_claimed_until = EXCLUDED.email_claimed_until,
+                update_date = now(),
+                user_modify = p_user_transaction
+            RETURNING r.review_id, r.appointment_id, r.token
+        )
+        SELECT cl.review_id,
+               cl.appointment_id,
+               cl.token::VARCHAR,
+               cd.candidate_email::VARCHAR,
+               cd.candidate_customer::VARCHAR,
+               cd.candidate_service::VARCHAR,
+               cd.candidate_staff::VARCHAR,
+               cd.candidate_start::TIMESTAMP,
+               cd.candidate_location::VARCHAR
+        FROM claimed cl
+        JOIN candidates cd ON cd.candidate_id = cl.appointment_id
+        ORDER BY cd.candidate_start, cd.candidate_id;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    # Versión anterior: evalúa cada candidata con 'sp_process_appointment_for_review_email'
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION sp_prepare_review_email_campaign(
+        p_days_after INTEGER,
+        p_limit INTEGER,
+        p_user_transaction VARCHAR,
+        p_lease_seconds INTEGER
+    )
+    {RETURNS}
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        v_candidate RECORD;
+        v_result RECORD;
+        v_count INTEGER := 0;
+    BEGIN
+        PERFORM pg_advisory_xact_lock(hashtext('reviews:email_campaign'));
+
+        FOR v_candidate IN
+            SELECT a.appointment_id AS candidate_id,
+                   a.start_datetime,
+                   s.service_name AS candidate_service,
+                   u.user_name AS candidate_staff,
+                   l.nombre_sede AS candidate_location
+            FROM appointments a
+            LEFT JOIN services s ON s.service_id = a.service_id
+            LEFT JOIN users u ON u.id = a.user_id
+            LEFT JOIN location l ON l.id = a.location_id
+            WHERE {CAMPAIGN_WINDOW}
+              AND NOT EXISTS (
+                  SELECT 1
+                  FROM reviews r
+                  WHERE r.appointment_id = a.appointment_id
+                    AND r.annulled = FALSE
+                    AND (r.email_sent_at IS NOT NULL
+                         OR r.reviewed_at IS NOT NULL
+                         OR r.email_claimed_until > now())
+              )
+            ORDER BY a.start_datetime, a.appointment_id
+        LOOP
+            EXIT WHEN v_count >= p_limit;
+
+            SELECT * INTO v_result
+            FROM sp_process_appointment_for_review_email(
+                v_candidate.candidate_id, p_days_after, p_user_transaction
+            );
+
+            CONTINUE WHEN v_result IS NULL OR NOT COALESCE(v_result.should_send_email, FALSE);
+
+            UPDATE reviews r
+            SET email_claimed_until = now() + make_interval(secs => p_lease_seconds)
+            WHERE r.review_id = v_result.review_id;
+
+            review_id := v_result.review_id;
+            appointment_id := v_candidate.candidate_id;
+            token := v_result.token::VARCHAR;
+            customer_email := v_result.customer_email::VARCHAR;
+            customer_name := v_result.customer_name::VARCHAR;
+            service_name := v_candidate.candidate_service::VARCHAR;
+            staff_name := v_candidate.candidate_staff::VARCHAR;
+            appointment_date := v_candidate.start_datetime::TIMESTAMP;
+            location_name := v_candidate.candidate_location::VARCHAR;
+            RETURN NEXT;
+            v_count := v_count + 1;
+        END LOOP;
+    END;
+    $$;
+    """)
+    op.execute("DROP INDEX IF EXISTS reviews_appointment_active_uq")
+    op.drop_table('review_email_exclusions')
@@ -0,0 +1,151 @@
+"""feat: scheduler job runs
+
+Revision ID: a7c3e91b5d24
+Revises: f5e4579aaabd
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e91b5d24'
+down_revision: Union[str, None] = 'f5e4579aaabd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('scheduler_job_runs',
+    sa.Column('job_name', sa.String(length=100), nullable=False),
+    sa.Column('last_scheduled_for', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_duration_ms', sa.Integer(), nullable=True),
+    sa.Column('last_status', sa.String(length=20), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('last_run_by', sa.String(length=100), nullable=True),
+    sa.Column('next_run_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('job_name')
+    )
+
+    # Elección de líder por ejecución: solo la réplica que obtiene el advisory lock del job
+    # y cuya ejecución programada aún no fue reclamada ejecuta el job. El lock es de
+    # transacción, así que se libera solo al confirmar el reclamo.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION scheduler_sp_claim_job_run(
+        p_job_name VARCHAR,
+        p_scheduled_for TIMESTAMPTZ,
+        p_worker_id VARCHAR
+    )
+    RETURNS BOOLEAN
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        IF NOT pg_try_advisory_xact_lock(hashtext('scheduler:' || p_job_name)) THEN
+            RETURN FALSE;
+        END IF;
+
+        INSERT INTO scheduler_job_runs AS r (
+            job_name, last_scheduled_for, last_started_at, last_status, last_run_by
+        )
+        VALUES (p_job_name, p_scheduled_for, now(), 'running', p_worker_id)
+        ON CONFLICT (job_name) DO UPDATE
+        SET last_scheduled_for = EXCLUDED.last_scheduled_for,
+            last_started_at = EXCLUDED.last_started_at,
+            last_status = EXCLUDED.last_status,
+            last_run_by = EXCLUDED.last_run_by
+        WHERE r.last_scheduled_for IS NULL
+           OR r.last_scheduled_for < EXCLUDED.last_scheduled_for;
+
+        RETURN FOUND;
+    END;
+    $$;
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION scheduler_sp_finish_job_run(
+        p_job_name VARCHAR,
+        p_worker_id VARCHAR,
+        p_status VARCHAR,
+        p_duration_ms INTEGER,
+        p_error TEXT,
+        p_next_run_at TIMESTAMPTZ
+    )
+    RETURNS VOID
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        UPDATE scheduler_job_runs
+        SET last_finished_at = now(),
+            last_duration_ms = p_duration_ms,
+            last_status = p_status,
+            last_error = p_error,
+            next_run_at = p_next_run_at
+        WHERE job_name = p_job_name
+          AND last_run_by = p_worker_id;
+    END;
+    $$;
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION scheduler_sp_get_job_runs()
+    RETURNS TABLE (
+        job_name VARCHAR,
+        last_scheduled_for TIMESTAMPTZ,
+        last_started_at TIMESTAMPTZ,
+        last_finished_at TIMESTAMPTZ,
+        last_duration_ms INTEGER,
+        last_status VARCHAR,
+        last_error TEXT,
+        last_run_by VARCHAR,
+        next_run_at TIMESTAMPTZ
+    )
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        RETURN QUERY
+        SELECT r.job_name, r.last_scheduled_for, r.last_started_at, r.last_finished_at,
+               r.last_duration_ms, r.last_status, r.last_error, r.last_run_by, r.next_run_at
+        FROM scheduler_job_runs r
+        ORDER BY r.job_name;
+    END;
+    $$;
+    """)
+
+    # Limpieza periódica: mensajes del outbox ya resueltos y registros del ledger antiguos
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notifications_sp_purge_history(
+        p_retention_days INTEGER
+    )
+    RETURNS TABLE (outbox_deleted INTEGER, ledger_deleted INTEGER)
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        v_outbox_deleted INTEGER;
+        v_ledger_deleted INTEGER;
+    BEGIN
+        DELETE FROM notification_outbox
+        WHERE status IN ('sent', 'dead')
+          AND insert_date < now() - make_interval(days => p_retention_days);
+        GET DIAGNOSTICS v_outbox_deleted = ROW_COUNT;
+
+        DELETE FROM notification_ledger
+        WHERE insert_date < now() - make_interval(days => p_retention_days);
+        GET DIAGNOSTICS v_ledger_deleted = ROW_COUNT;
+
+        RETURN QUERY SELECT v_outbox_deleted, v_ledger_deleted;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS notifications_sp_purge_history(INTEGER)")
+    op.execute("DROP FUNCTION IF EXISTS scheduler_sp_get_job_runs()")
+    op.execute("DROP FUNCTION IF EXISTS scheduler_sp_finish_job_run(VARCHAR, VARCHAR, VARCHAR, INTEGER, TEXT, TIMESTAMPTZ)")
+    op.execute("DROP FUNCTION IF EXISTS scheduler_sp_claim_job_run(VARCHAR, TIMESTAMPTZ, VARCHAR)")
+    op.drop_table('scheduler_job_runs')
@@ -0,0 +1,71 @@
+"""feat: appointments find overlap
+
+Revision ID: c31f77d9cd3b
+Revises: 0567030420b2
+Create Date: 2026-10-20 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c31f77d9cd3b'
+down_revision: Union[str, None] = '0567030420b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # btree_gist permite combinar la igualdad sobre user_id con el rango en un índice GiST.
+    # La extensión no se elimina en el downgrade: puede usarla otro objeto.
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute("""
+    CREATE INDEX IF NOT EXISTS appointments_user_period_gist
+    ON appointments USING gist (user_id, tsrange(start_datetime, end_datetime))
+    WHERE annulled = FALSE
+    """)
+
+    # Devuelve como máximo una cita activa del empleado que se superpone con el horario.
+    # Los rangos son semiabiertos '[)': una cita que termina cuando empieza otra no choca.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION appointments_sp_find_overlap(
+        p_user_id INTEGER,
+        p_start_datetime TIMESTAMP,
+        p_end_datetime TIMESTAMP,
+        p_exclude_appointment_id INTEGER
+    )
+    RETURNS TABLE (
+        appointment_id INTEGER,
+        user_id INTEGER,
+        user_name VARCHAR,
+        start_datetime TIMESTAMP,
+        end_datetime TIMESTAMP
+    )
+    LANGUAGE plpgsql
+    STABLE
+    AS $$
+    BEGIN
+        RETURN QUERY
+        SELECT a.appointment_id,
+               a.user_id,
+               u.user_name::VARCHAR,
+               a.start_datetime::TIMESTAMP,
+               a.end_datetime::TIMESTAMP
+        FROM appointments a
+        LEFT JOIN users u ON u.id = a.user_id
+        WHERE a.user_id = p_user_id
+          AND a.annulled = FALSE
+          AND a.appointment_id IS DISTINCT FROM p_exclude_appointment_id
+          AND tsrange(a.start_datetime, a.end_datetime) && tsrange(p_start_datetime, p_end_datetime)
+        ORDER BY a.start_datetime
+        LIMIT 1;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS appointments_sp_find_overlap(INTEGER, TIMESTAMP, TIMESTAMP, INTEGER)")
+    op.execute("DROP INDEX IF EXISTS appointments_user_period_gist")
@@ -0,0 +1,235 @@
+"""feat: appointment series
+
+Revision ID: c41d7e9b0f26
+Revises: a7c3e91b5d24
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e9b0f26'
+down_revision: Union[str, None] = 'a7c3e91b5d24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SERIES_COLUMNS = """
+        series_id INTEGER,
+        location_id INTEGER,
+        user_id INTEGER,
+        service_id INTEGER,
+        customer_id INTEGER,
+        status_maintable_id INTEGER,
+        frequency VARCHAR,
+        repeat_interval INTEGER,
+        start_date DATE,
+        start_time TIME,
+        duration_minutes INTEGER,
+        until_date DATE,
+        materialized_until DATE
+"""
+
+SERIES_SELECT = """
+        SELECT s.series_id, s.location_id, s.user_id, s.service_id, s.customer_id,
+               s.status_maintable_id, s.frequency, s.repeat_interval, s.start_date,
+               s.start_time, s.duration_minutes, s.until_date, s.materialized_until
+        FROM appointment_series s
+"""
+
+
+def upgrade() -> None:
+    op.create_table('appointment_series',
+    sa.Column('series_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('location_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('service_id', sa.Integer(), nullable=False),
+    sa.Column('customer_id', sa.Integer(), nullable=False),
+    sa.Column('status_maintable_id', sa.Integer(), nullable=False),
+    sa.Column('frequency', sa.String(length=10), nullable=False),
+    sa.Column('repeat_interval', sa.Integer(), server_default=sa.text('1'), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('start_time', sa.Time(), nullable=False),
+    sa.Column('duration_minutes', sa.Integer(), nullable=False),
+    sa.Column('until_date', sa.Date(), nullable=True),
+    sa.Column('materialized_until', sa.Date(), nullable=True),
+    sa.Column('annulled', sa.Boolean(), server_default=sa.text('false'), nullable=False),
+    sa.Column('insert_date', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('update_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('user_create', sa.String(length=255), nullable=False),
+    sa.Column('user_modify', sa.String(length=255), nullable=True),
+    sa.CheckConstraint("frequency IN ('DAILY', 'WEEKLY')", name='appointment_series_frequency_check'),
+    sa.CheckConstraint('repeat_interval > 0', name='appointment_series_interval_check'),
+    sa.PrimaryKeyConstraint('series_id')
+    )
+    op.create_index(
+        'ix_appointment_series_materialized_until',
+        'appointment_series',
+        ['materialized_until'],
+        postgresql_where=sa.text('annulled = false'),
+    )
+
+    op.create_table('appointment_series_occurrences',
+    sa.Column('series_id', sa.Integer(), nullable=False),
+    sa.Column('occurrence_date', sa.Date(), nullable=False),
+    sa.Column('appointment_id', sa.Integer(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('insert_date', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['series_id'], ['appointment_series.series_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('series_id', 'occurrence_date')
+    )
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION appointment_series_sp_create(
+        p_location_id INTEGER,
+        p_user_id INTEGER,
+        p_service_id INTEGER,
+        p_customer_id INTEGER,
+        p_status_maintable_id INTEGER,
+        p_frequency VARCHAR,
+        p_repeat_interval INTEGER,
+        p_start_date DATE,
+        p_start_time TIME,
+        p_duration_minutes INTEGER,
+        p_until_date DATE,
+        p_user_create VARCHAR
+    )
+    RETURNS INTEGER
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        v_series_id INTEGER;
+    BEGIN
+        INSERT INTO appointment_series (
+            location_id, user_id, service_id, customer_id, status_maintable_id,
+            frequency, repeat_interval, start_date, start_time, duration_minutes,
+            until_date, user_create
+        )
+        VALUES (
+            p_location_id, p_user_id, p_service_id, p_customer_id, p_status_maintable_id,
+            p_frequency, p_repeat_interval, p_start_date, p_start_time, p_duration_minutes,
+            p_until_date, p_user_create
+        )
+        RETURNING series_id INTO v_series_id;
+
+        RETURN v_series_id;
+    END;
+    $$;
+    """)
+
+    # Series con ocurrencias pendientes de materializar hasta el horizonte. FOR UPDATE
+    # SKIP LOCKED evita que dos procesos materialicen la misma serie a la vez.
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION appointment_series_sp_claim_due(
+        p_horizon DATE,
+        p_limit INTEGER
+    )
+    RETURNS TABLE ({SERIES_COLUMNS})
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        RETURN QUERY
+        {SERIES_SELECT}
+        WHERE s.annulled = FALSE
+          AND (s.materialized_until IS NULL OR s.materialized_until < p_horizon)
+          AND (s.until_date IS NULL OR s.materialized_until IS NULL OR s.materialized_until < s.until_date)
+        ORDER BY s.series_id
+        LIMIT p_limit
+        FOR UPDATE OF s SKIP LOCKED;
+    END;
+    $$;
+    """)
+
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION appointment_series_sp_get_for_update(
+        p_series_id INTEGER
+    )
+    RETURNS TABLE ({SERIES_COLUMNS})
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        RETURN QUERY
+        {SERIES_SELECT}
+        WHERE s.series_id = p_series_id
+          AND s.annulled = FALSE
+        FOR UPDATE OF s;
+    END;
+    $$;
+    """)
+
+    # p_items: [{"occurrence_date", "appointment_id", "status", "error"}]
+    op.execute("""
+    CREATE OR REPLACE FUNCTION appointment_series_sp_register_occurrences(
+        p_series_id INTEGER,
+        p_items JSONB,
+        p_materialized_until DATE
+    )
+    RETURNS INTEGER
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        v_inserted INTEGER;
+    BEGIN
+        INSERT INTO appointment_series_occurrences (series_id, occurrence_date, appointment_id, status, error)
+        SELECT p_series_id, i.occurrence_date, i.appointment_id, i.status, i.error
+        FROM jsonb_to_recordset(p_items)
+             AS i(occurrence_date DATE, appointment_id INTEGER, status VARCHAR, error TEXT)
+        ON CONFLICT (series_id, occurrence_date) DO NOTHING;
+        GET DIAGNOSTICS v_inserted = ROW_COUNT;
+
+        UPDATE appointment_series
+        SET materialized_until = GREATEST(COALESCE(materialized_until, p_materialized_until), p_materialized_until)
+        WHERE series_id = p_series_id;
+
+        RETURN v_inserted;
+    END;
+    $$;
+    """)
+
+    # "Esta y las siguientes": la serie termina el día anterior a p_from_date y se
+    # devuelven las citas ya creadas desde esa fecha para anularlas.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION appointment_series_sp_truncate(
+        p_series_id INTEGER,
+        p_from_date DATE,
+        p_user_modify VARCHAR
+    )
+    RETURNS TABLE (appointment_id INTEGER)
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        UPDATE appointment_series s
+        SET until_date = p_from_date - 1,
+            materialized_until = LEAST(s.materialized_until, p_from_date - 1),
+            annulled = (p_from_date <= s.start_date),
+            update_date = now(),
+            user_modify = p_user_modify
+        WHERE s.series_id = p_series_id;
+
+        RETURN QUERY
+        WITH removed AS (
+            DELETE FROM appointment_series_occurrences o
+            WHERE o.series_id = p_series_id
+              AND o.occurrence_date >= p_from_date
+            RETURNING o.appointment_id
+        )
+        SELECT r.appointment_id FROM removed r WHERE r.appointment_id IS NOT NULL;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS appointment_series_sp_truncate(INTEGER, DATE, VARCHAR)")
+    op.execute("DROP FUNCTION IF EXISTS appointment_series_sp_register_occurrences(INTEGER, JSONB, DATE)")
+    op.execute("DROP FUNCTION IF EXISTS appointment_series_sp_get_for_update(INTEGER)")
+    op.execute("DROP FUNCTION IF EXISTS appointment_series_sp_claim_due(DATE, INTEGER)")
+    op.execute("DROP FUNCTION IF EXISTS appointment_series_sp_create(INTEGER, INTEGER, INTEGER, INTEGER, INTEGER, VARCHAR, INTEGER, DATE, TIME, INTEGER, DATE, VARCHAR)")
+    op.drop_table('appointment_series_occurrences')
+    op.drop_index('ix_appointment_series_materialized_until', table_name='appointment_series')
+    op.drop_table('appointment_series')
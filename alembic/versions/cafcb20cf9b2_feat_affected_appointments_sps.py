@@ -0,0 +1,201 @@
+"""feat: affected appointments and reassign sps
+
+Revision ID: cafcb20cf9b2
+Revises: 3d8228d18b75
+Create Date: 2026-10-20 13:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cafcb20cf9b2'
+down_revision: Union[str, None] = '3d8228d18b75'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Columnas de AffectedAppointmentEntity (ver _to_affected_entity en el repositorio)
+AFFECTED_COLUMNS = """
+        appointment_id INTEGER,
+        location_id INTEGER,
+        user_id INTEGER,
+        user_name VARCHAR,
+        service_id INTEGER,
+        customer_id INTEGER,
+        customer_name VARCHAR,
+        status_maintable_id INTEGER,
+        start_datetime TIMESTAMP,
+        end_datetime TIMESTAMP,
+        reason VARCHAR
+"""
+
+
+def upgrade() -> None:
+    # Citas activas del empleado en [p_start_date, p_end_date + 1) que se superponen con
+    # un día libre ('DAY_OFF') o que ningún turno de su sede contiene ('NO_SHIFT').
+    # Un día libre sin horas ocupa días completos, igual que en location_sp_get_calendar.
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION appointments_sp_find_unavailable(
+        p_user_id INTEGER,
+        p_start_date DATE,
+        p_end_date DATE,
+        p_location_id INTEGER
+    )
+    RETURNS TABLE ({AFFECTED_COLUMNS})
+    LANGUAGE plpgsql
+    STABLE
+    AS $$
+    BEGIN
+        RETURN QUERY
+        SELECT * FROM (
+            SELECT a.appointment_id,
+                   a.location_id,
+                   a.user_id,
+                   u.user_name::VARCHAR,
+                   a.service_id,
+                   a.customer_id,
+                   c.name_customer::VARCHAR,
+                   a.status_maintable_id,
+                   a.start_datetime::TIMESTAMP,
+                   a.end_datetime::TIMESTAMP,
+                   CASE
+                       WHEN EXISTS (
+                           SELECT 1
+                           FROM days_off d
+                           WHERE d.user_id = a.user_id
+                             AND d.annulled = FALSE
+                             AND tsrange(
+                                     d.fecha_inicio + COALESCE(d.hora_inicio, TIME '00:00'),
+                                     CASE WHEN d.hora_fin IS NULL
+                                          THEN (d.fecha_fin + 1)::TIMESTAMP
+                                          ELSE d.fecha_fin + d.hora_fin
+                                     END
+                                 ) && tsrange(a.start_datetime, a.end_datetime)
+                       ) THEN 'DAY_OFF'
+                       WHEN NOT EXISTS (
+                           SELECT 1
+                           FROM shifts s
+                           WHERE s.user_id = a.user_id
+                             AND s.sede_id = a.location_id
+                             AND s.annulled = FALSE
+                             AND s.fecha_turno + s.hora_inicio <= a.start_datetime
+                             AND s.fecha_turno + s.hora_fin >= a.end_datetime
+                       ) THEN 'NO_SHIFT'
+                   END::VARCHAR AS reason
+            FROM appointments a
+            LEFT JOIN users u ON u.id = a.user_id
+            LEFT JOIN customer c ON c.id = a.customer_id
+            WHERE a.user_id = p_user_id
+              AND a.annulled = FALSE
+              AND (p_location_id IS NULL OR a.location_id = p_location_id)
+              AND tsrange(a.start_datetime, a.end_datetime)
+                  && tsrange(p_start_date::TIMESTAMP, (p_end_date + 1)::TIMESTAMP)
+        ) affected
+        WHERE affected.reason IS NOT NULL
+        ORDER BY affected.start_datetime;
+    END;
+    $$;
+    """)
+
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION appointments_sp_get_by_ids(
+        p_appointment_ids INTEGER[]
+    )
+    RETURNS TABLE ({AFFECTED_COLUMNS})
+    LANGUAGE plpgsql
+    STABLE
+    AS $$
+    BEGIN
+        RETURN QUERY
+        SELECT a.appointment_id,
+               a.location_id,
+               a.user_id,
+               u.user_name::VARCHAR,
+               a.service_id,
+               a.customer_id,
+               c.name_customer::VARCHAR,
+               a.status_maintable_id,
+               a.start_datetime::TIMESTAMP,
+               a.end_datetime::TIMESTAMP,
+               NULL::VARCHAR
+        FROM appointments a
+        LEFT JOIN users u ON u.id = a.user_id
+        LEFT JOIN customer c ON c.id = a.customer_id
+        WHERE a.appointment_id = ANY(p_appointment_ids)
+          AND a.annulled = FALSE
+        ORDER BY a.start_datetime, a.appointment_id;
+    END;
+    $$;
+    """)
+
+    # Un único UPDATE para todo el lote; devuelve solo las citas no anuladas que cambiaron.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION appointments_sp_reassign_bulk(
+        p_items JSONB,
+        p_user_modify VARCHAR
+    )
+    RETURNS TABLE (
+        appointment_id INTEGER
+    )
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        RETURN QUERY
+        UPDATE appointments a
+        SET user_id = i.user_id,
+            user_modify = p_user_modify,
+            update_date = NOW()
+        FROM jsonb_to_recordset(p_items) AS i(appointment_id INTEGER, user_id INTEGER)
+        WHERE a.appointment_id = i.appointment_id
+          AND a.annulled = FALSE
+        RETURNING a.appointment_id;
+    END;
+    $$;
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION days_off_sp_get_day_off_by_id(
+        p_day_off_id INTEGER
+    )
+    RETURNS SETOF days_off
+    LANGUAGE plpgsql
+    STABLE
+    AS $$
+    BEGIN
+        RETURN QUERY
+        SELECT d.*
+        FROM days_off d
+        WHERE d.id = p_day_off_id
+          AND d.annulled = FALSE;
+    END;
+    $$;
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION shifts_sp_get_shift_by_id(
+        p_shift_id INTEGER
+    )
+    RETURNS SETOF shifts
+    LANGUAGE plpgsql
+    STABLE
+    AS $$
+    BEGIN
+        RETURN QUERY
+        SELECT s.*
+        FROM shifts s
+        WHERE s.id = p_shift_id
+          AND s.annulled = FALSE;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS shifts_sp_get_shift_by_id(INTEGER)")
+    op.execute("DROP FUNCTION IF EXISTS days_off_sp_get_day_off_by_id(INTEGER)")
+    op.execute("DROP FUNCTION IF EXISTS appointments_sp_reassign_bulk(JSONB, VARCHAR)")
+    op.execute("DROP FUNCTION IF EXISTS appointments_sp_get_by_ids(INTEGER[])")
+    op.execute("DROP FUNCTION IF EXISTS appointments_sp_find_unavailable(INTEGER, DATE, DATE, INTEGER)")
@@ -0,0 +1,52 @@
+"""fix: defer outbox without attempt
+
+Revision ID: d201b680750a
+Revises: 8a82c072413a
+Create Date: 2026-10-20 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd201b680750a'
+down_revision: Union[str, None] = '8a82c072413a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Devuelve a 'pending' un mensaje que no llegó a enviarse porque el circuit breaker
+    # o el bulkhead lo rechazaron de inmediato. El reclamo ya sumó un intento: se
+    # descuenta para que una caída de Evolution API no agote los reintentos.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notifications_sp_defer_outbox(
+        p_outbox_id BIGINT,
+        p_worker_id VARCHAR,
+        p_reason TEXT,
+        p_next_attempt_at TIMESTAMPTZ
+    )
+    RETURNS BOOLEAN
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        UPDATE notification_outbox
+        SET status = 'pending',
+            attempts = GREATEST(attempts - 1, 0),
+            next_attempt_at = p_next_attempt_at,
+            last_error = p_reason,
+            locked_by = NULL,
+            locked_until = NULL,
+            update_date = now(),
+            user_modify = p_worker_id
+        WHERE id = p_outbox_id AND locked_by = p_worker_id;
+        RETURN FOUND;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS notifications_sp_defer_outbox(BIGINT, VARCHAR, TEXT, TIMESTAMPTZ)")
@@ -0,0 +1,74 @@
+"""feat: notification ledger
+
+Revision ID: f5e4579aaabd
+Revises: 2f399f6ad2f8
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5e4579aaabd'
+down_revision: Union[str, None] = '2f399f6ad2f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('notification_ledger',
+    sa.Column('appointment_id', sa.Integer(), nullable=False),
+    sa.Column('reminder_type', sa.String(length=50), nullable=False),
+    sa.Column('insert_date', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('user_create', sa.String(length=255), nullable=False),
+    sa.PrimaryKeyConstraint('appointment_id', 'reminder_type')
+    )
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notifications_sp_get_notified_appointments(
+        p_appointment_ids INTEGER[],
+        p_reminder_type VARCHAR
+    )
+    RETURNS TABLE (appointment_id INTEGER)
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        RETURN QUERY
+        SELECT l.appointment_id
+        FROM notification_ledger l
+        WHERE l.reminder_type = p_reminder_type
+          AND l.appointment_id = ANY(p_appointment_ids);
+    END;
+    $$;
+    """)
+
+    # Devuelve solo las citas registradas en esta llamada: ON CONFLICT DO NOTHING hace
+    # que dos ejecuciones concurrentes no registren (ni envíen) la misma cita dos veces.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notifications_sp_register_notifications(
+        p_appointment_ids INTEGER[],
+        p_reminder_type VARCHAR,
+        p_user_create VARCHAR
+    )
+    RETURNS TABLE (appointment_id INTEGER)
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        RETURN QUERY
+        INSERT INTO notification_ledger AS l (appointment_id, reminder_type, user_create)
+        SELECT DISTINCT ids.id, p_reminder_type, p_user_create
+        FROM unnest(p_appointment_ids) AS ids(id)
+        ON CONFLICT ON CONSTRAINT notification_ledger_pkey DO NOTHING
+        RETURNING l.appointment_id;
+    END;
+    $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS notifications_sp_register_notifications(INTEGER[], VARCHAR, VARCHAR)")
+    op.execute("DROP FUNCTION IF EXISTS notifications_sp_get_notified_appointments(INTEGER[], VARCHAR)")
+    op.drop_table('notification_ledger')
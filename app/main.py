@@ -1,6 +1,7 @@
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
 
 from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
@@ -12,10 +13,19 @@ from mediatr import Mediator
 
 from app.constants import injector_var, origins, prefix_v1, prefix_v2, uow_var
 from app.database import create_session
+from app.modules.notifications.infra.services.notification_outbox_dispatcher import (
+    get_outbox_dispatcher,
+)
+from app.modules.scheduler.infra.services.job_scheduler import get_job_scheduler
+from app.modules.scheduler.infra.services.scheduled_jobs import register_default_jobs
 from app.modules.share.domain.exceptions import (
     InvalidFieldsException,
     InvalidFiltersException,
 )
+from app.modules.share.infra.concurrency import (
+    get_bulkheads_stats,
+    get_circuit_breakers_stats,
+)
 from app.modules.share.infra.custom_validation_handler import (
     custom_validation_exception_handler,
 )
@@ -27,10 +37,20 @@ from app.modules.share.infra.exception_handlers import (
     runtime_error_handler,
     value_error_handler,
 )
+from app.modules.share.infra.email import close_smtp_pools
+from app.modules.share.infra.events import get_event_bus
+from app.modules.share.infra.executor import ExecutorService
+from app.modules.share.infra.http import HttpClientRegistry
 from app.modules.share.infra.mediator_config import MediatorManager
 from app.modules.share.infra.persistence.unit_of_work import UnitOfWork
+from app.modules.share.infra.templates import MessageTemplateRegistry
 from app.versions.v1_app import create_v1_app
 from app.versions.v2_app import create_v2_app
+from config.setting import (
+    NOTIFICATIONS_OUTBOX_WORKER_ENABLED,
+    SCHEDULER_ENABLED,
+    SCHEDULER_SERIES_ENABLED,
+)
 
 # Configurar templates con ruta robusta
 # Obtener la ruta del directorio actual del módulo app
@@ -84,6 +104,33 @@ def setup_middleware(app: FastAPI) -> None:
     )
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Gestiona los recursos compartidos de la aplicación durante su ciclo de vida.
+    Se inicializan al arrancar y se liberan al apagar el servidor.
+    """
+    ExecutorService.get_instance()
+    MessageTemplateRegistry.get_instance().warm_up()
+    if NOTIFICATIONS_OUTBOX_WORKER_ENABLED:
+        get_outbox_dispatcher().start()
+    scheduler_enabled = SCHEDULER_ENABLED or SCHEDULER_SERIES_ENABLED
+    if scheduler_enabled:
+        register_default_jobs(get_job_scheduler())
+        get_job_scheduler().start()
+    try:
+        yield
+    finally:
+        if scheduler_enabled:
+            await get_job_scheduler().stop()
+        if NOTIFICATIONS_OUTBOX_WORKER_ENABLED:
+            await get_outbox_dispatcher().stop()
+        await get_event_bus().shutdown()
+        await HttpClientRegistry.aclose_all()
+        await close_smtp_pools()
+        ExecutorService.shutdown_instance()
+
+
 def create_app(mediator: Optional[Mediator] = None) -> FastAPI:
     """
     Crea la aplicación principal de FastAPI con arquitectura profesional.
@@ -101,6 +148,7 @@ def create_app(mediator: Optional[Mediator] = None) -> FastAPI:
         version="1.0.0",
         docs_url=None,  # Deshabilitar Swagger automático
         redoc_url=None,  # Deshabilitar ReDoc automático
+        lifespan=lifespan,
     )
 
     # Configurar exception handlers globales
@@ -175,6 +223,12 @@ def create_app(mediator: Optional[Mediator] = None) -> FastAPI:
         return {
             "status": "healthy",
             "mediator_initialized": MediatorManager.is_initialized(),
+            "executor": ExecutorService.get_instance().get_stats(),
+            "http_clients": HttpClientRegistry.get_stats(),
+            "circuit_breakers": get_circuit_breakers_stats(),
+            "bulkheads": get_bulkheads_stats(),
+            "domain_events": get_event_bus().get_stats(),
+            "notification_outbox": get_outbox_dispatcher().get_stats(),
             "version": "1.0.0",
         }
 
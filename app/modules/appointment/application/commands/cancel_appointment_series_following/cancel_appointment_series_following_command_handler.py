@@ -0,0 +1,49 @@
+from datetime import date
+from typing import List
+
+from mediatr import Mediator
+from pydantic import BaseModel
+
+from app.modules.appointment.application.services.appointment_series_service import (
+    AppointmentSeriesService,
+)
+from app.modules.share.domain.handler.request_handler import IRequestHandler
+
+
+class CancelAppointmentSeriesFollowingCommand(BaseModel):
+    """
+    Comando para cancelar una serie desde una fecha ("esta y las siguientes").
+    """
+
+    series_id: int
+    from_date: date
+    user_modify: str
+
+
+class CancelAppointmentSeriesFollowingResponse(BaseModel):
+    series_id: int
+    annulled_appointment_ids: List[int]
+
+
+@Mediator.handler
+class CancelAppointmentSeriesFollowingCommandHandler(
+    IRequestHandler[CancelAppointmentSeriesFollowingCommand, CancelAppointmentSeriesFollowingResponse]
+):
+    """
+    Manejador para el comando CancelAppointmentSeriesFollowingCommand.
+    Solo anula las citas de la serie desde from_date; las anteriores se conservan.
+    """
+
+    def __init__(self) -> None:
+        self.series_service = AppointmentSeriesService()
+
+    async def handle(
+        self, command: CancelAppointmentSeriesFollowingCommand
+    ) -> CancelAppointmentSeriesFollowingResponse:
+        series = await self.series_service.get_series(command.series_id)
+        annulled = await self.series_service.truncate(
+            series, command.from_date, command.user_modify
+        )
+        return CancelAppointmentSeriesFollowingResponse(
+            series_id=series.series_id, annulled_appointment_ids=annulled
+        )
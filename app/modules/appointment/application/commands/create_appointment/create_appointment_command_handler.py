@@ -9,10 +9,12 @@ from app.constants import injector_var
 from app.modules.appointment.application.utils.appointment_validation_utils import (
     AppointmentValidationUtils,
 )
+from app.modules.appointment.domain.events import AppointmentCreatedEvent
 from app.modules.appointment.domain.repositories.appointment_repository import (
     AppointmentRepository,
 )
 from app.modules.share.domain.handler.request_handler import IRequestHandler
+from app.modules.share.infra.events import publish_event
 
 
 # --- Definición del Comando ---
@@ -74,6 +76,16 @@ class CreateAppointmentCommandHandler(IRequestHandler[CreateAppointmentCommand,
         Raises:
             ValueError: Si ya existe una cita en conflicto con las fechas especificadas.
         """
+        # Serializa las reservas concurrentes del mismo empleado y día: el lock se
+        # mantiene hasta el commit, así que ninguna otra reserva puede colarse entre
+        # la validación y la escritura
+        await AppointmentValidationUtils.lock_staff_schedule(
+            appointment_repository=self.appointment_repository,
+            user_id=command.user_id,
+            start_datetime=command.start_datetime,
+            end_datetime=command.end_datetime,
+        )
+
         # Validar que no exista conflicto de fechas antes de crear
         await AppointmentValidationUtils.validate_no_conflicting_appointments(
             appointment_repository=self.appointment_repository,
@@ -95,5 +107,20 @@ class CreateAppointmentCommandHandler(IRequestHandler[CreateAppointmentCommand,
             user_create=command.user_create,
         )
 
+        # Los suscriptores se ejecutan después del commit, fuera del request
+        publish_event(
+            AppointmentCreatedEvent(
+                appointment_id=new_appointment_id,
+                location_id=command.location_id,
+                user_id=command.user_id,
+                service_id=command.service_id,
+                customer_id=command.customer_id,
+                status_maintable_id=command.status_maintable_id,
+                start_datetime=command.start_datetime,
+                end_datetime=command.end_datetime,
+                user_create=command.user_create,
+            )
+        )
+
         # Devuelve el ID obtenido del repositorio
         return new_appointment_id
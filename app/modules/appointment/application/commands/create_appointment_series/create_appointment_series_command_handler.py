@@ -0,0 +1,127 @@
+import logging
+from datetime import date, time
+from typing import List, Optional
+
+from mediatr import Mediator
+from pydantic import BaseModel, Field
+
+from app.modules.appointment.application.services.appointment_series_service import (
+    OCCURRENCE_CREATED,
+    AppointmentSeriesService,
+    SeriesMaterialization,
+)
+from app.modules.appointment.domain.entities.appointment_series_domain import (
+    RecurrenceFrequency,
+)
+from app.modules.share.domain.handler.request_handler import IRequestHandler
+
+logger = logging.getLogger(__name__)
+
+SERIES_STALLED_WARNING = (
+    "El job de materialización de series está desactivado (SCHEDULER_SERIES_ENABLED o "
+    "SCHEDULER_SERIES_INTERVAL): no se crearán citas después de materialized_until"
+)
+
+
+class CreateAppointmentSeriesCommand(BaseModel):
+    """
+    Comando para crear una serie de citas repetidas.
+    """
+
+    location_id: int
+    user_id: int
+    service_id: int
+    customer_id: int
+    status_maintable_id: int
+    frequency: RecurrenceFrequency
+    repeat_interval: int
+    start_date: date
+    start_time: time
+    duration_minutes: int
+    until_date: Optional[date] = None
+    user_create: str
+
+
+class SeriesOccurrenceResult(BaseModel):
+    occurrence_date: date
+    status: str
+    appointment_id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class AppointmentSeriesResponse(BaseModel):
+    """
+    Serie creada y citas generadas hasta el horizonte actual. warning avisa si la
+    serie no se extenderá más allá de materialized_until.
+    """
+
+    series_id: int
+    materialized_until: date
+    created: int
+    conflicts: int
+    occurrences: List[SeriesOccurrenceResult] = Field(default_factory=list)
+    warning: Optional[str] = None
+
+    @classmethod
+    def from_materialization(
+        cls, materialization: SeriesMaterialization
+    ) -> "AppointmentSeriesResponse":
+        occurrences = [
+            SeriesOccurrenceResult(
+                occurrence_date=occurrence.occurrence_date,
+                status=occurrence.status,
+                appointment_id=occurrence.appointment_id,
+                error=occurrence.error,
+            )
+            for occurrence in materialization.occurrences
+        ]
+        created = sum(1 for o in occurrences if o.status == OCCURRENCE_CREATED)
+        return cls(
+            series_id=materialization.series_id,
+            materialized_until=materialization.materialized_until,
+            created=created,
+            conflicts=len(occurrences) - created,
+            occurrences=occurrences,
+        )
+
+
+@Mediator.handler
+class CreateAppointmentSeriesCommandHandler(
+    IRequestHandler[CreateAppointmentSeriesCommand, AppointmentSeriesResponse]
+):
+    """
+    Manejador para el comando CreateAppointmentSeriesCommand.
+    Registra la serie y crea de inmediato sus citas hasta el horizonte; las
+    siguientes las crea el job de materialización a medida que avanza el tiempo.
+    """
+
+    def __init__(self) -> None:
+        self.series_service = AppointmentSeriesService()
+
+    async def handle(self, command: CreateAppointmentSeriesCommand) -> AppointmentSeriesResponse:
+        series_id = await self.series_service.series_repository.create_series(
+            location_id=command.location_id,
+            user_id=command.user_id,
+            service_id=command.service_id,
+            customer_id=command.customer_id,
+            status_maintable_id=command.status_maintable_id,
+            frequency=command.frequency,
+            repeat_interval=command.repeat_interval,
+            start_date=command.start_date,
+            start_time=command.start_time,
+            duration_minutes=command.duration_minutes,
+            until_date=command.until_date,
+            user_create=command.user_create,
+        )
+        series = await self.series_service.get_series(series_id)
+
+        materializations = await self.series_service.materialize(
+            [series], self.series_service.horizon(), command.user_create
+        )
+        response = AppointmentSeriesResponse.from_materialization(materializations[0])
+
+        continues = series.until_date is None or series.until_date > response.materialized_until
+        if continues and not self.series_service.materialization_job_enabled():
+            logger.warning(f"Serie {series_id}: {SERIES_STALLED_WARNING}")
+            response.warning = SERIES_STALLED_WARNING
+        return response
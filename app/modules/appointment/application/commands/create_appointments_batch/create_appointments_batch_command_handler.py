@@ -0,0 +1,205 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from mediatr import Mediator
+from pydantic import BaseModel, Field
+
+from app.constants import injector_var
+from app.modules.appointment.application.utils.appointment_validation_utils import (
+    AppointmentValidationUtils,
+)
+from app.modules.appointment.domain.entities.appointment_domain import (
+    NewAppointmentEntity,
+)
+from app.modules.appointment.domain.events import AppointmentCreatedEvent
+from app.modules.appointment.domain.repositories.appointment_repository import (
+    AppointmentRepository,
+)
+from app.modules.share.domain.handler.request_handler import IRequestHandler
+from app.modules.share.infra.events import publish_event
+
+ITEM_CREATED = "created"
+ITEM_CONFLICT = "conflict"
+ITEM_SKIPPED = "skipped"
+
+
+class BatchAppointmentItem(BaseModel):
+    """
+    Cita a crear dentro de un lote.
+    """
+
+    location_id: int
+    user_id: int
+    service_id: int
+    customer_id: int
+    status_maintable_id: int
+    start_datetime: datetime
+    end_datetime: datetime
+
+
+class CreateAppointmentsBatchCommand(BaseModel):
+    """
+    Comando para crear varias citas en una sola transacción.
+    """
+
+    items: List[BatchAppointmentItem]
+    atomic: bool = False
+    user_create: str
+
+
+class BatchAppointmentResult(BaseModel):
+    """
+    Resultado de un ítem del lote, en el mismo orden de la solicitud.
+    """
+
+    index: int
+    status: str
+    appointment_id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class CreateAppointmentsBatchResponse(BaseModel):
+    """
+    Resumen del alta masiva de citas.
+    """
+
+    success: bool
+    message: str
+    total: int
+    created: int
+    conflicts: int
+    results: List[BatchAppointmentResult] = Field(default_factory=list)
+
+
+@Mediator.handler
+class CreateAppointmentsBatchCommandHandler(
+    IRequestHandler[CreateAppointmentsBatchCommand, CreateAppointmentsBatchResponse]
+):
+    """
+    Manejador para el comando CreateAppointmentsBatchCommand.
+
+    Bloquea las agendas involucradas, verifica los conflictos de todo el lote contra
+    la base de datos en una sola consulta, resuelve los conflictos entre ítems del
+    mismo lote en memoria e inserta las citas válidas con una única llamada.
+    Todo ocurre en la transacción del request.
+    """
+
+    def __init__(self) -> None:
+        injector = injector_var.get()
+        self.appointment_repository: AppointmentRepository = injector.get(AppointmentRepository)  # type: ignore[type-abstract]
+
+    async def handle(
+        self, command: CreateAppointmentsBatchCommand
+    ) -> CreateAppointmentsBatchResponse:
+        appointments = [
+            NewAppointmentEntity(
+                location_id=item.location_id,
+                user_id=item.user_id,
+                service_id=item.service_id,
+                customer_id=item.customer_id,
+                status_maintable_id=item.status_maintable_id,
+                start_datetime=item.start_datetime,
+                end_datetime=item.end_datetime,
+            )
+            for item in command.items
+        ]
+
+        await AppointmentValidationUtils.lock_staff_schedules(
+            self.appointment_repository,
+            [(a.user_id, a.start_datetime, a.end_datetime) for a in appointments],
+        )
+
+        existing_conflicts = await self.appointment_repository.find_overlapping_appointments_bulk(
+            appointments
+        )
+
+        results: List[BatchAppointmentResult] = []
+        accepted: List[int] = []
+        # Citas ya aceptadas del lote por empleado, para detectar conflictos internos
+        accepted_by_user: Dict[int, List[int]] = defaultdict(list)
+        for index, appointment in enumerate(appointments):
+            conflict = existing_conflicts.get(index)
+            if conflict is not None:
+                results.append(
+                    BatchAppointmentResult(
+                        index=index,
+                        status=ITEM_CONFLICT,
+                        error=(
+                            f"Se superpone con la cita {conflict.appointment_id} de "
+                            f"'{conflict.user_name}' ({conflict.start_datetime.strftime('%Y-%m-%d %H:%M')} "
+                            f"- {conflict.end_datetime.strftime('%Y-%m-%d %H:%M')})"
+                        ),
+                    )
+                )
+                continue
+
+            sibling = next(
+                (
+                    other
+                    for other in accepted_by_user[appointment.user_id]
+                    if appointment.start_datetime < appointments[other].end_datetime
+                    and appointment.end_datetime > appointments[other].start_datetime
+                ),
+                None,
+            )
+            if sibling is not None:
+                results.append(
+                    BatchAppointmentResult(
+                        index=index,
+                        status=ITEM_CONFLICT,
+                        error=f"Se superpone con el ítem {sibling} del mismo lote",
+                    )
+                )
+                continue
+
+            accepted_by_user[appointment.user_id].append(index)
+            accepted.append(index)
+            results.append(BatchAppointmentResult(index=index, status=ITEM_CREATED))
+
+        conflicts = len(appointments) - len(accepted)
+        if command.atomic and conflicts:
+            for result in results:
+                if result.status == ITEM_CREATED:
+                    result.status = ITEM_SKIPPED
+                    result.error = "No se creó porque otros ítems del lote tienen conflictos"
+            return CreateAppointmentsBatchResponse(
+                success=False,
+                message=f"Lote rechazado: {conflicts} ítems con conflictos de horario",
+                total=len(appointments),
+                created=0,
+                conflicts=conflicts,
+                results=results,
+            )
+
+        new_ids = await self.appointment_repository.create_appointments_bulk(
+            appointments=[appointments[index] for index in accepted],
+            user_create=command.user_create,
+        )
+
+        for index, appointment_id in zip(accepted, new_ids):
+            results[index].appointment_id = appointment_id
+            appointment = appointments[index]
+            # Los suscriptores se ejecutan después del commit, fuera del request
+            publish_event(
+                AppointmentCreatedEvent(
+                    appointment_id=appointment_id,
+                    location_id=appointment.location_id,
+                    user_id=appointment.user_id,
+                    service_id=appointment.service_id,
+                    customer_id=appointment.customer_id,
+                    status_maintable_id=appointment.status_maintable_id,
+                    start_datetime=appointment.start_datetime,
+                    end_datetime=appointment.end_datetime,
+                    user_create=command.user_create,
+                )
+            )
+
+        return CreateAppointmentsBatchResponse(
+            success=conflicts == 0,
+            message=f"{len(new_ids)} citas creadas, {conflicts} con conflictos de horario",
+            total=len(appointments),
+            created=len(new_ids),
+            conflicts=conflicts,
+            results=results,
+        )
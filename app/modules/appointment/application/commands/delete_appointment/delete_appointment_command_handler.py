@@ -4,10 +4,12 @@ from mediatr import Mediator
 from pydantic import BaseModel
 
 from app.constants import injector_var
+from app.modules.appointment.domain.events import AppointmentDeletedEvent
 from app.modules.appointment.domain.repositories.appointment_repository import (
     AppointmentRepository,
 )
 from app.modules.share.domain.handler.request_handler import IRequestHandler
+from app.modules.share.infra.events import publish_event
 
 
 # --- Definición del Comando ---
@@ -60,6 +62,14 @@ class DeleteAppointmentCommandHandler(IRequestHandler[DeleteAppointmentCommand,
             user_modify=command.user_modify,
         )
 
+        # Los suscriptores se ejecutan después del commit, fuera del request
+        publish_event(
+            AppointmentDeletedEvent(
+                appointment_id=command.appointment_id,
+                user_modify=command.user_modify,
+            )
+        )
+
     async def _validate_appointment_exists(self, appointment_id: int) -> None:
         """
         Valida que la cita exista en la base de datos.
@@ -0,0 +1,66 @@
+from mediatr import Mediator
+from pydantic import BaseModel, Field
+
+from app.modules.appointment.application.services.appointment_series_service import (
+    OCCURRENCE_CREATED,
+    AppointmentSeriesService,
+)
+from app.modules.share.domain.handler.request_handler import IRequestHandler
+from config.setting import (
+    APPOINTMENT_SERIES_HORIZON_DAYS,
+    APPOINTMENT_SERIES_MATERIALIZE_BATCH,
+)
+
+
+class MaterializeAppointmentSeriesCommand(BaseModel):
+    """
+    Comando para extender las series de citas hasta el horizonte móvil.
+    Lo envía el scheduler periódicamente.
+    """
+
+    horizon_days: int = Field(default=APPOINTMENT_SERIES_HORIZON_DAYS, ge=1)
+    limit: int = Field(default=APPOINTMENT_SERIES_MATERIALIZE_BATCH, ge=1)
+    user_transaction: str = "scheduler"
+
+
+class MaterializeAppointmentSeriesResponse(BaseModel):
+    series: int
+    created: int
+    conflicts: int
+
+
+@Mediator.handler
+class MaterializeAppointmentSeriesCommandHandler(
+    IRequestHandler[MaterializeAppointmentSeriesCommand, MaterializeAppointmentSeriesResponse]
+):
+    """
+    Manejador para el comando MaterializeAppointmentSeriesCommand.
+
+    Reclama hasta 'limit' series con ocurrencias pendientes (las bloqueadas por otra
+    transacción se saltan) y crea sus citas en bloque. Las series que queden
+    pendientes se procesan en la siguiente ejecución.
+    """
+
+    def __init__(self) -> None:
+        self.series_service = AppointmentSeriesService()
+
+    async def handle(
+        self, command: MaterializeAppointmentSeriesCommand
+    ) -> MaterializeAppointmentSeriesResponse:
+        horizon = self.series_service.horizon(command.horizon_days)
+        series_list = await self.series_service.series_repository.claim_due_series(
+            horizon=horizon, limit=command.limit
+        )
+        if not series_list:
+            return MaterializeAppointmentSeriesResponse(series=0, created=0, conflicts=0)
+
+        materializations = await self.series_service.materialize(
+            series_list, horizon, command.user_transaction
+        )
+        occurrences = [o for m in materializations for o in m.occurrences]
+        created = sum(1 for o in occurrences if o.status == OCCURRENCE_CREATED)
+        return MaterializeAppointmentSeriesResponse(
+            series=len(series_list),
+            created=created,
+            conflicts=len(occurrences) - created,
+        )
@@ -0,0 +1,259 @@
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
+
+from mediatr import Mediator
+from pydantic import BaseModel, Field
+
+from app.constants import injector_var
+from app.modules.appointment.application.services.availability_service import (
+    AvailabilityService,
+    LocationOccupancy,
+)
+from app.modules.appointment.application.utils.appointment_validation_utils import (
+    AppointmentValidationUtils,
+)
+from app.modules.appointment.domain.entities.appointment_domain import (
+    AffectedAppointmentEntity,
+    NewAppointmentEntity,
+)
+from app.modules.appointment.domain.events import AppointmentUpdatedEvent
+from app.modules.appointment.domain.repositories.appointment_repository import (
+    AppointmentRepository,
+)
+from app.modules.share.domain.handler.request_handler import IRequestHandler
+from app.modules.share.infra.events import publish_event
+
+ITEM_REASSIGNED = "reassigned"
+ITEM_UNASSIGNED = "unassigned"
+
+
+class ReassignAppointmentsCommand(BaseModel):
+    """
+    Comando para mover varias citas a otro empleado disponible de su misma sede.
+    """
+
+    appointment_ids: List[int]
+    user_modify: str
+
+
+class ReassignmentResult(BaseModel):
+    """
+    Resultado de una cita, en el mismo orden de la solicitud.
+    """
+
+    appointment_id: int
+    status: str
+    previous_user_id: Optional[int] = None
+    new_user_id: Optional[int] = None
+    new_user_name: Optional[str] = None
+    error: Optional[str] = None
+
+
+class ReassignAppointmentsResponse(BaseModel):
+    """
+    Resumen de la reasignación masiva de citas.
+    """
+
+    total: int
+    reassigned: int
+    unassigned: int
+    results: List[ReassignmentResult] = Field(default_factory=list)
+
+
+@Mediator.handler
+class ReassignAppointmentsCommandHandler(
+    IRequestHandler[ReassignAppointmentsCommand, ReassignAppointmentsResponse]
+):
+    """
+    Manejador para el comando ReassignAppointmentsCommand.
+
+    Carga la ocupación de cada sede una sola vez para todo el rango de las citas y
+    elige en memoria, en orden de inicio, el empleado libre con menos citas
+    asignadas en esta operación. Luego bloquea las agendas de destino, vuelve a
+    verificar los conflictos contra la base de datos en una sola consulta y aplica
+    todos los cambios con un único UPDATE, en la transacción del request.
+    """
+
+    def __init__(self) -> None:
+        injector = injector_var.get()
+        self.appointment_repository: AppointmentRepository = injector.get(AppointmentRepository)  # type: ignore[type-abstract]
+        self.availability_service = AvailabilityService()
+
+    async def handle(
+        self, command: ReassignAppointmentsCommand
+    ) -> ReassignAppointmentsResponse:
+        requested_ids = list(dict.fromkeys(command.appointment_ids))
+        appointments = await self.appointment_repository.find_appointments_by_ids(requested_ids)
+        by_id = {appointment.appointment_id: appointment for appointment in appointments}
+
+        results: Dict[int, ReassignmentResult] = {
+            appointment_id: ReassignmentResult(
+                appointment_id=appointment_id,
+                status=ITEM_UNASSIGNED,
+                error="La cita no existe o está anulada",
+            )
+            for appointment_id in requested_ids
+            if appointment_id not in by_id
+        }
+
+        by_location: Dict[int, List[AffectedAppointmentEntity]] = defaultdict(list)
+        for appointment in appointments:
+            by_location[appointment.location_id].append(appointment)
+
+        chosen: Dict[int, int] = {}
+        staff_names: Dict[int, str] = {}
+        for location_id, location_appointments in by_location.items():
+            occupancy = await self._load_occupancy(location_id, location_appointments)
+            staff_names.update(occupancy.staff_names)
+            chosen.update(self._choose_staff(occupancy, location_appointments, results))
+
+        chosen = await self._discard_conflicts(chosen, by_id, staff_names, results)
+
+        updated = set(
+            await self.appointment_repository.reassign_appointments_bulk(
+                assignments=chosen, user_modify=command.user_modify
+            )
+        )
+
+        for appointment_id, new_user_id in chosen.items():
+            appointment = by_id[appointment_id]
+            if appointment_id not in updated:
+                results[appointment_id] = self._unassigned(
+                    appointment, "La cita fue anulada durante la reasignación"
+                )
+                continue
+
+            results[appointment_id] = ReassignmentResult(
+                appointment_id=appointment_id,
+                status=ITEM_REASSIGNED,
+                previous_user_id=appointment.user_id,
+                new_user_id=new_user_id,
+                new_user_name=staff_names.get(new_user_id),
+            )
+            # Los suscriptores se ejecutan después del commit, fuera del request
+            publish_event(
+                AppointmentUpdatedEvent(
+                    appointment_id=appointment_id,
+                    location_id=appointment.location_id,
+                    user_id=new_user_id,
+                    service_id=appointment.service_id,
+                    customer_id=appointment.customer_id,
+                    status_maintable_id=appointment.status_maintable_id,
+                    start_datetime=appointment.start_datetime,
+                    end_datetime=appointment.end_datetime,
+                    user_modify=command.user_modify,
+                    previous_status_maintable_id=appointment.status_maintable_id,
+                )
+            )
+
+        ordered = [results[appointment_id] for appointment_id in requested_ids]
+        reassigned = sum(1 for result in ordered if result.status == ITEM_REASSIGNED)
+        return ReassignAppointmentsResponse(
+            total=len(ordered),
+            reassigned=reassigned,
+            unassigned=len(ordered) - reassigned,
+            results=ordered,
+        )
+
+    async def _load_occupancy(
+        self, location_id: int, appointments: List[AffectedAppointmentEntity]
+    ) -> LocationOccupancy:
+        """Ocupación del personal de la sede entre la primera y la última cita."""
+        starts = [self.availability_service.to_local(a.start_datetime) for a in appointments]
+        ends = [self.availability_service.to_local(a.end_datetime) for a in appointments]
+        schedules = await self.availability_service.get_location_schedules(location_id)
+        return await self.availability_service.load_occupancy(
+            location_id=location_id,
+            schedules=schedules,
+            start_date=min(starts).date(),
+            end_date=max(ends).date(),
+        )
+
+    def _choose_staff(
+        self,
+        occupancy: LocationOccupancy,
+        appointments: List[AffectedAppointmentEntity],
+        results: Dict[int, ReassignmentResult],
+    ) -> Dict[int, int]:
+        """
+        Elige un empleado para cada cita de la sede. Cada asignación se reserva en el
+        índice, así dos citas del mismo pedido no terminan superpuestas.
+        """
+        chosen: Dict[int, int] = {}
+        load: Counter[int] = Counter()
+        for appointment in sorted(appointments, key=lambda a: a.start_datetime):
+            start = self.availability_service.to_local(appointment.start_datetime)
+            end = self.availability_service.to_local(appointment.end_datetime)
+            candidates = [
+                user_id
+                for user_id in occupancy.staff_names
+                if user_id != appointment.user_id
+                and occupancy.index.is_free(user_id, start, end)
+            ]
+            if not candidates:
+                results[appointment.appointment_id] = self._unassigned(
+                    appointment, "No hay otro empleado disponible en la sede para ese horario"
+                )
+                continue
+
+            new_user_id = min(candidates, key=lambda user_id: (load[user_id], user_id))
+            occupancy.index.move(appointment.user_id, (start, end), new_user_id, (start, end))
+            load[new_user_id] += 1
+            chosen[appointment.appointment_id] = new_user_id
+        return chosen
+
+    async def _discard_conflicts(
+        self,
+        chosen: Dict[int, int],
+        by_id: Dict[int, AffectedAppointmentEntity],
+        staff_names: Dict[int, str],
+        results: Dict[int, ReassignmentResult],
+    ) -> Dict[int, int]:
+        """
+        Bloquea las agendas de destino y descarta las asignaciones que chocan con
+        citas registradas después de cargar la ocupación.
+        """
+        if not chosen:
+            return chosen
+
+        pending = [
+            NewAppointmentEntity(
+                location_id=by_id[appointment_id].location_id,
+                user_id=new_user_id,
+                service_id=by_id[appointment_id].service_id,
+                customer_id=by_id[appointment_id].customer_id,
+                status_maintable_id=by_id[appointment_id].status_maintable_id,
+                start_datetime=by_id[appointment_id].start_datetime,
+                end_datetime=by_id[appointment_id].end_datetime,
+            )
+            for appointment_id, new_user_id in chosen.items()
+        ]
+        await AppointmentValidationUtils.lock_staff_schedules(
+            self.appointment_repository,
+            [(a.user_id, a.start_datetime, a.end_datetime) for a in pending],
+        )
+        conflicts = await self.appointment_repository.find_overlapping_appointments_bulk(pending)
+
+        accepted: Dict[int, int] = {}
+        for index, (appointment_id, new_user_id) in enumerate(chosen.items()):
+            conflict = conflicts.get(index)
+            if conflict is None:
+                accepted[appointment_id] = new_user_id
+                continue
+            results[appointment_id] = self._unassigned(
+                by_id[appointment_id],
+                f"'{staff_names.get(new_user_id, new_user_id)}' tiene la cita "
+                f"{conflict.appointment_id} en ese horario",
+            )
+        return accepted
+
+    @staticmethod
+    def _unassigned(
+        appointment: AffectedAppointmentEntity, error: str
+    ) -> ReassignmentResult:
+        return ReassignmentResult(
+            appointment_id=appointment.appointment_id,
+            status=ITEM_UNASSIGNED,
+            previous_user_id=appointment.user_id,
+            error=error,
+        )
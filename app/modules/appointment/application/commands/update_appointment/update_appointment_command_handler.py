@@ -9,10 +9,12 @@ from app.constants import injector_var
 from app.modules.appointment.application.utils.appointment_validation_utils import (
     AppointmentValidationUtils,
 )
+from app.modules.appointment.domain.events import AppointmentUpdatedEvent
 from app.modules.appointment.domain.repositories.appointment_repository import (
     AppointmentRepository,
 )
 from app.modules.share.domain.handler.request_handler import IRequestHandler
+from app.modules.share.infra.events import publish_event
 
 
 # --- Definición del Comando ---
@@ -74,6 +76,16 @@ class UpdateAppointmentCommandHandler(IRequestHandler[UpdateAppointmentCommand,
         Raises:
             ValueError: Si ya existe una cita en conflicto con las fechas especificadas.
         """
+        # Serializa las reservas concurrentes del mismo empleado y día: el lock se
+        # mantiene hasta el commit, así que ninguna otra reserva puede colarse entre
+        # la validación y la escritura
+        await AppointmentValidationUtils.lock_staff_schedule(
+            appointment_repository=self.appointment_repository,
+            user_id=command.user_id,
+            start_datetime=command.start_datetime,
+            end_datetime=command.end_datetime,
+        )
+
         # Validar que no exista conflicto de fechas antes de actualizar
         # Se excluye la cita actual del chequeo de conflictos
         await AppointmentValidationUtils.validate_no_conflicting_appointments(
@@ -84,6 +96,12 @@ class UpdateAppointmentCommandHandler(IRequestHandler[UpdateAppointmentCommand,
             exclude_appointment_id=command.appointment_id,
         )
 
+        # Estado previo para que los suscriptores distingan los cambios de estado
+        current = await self.appointment_repository.find_appointments_by_ids(
+            [command.appointment_id]
+        )
+        previous_status = current[0].status_maintable_id if current else None
+
         # Delega la lógica de actualización al método update_appointment del repositorio
         # Pasa los datos recibidos en el comando al método del repositorio
         await self.appointment_repository.update_appointment(
@@ -97,3 +115,19 @@ class UpdateAppointmentCommandHandler(IRequestHandler[UpdateAppointmentCommand,
             end_datetime=command.end_datetime,
             user_modify=command.user_modify,
         )
+
+        # Los suscriptores se ejecutan después del commit, fuera del request
+        publish_event(
+            AppointmentUpdatedEvent(
+                appointment_id=command.appointment_id,
+                location_id=command.location_id,
+                user_id=command.user_id,
+                service_id=command.service_id,
+                customer_id=command.customer_id,
+                status_maintable_id=command.status_maintable_id,
+                start_datetime=command.start_datetime,
+                end_datetime=command.end_datetime,
+                user_modify=command.user_modify,
+                previous_status_maintable_id=previous_status,
+            )
+        )
@@ -0,0 +1,100 @@
+from datetime import date, time
+from typing import List, Optional
+
+from mediatr import Mediator
+from pydantic import BaseModel
+
+from app.modules.appointment.application.commands.create_appointment_series.create_appointment_series_command_handler import (
+    AppointmentSeriesResponse,
+)
+from app.modules.appointment.application.services.appointment_series_service import (
+    AppointmentSeriesService,
+)
+from app.modules.appointment.application.utils.recurrence_utils import is_occurrence
+from app.modules.appointment.domain.entities.appointment_series_domain import (
+    RecurrenceFrequency,
+)
+from app.modules.share.domain.handler.request_handler import IRequestHandler
+
+
+class UpdateAppointmentSeriesFollowingCommand(BaseModel):
+    """
+    Comando para modificar una serie desde una de sus ocurrencias
+    ("esta y las siguientes"). Los campos no enviados conservan el valor de la serie.
+    """
+
+    series_id: int
+    from_date: date
+    user_id: Optional[int] = None
+    service_id: Optional[int] = None
+    status_maintable_id: Optional[int] = None
+    frequency: Optional[RecurrenceFrequency] = None
+    repeat_interval: Optional[int] = None
+    start_date: Optional[date] = None
+    start_time: Optional[time] = None
+    duration_minutes: Optional[int] = None
+    until_date: Optional[date] = None
+    user_modify: str
+
+
+class UpdateAppointmentSeriesFollowingResponse(AppointmentSeriesResponse):
+    previous_series_id: int
+    annulled_appointment_ids: List[int]
+
+
+@Mediator.handler
+class UpdateAppointmentSeriesFollowingCommandHandler(
+    IRequestHandler[UpdateAppointmentSeriesFollowingCommand, UpdateAppointmentSeriesFollowingResponse]
+):
+    """
+    Manejador para el comando UpdateAppointmentSeriesFollowingCommand.
+
+    La serie original termina el día anterior a from_date y se anulan solo sus citas
+    desde esa fecha; el resto se registra como una serie nueva con los cambios, que
+    se materializa hasta el horizonte en la misma transacción.
+    """
+
+    def __init__(self) -> None:
+        self.series_service = AppointmentSeriesService()
+
+    async def handle(
+        self, command: UpdateAppointmentSeriesFollowingCommand
+    ) -> UpdateAppointmentSeriesFollowingResponse:
+        series = await self.series_service.get_series(command.series_id)
+        if not is_occurrence(series, command.from_date):
+            raise ValueError(
+                f"La serie {series.series_id} no tiene una cita el {command.from_date.isoformat()}"
+            )
+        start_date = command.start_date or command.from_date
+        if start_date < command.from_date:
+            raise ValueError("La nueva fecha de inicio no puede ser anterior a la cita modificada")
+
+        annulled = await self.series_service.truncate(
+            series, command.from_date, command.user_modify
+        )
+
+        new_series_id = await self.series_service.series_repository.create_series(
+            location_id=series.location_id,
+            user_id=command.user_id or series.user_id,
+            service_id=command.service_id or series.service_id,
+            customer_id=series.customer_id,
+            status_maintable_id=command.status_maintable_id or series.status_maintable_id,
+            frequency=command.frequency or series.frequency,
+            repeat_interval=command.repeat_interval or series.repeat_interval,
+            start_date=start_date,
+            start_time=command.start_time or series.start_time,
+            duration_minutes=command.duration_minutes or series.duration_minutes,
+            until_date=command.until_date if command.until_date is not None else series.until_date,
+            user_create=command.user_modify,
+        )
+        new_series = await self.series_service.get_series(new_series_id)
+        materializations = await self.series_service.materialize(
+            [new_series], self.series_service.horizon(), command.user_modify
+        )
+
+        response = AppointmentSeriesResponse.from_materialization(materializations[0])
+        return UpdateAppointmentSeriesFollowingResponse(
+            **response.model_dump(),
+            previous_series_id=series.series_id,
+            annulled_appointment_ids=annulled,
+        )
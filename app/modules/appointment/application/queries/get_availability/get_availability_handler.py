@@ -0,0 +1,121 @@
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+from mediatr import Mediator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+
+from app.modules.appointment.application.services.availability_service import (
+    AvailabilityService,
+)
+from app.modules.appointment.application.utils.interval_utils import split_into_slots
+from app.modules.share.domain.handler.request_handler import IRequestHandler
+from config.setting import AVAILABILITY_MAX_RANGE_DAYS, AVAILABILITY_SLOT_STEP_MINUTES
+
+
+class GetAvailabilityQuery(BaseModel):
+    """
+    Query para obtener los horarios libres donde se puede reservar un servicio.
+    """
+    location_id: int = Field(..., gt=0, description="ID de la sede")
+    service_id: int = Field(..., gt=0, description="ID del servicio a reservar")
+    start_date: date = Field(..., description="Primer día del rango (YYYY-MM-DD)")
+    end_date: date = Field(..., description="Último día del rango, inclusive (YYYY-MM-DD)")
+    user_id: Optional[int] = Field(
+        default=None, gt=0, description="ID del empleado (opcional, por defecto todos)"
+    )
+    step_minutes: int = Field(
+        default=AVAILABILITY_SLOT_STEP_MINUTES,
+        ge=5,
+        le=240,
+        description="Minutos entre el inicio de un slot y el siguiente",
+    )
+
+    @field_validator("end_date")
+    @classmethod
+    def validate_date_range(cls, v: date, info: ValidationInfo) -> date:
+        start_date = info.data.get("start_date")
+        if start_date is not None:
+            if v < start_date:
+                raise ValueError("end_date debe ser igual o posterior a start_date")
+            if (v - start_date).days + 1 > AVAILABILITY_MAX_RANGE_DAYS:
+                raise ValueError(
+                    f"El rango no puede superar {AVAILABILITY_MAX_RANGE_DAYS} días"
+                )
+        return v
+
+
+class AvailabilitySlot(BaseModel):
+    start: datetime
+    end: datetime
+
+
+class StaffAvailability(BaseModel):
+    user_id: int
+    user_name: str
+    slots: List[AvailabilitySlot]
+
+
+class GetAvailabilityResponse(BaseModel):
+    location_id: int
+    service_id: int
+    duration_minutes: float
+    start_date: date
+    end_date: date
+    staff: List[StaffAvailability]
+
+
+@Mediator.handler
+class GetAvailabilityQueryHandler(
+    IRequestHandler[GetAvailabilityQuery, GetAvailabilityResponse]
+):
+    """
+    Calcula la disponibilidad en el servidor:
+    turnos - días libres - citas, recortado al horario de atención de la sede.
+
+    Turnos, días libres y citas se cargan en bloque en un OccupancyIndex (máscaras
+    de bits de 5 minutos por empleado y día) y los tramos libres se leen de ahí.
+    """
+
+    def __init__(self) -> None:
+        self.availability_service = AvailabilityService()
+
+    async def handle(self, query: GetAvailabilityQuery) -> GetAvailabilityResponse:
+        schedules = await self.availability_service.get_location_schedules(query.location_id)
+        duration_minutes = await self.availability_service.get_service_duration(
+            query.location_id, query.service_id
+        )
+
+        occupancy = await self.availability_service.load_occupancy(
+            location_id=query.location_id,
+            schedules=schedules,
+            start_date=query.start_date,
+            end_date=query.end_date,
+            user_id=query.user_id,
+        )
+
+        duration = timedelta(minutes=duration_minutes)
+        step = timedelta(minutes=query.step_minutes)
+        days = [
+            query.start_date + timedelta(days=offset)
+            for offset in range((query.end_date - query.start_date).days + 1)
+        ]
+
+        staff: List[StaffAvailability] = []
+        for user_id, user_name in occupancy.staff_names.items():
+            slots: List[AvailabilitySlot] = []
+            for day in days:
+                free = occupancy.index.free_ranges(user_id, day)
+                slots.extend(
+                    AvailabilitySlot(start=start, end=end)
+                    for start, end in split_into_slots(free, duration, step)
+                )
+            staff.append(StaffAvailability(user_id=user_id, user_name=user_name, slots=slots))
+
+        return GetAvailabilityResponse(
+            location_id=query.location_id,
+            service_id=query.service_id,
+            duration_minutes=duration_minutes,
+            start_date=query.start_date,
+            end_date=query.end_date,
+            staff=staff,
+        )
@@ -0,0 +1,143 @@
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+
+from mediatr import Mediator
+from pydantic import BaseModel, Field
+
+from app.modules.appointment.application.services.availability_service import (
+    AvailabilityService,
+    LocationOccupancy,
+)
+from app.modules.share.domain.handler.request_handler import IRequestHandler
+from config.setting import (
+    AVAILABILITY_NEXT_CHUNK_DAYS,
+    AVAILABILITY_NEXT_MAX_DAYS,
+    AVAILABILITY_SLOT_STEP_MINUTES,
+)
+
+
+class GetNextAvailableQuery(BaseModel):
+    """
+    Query para obtener los próximos horarios libres de un servicio con cualquier
+    empleado de la sede.
+    """
+    location_id: int = Field(..., gt=0, description="ID de la sede")
+    service_id: int = Field(..., gt=0, description="ID del servicio a reservar")
+    after: Optional[datetime] = Field(
+        default=None,
+        description="Buscar a partir de esta fecha y hora (por defecto, ahora)",
+    )
+    limit: int = Field(default=5, ge=1, le=50, description="Cantidad de horarios a devolver")
+
+
+class NextAvailableSlot(BaseModel):
+    user_id: int
+    user_name: str
+    start: datetime
+    end: datetime
+
+
+class GetNextAvailableResponse(BaseModel):
+    location_id: int
+    service_id: int
+    duration_minutes: float
+    after: datetime
+    slots: List[NextAvailableSlot]
+
+
+@Mediator.handler
+class GetNextAvailableQueryHandler(
+    IRequestHandler[GetNextAvailableQuery, GetNextAvailableResponse]
+):
+    """
+    Busca los primeros horarios libres recorriendo los días en orden y, en cada día,
+    a todo el personal de la sede a la vez sobre su índice de ocupación.
+
+    La ocupación se carga por bloques de AVAILABILITY_NEXT_CHUNK_DAYS días (tres
+    consultas por bloque) y la búsqueda se corta en cuanto se completan los horarios
+    pedidos. Los días sin turno no tienen entrada en el índice y se saltan sin costo.
+    """
+
+    def __init__(self) -> None:
+        self.availability_service = AvailabilityService()
+
+    async def handle(self, query: GetNextAvailableQuery) -> GetNextAvailableResponse:
+        after = (
+            self.availability_service.to_local(query.after)
+            if query.after is not None
+            else self.availability_service.now()
+        )
+        schedules = await self.availability_service.get_location_schedules(query.location_id)
+        duration_minutes = await self.availability_service.get_service_duration(
+            query.location_id, query.service_id
+        )
+
+        slots: List[NextAvailableSlot] = []
+        horizon_end = after.date() + timedelta(days=AVAILABILITY_NEXT_MAX_DAYS - 1)
+        chunk_start = after.date()
+        while chunk_start <= horizon_end and len(slots) < query.limit:
+            chunk_end = min(
+                chunk_start + timedelta(days=max(1, AVAILABILITY_NEXT_CHUNK_DAYS) - 1),
+                horizon_end,
+            )
+            occupancy = await self.availability_service.load_occupancy(
+                location_id=query.location_id,
+                schedules=schedules,
+                start_date=chunk_start,
+                end_date=chunk_end,
+            )
+
+            day = chunk_start
+            while day <= chunk_end and len(slots) < query.limit:
+                slots.extend(
+                    self._earliest_in_day(
+                        occupancy, day, duration_minutes, after, query.limit - len(slots)
+                    )
+                )
+                day += timedelta(days=1)
+            chunk_start = chunk_end + timedelta(days=1)
+
+        return GetNextAvailableResponse(
+            location_id=query.location_id,
+            service_id=query.service_id,
+            duration_minutes=duration_minutes,
+            after=after,
+            slots=slots,
+        )
+
+    @staticmethod
+    def _earliest_in_day(
+        occupancy: LocationOccupancy,
+        day: date,
+        duration_minutes: float,
+        after: datetime,
+        limit: int,
+    ) -> List[NextAvailableSlot]:
+        """
+        Los 'limit' horarios libres más tempranos del día entre todo el personal.
+        De cada empleado basta con sus 'limit' primeros horarios.
+        """
+        duration = timedelta(minutes=duration_minutes)
+        step = timedelta(minutes=AVAILABILITY_SLOT_STEP_MINUTES)
+        not_before = after if day == after.date() else None
+
+        candidates: List[Tuple[datetime, int]] = []
+        for user_id in occupancy.staff_names:
+            cursor = not_before
+            for _ in range(limit):
+                start = occupancy.index.first_free(user_id, day, duration_minutes, cursor)
+                if start is None:
+                    break
+                candidates.append((start, user_id))
+                cursor = start + step
+
+        candidates.sort()
+        return [
+            NextAvailableSlot(
+                user_id=user_id,
+                user_name=occupancy.staff_names[user_id],
+                start=start,
+                end=start + duration,
+            )
+            for start, user_id in candidates[:limit]
+        ]
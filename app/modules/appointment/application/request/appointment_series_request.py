@@ -0,0 +1,98 @@
+from datetime import date, time
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+
+from app.modules.appointment.domain.entities.appointment_series_domain import (
+    RecurrenceFrequency,
+)
+
+
+class CreateAppointmentSeriesRequest(BaseModel):
+    """
+    Modelo Pydantic para la solicitud de creación de una serie de citas repetidas.
+    """
+
+    # --- Campos del Modelo ---
+    location_id: int = Field(..., description="ID de la ubicación de las citas", gt=0)
+    user_id: int = Field(..., description="ID del empleado asignado", gt=0)
+    service_id: int = Field(..., description="ID del servicio a realizar", gt=0)
+    customer_id: int = Field(..., description="ID del cliente", gt=0)
+    status_maintable_id: int = Field(
+        ..., description="ID del estado inicial de cada cita", gt=0
+    )
+    frequency: RecurrenceFrequency = Field(..., description="DAILY o WEEKLY")
+    repeat_interval: int = Field(
+        default=1, description="Cada cuántos días o semanas se repite", ge=1, le=52
+    )
+    start_date: date = Field(..., description="Fecha de la primera cita")
+    start_time: time = Field(..., description="Hora de inicio de cada cita")
+    duration_minutes: int = Field(..., description="Duración de cada cita", gt=0, le=1440)
+    until_date: Optional[date] = Field(
+        default=None, description="Fecha de la última cita posible (sin fin si se omite)"
+    )
+
+    # --- Validadores de Campo ---
+
+    @field_validator("until_date")
+    def validate_until_date(cls, v: Optional[date], info: ValidationInfo) -> Optional[date]:
+        """
+        Valida que until_date no sea anterior a start_date.
+        """
+        start_date = info.data.get("start_date")
+        if v is not None and start_date and v < start_date:
+            raise ValueError("until_date no puede ser anterior a start_date")
+        return v
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "location_id": 1,
+                "user_id": 25,
+                "service_id": 3,
+                "customer_id": 15,
+                "status_maintable_id": 1,
+                "frequency": "WEEKLY",
+                "repeat_interval": 2,
+                "start_date": "2025-12-05",
+                "start_time": "10:00:00",
+                "duration_minutes": 60,
+                "until_date": "2026-06-30",
+            }
+        },
+        extra="forbid",
+    )
+
+
+class UpdateAppointmentSeriesFollowingRequest(BaseModel):
+    """
+    Modelo Pydantic para modificar una serie desde una de sus citas
+    ("esta y las siguientes"). Los campos omitidos conservan el valor de la serie.
+    """
+
+    # --- Campos del Modelo ---
+    from_date: date = Field(
+        ..., description="Fecha de la cita desde la que aplica el cambio (hoy o posterior)"
+    )
+    user_id: Optional[int] = Field(default=None, description="Nuevo empleado asignado", gt=0)
+    service_id: Optional[int] = Field(default=None, description="Nuevo servicio", gt=0)
+    status_maintable_id: Optional[int] = Field(default=None, description="Nuevo estado", gt=0)
+    frequency: Optional[RecurrenceFrequency] = Field(default=None, description="DAILY o WEEKLY")
+    repeat_interval: Optional[int] = Field(default=None, ge=1, le=52)
+    start_date: Optional[date] = Field(
+        default=None,
+        description="Nueva fecha de la primera cita, para mover el día (por defecto, from_date)",
+    )
+    start_time: Optional[time] = Field(default=None, description="Nueva hora de inicio")
+    duration_minutes: Optional[int] = Field(default=None, gt=0, le=1440)
+    until_date: Optional[date] = Field(default=None, description="Nueva fecha de fin")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "from_date": "2026-01-16",
+                "start_time": "11:00:00",
+            }
+        },
+        extra="forbid",
+    )
@@ -0,0 +1,56 @@
+from typing import List
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.modules.appointment.application.request.create_appointment_request import (
+    CreateAppointmentRequest,
+)
+from config.setting import APPOINTMENTS_BATCH_MAX_ITEMS
+
+
+class CreateAppointmentsBatchRequest(BaseModel):
+    """
+    Modelo Pydantic para la solicitud de creación de varias citas en un solo llamado.
+    Cada ítem se valida igual que en la creación individual.
+    """
+
+    # --- Campos del Modelo ---
+    items: List[CreateAppointmentRequest] = Field(
+        ...,
+        description="Citas a crear",
+        min_length=1,
+        max_length=APPOINTMENTS_BATCH_MAX_ITEMS,
+    )
+    atomic: bool = Field(
+        default=False,
+        description="Si es true, basta un ítem con conflicto para que no se cree ninguna cita",
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [
+                    {
+                        "location_id": 1,
+                        "user_id": 25,
+                        "service_id": 3,
+                        "customer_id": 15,
+                        "status_maintable_id": 1,
+                        "start_datetime": "2025-12-25T10:00:00",
+                        "end_datetime": "2025-12-25T11:00:00",
+                    },
+                    {
+                        "location_id": 1,
+                        "user_id": 25,
+                        "service_id": 3,
+                        "customer_id": 16,
+                        "status_maintable_id": 1,
+                        "start_datetime": "2025-12-25T11:00:00",
+                        "end_datetime": "2025-12-25T12:00:00",
+                    },
+                ],
+                "atomic": False,
+            }
+        },
+        extra="forbid",
+    )
@@ -0,0 +1,25 @@
+from typing import List
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from config.setting import APPOINTMENTS_BATCH_MAX_ITEMS
+
+
+class ReassignAppointmentsRequest(BaseModel):
+    """
+    Modelo Pydantic para la solicitud de reasignación de varias citas a otro
+    empleado disponible de su misma sede.
+    """
+
+    # --- Campos del Modelo ---
+    appointment_ids: List[int] = Field(
+        ...,
+        description="IDs de las citas a reasignar",
+        min_length=1,
+        max_length=APPOINTMENTS_BATCH_MAX_ITEMS,
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"appointment_ids": [120, 121, 135]}},
+        extra="forbid",
+    )
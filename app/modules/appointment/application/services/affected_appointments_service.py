@@ -0,0 +1,135 @@
+"""
+Citas afectadas por un cambio en la disponibilidad del personal.
+
+Los comandos de días libres y turnos consultan, en la misma transacción del cambio,
+qué citas activas del empleado quedaron fuera de su disponibilidad y las informan en
+su respuesta, para reasignarlas con POST /appointments/reassign.
+"""
+
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.constants import injector_var
+from app.modules.appointment.domain.entities.appointment_domain import (
+    AffectedAppointmentEntity,
+)
+from app.modules.appointment.domain.repositories.appointment_repository import (
+    AppointmentRepository,
+)
+
+
+class AffectedAppointmentResponse(BaseModel):
+    appointment_id: int
+    location_id: int
+    user_id: int
+    user_name: str
+    service_id: int
+    customer_id: int
+    customer_name: str
+    start_datetime: datetime
+    end_datetime: datetime
+    reason: Optional[str] = None
+
+    @classmethod
+    def from_entity(cls, entity: AffectedAppointmentEntity) -> "AffectedAppointmentResponse":
+        return cls(
+            appointment_id=entity.appointment_id,
+            location_id=entity.location_id,
+            user_id=entity.user_id,
+            user_name=entity.user_name,
+            service_id=entity.service_id,
+            customer_id=entity.customer_id,
+            customer_name=entity.customer_name,
+            start_datetime=entity.start_datetime,
+            end_datetime=entity.end_datetime,
+            reason=entity.reason,
+        )
+
+
+class AvailabilityChangeResponse(BaseModel):
+    """
+    Resultado de crear o modificar un día libre o un turno: el mensaje del stored
+    procedure y las citas del empleado que ya no puede atender.
+    """
+    message: str
+    affected_appointments: List[AffectedAppointmentResponse] = Field(default_factory=list)
+
+
+class AffectedAppointmentsService:
+    """
+    Servicio de aplicación que busca las citas afectadas por un cambio de
+    disponibilidad con una consulta indexada por empleado y rango de días.
+    """
+
+    def __init__(self) -> None:
+        injector = injector_var.get()
+        self.appointment_repository: AppointmentRepository = injector.get(AppointmentRepository)  # type: ignore[type-abstract]
+
+    async def build_response(
+        self,
+        message: str,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        location_id: Optional[int] = None,
+    ) -> AvailabilityChangeResponse:
+        """
+        Arma la respuesta del comando con las citas del empleado en [start_date, end_date]
+        que se superponen con un día libre o no están cubiertas por un turno.
+
+        Args:
+            message: Mensaje devuelto por el stored procedure del cambio.
+            user_id: ID del empleado.
+            start_date: Primer día afectado por el cambio.
+            end_date: Último día afectado por el cambio, inclusive.
+            location_id: Limita la búsqueda a una sede (cambios de turno).
+        """
+        affected = await self.appointment_repository.find_unavailable_appointments(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            location_id=location_id,
+        )
+        return AvailabilityChangeResponse(
+            message=message,
+            affected_appointments=[AffectedAppointmentResponse.from_entity(a) for a in affected],
+        )
+
+    async def build_response_for_days(
+        self,
+        message: str,
+        user_id: int,
+        days: Iterable[date],
+        location_id: Optional[int] = None,
+    ) -> AvailabilityChangeResponse:
+        """
+        Igual que build_response, pero consulta cada día por separado. Se usa cuando el
+        cambio toca días no contiguos (un turno que se mueve de fecha): los días entre
+        ambas fechas no cambiaron y no deben informarse.
+
+        Args:
+            message: Mensaje devuelto por el stored procedure del cambio.
+            user_id: ID del empleado.
+            days: Días afectados por el cambio; los repetidos se consultan una vez.
+            location_id: Limita la búsqueda a una sede (cambios de turno).
+        """
+        # Una cita que cruza la medianoche puede aparecer en dos días consecutivos
+        affected: Dict[int, AffectedAppointmentEntity] = {}
+        for day in sorted(set(days)):
+            for appointment in await self.appointment_repository.find_unavailable_appointments(
+                user_id=user_id,
+                start_date=day,
+                end_date=day,
+                location_id=location_id,
+            ):
+                affected.setdefault(appointment.appointment_id, appointment)
+
+        return AvailabilityChangeResponse(
+            message=message,
+            affected_appointments=[
+                AffectedAppointmentResponse.from_entity(a)
+                for a in sorted(affected.values(), key=lambda a: a.start_datetime)
+            ],
+        )
@@ -0,0 +1,266 @@
+"""
+Materialización y corte de series de citas repetidas.
+
+Las citas de una serie no se crean todas al darla de alta: se crean por adelantado
+solo hasta un horizonte móvil (hoy + APPOINTMENT_SERIES_HORIZON_DAYS) y un job
+periódico va extendiendo ese horizonte. Nunca se crean citas en días ya pasados: si
+el job estuvo detenido, la serie continúa desde hoy.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Tuple
+from zoneinfo import ZoneInfo
+
+from app.constants import injector_var
+from app.modules.appointment.application.utils.appointment_validation_utils import (
+    AppointmentValidationUtils,
+)
+from app.modules.appointment.application.utils.recurrence_utils import (
+    expand_occurrences,
+)
+from app.modules.appointment.domain.entities.appointment_domain import (
+    NewAppointmentEntity,
+)
+from app.modules.appointment.domain.entities.appointment_series_domain import (
+    AppointmentSeriesEntity,
+    SeriesOccurrenceEntity,
+)
+from app.modules.appointment.domain.events import (
+    AppointmentCreatedEvent,
+    AppointmentDeletedEvent,
+)
+from app.modules.appointment.domain.repositories.appointment_repository import (
+    AppointmentRepository,
+)
+from app.modules.appointment.domain.repositories.appointment_series_repository import (
+    AppointmentSeriesRepository,
+)
+from app.modules.share.infra.events import publish_event
+from config.setting import (
+    APPOINTMENT_SERIES_HORIZON_DAYS,
+    AVAILABILITY_TIMEZONE,
+    SCHEDULER_SERIES_ENABLED,
+    SCHEDULER_SERIES_INTERVAL,
+)
+
+OCCURRENCE_CREATED = "created"
+OCCURRENCE_CONFLICT = "conflict"
+
+
+@dataclass
+class SeriesMaterialization:
+    """Ocurrencias creadas o rechazadas de una serie en una materialización."""
+    series_id: int
+    materialized_until: date
+    occurrences: List[SeriesOccurrenceEntity] = field(default_factory=list)
+
+
+class AppointmentSeriesService:
+    """
+    Servicio de aplicación compartido por los comandos de series de citas.
+    """
+
+    def __init__(self) -> None:
+        injector = injector_var.get()
+        self.appointment_repository: AppointmentRepository = injector.get(AppointmentRepository)  # type: ignore[type-abstract]
+        self.series_repository: AppointmentSeriesRepository = injector.get(AppointmentSeriesRepository)  # type: ignore[type-abstract]
+        self.timezone = ZoneInfo(AVAILABILITY_TIMEZONE)
+
+    def today(self) -> date:
+        """Día actual en hora local del negocio."""
+        return datetime.now(self.timezone).date()
+
+    def horizon(self, days: int = APPOINTMENT_SERIES_HORIZON_DAYS) -> date:
+        """Último día, en hora local, hasta el que se crean citas por adelantado."""
+        return self.today() + timedelta(days=days)
+
+    @staticmethod
+    def materialization_job_enabled() -> bool:
+        """Indica si el job periódico que extiende el horizonte de las series está activo."""
+        return SCHEDULER_SERIES_ENABLED and SCHEDULER_SERIES_INTERVAL > 0
+
+    async def materialize(
+        self,
+        series_list: List[AppointmentSeriesEntity],
+        horizon: date,
+        user_create: str,
+    ) -> List[SeriesMaterialization]:
+        """
+        Crea las citas de las series desde su último día materializado hasta el
+        horizonte. Las series deben estar bloqueadas por la transacción actual
+        (claim_due_series o get_series_for_update).
+
+        Todas las ocurrencias de todas las series se verifican con una sola consulta
+        de conflictos y se insertan con una sola llamada. Una ocurrencia en conflicto
+        se registra como tal y no se reintenta. La ventana empieza como mínimo hoy.
+
+        Args:
+            series_list: Series a materializar.
+            horizon: Último día a materializar.
+            user_create: Usuario que registra las citas.
+
+        Returns:
+            List[SeriesMaterialization]: Resultado por serie, en el mismo orden.
+        """
+        today = self.today()
+        materializations: List[SeriesMaterialization] = []
+        pending: List[Tuple[SeriesOccurrenceEntity, NewAppointmentEntity]] = []
+        for series in series_list:
+            window_start = (
+                series.materialized_until + timedelta(days=1)
+                if series.materialized_until is not None
+                else series.start_date
+            )
+            # Sin relleno hacia atrás: los días anteriores a hoy se dan por materializados
+            window_start = max(window_start, today)
+            window_end = horizon if series.until_date is None else min(horizon, series.until_date)
+            materialization = SeriesMaterialization(
+                series_id=series.series_id, materialized_until=window_end
+            )
+            for day in expand_occurrences(series, window_start, window_end):
+                start = datetime.combine(day, series.start_time)
+                occurrence = SeriesOccurrenceEntity(occurrence_date=day, status=OCCURRENCE_CREATED)
+                materialization.occurrences.append(occurrence)
+                pending.append(
+                    (
+                        occurrence,
+                        NewAppointmentEntity(
+                            location_id=series.location_id,
+                            user_id=series.user_id,
+                            service_id=series.service_id,
+                            customer_id=series.customer_id,
+                            status_maintable_id=series.status_maintable_id,
+                            start_datetime=start,
+                            end_datetime=start + timedelta(minutes=series.duration_minutes),
+                        ),
+                    )
+                )
+            materializations.append(materialization)
+
+        if pending:
+            await self._create_occurrences(pending, user_create)
+
+        for materialization in materializations:
+            await self.series_repository.register_occurrences(
+                series_id=materialization.series_id,
+                occurrences=materialization.occurrences,
+                materialized_until=materialization.materialized_until,
+            )
+        return materializations
+
+    async def _create_occurrences(
+        self,
+        pending: List[Tuple[SeriesOccurrenceEntity, NewAppointmentEntity]],
+        user_create: str,
+    ) -> None:
+        """Verifica los conflictos de todas las ocurrencias e inserta las válidas."""
+        appointments = [appointment for _, appointment in pending]
+        await AppointmentValidationUtils.lock_staff_schedules(
+            self.appointment_repository,
+            [(a.user_id, a.start_datetime, a.end_datetime) for a in appointments],
+        )
+        existing_conflicts = await self.appointment_repository.find_overlapping_appointments_bulk(
+            appointments
+        )
+
+        accepted: List[int] = []
+        # Ocurrencias aceptadas por empleado y día; dos series del mismo empleado
+        # pueden chocar entre sí
+        accepted_by_day: Dict[Tuple[int, date], List[int]] = defaultdict(list)
+        for index, (occurrence, appointment) in enumerate(pending):
+            conflict = existing_conflicts.get(index)
+            if conflict is not None:
+                occurrence.status = OCCURRENCE_CONFLICT
+                occurrence.error = (
+                    f"Se superpone con la cita {conflict.appointment_id} de '{conflict.user_name}'"
+                )
+                continue
+
+            key = (appointment.user_id, appointment.start_datetime.date())
+            if any(
+                appointment.start_datetime < appointments[other].end_datetime
+                and appointment.end_datetime > appointments[other].start_datetime
+                for other in accepted_by_day[key]
+            ):
+                occurrence.status = OCCURRENCE_CONFLICT
+                occurrence.error = "Se superpone con otra cita repetida del mismo empleado"
+                continue
+
+            accepted_by_day[key].append(index)
+            accepted.append(index)
+
+        if not accepted:
+            return
+        new_ids = await self.appointment_repository.create_appointments_bulk(
+            appointments=[appointments[index] for index in accepted],
+            user_create=user_create,
+        )
+        for index, appointment_id in zip(accepted, new_ids):
+            occurrence, appointment = pending[index]
+            occurrence.appointment_id = appointment_id
+            publish_event(
+                AppointmentCreatedEvent(
+                    appointment_id=appointment_id,
+                    location_id=appointment.location_id,
+                    user_id=appointment.user_id,
+                    service_id=appointment.service_id,
+                    customer_id=appointment.customer_id,
+                    status_maintable_id=appointment.status_maintable_id,
+                    start_datetime=appointment.start_datetime,
+                    end_datetime=appointment.end_datetime,
+                    user_create=user_create,
+                )
+            )
+
+    async def truncate(
+        self, series: AppointmentSeriesEntity, from_date: date, user_modify: str
+    ) -> List[int]:
+        """
+        Termina la serie el día anterior a from_date y anula las citas que ya se
+        habían creado desde esa fecha. Las ocurrencias anteriores no se tocan.
+
+        from_date no puede ser un día pasado: materialize no vuelve a crear citas antes
+        de hoy, así que las citas pasadas anuladas se perderían.
+
+        Returns:
+            List[int]: IDs de las citas anuladas.
+
+        Raises:
+            ValueError: Si from_date es anterior a hoy o está fuera de la serie.
+        """
+        if from_date < self.today():
+            raise ValueError(
+                f"La fecha {from_date.isoformat()} ya pasó: solo se pueden modificar o "
+                f"cancelar las citas de la serie desde hoy"
+            )
+        if from_date < series.start_date:
+            raise ValueError(
+                f"La fecha {from_date.isoformat()} es anterior al inicio de la serie "
+                f"({series.start_date.isoformat()})"
+            )
+        if series.until_date is not None and from_date > series.until_date:
+            raise ValueError(
+                f"La fecha {from_date.isoformat()} es posterior al fin de la serie "
+                f"({series.until_date.isoformat()})"
+            )
+
+        annulled = await self.series_repository.truncate_series(
+            series_id=series.series_id, from_date=from_date, user_modify=user_modify
+        )
+        for appointment_id in annulled:
+            await self.appointment_repository.annul_appointment(
+                appointment_id=appointment_id, user_modify=user_modify
+            )
+            publish_event(
+                AppointmentDeletedEvent(appointment_id=appointment_id, user_modify=user_modify)
+            )
+        return annulled
+
+    async def get_series(self, series_id: int) -> AppointmentSeriesEntity:
+        """Obtiene la serie bloqueándola hasta el fin de la transacción."""
+        series = await self.series_repository.get_series_for_update(series_id)
+        if series is None:
+            raise ValueError(f"La serie de citas con ID {series_id} no existe")
+        return series
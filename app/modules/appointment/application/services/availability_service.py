@@ -0,0 +1,212 @@
+"""
+Carga de los datos de disponibilidad de una sede.
+
+Reúne el horario de la sede, los turnos y días libres del personal y sus citas en un
+OccupancyIndex, que luego consultan las queries de disponibilidad.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+from app.constants import injector_var
+from app.modules.appointment.application.utils.day_occupancy import OccupancyIndex
+from app.modules.appointment.application.utils.interval_utils import Interval
+from app.modules.appointment.domain.repositories.appointment_repository import (
+    AppointmentRepository,
+)
+from app.modules.location.domain.entities.location_domain import (
+    DayOfWeek,
+    ScheduleRequestDomain,
+)
+from app.modules.location.domain.repositories.location_repository import (
+    LocationRepository,
+)
+from app.modules.services.domain.repositories.service_repository import (
+    ServiceRepository,
+)
+from app.modules.user_locations.domain.repositories.user_locations_repository import (
+    UserLocationsRepository,
+)
+from config.setting import AVAILABILITY_TIMEZONE
+
+# DayOfWeek se declara de lunes a domingo, igual que date.weekday()
+WEEKDAYS = list(DayOfWeek)
+PAGE_SIZE = 100
+
+
+@dataclass
+class LocationOccupancy:
+    """Personal de la sede y su ocupación en un rango de días."""
+    staff_names: Dict[int, str] = field(default_factory=dict)
+    index: OccupancyIndex = field(default_factory=OccupancyIndex)
+
+
+class AvailabilityService:
+    """
+    Servicio de aplicación que arma la ocupación del personal de una sede a partir
+    de los repositorios existentes.
+    """
+
+    def __init__(self) -> None:
+        injector = injector_var.get()
+        self.appointment_repository: AppointmentRepository = injector.get(AppointmentRepository)  # type: ignore[type-abstract]
+        self.location_repository: LocationRepository = injector.get(LocationRepository)  # type: ignore[type-abstract]
+        self.service_repository: ServiceRepository = injector.get(ServiceRepository)  # type: ignore[type-abstract]
+        self.user_locations_repository: UserLocationsRepository = injector.get(UserLocationsRepository)  # type: ignore[type-abstract]
+        self.timezone = ZoneInfo(AVAILABILITY_TIMEZONE)
+
+    async def get_location_schedules(self, location_id: int) -> List[ScheduleRequestDomain]:
+        """Horario semanal de atención de la sede (404 si la sede no existe)."""
+        location = await self.location_repository.find_location_by_id(location_id)
+        return location.schedules
+
+    async def get_service_duration(self, location_id: int, service_id: int) -> float:
+        """
+        Busca el servicio entre los de la sede y devuelve su duración en minutos.
+
+        Raises:
+            ValueError: Si el servicio no pertenece a la sede o no tiene duración.
+        """
+        page_index = 1
+        while True:
+            services = await self.service_repository.find_services_by_location_v2(
+                location_id=location_id,
+                page_index=page_index,
+                page_size=PAGE_SIZE,
+                order_by="service_id",
+                sort_by="ASC",
+            )
+            for service in services.data:
+                if service.service_id == service_id:
+                    if not service.duration_minutes or service.duration_minutes <= 0:
+                        raise ValueError(
+                            f"El servicio {service_id} no tiene una duración configurada"
+                        )
+                    return service.duration_minutes
+
+            if len(services.data) < PAGE_SIZE or page_index * PAGE_SIZE >= services.total_items:
+                raise ValueError(
+                    f"El servicio {service_id} no existe en la sede {location_id}"
+                )
+            page_index += 1
+
+    async def load_occupancy(
+        self,
+        location_id: int,
+        schedules: List[ScheduleRequestDomain],
+        start_date: date,
+        end_date: date,
+        user_id: Optional[int] = None,
+    ) -> LocationOccupancy:
+        """
+        Carga turnos, días libres y citas del personal de la sede en el rango
+        [start_date, end_date] y construye su índice de ocupación.
+
+        Args:
+            location_id: ID de la sede.
+            schedules: Horario semanal de la sede.
+            start_date: Primer día del rango.
+            end_date: Último día del rango, inclusive.
+            user_id: Limita la carga a un empleado (opcional).
+
+        Returns:
+            LocationOccupancy: Nombres del personal e índice de ocupación.
+        """
+        users = await self.user_locations_repository.get_user_by_location(
+            sede_id=location_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        staff_names: Dict[int, str] = {}
+        shifts: Dict[int, List[Interval]] = defaultdict(list)
+        days_off: Dict[int, List[Interval]] = defaultdict(list)
+        for user in users:
+            if user_id is not None and user.user_id != user_id:
+                continue
+            staff_names[user.user_id] = user.user_name
+            for day_off in user.days_off:
+                days_off[user.user_id].append(
+                    (self.to_local(day_off.start_time), self.to_local(day_off.end_time))
+                )
+            for shift in user.shifts:
+                # Un turno en otra sede no habilita reservas en esta
+                if shift.sede_id in (None, location_id):
+                    shifts[user.user_id].append(
+                        (self.to_local(shift.start_time), self.to_local(shift.end_time))
+                    )
+
+        busy = await self._get_busy_intervals(
+            staff_ids=list(staff_names),
+            range_start=datetime.combine(start_date, time.min),
+            range_end=datetime.combine(end_date + timedelta(days=1), time.min),
+        )
+
+        index = OccupancyIndex.build(
+            opening=self._build_opening_intervals(schedules, start_date, end_date),
+            shifts=shifts,
+            days_off=days_off,
+            appointments=busy,
+        )
+        return LocationOccupancy(staff_names=staff_names, index=index)
+
+    async def _get_busy_intervals(
+        self,
+        staff_ids: List[int],
+        range_start: datetime,
+        range_end: datetime,
+    ) -> Dict[int, List[Interval]]:
+        """
+        Obtiene las citas del rango agrupadas por empleado.
+        No se filtra por sede: una cita del empleado en otra sede también lo ocupa.
+        """
+        busy: Dict[int, List[Interval]] = defaultdict(list)
+        if not staff_ids:
+            return busy
+
+        appointments = await self.appointment_repository.find_busy_intervals(
+            user_ids=staff_ids,
+            start_datetime=range_start,
+            end_datetime=range_end,
+        )
+        for appointment in appointments:
+            busy[appointment.user_id].append(
+                (
+                    self.to_local(appointment.start_datetime),
+                    self.to_local(appointment.end_datetime),
+                )
+            )
+        return busy
+
+    @staticmethod
+    def _build_opening_intervals(
+        schedules: List[ScheduleRequestDomain], start_date: date, end_date: date
+    ) -> List[Interval]:
+        """Expande el horario semanal de la sede a intervalos concretos del rango."""
+        ranges_by_day = {schedule.day: schedule.ranges for schedule in schedules}
+
+        opening: List[Interval] = []
+        current = start_date
+        while current <= end_date:
+            for schedule_range in ranges_by_day.get(WEEKDAYS[current.weekday()], []):
+                opening.append(
+                    (
+                        datetime.combine(current, time.fromisoformat(schedule_range.start)),
+                        datetime.combine(current, time.fromisoformat(schedule_range.end)),
+                    )
+                )
+            current += timedelta(days=1)
+        return opening
+
+    def to_local(self, value: datetime) -> datetime:
+        """Normaliza a hora local sin zona, que es como se expresan los horarios de la sede."""
+        if value.tzinfo is not None:
+            return value.astimezone(self.timezone).replace(tzinfo=None)
+        return value
+
+    def now(self) -> datetime:
+        """Hora local actual sin zona."""
+        return datetime.now(self.timezone).replace(tzinfo=None)
@@ -3,8 +3,8 @@ Utilidades para validaciones de appointments.
 Contiene lógica de validación compartida entre comandos.
 """
 
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional, Set, Tuple
 
 from app.modules.appointment.domain.repositories.appointment_repository import (
     AppointmentRepository,
@@ -17,6 +17,56 @@ class AppointmentValidationUtils:
     Contiene métodos de validación reutilizables.
     """
 
+    @staticmethod
+    async def lock_staff_schedule(
+        appointment_repository: AppointmentRepository,
+        user_id: int,
+        start_datetime: datetime,
+        end_datetime: datetime,
+    ) -> None:
+        """
+        Bloquea la agenda del empleado en los días que abarca la cita hasta el final
+        de la transacción. Debe llamarse antes de validar conflictos para que la
+        validación y el insert/update sean atómicos frente a reservas concurrentes.
+
+        Los días se bloquean en orden cronológico para que dos reservas que abarcan
+        los mismos días no se esperen mutuamente (deadlock).
+
+        Args:
+            appointment_repository: Repositorio de appointments.
+            user_id: ID del empleado.
+            start_datetime: Fecha y hora de inicio de la cita.
+            end_datetime: Fecha y hora de fin de la cita.
+        """
+        await AppointmentValidationUtils.lock_staff_schedules(
+            appointment_repository, [(user_id, start_datetime, end_datetime)]
+        )
+
+    @staticmethod
+    async def lock_staff_schedules(
+        appointment_repository: AppointmentRepository,
+        appointments: Iterable[Tuple[int, datetime, datetime]],
+    ) -> None:
+        """
+        Igual que lock_staff_schedule para varias citas (user_id, inicio, fin).
+        Cada par empleado-día se bloquea una sola vez, siempre en orden
+        (empleado, día), el mismo que sigue una reserva individual.
+
+        Args:
+            appointment_repository: Repositorio de appointments.
+            appointments: Tuplas (user_id, start_datetime, end_datetime).
+        """
+        keys: Set[Tuple[int, date]] = set()
+        for user_id, start_datetime, end_datetime in appointments:
+            day = start_datetime.date()
+            last_day = max(day, end_datetime.date())
+            while day <= last_day:
+                keys.add((user_id, day))
+                day += timedelta(days=1)
+
+        for user_id, day in sorted(keys):
+            await appointment_repository.lock_staff_day(user_id=user_id, day=day)
+
     @staticmethod
     async def validate_no_conflicting_appointments(
         appointment_repository: AppointmentRepository,
@@ -28,12 +78,14 @@ class AppointmentValidationUtils:
         """
         Valida que no existan citas en conflicto con las fechas especificadas.
 
-        Busca citas del mismo empleado en el mismo día para verificar superposiciones.
         Las citas se superponen si:
         - Son del mismo empleado (user_id)
         - La nueva cita empieza antes de que termine una existente Y
         - La nueva cita termina después de que empiece la existente
 
+        La verificación la hace la base de datos con una consulta de superposición
+        indexada que devuelve solo la cita en conflicto (si existe).
+
         Args:
             appointment_repository: Repositorio de appointments.
             user_id: ID del empleado.
@@ -44,48 +96,19 @@ class AppointmentValidationUtils:
         Raises:
             ValueError: Si encuentra citas en conflicto.
         """
-        # Obtener fecha del día para buscar todas las citas del empleado en ese día
-        appointment_date = start_datetime.date()
-        start_of_day = f"{appointment_date} 00:00:00"
-        end_of_day = f"{appointment_date} 23:59:59"
-
-        # Buscar todas las citas del empleado en el día especificado
-        filters = {
-            "user_id": user_id,
-            "start_date": start_of_day,
-            "end_date": end_of_day,
-        }
-
-        existing_appointments = await appointment_repository.find_appointments_refactor(
-            page_index=1,
-            page_size=100,  # Buscar todas las citas del día (debería ser suficiente)
-            order_by="start_datetime",
-            sort_by="ASC",
-            query=None,
-            filters=filters,
+        appointment = await appointment_repository.find_overlapping_appointment(
+            user_id=user_id,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            exclude_appointment_id=exclude_appointment_id,
         )
 
-        # Verificar superposiciones con cada cita existente
-        for appointment in existing_appointments.data:
-            # Excluir la cita actual si estamos haciendo update
-            if (
-                exclude_appointment_id
-                and appointment.appointment_id == exclude_appointment_id
-            ):
-                continue
-
-            # Verificar si hay superposición:
-            # Nueva cita empieza antes de que termine la existente Y
-            # Nueva cita termina después de que empiece la existente
-            if (
-                start_datetime < appointment.end_datetime
-                and end_datetime > appointment.start_datetime
-            ):
-                raise ValueError(
-                    f"Conflicto de horarios detectado. Ya existe una cita programada "
-                    f"para el empleado '{appointment.user_name}' (ID: {user_id}) "
-                    f"desde {appointment.start_datetime.strftime('%Y-%m-%d %H:%M')} "
-                    f"hasta {appointment.end_datetime.strftime('%Y-%m-%d %H:%M')}. "
-                    f"La cita solicitada ({start_datetime.strftime('%Y-%m-%d %H:%M')} "
-                    f"- {end_datetime.strftime('%Y-%m-%d %H:%M')}) se superpone con esta cita existente."
-                )
+        if appointment is not None:
+            raise ValueError(
+                f"Conflicto de horarios detectado. Ya existe una cita programada "
+                f"para el empleado '{appointment.user_name}' (ID: {user_id}) "
+                f"desde {appointment.start_datetime.strftime('%Y-%m-%d %H:%M')} "
+                f"hasta {appointment.end_datetime.strftime('%Y-%m-%d %H:%M')}. "
+                f"La cita solicitada ({start_datetime.strftime('%Y-%m-%d %H:%M')} "
+                f"- {end_datetime.strftime('%Y-%m-%d %H:%M')}) se superpone con esta cita existente."
+            )
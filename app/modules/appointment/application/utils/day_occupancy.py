@@ -0,0 +1,289 @@
+"""
+Índice de ocupación por empleado y día en slots de 5 minutos.
+
+Cada día se representa con dos máscaras de bits (enteros de Python) de 288 slots:
+- available: slots dentro del turno, fuera de días libres y dentro del horario de la sede.
+- booked: slots ocupados por citas.
+
+Un slot está libre si está disponible y no reservado, así que preguntar si un rango
+está libre es un AND de máscaras, y buscar el primer hueco de N slots se resuelve con
+desplazamientos de bits en lugar de recorrer listas de citas.
+
+Los bordes que no caen en múltiplos de 5 minutos se redondean de forma conservadora:
+la disponibilidad hacia adentro y las reservas y días libres hacia afuera.
+
+El índice no es una caché compartida: cada request lo construye desde la base con
+AvailabilityService y se descarta al terminar, así que no se suscribe a los eventos de
+citas. Sus actualizaciones incrementales solo sirven dentro del mismo request.
+"""
+
+import math
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.modules.appointment.application.utils.interval_utils import Interval
+
+SLOT_MINUTES = 5
+SLOT_SECONDS = SLOT_MINUTES * 60
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+ONE_DAY = timedelta(days=1)
+
+
+def _range_mask(midnight: datetime, start: datetime, end: datetime, inward: bool) -> int:
+    """
+    Máscara de los slots del día (que empieza en 'midnight') cubiertos por [start, end).
+
+    Args:
+        inward: True redondea hacia adentro (solo slots completos), False hacia afuera.
+    """
+    start_slot = max(0.0, (start - midnight).total_seconds() / SLOT_SECONDS)
+    end_slot = min(float(SLOTS_PER_DAY), (end - midnight).total_seconds() / SLOT_SECONDS)
+    if inward:
+        first, last = math.ceil(start_slot), math.floor(end_slot)
+    else:
+        first, last = math.floor(start_slot), math.ceil(end_slot)
+
+    if last <= first:
+        return 0
+    return ((1 << (last - first)) - 1) << first
+
+
+def _split_by_day(start: datetime, end: datetime) -> Iterator[date]:
+    """Días que toca el intervalo [start, end)."""
+    day = start.date()
+    while datetime.combine(day, time.min) < end:
+        yield day
+        day += timedelta(days=1)
+
+
+def _runs(mask: int) -> Iterator[Tuple[int, int]]:
+    """Recorre los tramos de bits encendidos como (primer_slot, cantidad)."""
+    while mask:
+        first = (mask & -mask).bit_length() - 1
+        shifted = mask >> first
+        length = (shifted ^ (shifted + 1)).bit_length() - 1
+        yield first, length
+        mask &= ~(((1 << length) - 1) << first)
+
+
+class DayOccupancy:
+    """
+    Ocupación de un empleado en un día.
+    """
+
+    __slots__ = ("day", "midnight", "available", "booked")
+
+    def __init__(self, day: date) -> None:
+        self.day = day
+        self.midnight = datetime.combine(day, time.min)
+        self.available = 0
+        self.booked = 0
+
+    @property
+    def free(self) -> int:
+        """Máscara de los slots libres para reservar."""
+        return self.available & ~self.booked
+
+    def add_available(self, start: datetime, end: datetime) -> None:
+        self.available |= _range_mask(self.midnight, start, end, inward=True)
+
+    def remove_available(self, start: datetime, end: datetime) -> None:
+        self.available &= ~_range_mask(self.midnight, start, end, inward=False)
+
+    def restrict_to(self, mask: int) -> None:
+        """Recorta la disponibilidad a una máscara (por ejemplo, el horario de la sede)."""
+        self.available &= mask
+
+    def book(self, start: datetime, end: datetime) -> None:
+        self.booked |= _range_mask(self.midnight, start, end, inward=False)
+
+    def release(self, start: datetime, end: datetime) -> None:
+        # Las citas de un empleado no se superponen, así que liberar una no
+        # deja libres slots de otra
+        self.booked &= ~_range_mask(self.midnight, start, end, inward=False)
+
+    def is_free(self, start: datetime, end: datetime) -> bool:
+        """Indica si todo el tramo del día dentro de [start, end) está libre."""
+        mask = _range_mask(self.midnight, start, end, inward=False)
+        return mask & ~self.free == 0
+
+    def first_free(self, minutes: float, not_before: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Inicio del primer hueco libre de al menos 'minutes' minutos.
+
+        Args:
+            minutes: Duración requerida.
+            not_before: Hora mínima de inicio (opcional).
+
+        Returns:
+            Optional[datetime]: Inicio del hueco, o None si no hay ninguno ese día.
+        """
+        slots = max(1, math.ceil(minutes / SLOT_MINUTES))
+
+        # Tras el bucle, el bit i queda encendido si los slots i..i+slots-1 están libres.
+        # Duplicar el desplazamiento en cada paso hace falta solo log2(slots) operaciones.
+        runs = self.free
+        covered = 1
+        while covered < slots and runs:
+            shift = min(covered, slots - covered)
+            runs &= runs >> shift
+            covered += shift
+
+        if not_before is not None:
+            first_allowed = math.ceil((not_before - self.midnight).total_seconds() / SLOT_SECONDS)
+            if first_allowed >= SLOTS_PER_DAY:
+                return None
+            if first_allowed > 0:
+                runs &= ~((1 << first_allowed) - 1)
+
+        if not runs:
+            return None
+        first = (runs & -runs).bit_length() - 1
+        return self.midnight + timedelta(minutes=first * SLOT_MINUTES)
+
+    def free_ranges(self) -> List[Interval]:
+        """Tramos libres del día como intervalos ordenados."""
+        return [
+            (
+                self.midnight + timedelta(minutes=first * SLOT_MINUTES),
+                self.midnight + timedelta(minutes=(first + length) * SLOT_MINUTES),
+            )
+            for first, length in _runs(self.free)
+        ]
+
+
+def _opening_masks(opening: Iterable[Interval]) -> Dict[date, int]:
+    """Máscara del horario de atención de la sede por día (redondeada hacia adentro)."""
+    masks: Dict[date, int] = defaultdict(int)
+    for start, end in opening:
+        for day in _split_by_day(start, end):
+            masks[day] |= _range_mask(datetime.combine(day, time.min), start, end, inward=True)
+    return masks
+
+
+class OccupancyIndex:
+    """
+    Índice de ocupación por (empleado, día) de un request, construido en bloque.
+    book, release y move lo mantienen al día con las decisiones que toma el propio
+    request (por ejemplo, una reasignación masiva que ocupa al empleado elegido antes
+    de evaluar la siguiente cita); los cambios de otros requests no se reflejan.
+    """
+
+    def __init__(self) -> None:
+        self._days: Dict[Tuple[int, date], DayOccupancy] = {}
+
+    @classmethod
+    def build(
+        cls,
+        opening: Iterable[Interval],
+        shifts: Dict[int, List[Interval]],
+        days_off: Dict[int, List[Interval]],
+        appointments: Dict[int, List[Interval]],
+    ) -> "OccupancyIndex":
+        """
+        Construye el índice a partir de los horarios de la sede, turnos, días libres
+        y citas de cada empleado.
+
+        Args:
+            opening: Horario de atención de la sede en el rango.
+            shifts: Turnos por user_id.
+            days_off: Días libres por user_id.
+            appointments: Citas por user_id.
+
+        Returns:
+            OccupancyIndex: Índice listo para consultar.
+        """
+        index = cls()
+        index._add_shifts(shifts)
+        index._remove_days_off(days_off)
+
+        opening_masks = _opening_masks(opening)
+        for (user_id, day), occupancy in index._days.items():
+            occupancy.restrict_to(opening_masks.get(day, 0))
+
+        for user_id, intervals in appointments.items():
+            for start, end in intervals:
+                index.book(user_id, start, end)
+        return index
+
+    def _add_shifts(self, shifts: Dict[int, List[Interval]]) -> None:
+        """Crea los días de cada turno y marca sus slots como disponibles."""
+        for user_id, intervals in shifts.items():
+            for start, end in intervals:
+                for day in _split_by_day(start, end):
+                    self.get_day(user_id, day).add_available(start, end)
+
+    def _remove_days_off(self, days_off: Dict[int, List[Interval]]) -> None:
+        """Quita los días libres de los días con turno; los demás ya están vacíos."""
+        for user_id, intervals in days_off.items():
+            for start, end in intervals:
+                for day in _split_by_day(start, end):
+                    occupancy = self._days.get((user_id, day))
+                    if occupancy is not None:
+                        occupancy.remove_available(start, end)
+
+    def get_day(self, user_id: int, day: date) -> DayOccupancy:
+        """Devuelve (creándola vacía si no existe) la ocupación del empleado en el día."""
+        occupancy = self._days.get((user_id, day))
+        if occupancy is None:
+            occupancy = DayOccupancy(day)
+            self._days[(user_id, day)] = occupancy
+        return occupancy
+
+    def book(self, user_id: int, start: datetime, end: datetime) -> None:
+        for day in _split_by_day(start, end):
+            self.get_day(user_id, day).book(start, end)
+
+    def release(self, user_id: int, start: datetime, end: datetime) -> None:
+        for day in _split_by_day(start, end):
+            occupancy = self._days.get((user_id, day))
+            if occupancy is not None:
+                occupancy.release(start, end)
+
+    def move(
+        self,
+        user_id: int,
+        old: Interval,
+        new_user_id: int,
+        new: Interval,
+    ) -> None:
+        """
+        Refleja en el índice que una cita cambia de horario o de empleado dentro del
+        request; la reasignación masiva lo usa tras elegir a cada nuevo empleado.
+        """
+        self.release(user_id, *old)
+        self.book(new_user_id, *new)
+
+    def is_free(self, user_id: int, start: datetime, end: datetime) -> bool:
+        """Indica si el empleado tiene libre todo el intervalo [start, end)."""
+        occupancy = self._days.get((user_id, start.date()))
+        if occupancy is not None and end <= occupancy.midnight + ONE_DAY:
+            # Caso habitual: la cita empieza y termina el mismo día
+            return occupancy.is_free(start, end)
+
+        for day in _split_by_day(start, end):
+            occupancy = self._days.get((user_id, day))
+            if occupancy is None or not occupancy.is_free(start, end):
+                return False
+        return True
+
+    def first_free(
+        self,
+        user_id: int,
+        day: date,
+        minutes: float,
+        not_before: Optional[datetime] = None,
+    ) -> Optional[datetime]:
+        """Inicio del primer hueco del empleado en el día con al menos 'minutes' minutos libres."""
+        occupancy = self._days.get((user_id, day))
+        if occupancy is None:
+            return None
+        return occupancy.first_free(minutes, not_before)
+
+    def free_ranges(self, user_id: int, day: date) -> List[Interval]:
+        """Tramos libres del empleado en el día."""
+        occupancy = self._days.get((user_id, day))
+        if occupancy is None:
+            return []
+        return occupancy.free_ranges()
@@ -0,0 +1,32 @@
+"""
+Intervalos de tiempo (inicio, fin) usados en el cálculo de disponibilidad.
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+Interval = Tuple[datetime, datetime]
+
+
+def split_into_slots(
+    free: List[Interval], duration: timedelta, step: timedelta
+) -> List[Interval]:
+    """
+    Genera los slots de la duración indicada que caben completos en cada tramo libre.
+    Los inicios se separan por 'step' contando desde el inicio de cada tramo.
+
+    Args:
+        free: Tramos libres ordenados y disjuntos.
+        duration: Duración del servicio.
+        step: Separación entre inicios de slots consecutivos.
+
+    Returns:
+        List[Interval]: Slots (inicio, fin) en orden cronológico.
+    """
+    slots: List[Interval] = []
+    for start, end in free:
+        slot_start = start
+        while slot_start + duration <= end:
+            slots.append((slot_start, slot_start + duration))
+            slot_start += step
+    return slots
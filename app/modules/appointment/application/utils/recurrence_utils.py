@@ -0,0 +1,55 @@
+"""
+Expansión de la regla de repetición de una serie de citas.
+"""
+
+from datetime import date, timedelta
+from typing import List
+
+from app.modules.appointment.domain.entities.appointment_series_domain import (
+    AppointmentSeriesEntity,
+    RecurrenceFrequency,
+)
+
+
+def series_step(series: AppointmentSeriesEntity) -> timedelta:
+    """Separación entre dos ocurrencias consecutivas de la serie."""
+    days = 7 if series.frequency == RecurrenceFrequency.WEEKLY else 1
+    return timedelta(days=days * series.repeat_interval)
+
+
+def is_occurrence(series: AppointmentSeriesEntity, day: date) -> bool:
+    """Indica si la serie tiene una ocurrencia en el día indicado."""
+    if day < series.start_date or (series.until_date is not None and day > series.until_date):
+        return False
+    return (day - series.start_date).days % series_step(series).days == 0
+
+
+def expand_occurrences(
+    series: AppointmentSeriesEntity, from_date: date, to_date: date
+) -> List[date]:
+    """
+    Fechas de las ocurrencias de la serie dentro de [from_date, to_date].
+    Solo se generan las del rango pedido, sin recorrer la serie desde su inicio.
+
+    Args:
+        series: Serie a expandir.
+        from_date: Primer día del rango.
+        to_date: Último día del rango, inclusive.
+
+    Returns:
+        List[date]: Fechas en orden cronológico.
+    """
+    step = series_step(series)
+    last = to_date if series.until_date is None else min(to_date, series.until_date)
+
+    current = series.start_date
+    if from_date > current:
+        # Salta directamente a la primera ocurrencia del rango
+        steps = -(-(from_date - current).days // step.days)
+        current += step * steps
+
+    occurrences: List[date] = []
+    while current <= last:
+        occurrences.append(current)
+        current += step
+    return occurrences
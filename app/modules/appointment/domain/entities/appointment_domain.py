@@ -41,3 +41,68 @@ class AppointmentEntity:
     # Datos de Auditoría
     insert_date: datetime
     update_date: Optional[datetime]
+
+
+@dataclass
+class AppointmentConflictEntity:
+    """
+    Cita que se superpone con un horario solicitado.
+    Corresponde a la fila devuelta por el stored procedure 'appointments_sp_find_overlap'.
+    """
+
+    appointment_id: int
+    user_id: int
+    user_name: str
+    start_datetime: datetime
+    end_datetime: datetime
+
+
+@dataclass
+class BusyIntervalEntity:
+    """
+    Horario ocupado por una cita activa de un empleado, en cualquier sede.
+    Corresponde a la fila devuelta por el stored procedure 'appointments_sp_find_busy_intervals'.
+    """
+
+    appointment_id: int
+    user_id: int
+    start_datetime: datetime
+    end_datetime: datetime
+
+
+@dataclass
+class NewAppointmentEntity:
+    """
+    Datos de una cita a insertar en un alta masiva
+    (stored procedure 'sp_create_appointments_bulk').
+    """
+
+    location_id: int
+    user_id: int
+    service_id: int
+    customer_id: int
+    status_maintable_id: int
+    start_datetime: datetime
+    end_datetime: datetime
+
+
+@dataclass
+class AffectedAppointmentEntity:
+    """
+    Cita activa cuyo empleado dejó de estar disponible en su horario.
+    Corresponde a las filas de 'appointments_sp_find_unavailable' y
+    'appointments_sp_get_by_ids'.
+    """
+
+    appointment_id: int
+    location_id: int
+    user_id: int
+    user_name: str
+    service_id: int
+    customer_id: int
+    customer_name: str
+    status_maintable_id: int
+    start_datetime: datetime
+    end_datetime: datetime
+    # 'DAY_OFF' si se superpone con un día libre, 'NO_SHIFT' si ningún turno la cubre
+    reason: Optional[str] = None
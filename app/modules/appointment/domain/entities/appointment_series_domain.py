@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from datetime import date, time
+from enum import Enum
+from typing import Optional
+
+
+class RecurrenceFrequency(Enum):
+    DAILY = "DAILY"
+    WEEKLY = "WEEKLY"
+
+
+@dataclass
+class AppointmentSeriesEntity:
+    """
+    Serie de citas repetidas (por ejemplo, "cada dos viernes a las 10:00").
+    Corresponde a la tabla 'appointment_series'. Las citas de la serie se crean
+    por adelantado solo hasta un horizonte móvil (materialized_until).
+    """
+
+    series_id: int
+    location_id: int
+    user_id: int
+    service_id: int
+    customer_id: int
+    status_maintable_id: int
+    frequency: RecurrenceFrequency
+    repeat_interval: int
+    start_date: date
+    start_time: time
+    duration_minutes: int
+    until_date: Optional[date]
+    materialized_until: Optional[date]
+
+
+@dataclass
+class SeriesOccurrenceEntity:
+    """
+    Resultado de materializar una ocurrencia de la serie
+    (tabla 'appointment_series_occurrences').
+    """
+
+    occurrence_date: date
+    status: str
+    appointment_id: Optional[int] = None
+    error: Optional[str] = None
@@ -0,0 +1,11 @@
+from app.modules.appointment.domain.events.appointment_events import (
+    AppointmentCreatedEvent,
+    AppointmentDeletedEvent,
+    AppointmentUpdatedEvent,
+)
+
+__all__ = [
+    "AppointmentCreatedEvent",
+    "AppointmentDeletedEvent",
+    "AppointmentUpdatedEvent",
+]
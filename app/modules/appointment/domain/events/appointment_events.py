@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from app.modules.share.domain.events import DomainEvent
+
+
+@dataclass(frozen=True, kw_only=True)
+class AppointmentCreatedEvent(DomainEvent):
+    """
+    Evento publicado cuando se confirma la creación de una cita.
+    """
+
+    appointment_id: int
+    location_id: int
+    user_id: int
+    service_id: int
+    customer_id: int
+    status_maintable_id: int
+    start_datetime: datetime
+    end_datetime: datetime
+    user_create: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class AppointmentUpdatedEvent(DomainEvent):
+    """
+    Evento publicado cuando se confirma la actualización de una cita.
+    previous_status_maintable_id es el estado antes de la actualización (None si no se conoce).
+    """
+
+    appointment_id: int
+    location_id: int
+    user_id: int
+    service_id: int
+    customer_id: int
+    status_maintable_id: int
+    start_datetime: datetime
+    end_datetime: datetime
+    user_modify: str
+    previous_status_maintable_id: Optional[int] = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class AppointmentDeletedEvent(DomainEvent):
+    """
+    Evento publicado cuando se confirma la anulación de una cita.
+    """
+
+    appointment_id: int
+    user_modify: str
@@ -1,9 +1,15 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Dict, Optional
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 # Importaciones específicas del módulo
-from app.modules.appointment.domain.entities.appointment_domain import AppointmentEntity
+from app.modules.appointment.domain.entities.appointment_domain import (
+    AffectedAppointmentEntity,
+    AppointmentConflictEntity,
+    AppointmentEntity,
+    BusyIntervalEntity,
+    NewAppointmentEntity,
+)
 
 # Importación de tipo compartido
 from app.modules.share.domain.repositories.repository_types import ResponseListRefactor
@@ -43,6 +49,33 @@ class AppointmentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_appointments_after(
+        self,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        limit: int,
+        location_id: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[AppointmentEntity]:
+        """
+        Método abstracto para recorrer las citas activas de un rango por keyset,
+        ordenadas por (start_datetime, appointment_id).
+        Utiliza el stored procedure 'appointments_sp_get_page_after'.
+
+        Args:
+            start_datetime: Inicio del rango (inclusive).
+            end_datetime: Fin del rango (inclusive).
+            limit: Cantidad máxima de citas a devolver.
+            location_id: Limita la búsqueda a una sede (opcional).
+            after: Clave (start_datetime, appointment_id) de la última cita de la
+                página anterior; None para la primera página.
+
+        Returns:
+            List[AppointmentEntity]: Citas siguientes a la clave, en orden.
+        """
+        pass
+
     @abstractmethod
     async def create_appointment(
         self,
@@ -125,3 +158,159 @@ class AppointmentRepository(ABC):
             None
         """
         pass
+
+    @abstractmethod
+    async def find_overlapping_appointment(
+        self,
+        user_id: int,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        exclude_appointment_id: Optional[int] = None,
+    ) -> Optional[AppointmentConflictEntity]:
+        """
+        Método abstracto para buscar una cita activa del empleado que se superponga
+        con el horario indicado.
+        Utiliza el stored procedure 'appointments_sp_find_overlap'.
+
+        Args:
+            user_id: ID del empleado.
+            start_datetime: Fecha y hora de inicio del horario solicitado.
+            end_datetime: Fecha y hora de fin del horario solicitado.
+            exclude_appointment_id: ID de cita a ignorar (para updates).
+
+        Returns:
+            Optional[AppointmentConflictEntity]: La cita en conflicto, o None si el horario está libre.
+        """
+        pass
+
+    @abstractmethod
+    async def find_busy_intervals(
+        self,
+        user_ids: List[int],
+        start_datetime: datetime,
+        end_datetime: datetime,
+    ) -> List[BusyIntervalEntity]:
+        """
+        Método abstracto para obtener, en una sola consulta, los horarios ocupados por
+        las citas activas de varios empleados en un rango, sin filtrar por sede.
+        Utiliza el stored procedure 'appointments_sp_find_busy_intervals'.
+
+        Args:
+            user_ids: IDs de los empleados.
+            start_datetime: Inicio del rango.
+            end_datetime: Fin del rango (exclusivo).
+
+        Returns:
+            List[BusyIntervalEntity]: Citas que se superponen con el rango, ordenadas
+            por empleado e inicio.
+        """
+        pass
+
+    @abstractmethod
+    async def lock_staff_day(self, user_id: int, day: date) -> None:
+        """
+        Método abstracto para tomar un advisory lock de transacción sobre la agenda
+        de un empleado en un día. Se libera solo al confirmar o revertir la transacción.
+
+        Args:
+            user_id: ID del empleado.
+            day: Día de la agenda a bloquear.
+
+        Returns:
+            None
+        """
+        pass
+
+    @abstractmethod
+    async def find_overlapping_appointments_bulk(
+        self, appointments: List[NewAppointmentEntity]
+    ) -> Dict[int, AppointmentConflictEntity]:
+        """
+        Método abstracto para buscar, en una sola consulta, una cita activa en conflicto
+        para cada cita de la lista.
+        Utiliza el stored procedure 'appointments_sp_find_overlaps_bulk'.
+
+        Args:
+            appointments: Citas a verificar.
+
+        Returns:
+            Dict[int, AppointmentConflictEntity]: Cita en conflicto por posición en la lista.
+            Las posiciones sin conflicto no aparecen.
+        """
+        pass
+
+    @abstractmethod
+    async def create_appointments_bulk(
+        self, appointments: List[NewAppointmentEntity], user_create: str
+    ) -> List[int]:
+        """
+        Método abstracto para crear varias citas en una sola sentencia.
+        Utiliza el stored procedure 'sp_create_appointments_bulk'.
+
+        Args:
+            appointments: Citas a crear.
+            user_create: Usuario que crea los registros.
+
+        Returns:
+            List[int]: IDs de las citas creadas, en el mismo orden de la lista.
+        """
+        pass
+
+    @abstractmethod
+    async def find_unavailable_appointments(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        location_id: Optional[int] = None,
+    ) -> List[AffectedAppointmentEntity]:
+        """
+        Método abstracto para buscar las citas activas de un empleado en un rango de
+        días que ya no puede atender: se superponen con uno de sus días libres o no
+        están cubiertas por un turno suyo en la sede de la cita.
+        Utiliza el stored procedure 'appointments_sp_find_unavailable'.
+
+        Args:
+            user_id: ID del empleado.
+            start_date: Primer día del rango.
+            end_date: Último día del rango, inclusive.
+            location_id: Limita la búsqueda a las citas de una sede (opcional).
+
+        Returns:
+            List[AffectedAppointmentEntity]: Citas afectadas, ordenadas por inicio.
+        """
+        pass
+
+    @abstractmethod
+    async def find_appointments_by_ids(
+        self, appointment_ids: List[int]
+    ) -> List[AffectedAppointmentEntity]:
+        """
+        Método abstracto para obtener varias citas activas por ID en una sola consulta.
+        Utiliza el stored procedure 'appointments_sp_get_by_ids'.
+
+        Args:
+            appointment_ids: IDs de las citas.
+
+        Returns:
+            List[AffectedAppointmentEntity]: Citas encontradas (las anuladas o
+            inexistentes no aparecen), con reason en None.
+        """
+        pass
+
+    @abstractmethod
+    async def reassign_appointments_bulk(
+        self, assignments: Dict[int, int], user_modify: str
+    ) -> List[int]:
+        """
+        Método abstracto para cambiar el empleado de varias citas en una sola sentencia.
+        Utiliza el stored procedure 'appointments_sp_reassign_bulk'.
+
+        Args:
+            assignments: Nuevo empleado por ID de cita.
+            user_modify: Usuario que realiza la modificación.
+
+        Returns:
+            List[int]: IDs de las citas actualizadas.
+        """
+        pass
@@ -0,0 +1,96 @@
+from abc import ABC, abstractmethod
+from datetime import date, time
+from typing import List, Optional
+
+from app.modules.appointment.domain.entities.appointment_series_domain import (
+    AppointmentSeriesEntity,
+    RecurrenceFrequency,
+    SeriesOccurrenceEntity,
+)
+
+
+class AppointmentSeriesRepository(ABC):
+    """
+    Interfaz del repositorio de series de citas repetidas.
+    """
+
+    @abstractmethod
+    async def create_series(
+        self,
+        location_id: int,
+        user_id: int,
+        service_id: int,
+        customer_id: int,
+        status_maintable_id: int,
+        frequency: RecurrenceFrequency,
+        repeat_interval: int,
+        start_date: date,
+        start_time: time,
+        duration_minutes: int,
+        until_date: Optional[date],
+        user_create: str,
+    ) -> int:
+        """
+        Crea una serie. Utiliza el stored procedure 'appointment_series_sp_create'.
+
+        Returns:
+            int: ID de la serie creada.
+        """
+        pass
+
+    @abstractmethod
+    async def claim_due_series(self, horizon: date, limit: int) -> List[AppointmentSeriesEntity]:
+        """
+        Reclama (FOR UPDATE SKIP LOCKED) las series con ocurrencias pendientes de
+        materializar hasta 'horizon'.
+        Utiliza el stored procedure 'appointment_series_sp_claim_due'.
+
+        Args:
+            horizon: Último día que debe quedar materializado.
+            limit: Máximo de series a reclamar.
+
+        Returns:
+            List[AppointmentSeriesEntity]: Series bloqueadas hasta el fin de la transacción.
+        """
+        pass
+
+    @abstractmethod
+    async def get_series_for_update(self, series_id: int) -> Optional[AppointmentSeriesEntity]:
+        """
+        Obtiene y bloquea una serie activa.
+        Utiliza el stored procedure 'appointment_series_sp_get_for_update'.
+
+        Returns:
+            Optional[AppointmentSeriesEntity]: La serie, o None si no existe o está anulada.
+        """
+        pass
+
+    @abstractmethod
+    async def register_occurrences(
+        self,
+        series_id: int,
+        occurrences: List[SeriesOccurrenceEntity],
+        materialized_until: date,
+    ) -> int:
+        """
+        Registra las ocurrencias materializadas y avanza 'materialized_until'.
+        Utiliza el stored procedure 'appointment_series_sp_register_occurrences'.
+
+        Returns:
+            int: Cantidad de ocurrencias registradas.
+        """
+        pass
+
+    @abstractmethod
+    async def truncate_series(
+        self, series_id: int, from_date: date, user_modify: str
+    ) -> List[int]:
+        """
+        Termina la serie el día anterior a 'from_date' (si from_date es su primer día,
+        la anula) y elimina sus ocurrencias desde esa fecha.
+        Utiliza el stored procedure 'appointment_series_sp_truncate'.
+
+        Returns:
+            List[int]: IDs de las citas ya creadas desde 'from_date', que deben anularse.
+        """
+        pass
@@ -1,9 +1,9 @@
 # appointment_implementation_repository.py
 
 import json
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Importaciones de SQLAlchemy y manejo de errores
 from sqlalchemy import text
@@ -11,7 +11,13 @@ from sqlalchemy.exc import DBAPIError
 
 # Asumiendo que estas rutas de importación son correctas para tu proyecto
 from app.constants import uow_var
-from app.modules.appointment.domain.entities.appointment_domain import AppointmentEntity
+from app.modules.appointment.domain.entities.appointment_domain import (
+    AffectedAppointmentEntity,
+    AppointmentConflictEntity,
+    AppointmentEntity,
+    BusyIntervalEntity,
+    NewAppointmentEntity,
+)
 
 # Importa la interfaz abstracta que esta clase implementará
 from app.modules.appointment.domain.repositories.appointment_repository import (
@@ -148,6 +154,70 @@ class AppointmentImplementationRepository(AppointmentRepository):
             handle_error(e)
             raise RuntimeError("Este punto nunca se alcanza")
 
+    async def find_appointments_after(
+        self,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        limit: int,
+        location_id: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[AppointmentEntity]:
+        """
+        Implementación concreta del recorrido por keyset.
+        Llama al stored procedure 'appointments_sp_get_page_after', que filtra con
+        (start_datetime, appointment_id) > (p_after_start, p_after_id) sobre el índice
+        'ix_appointments_start_id'. A diferencia del OFFSET, una cita creada o anulada
+        durante el recorrido no desplaza a las demás entre páginas.
+        """
+        stmt = text(
+            """
+            SELECT * FROM appointments_sp_get_page_after(
+                :p_start_datetime, :p_end_datetime, :p_location_id,
+                :p_after_start, :p_after_id, :p_limit
+            )
+            """
+        )
+
+        params = {
+            "p_start_datetime": start_datetime,
+            "p_end_datetime": end_datetime,
+            "p_location_id": location_id,
+            "p_after_start": after[0] if after else None,
+            "p_after_id": after[1] if after else None,
+            "p_limit": limit,
+        }
+
+        try:
+            result = await self._uow.session.execute(stmt, params)
+
+            return [
+                AppointmentEntity(
+                    appointment_id=row.appointment_id,
+                    start_datetime=row.start_datetime,
+                    end_datetime=row.end_datetime,
+                    location_id=row.location_id,
+                    location_name=row.location_name,
+                    user_id=row.user_id,
+                    user_name=row.user_name,
+                    service_id=row.service_id,
+                    service_name=row.service_name,
+                    service_price=Decimal(str(row.service_price or 0)),
+                    service_duration=row.service_duration,
+                    customer_id=row.customer_id,
+                    customer_name=row.customer_name,
+                    customer_phone=row.customer_phone,
+                    status_id=row.status_id,
+                    status_name=row.status_name,
+                    insert_date=row.insert_date,
+                    update_date=row.update_date,
+                )
+                for row in result.fetchall()
+            ]
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
     async def create_appointment(
         self,
         location_id: int,
@@ -312,3 +382,359 @@ class AppointmentImplementationRepository(AppointmentRepository):
         except DBAPIError as e:
             handle_error(e)
             raise RuntimeError("Este punto nunca se alcanza")
+
+    async def find_overlapping_appointment(
+        self,
+        user_id: int,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        exclude_appointment_id: Optional[int] = None,
+    ) -> Optional[AppointmentConflictEntity]:
+        """
+        Implementación concreta de la búsqueda de una cita superpuesta.
+        Llama al stored procedure 'appointments_sp_find_overlap', que devuelve como
+        máximo una fila (appointment_id, user_id, user_name, start_datetime, end_datetime):
+
+            WHERE a.user_id = p_user_id
+              AND a.annulled = FALSE
+              AND a.appointment_id IS DISTINCT FROM p_exclude_appointment_id
+              AND tsrange(a.start_datetime, a.end_datetime) && tsrange(p_start_datetime, p_end_datetime)
+            LIMIT 1
+
+        La consulta se resuelve con el índice GiST parcial
+        'appointments_user_period_gist' ON appointments USING gist
+        (user_id, tsrange(start_datetime, end_datetime)) WHERE annulled = FALSE
+        (requiere la extensión btree_gist), por lo que su costo no depende de
+        cuántas citas tenga el empleado ese día.
+
+        Args:
+            user_id: ID del empleado.
+            start_datetime: Fecha y hora de inicio del horario solicitado.
+            end_datetime: Fecha y hora de fin del horario solicitado.
+            exclude_appointment_id: ID de cita a ignorar (para updates).
+
+        Returns:
+            Optional[AppointmentConflictEntity]: La cita en conflicto, o None.
+        """
+        stmt = text(
+            """
+            SELECT * FROM appointments_sp_find_overlap(
+                :p_user_id, :p_start_datetime, :p_end_datetime, :p_exclude_appointment_id
+            )
+            """
+        )
+
+        params = {
+            "p_user_id": user_id,
+            "p_start_datetime": start_datetime,
+            "p_end_datetime": end_datetime,
+            "p_exclude_appointment_id": exclude_appointment_id,
+        }
+
+        try:
+            result = await self._uow.session.execute(stmt, params)
+            row = result.first()
+
+            if row is None:
+                return None
+
+            return AppointmentConflictEntity(
+                appointment_id=row.appointment_id,
+                user_id=row.user_id,
+                user_name=row.user_name,
+                start_datetime=row.start_datetime,
+                end_datetime=row.end_datetime,
+            )
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def find_busy_intervals(
+        self,
+        user_ids: List[int],
+        start_datetime: datetime,
+        end_datetime: datetime,
+    ) -> List[BusyIntervalEntity]:
+        """
+        Implementación concreta de la lectura de los horarios ocupados del personal.
+        Llama al stored procedure 'appointments_sp_find_busy_intervals', que cruza cada
+        empleado de p_user_ids con sus citas activas del rango:
+
+            FROM (SELECT DISTINCT staff_id FROM unnest(p_user_ids)) s
+            JOIN appointments a ON a.user_id = s.staff_id
+            WHERE a.annulled = FALSE
+              AND tsrange(a.start_datetime, a.end_datetime) && tsrange(p_start_datetime, p_end_datetime)
+
+        Cada empleado se resuelve con el índice GiST 'appointments_user_period_gist'
+        (igualdad sobre user_id y rango), así que el costo depende de las citas del
+        personal en el rango y no del total de citas.
+        """
+        if not user_ids:
+            return []
+
+        stmt = text(
+            """
+            SELECT * FROM appointments_sp_find_busy_intervals(
+                :p_user_ids, :p_start_datetime, :p_end_datetime
+            )
+            """
+        )
+
+        params = {
+            "p_user_ids": user_ids,
+            "p_start_datetime": start_datetime,
+            "p_end_datetime": end_datetime,
+        }
+
+        try:
+            result = await self._uow.session.execute(stmt, params)
+            return [
+                BusyIntervalEntity(
+                    appointment_id=row.appointment_id,
+                    user_id=row.user_id,
+                    start_datetime=row.start_datetime,
+                    end_datetime=row.end_datetime,
+                )
+                for row in result.fetchall()
+            ]
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def lock_staff_day(self, user_id: int, day: date) -> None:
+        """
+        Implementación concreta del lock de agenda por empleado y día.
+        Usa pg_advisory_xact_lock, que espera si otra transacción tiene el mismo lock
+        y lo libera automáticamente al terminar la transacción de la UoW.
+
+        Args:
+            user_id: ID del empleado.
+            day: Día de la agenda a bloquear.
+
+        Returns:
+            None
+        """
+        stmt = text("SELECT pg_advisory_xact_lock(hashtext(:p_lock_key))")
+
+        params = {"p_lock_key": f"appointments:{user_id}:{day.isoformat()}"}
+
+        try:
+            await self._uow.session.execute(stmt, params)
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    @staticmethod
+    def _appointments_to_json(appointments: List[NewAppointmentEntity]) -> str:
+        """Serializa las citas como arreglo JSON con su posición (item_index)."""
+        return json.dumps(
+            [
+                {
+                    "item_index": position,
+                    "location_id": appointment.location_id,
+                    "user_id": appointment.user_id,
+                    "service_id": appointment.service_id,
+                    "customer_id": appointment.customer_id,
+                    "status_maintable_id": appointment.status_maintable_id,
+                    "start_datetime": appointment.start_datetime.isoformat(),
+                    "end_datetime": appointment.end_datetime.isoformat(),
+                }
+                for position, appointment in enumerate(appointments)
+            ]
+        )
+
+    async def find_overlapping_appointments_bulk(
+        self, appointments: List[NewAppointmentEntity]
+    ) -> Dict[int, AppointmentConflictEntity]:
+        """
+        Implementación concreta de la verificación de conflictos en bloque.
+        Llama al stored procedure 'appointments_sp_find_overlaps_bulk(p_items JSONB)',
+        que expande los ítems con jsonb_to_recordset y, con un JOIN LATERAL sobre el
+        índice GiST 'appointments_user_period_gist', devuelve como máximo una cita en
+        conflicto por ítem: (item_index, appointment_id, user_id, user_name,
+        start_datetime, end_datetime).
+        """
+        if not appointments:
+            return {}
+
+        stmt = text("SELECT * FROM appointments_sp_find_overlaps_bulk(CAST(:p_items AS JSONB))")
+
+        params = {"p_items": self._appointments_to_json(appointments)}
+
+        try:
+            result = await self._uow.session.execute(stmt, params)
+
+            return {
+                row.item_index: AppointmentConflictEntity(
+                    appointment_id=row.appointment_id,
+                    user_id=row.user_id,
+                    user_name=row.user_name,
+                    start_datetime=row.start_datetime,
+                    end_datetime=row.end_datetime,
+                )
+                for row in result.fetchall()
+            }
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def create_appointments_bulk(
+        self, appointments: List[NewAppointmentEntity], user_create: str
+    ) -> List[int]:
+        """
+        Implementación concreta del alta masiva de citas.
+        Llama al stored procedure 'sp_create_appointments_bulk(p_items JSONB, p_user_create)',
+        que inserta todas las filas con un único INSERT ... SELECT FROM jsonb_to_recordset
+        y devuelve (item_index, appointment_id) de cada cita creada.
+        """
+        if not appointments:
+            return []
+
+        stmt = text(
+            "SELECT * FROM sp_create_appointments_bulk(CAST(:p_items AS JSONB), :p_user_create)"
+        )
+
+        params = {
+            "p_items": self._appointments_to_json(appointments),
+            "p_user_create": user_create,
+        }
+
+        try:
+            result = await self._uow.session.execute(stmt, params)
+            ids_by_index = {row.item_index: row.appointment_id for row in result.fetchall()}
+
+            if len(ids_by_index) != len(appointments):
+                raise RuntimeError("No se pudieron crear todas las citas del lote")
+
+            return [ids_by_index[position] for position in range(len(appointments))]
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    @staticmethod
+    def _to_affected_entity(row: Any) -> AffectedAppointmentEntity:
+        return AffectedAppointmentEntity(
+            appointment_id=row.appointment_id,
+            location_id=row.location_id,
+            user_id=row.user_id,
+            user_name=row.user_name,
+            service_id=row.service_id,
+            customer_id=row.customer_id,
+            customer_name=row.customer_name,
+            status_maintable_id=row.status_maintable_id,
+            start_datetime=row.start_datetime,
+            end_datetime=row.end_datetime,
+            reason=getattr(row, "reason", None),
+        )
+
+    async def find_unavailable_appointments(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        location_id: Optional[int] = None,
+    ) -> List[AffectedAppointmentEntity]:
+        """
+        Implementación concreta de la búsqueda de citas afectadas por un cambio de
+        disponibilidad. Llama al stored procedure 'appointments_sp_find_unavailable',
+        que se ejecuta en la misma transacción que el cambio (ve el día libre o el
+        turno recién modificado):
+
+            WHERE a.user_id = p_user_id
+              AND a.annulled = FALSE
+              AND (p_location_id IS NULL OR a.location_id = p_location_id)
+              AND tsrange(a.start_datetime, a.end_datetime)
+                  && tsrange(p_start_date, p_end_date + 1)
+              AND (EXISTS (día libre activo del empleado que se superpone)     -> 'DAY_OFF'
+                   OR NOT EXISTS (turno activo del empleado en a.location_id
+                                  que contiene la cita))                       -> 'NO_SHIFT'
+            ORDER BY a.start_datetime
+
+        El rango de citas se resuelve con el índice GiST 'appointments_user_period_gist',
+        así que el costo depende de las citas del empleado en esos días y no del total.
+        """
+        stmt = text(
+            """
+            SELECT * FROM appointments_sp_find_unavailable(
+                :p_user_id, :p_start_date, :p_end_date, :p_location_id
+            )
+            """
+        )
+
+        params = {
+            "p_user_id": user_id,
+            "p_start_date": start_date,
+            "p_end_date": end_date,
+            "p_location_id": location_id,
+        }
+
+        try:
+            result = await self._uow.session.execute(stmt, params)
+            return [self._to_affected_entity(row) for row in result.fetchall()]
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def find_appointments_by_ids(
+        self, appointment_ids: List[int]
+    ) -> List[AffectedAppointmentEntity]:
+        """
+        Implementación concreta de la lectura de varias citas por ID.
+        Llama al stored procedure 'appointments_sp_get_by_ids(p_appointment_ids INTEGER[])',
+        que devuelve las citas activas con las mismas columnas que
+        'appointments_sp_find_unavailable' (reason en NULL).
+        """
+        if not appointment_ids:
+            return []
+
+        stmt = text("SELECT * FROM appointments_sp_get_by_ids(:p_appointment_ids)")
+
+        try:
+            result = await self._uow.session.execute(
+                stmt, {"p_appointment_ids": appointment_ids}
+            )
+            return [self._to_affected_entity(row) for row in result.fetchall()]
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def reassign_appointments_bulk(
+        self, assignments: Dict[int, int], user_modify: str
+    ) -> List[int]:
+        """
+        Implementación concreta de la reasignación masiva.
+        Llama al stored procedure 'appointments_sp_reassign_bulk(p_items JSONB, p_user_modify)',
+        que aplica todos los cambios con un único UPDATE ... FROM jsonb_to_recordset
+        (solo sobre citas no anuladas) y devuelve los appointment_id actualizados.
+        """
+        if not assignments:
+            return []
+
+        stmt = text(
+            "SELECT * FROM appointments_sp_reassign_bulk(CAST(:p_items AS JSONB), :p_user_modify)"
+        )
+
+        params = {
+            "p_items": json.dumps(
+                [
+                    {"appointment_id": appointment_id, "user_id": user_id}
+                    for appointment_id, user_id in assignments.items()
+                ]
+            ),
+            "p_user_modify": user_modify,
+        }
+
+        try:
+            result = await self._uow.session.execute(stmt, params)
+            return [row.appointment_id for row in result.fetchall()]
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
@@ -0,0 +1,196 @@
+import json
+from datetime import date, time
+from typing import Any, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.constants import uow_var
+from app.modules.appointment.domain.entities.appointment_series_domain import (
+    AppointmentSeriesEntity,
+    RecurrenceFrequency,
+    SeriesOccurrenceEntity,
+)
+from app.modules.appointment.domain.repositories.appointment_series_repository import (
+    AppointmentSeriesRepository,
+)
+from app.modules.share.infra.persistence.unit_of_work import UnitOfWork
+from app.modules.share.utils.handle_dbapi_error import handle_error
+
+
+class AppointmentSeriesImplementationRepository(AppointmentSeriesRepository):
+    """
+    Implementación concreta del repositorio de series de citas usando SQLAlchemy.
+    """
+
+    @property
+    def _uow(self) -> UnitOfWork:
+        """Proporciona acceso a la instancia actual de UnitOfWork."""
+        try:
+            return uow_var.get()
+        except LookupError:
+            raise RuntimeError("UnitOfWork no encontrado en el contexto")
+
+    @staticmethod
+    def _to_entity(row: Any) -> AppointmentSeriesEntity:
+        return AppointmentSeriesEntity(
+            series_id=row.series_id,
+            location_id=row.location_id,
+            user_id=row.user_id,
+            service_id=row.service_id,
+            customer_id=row.customer_id,
+            status_maintable_id=row.status_maintable_id,
+            frequency=RecurrenceFrequency(row.frequency),
+            repeat_interval=row.repeat_interval,
+            start_date=row.start_date,
+            start_time=row.start_time,
+            duration_minutes=row.duration_minutes,
+            until_date=row.until_date,
+            materialized_until=row.materialized_until,
+        )
+
+    async def create_series(
+        self,
+        location_id: int,
+        user_id: int,
+        service_id: int,
+        customer_id: int,
+        status_maintable_id: int,
+        frequency: RecurrenceFrequency,
+        repeat_interval: int,
+        start_date: date,
+        start_time: time,
+        duration_minutes: int,
+        until_date: Optional[date],
+        user_create: str,
+    ) -> int:
+        """
+        Crea la serie llamando a 'appointment_series_sp_create'.
+        """
+        query = text(
+            """
+            SELECT appointment_series_sp_create(
+                :p_location_id, :p_user_id, :p_service_id, :p_customer_id,
+                :p_status_maintable_id, :p_frequency, :p_repeat_interval, :p_start_date,
+                :p_start_time, :p_duration_minutes, :p_until_date, :p_user_create
+            )
+            """
+        )
+
+        params = {
+            "p_location_id": location_id,
+            "p_user_id": user_id,
+            "p_service_id": service_id,
+            "p_customer_id": customer_id,
+            "p_status_maintable_id": status_maintable_id,
+            "p_frequency": frequency.value,
+            "p_repeat_interval": repeat_interval,
+            "p_start_date": start_date,
+            "p_start_time": start_time,
+            "p_duration_minutes": duration_minutes,
+            "p_until_date": until_date,
+            "p_user_create": user_create,
+        }
+
+        try:
+            result = await self._uow.session.execute(query, params)
+            series_id: int = result.scalar_one()
+            return series_id
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def claim_due_series(self, horizon: date, limit: int) -> List[AppointmentSeriesEntity]:
+        """
+        Reclama las series pendientes llamando a 'appointment_series_sp_claim_due'.
+        """
+        query = text("SELECT * FROM appointment_series_sp_claim_due(:p_horizon, :p_limit)")
+
+        try:
+            result = await self._uow.session.execute(
+                query, {"p_horizon": horizon, "p_limit": limit}
+            )
+            return [self._to_entity(row) for row in result.fetchall()]
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def get_series_for_update(self, series_id: int) -> Optional[AppointmentSeriesEntity]:
+        """
+        Obtiene y bloquea la serie llamando a 'appointment_series_sp_get_for_update'.
+        """
+        query = text("SELECT * FROM appointment_series_sp_get_for_update(:p_series_id)")
+
+        try:
+            result = await self._uow.session.execute(query, {"p_series_id": series_id})
+            row = result.first()
+            return self._to_entity(row) if row is not None else None
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def register_occurrences(
+        self,
+        series_id: int,
+        occurrences: List[SeriesOccurrenceEntity],
+        materialized_until: date,
+    ) -> int:
+        """
+        Registra las ocurrencias llamando a 'appointment_series_sp_register_occurrences'.
+        """
+        query = text(
+            "SELECT appointment_series_sp_register_occurrences("
+            ":p_series_id, CAST(:p_items AS JSONB), :p_materialized_until)"
+        )
+
+        params = {
+            "p_series_id": series_id,
+            "p_items": json.dumps(
+                [
+                    {
+                        "occurrence_date": occurrence.occurrence_date.isoformat(),
+                        "appointment_id": occurrence.appointment_id,
+                        "status": occurrence.status,
+                        "error": occurrence.error,
+                    }
+                    for occurrence in occurrences
+                ]
+            ),
+            "p_materialized_until": materialized_until,
+        }
+
+        try:
+            result = await self._uow.session.execute(query, params)
+            registered: int = result.scalar_one()
+            return registered
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def truncate_series(
+        self, series_id: int, from_date: date, user_modify: str
+    ) -> List[int]:
+        """
+        Corta la serie llamando a 'appointment_series_sp_truncate'.
+        """
+        query = text(
+            "SELECT * FROM appointment_series_sp_truncate(:p_series_id, :p_from_date, :p_user_modify)"
+        )
+
+        params = {
+            "p_series_id": series_id,
+            "p_from_date": from_date,
+            "p_user_modify": user_modify,
+        }
+
+        try:
+            result = await self._uow.session.execute(query, params)
+            return [row.appointment_id for row in result.fetchall()]
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
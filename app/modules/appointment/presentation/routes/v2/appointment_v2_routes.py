@@ -1,3 +1,4 @@
+from datetime import date
 from typing import Annotated, Any, Dict
 
 from fastapi import APIRouter, Depends, Path, Query
@@ -6,18 +7,57 @@ from mediatr import Mediator
 from app.modules.appointment.application.commands.create_appointment.create_appointment_command_handler import (
     CreateAppointmentCommand,
 )
+from app.modules.appointment.application.commands.cancel_appointment_series_following.cancel_appointment_series_following_command_handler import (
+    CancelAppointmentSeriesFollowingCommand,
+    CancelAppointmentSeriesFollowingResponse,
+)
+from app.modules.appointment.application.commands.create_appointment_series.create_appointment_series_command_handler import (
+    AppointmentSeriesResponse,
+    CreateAppointmentSeriesCommand,
+)
+from app.modules.appointment.application.commands.create_appointments_batch.create_appointments_batch_command_handler import (
+    BatchAppointmentItem,
+    CreateAppointmentsBatchCommand,
+    CreateAppointmentsBatchResponse,
+)
 from app.modules.appointment.application.commands.delete_appointment.delete_appointment_command_handler import (
     DeleteAppointmentCommand,
 )
+from app.modules.appointment.application.commands.reassign_appointments.reassign_appointments_command_handler import (
+    ReassignAppointmentsCommand,
+    ReassignAppointmentsResponse,
+)
+from app.modules.appointment.application.commands.update_appointment_series_following.update_appointment_series_following_command_handler import (
+    UpdateAppointmentSeriesFollowingCommand,
+    UpdateAppointmentSeriesFollowingResponse,
+)
 from app.modules.appointment.application.commands.update_appointment.update_appointment_command_handler import (
     UpdateAppointmentCommand,
 )
 from app.modules.appointment.application.queries.get_appointment_refactor.get_appointment_refactor_handler import (
     FindAppointmentRefactorQuery,
 )
+from app.modules.appointment.application.queries.get_availability.get_availability_handler import (
+    GetAvailabilityQuery,
+    GetAvailabilityResponse,
+)
+from app.modules.appointment.application.queries.get_next_available.get_next_available_handler import (
+    GetNextAvailableQuery,
+    GetNextAvailableResponse,
+)
+from app.modules.appointment.application.request.appointment_series_request import (
+    CreateAppointmentSeriesRequest,
+    UpdateAppointmentSeriesFollowingRequest,
+)
 from app.modules.appointment.application.request.create_appointment_request import (
     CreateAppointmentRequest,
 )
+from app.modules.appointment.application.request.create_appointments_batch_request import (
+    CreateAppointmentsBatchRequest,
+)
+from app.modules.appointment.application.request.reassign_appointments_request import (
+    ReassignAppointmentsRequest,
+)
 from app.modules.appointment.application.request.update_appointment_request import (
     UpdateAppointmentRequest,
 )
@@ -50,6 +90,28 @@ class AppointmentV2Controller:
             },
         )(self.get_appointments)
 
+        self.router.get(
+            "/appointments/availability",
+            dependencies=[Depends(permission_required(roles=["admin", "staff"]))],
+            responses={
+                200: {
+                    "description": "Horarios libres por empleado para el servicio",
+                    "model": GetAvailabilityResponse,
+                }
+            },
+        )(self.get_availability)
+
+        self.router.get(
+            "/appointments/next-available",
+            dependencies=[Depends(permission_required(roles=["admin", "staff"]))],
+            responses={
+                200: {
+                    "description": "Próximos horarios libres con cualquier empleado de la sede",
+                    "model": GetNextAvailableResponse,
+                }
+            },
+        )(self.get_next_available)
+
         self.router.post(
             "/appointments",
             dependencies=[Depends(permission_required(roles=["admin", "staff"]))],
@@ -63,6 +125,61 @@ class AppointmentV2Controller:
             },
         )(self.create_appointment)
 
+        self.router.post(
+            "/appointments/batch",
+            dependencies=[Depends(permission_required(roles=["admin", "staff"]))],
+            responses={
+                200: {
+                    "description": "Resultado por ítem del alta masiva de citas",
+                    "model": CreateAppointmentsBatchResponse,
+                }
+            },
+        )(self.create_appointments_batch)
+
+        self.router.post(
+            "/appointments/reassign",
+            dependencies=[Depends(permission_required(roles=["admin", "staff"]))],
+            responses={
+                200: {
+                    "description": "Resultado por cita de la reasignación masiva",
+                    "model": ReassignAppointmentsResponse,
+                }
+            },
+        )(self.reassign_appointments)
+
+        self.router.post(
+            "/appointments/series",
+            dependencies=[Depends(permission_required(roles=["admin", "staff"]))],
+            responses={
+                200: {
+                    "description": "Serie creada y citas generadas hasta el horizonte",
+                    "model": AppointmentSeriesResponse,
+                }
+            },
+        )(self.create_appointment_series)
+
+        self.router.put(
+            "/appointments/series/{series_id}/following",
+            dependencies=[Depends(permission_required(roles=["admin", "staff"]))],
+            responses={
+                200: {
+                    "description": "Serie modificada desde la fecha indicada",
+                    "model": UpdateAppointmentSeriesFollowingResponse,
+                }
+            },
+        )(self.update_appointment_series_following)
+
+        self.router.delete(
+            "/appointments/series/{series_id}/following",
+            dependencies=[Depends(permission_required(roles=["admin", "staff"]))],
+            responses={
+                200: {
+                    "description": "Serie cancelada desde la fecha indicada",
+                    "model": CancelAppointmentSeriesFollowingResponse,
+                }
+            },
+        )(self.cancel_appointment_series_following)
+
         self.router.put(
             "/appointments/{appointment_id}",
             dependencies=[Depends(permission_required(roles=["admin", "staff"]))],
@@ -116,6 +233,42 @@ class AppointmentV2Controller:
         result = await self.mediator.send_async(query_params)
         return result
 
+    async def get_availability(
+        self, query_params: Annotated[GetAvailabilityQuery, Query()]
+    ) -> GetAvailabilityResponse:
+        """
+        Obtiene los horarios en los que se puede reservar un servicio en una sede
+
+        Parámetros:
+        - location_id: ID de la sede
+        - service_id: ID del servicio (se usa su duration_minutes)
+        - start_date / end_date: Rango de días, inclusive (formato: YYYY-MM-DD)
+        - user_id: ID del empleado (opcional, por defecto todos los de la sede)
+        - step_minutes: Minutos entre el inicio de un slot y el siguiente
+
+        Los slots se calculan como turnos menos días libres menos citas,
+        recortados al horario de atención de la sede.
+        """
+        result: GetAvailabilityResponse = await self.mediator.send_async(query_params)
+        return result
+
+    async def get_next_available(
+        self, query_params: Annotated[GetNextAvailableQuery, Query()]
+    ) -> GetNextAvailableResponse:
+        """
+        Obtiene los próximos horarios libres para un servicio con cualquier empleado
+
+        Parámetros:
+        - location_id: ID de la sede
+        - service_id: ID del servicio (se usa su duration_minutes)
+        - after: Buscar a partir de esta fecha y hora (opcional, por defecto ahora)
+        - limit: Cantidad de horarios a devolver (por defecto 5)
+
+        Los horarios se devuelven ordenados del más temprano al más tardío.
+        """
+        result: GetNextAvailableResponse = await self.mediator.send_async(query_params)
+        return result
+
     async def create_appointment(
         self,
         request: CreateAppointmentRequest,
@@ -154,6 +307,134 @@ class AppointmentV2Controller:
         result: int = await self.mediator.send_async(command)
         return {"appointment_id": result}
 
+    async def create_appointments_batch(
+        self,
+        request: CreateAppointmentsBatchRequest,
+        current_user: UserAuth = Depends(get_current_user),
+    ) -> CreateAppointmentsBatchResponse:
+        """
+        Crea varias citas en una sola transacción
+
+        Campos:
+        - items: Citas a crear, con los mismos campos que la creación individual
+        - atomic: Si es true y algún ítem tiene conflicto, no se crea ninguna cita
+
+        Los conflictos se verifican para todo el lote en una sola consulta, incluidos
+        los conflictos entre ítems del mismo lote (gana el ítem que aparece primero).
+        Cada ítem informa su resultado: created, conflict o skipped.
+        """
+        if not current_user.email:
+            raise ValueError("User email not found in token")
+
+        command = CreateAppointmentsBatchCommand(
+            items=[BatchAppointmentItem(**item.model_dump()) for item in request.items],
+            atomic=request.atomic,
+            user_create=current_user.email,
+        )
+
+        result: CreateAppointmentsBatchResponse = await self.mediator.send_async(command)
+        return result
+
+    async def reassign_appointments(
+        self,
+        request: ReassignAppointmentsRequest,
+        current_user: UserAuth = Depends(get_current_user),
+    ) -> ReassignAppointmentsResponse:
+        """
+        Reasigna varias citas a otro empleado disponible de su misma sede
+
+        Campos:
+        - appointment_ids: Citas a reasignar, por ejemplo las informadas en
+          affected_appointments al crear un día libre o modificar un turno
+
+        Para cada cita, en orden de inicio, se elige entre el personal de la sede con
+        turno y sin citas en ese horario al que tenga menos citas asignadas en esta
+        operación. Todos los cambios se aplican en una sola actualización.
+        Cada cita informa su resultado: reassigned o unassigned.
+        """
+        if not current_user.email:
+            raise ValueError("User email not found in token")
+
+        command = ReassignAppointmentsCommand(
+            appointment_ids=request.appointment_ids,
+            user_modify=current_user.email,
+        )
+
+        result: ReassignAppointmentsResponse = await self.mediator.send_async(command)
+        return result
+
+    async def create_appointment_series(
+        self,
+        request: CreateAppointmentSeriesRequest,
+        current_user: UserAuth = Depends(get_current_user),
+    ) -> AppointmentSeriesResponse:
+        """
+        Crea una serie de citas repetidas (diaria o semanal, cada N días o semanas)
+
+        Las citas se crean por adelantado solo hasta el horizonte configurado
+        (APPOINTMENT_SERIES_HORIZON_DAYS); las siguientes las crea un job periódico.
+        Las ocurrencias que chocan con otras citas se informan como conflict y no se crean.
+        """
+        if not current_user.email:
+            raise ValueError("User email not found in token")
+
+        command = CreateAppointmentSeriesCommand(
+            **request.model_dump(),
+            user_create=current_user.email,
+        )
+
+        result: AppointmentSeriesResponse = await self.mediator.send_async(command)
+        return result
+
+    async def update_appointment_series_following(
+        self,
+        series_id: Annotated[int, Path(description="ID de la serie", gt=0)],
+        request: UpdateAppointmentSeriesFollowingRequest,
+        current_user: UserAuth = Depends(get_current_user),
+    ) -> UpdateAppointmentSeriesFollowingResponse:
+        """
+        Modifica una serie desde una de sus citas ("esta y las siguientes")
+
+        Las citas anteriores a from_date no se modifican. Las citas ya creadas desde
+        from_date se anulan y se generan de nuevo con los cambios, como una serie nueva.
+        from_date debe ser hoy o una fecha posterior.
+        """
+        if not current_user.email:
+            raise ValueError("User email not found in token")
+
+        command = UpdateAppointmentSeriesFollowingCommand(
+            series_id=series_id,
+            **request.model_dump(),
+            user_modify=current_user.email,
+        )
+
+        result: UpdateAppointmentSeriesFollowingResponse = await self.mediator.send_async(command)
+        return result
+
+    async def cancel_appointment_series_following(
+        self,
+        series_id: Annotated[int, Path(description="ID de la serie", gt=0)],
+        from_date: Annotated[date, Query(description="Fecha desde la que se cancela la serie")],
+        current_user: UserAuth = Depends(get_current_user),
+    ) -> CancelAppointmentSeriesFollowingResponse:
+        """
+        Cancela una serie desde una fecha ("esta y las siguientes")
+
+        Se anulan las citas de la serie desde from_date; las anteriores se conservan.
+        from_date debe ser hoy o una fecha posterior.
+        """
+        if not current_user.email:
+            raise ValueError("User email not found in token")
+
+        command = CancelAppointmentSeriesFollowingCommand(
+            series_id=series_id,
+            from_date=from_date,
+            user_modify=current_user.email,
+        )
+
+        result: CancelAppointmentSeriesFollowingResponse = await self.mediator.send_async(command)
+        return result
+
     async def update_appointment(
         self,
         appointment_id: Annotated[
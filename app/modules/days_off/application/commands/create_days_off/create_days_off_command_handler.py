@@ -3,6 +3,11 @@ from datetime import date, time
 from mediatr import Mediator  # Importa la biblioteca Mediator
 from pydantic import BaseModel  # Importa BaseModel de Pydantic para validación de datos
 
+# Importa el servicio que detecta las citas afectadas por el día libre
+from app.modules.appointment.application.services.affected_appointments_service import (
+    AffectedAppointmentsService,
+    AvailabilityChangeResponse,
+)
 # Importa la interfaz del repositorio de días libres
 from app.modules.days_off.domain.repositories.days_off_repository import DaysOffRepository
 # Importa la interfaz base para los manejadores de comandos/solicitudes
@@ -32,10 +37,11 @@ class CreateDaysOffCommand(BaseModel):
 
 # --- Definición del Manejador del Comando ---
 @Mediator.handler
-class CreateDaysOffCommandHandler(IRequestHandler[CreateDaysOffCommand, str]):
+class CreateDaysOffCommandHandler(IRequestHandler[CreateDaysOffCommand, AvailabilityChangeResponse]):
     """
     Manejador para el comando CreateDaysOffCommand.
-    Orquesta la creación de un día libre utilizando el repositorio correspondiente.
+    Orquesta la creación de un día libre utilizando el repositorio correspondiente
+    e informa las citas del usuario que quedan dentro del día libre.
     """
     def __init__(self) -> None:
         # Constructor: Obtiene dependencias usando el inyector
@@ -44,8 +50,9 @@ class CreateDaysOffCommandHandler(IRequestHandler[CreateDaysOffCommand, str]):
         # Inyecta una instancia del Repositorio de Días Libres (la interfaz abstracta)
         # El contenedor se encarga de proporcionar la implementación concreta
         self.days_off_repository: DaysOffRepository = injector.get(DaysOffRepository)  # type: ignore[type-abstract]
+        self.affected_appointments_service = AffectedAppointmentsService()
 
-    async def handle(self, command: CreateDaysOffCommand) -> str:
+    async def handle(self, command: CreateDaysOffCommand) -> AvailabilityChangeResponse:
         """
         Lógica para manejar el comando CreateDaysOffCommand.
 
@@ -53,7 +60,7 @@ class CreateDaysOffCommandHandler(IRequestHandler[CreateDaysOffCommand, str]):
             command: El objeto comando con los datos del día libre a crear.
 
         Returns:
-            Un mensaje (str) indicando el resultado de la operación.
+            El mensaje del stored procedure y las citas afectadas por el día libre.
         """
         # Delega la lógica de creación al método create_day_off del repositorio
         # Pasa los datos recibidos en el comando al método del repositorio
@@ -68,5 +75,10 @@ class CreateDaysOffCommandHandler(IRequestHandler[CreateDaysOffCommand, str]):
             motivo=command.motivo,
         )
 
-        # Devuelve el mensaje obtenido del repositorio
-        return result_message 
\ No newline at end of file
+        # Citas del usuario que ahora caen dentro de un día libre (misma transacción)
+        return await self.affected_appointments_service.build_response(
+            message=result_message,
+            user_id=command.user_id,
+            start_date=command.fecha_inicio,
+            end_date=command.fecha_fin,
+        ) 
\ No newline at end of file
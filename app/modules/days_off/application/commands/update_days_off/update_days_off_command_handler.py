@@ -8,6 +8,10 @@ from pydantic import BaseModel, field_validator, model_validator
 
 # Importaciones necesarias del proyecto
 from app.constants import injector_var
+from app.modules.appointment.application.services.affected_appointments_service import (
+    AffectedAppointmentsService,
+    AvailabilityChangeResponse,
+)
 from app.modules.days_off.domain.repositories.days_off_repository import (
     DaysOffRepository,  # Importa la interfaz del repositorio de días libres
 )
@@ -65,7 +69,7 @@ class UpdateDaysOffCommand(BaseModel):
 
 # --- Handler ---
 @Mediator.handler
-class UpdateDaysOffCommandHandler(IRequestHandler[UpdateDaysOffCommand, str]):
+class UpdateDaysOffCommandHandler(IRequestHandler[UpdateDaysOffCommand, AvailabilityChangeResponse]):
     """
     Manejador (Handler) para el comando UpdateDaysOffCommand.
     Orquesta la lógica para actualizar un día libre: recibe el comando validado,
@@ -80,8 +84,9 @@ class UpdateDaysOffCommandHandler(IRequestHandler[UpdateDaysOffCommand, str]):
         # gracias a cómo se configuró la inyección de dependencias en otra parte.
         # El type: ignore es porque el injector devuelve 'Any' pero sabemos que es un DaysOffRepository.
         self.days_off_repository: DaysOffRepository = injector.get(DaysOffRepository)  # type: ignore[type-abstract]
+        self.affected_appointments_service = AffectedAppointmentsService()
 
-    async def handle(self, command: UpdateDaysOffCommand) -> str:
+    async def handle(self, command: UpdateDaysOffCommand) -> AvailabilityChangeResponse:
         """
         Ejecuta la lógica principal para manejar el comando de actualización.
 
@@ -89,8 +94,9 @@ class UpdateDaysOffCommandHandler(IRequestHandler[UpdateDaysOffCommand, str]):
             command: La instancia del comando UpdateDaysOffCommand con los datos validados.
 
         Returns:
-            Un string con el mensaje de resultado devuelto por el repositorio
-            (ej. "Day off ID 123 updated successfully." o un mensaje de error).
+            El mensaje de resultado devuelto por el repositorio
+            (ej. "Day off ID 123 updated successfully.") y las citas afectadas
+            por el día libre ya modificado.
         """
         # Llama al método correspondiente en el repositorio para actualizar los detalles
         # Pasa los datos directamente desde el objeto 'command' ya validado por Pydantic.
@@ -105,6 +111,15 @@ class UpdateDaysOffCommandHandler(IRequestHandler[UpdateDaysOffCommand, str]):
             motivo=command.motivo,
         )
 
-        # Devuelve el resultado (mensaje de texto) que proviene del repositorio
-        # (que a su vez, lo obtuvo del stored procedure).
-        return result
\ No newline at end of file
+        # Los campos no enviados conservan su valor, así que el rango final se lee
+        # del día libre ya actualizado (misma transacción)
+        day_off = await self.days_off_repository.get_day_off_by_id(command.day_off_id)
+        if day_off is None:
+            return AvailabilityChangeResponse(message=result)
+
+        return await self.affected_appointments_service.build_response(
+            message=result,
+            user_id=day_off.user_id,
+            start_date=day_off.fecha_inicio,
+            end_date=day_off.fecha_fin,
+        )
\ No newline at end of file
@@ -135,3 +135,17 @@ class DaysOffRepository(ABC):
                  "Day off ID 123 for user 5 is already annulled. No action taken.").
         """
         pass  # La implementación real estará en la subclase concreta
+
+    @abstractmethod
+    async def get_day_off_by_id(self, day_off_id: int) -> Optional[DaysOffEntity]:
+        """
+        Método abstracto para obtener un día libre activo por su ID.
+        Utiliza el stored procedure 'days_off_sp_get_day_off_by_id'.
+
+        Args:
+            day_off_id (int): El ID del día libre.
+
+        Returns:
+            Optional[DaysOffEntity]: El día libre, o None si no existe o está anulado.
+        """
+        pass  # La implementación real estará en la subclase concreta
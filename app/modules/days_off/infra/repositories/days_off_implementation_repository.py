@@ -214,4 +214,38 @@ class DaysOffImplementationRepository(DaysOffRepository):
             # y levanta una excepción HTTP genérica (ej. 500 Internal Server Error).
             handle_error(e)
             # Esta línea teóricamente no se alcanza si handle_error siempre levanta una excepción.
-            raise RuntimeError("Este punto nunca se alcanza") 
\ No newline at end of file
+            raise RuntimeError("Este punto nunca se alcanza") 
+
+    async def get_day_off_by_id(self, day_off_id: int) -> Optional[DaysOffEntity]:
+        """
+        Implementación concreta para obtener un día libre activo por su ID.
+        Llama a la función 'days_off_sp_get_day_off_by_id', que devuelve la fila
+        de la tabla 'days_off' (ninguna si no existe o está anulada).
+        """
+        stmt = text("SELECT * FROM days_off_sp_get_day_off_by_id(:p_day_off_id)")
+
+        try:
+            result = await self._uow.session.execute(stmt, {"p_day_off_id": day_off_id})
+            row = result.first()
+            if row is None:
+                return None
+
+            return DaysOffEntity(
+                id=row.id,
+                user_id=row.user_id,
+                tipo_dia_libre_maintable_id=row.tipo_dia_libre_maintable_id,
+                fecha_inicio=row.fecha_inicio,
+                fecha_fin=row.fecha_fin,
+                hora_inicio=row.hora_inicio,
+                hora_fin=row.hora_fin,
+                motivo=row.motivo,
+                insert_date=row.insert_date,
+                update_date=row.update_date,
+                user_create=row.user_create,
+                user_modify=row.user_modify,
+                annulled=row.annulled,
+            )
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")  # handle_error siempre levanta excepción
@@ -22,6 +22,11 @@ from app.modules.auth.presentation.dependencies.auth_dependencies import (
     permission_required,
 )
 
+# Importa la respuesta con las citas afectadas por el cambio de disponibilidad
+from app.modules.appointment.application.services.affected_appointments_service import (
+    AvailabilityChangeResponse,
+)
+
 # --- Importaciones de Comandos de Días Libres ---
 from app.modules.days_off.application.commands.create_days_off.create_days_off_command_handler import (
     CreateDaysOffCommand,
@@ -65,7 +70,7 @@ class DaysOffController:
         # --- Ruta POST para Crear un Día Libre ---
         self.router.post(
             "/days-off",
-            response_model=str,                           # Se espera un mensaje de texto como respuesta
+            response_model=AvailabilityChangeResponse,   # Mensaje y citas afectadas por el cambio
             status_code=status.HTTP_201_CREATED,         # Código de éxito para creación
             summary="Create day off",                    # Resumen breve de la ruta
             description="Crea un nuevo período de día libre para un usuario específico. Requiere rol 'admin' o 'counter'",
@@ -77,7 +82,7 @@ class DaysOffController:
         # --- RUTA PUT PARA ACTUALIZAR DETALLES DE DÍA LIBRE ---
         self.router.put(
             "/days-off/{day_off_id}/details",
-            response_model=str,                           # Se espera un mensaje de texto como respuesta
+            response_model=AvailabilityChangeResponse,   # Mensaje y citas afectadas por el cambio
             status_code=status.HTTP_200_OK,               # Código de éxito para actualización
             summary="Update day off details",            # Resumen breve de la ruta
             description="Actualiza los detalles de un día libre existente. Permite actualización parcial de campos. Requiere rol 'admin'.",
@@ -102,7 +107,7 @@ class DaysOffController:
         self, 
         request: CreateDaysOffRequest, 
         current_user: UserAuth = Depends(get_current_user)
-    ) -> str:
+    ) -> AvailabilityChangeResponse:
         """
         Maneja la petición POST a /days-off.
         Crea y envía el comando CreateDaysOffCommand al Mediator.
@@ -130,7 +135,7 @@ class DaysOffController:
         #    El Mediator buscará el Handler registrado para CreateDaysOffCommand
         #    y ejecutará su método handle().
         #    Se espera que devuelva una cadena de texto (str) como resultado.
-        result: str = await self.mediator.send_async(command)
+        result: AvailabilityChangeResponse = await self.mediator.send_async(command)
 
         # 4. Devolver el resultado obtenido del Handler
         #    FastAPI se encargará de enviar esta cadena como cuerpo de la respuesta HTTP.
@@ -142,7 +147,7 @@ class DaysOffController:
         day_off_id: Annotated[int, Path(ge=1, description="ID del día libre a actualizar")],
         payload: UpdateDaysOffDetailsPayload,
         current_user: UserAuth = Depends(get_current_user),
-    ) -> str:
+    ) -> AvailabilityChangeResponse:
         """
         Maneja la petición PUT a /days-off/{day_off_id}/details.
         Crea y envía el comando UpdateDaysOffCommand al Mediator para actualizar
@@ -170,7 +175,7 @@ class DaysOffController:
         # 3. Enviar el comando al Mediator
         #    El Mediator buscará el Handler registrado para UpdateDaysOffCommand
         #    y ejecutará su método handle().
-        result: str = await self.mediator.send_async(command)
+        result: AvailabilityChangeResponse = await self.mediator.send_async(command)
 
         # 4. Devolver el resultado obtenido del Handler
         return result
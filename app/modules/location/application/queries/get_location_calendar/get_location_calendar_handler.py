@@ -0,0 +1,70 @@
+from datetime import date
+
+from mediatr import Mediator
+from pydantic import BaseModel, Field, TypeAdapter, ValidationInfo, field_validator
+
+from app.constants import injector_var
+from app.modules.location.domain.entities.location_domain import LocationCalendarEntity
+from app.modules.location.domain.repositories.location_repository import (
+    LocationRepository,
+)
+from app.modules.location.infra.services.location_calendar_cache import (
+    CachedLocationCalendar,
+    get_location_calendar_cache,
+)
+from app.modules.share.domain.handler.request_handler import IRequestHandler
+from config.setting import LOCATION_CALENDAR_MAX_RANGE_DAYS
+
+_calendar_adapter = TypeAdapter(LocationCalendarEntity)
+
+
+class GetLocationCalendarQuery(BaseModel):
+    """
+    Query para obtener el calendario de una sede en un rango de fechas.
+    """
+    location_id: int = Field(..., gt=0, description="ID de la sede")
+    start: date = Field(..., description="Primer día del calendario")
+    end: date = Field(..., description="Último día del calendario, inclusive")
+
+    @field_validator("end")
+    def validate_range(cls, v: date, info: ValidationInfo) -> date:
+        start = info.data.get("start")
+        if start is None:
+            return v
+        if v < start:
+            raise ValueError("end no puede ser anterior a start")
+        if (v - start).days + 1 > LOCATION_CALENDAR_MAX_RANGE_DAYS:
+            raise ValueError(
+                f"El rango no puede superar {LOCATION_CALENDAR_MAX_RANGE_DAYS} días"
+            )
+        return v
+
+
+@Mediator.handler
+class GetLocationCalendarQueryHandler(
+    IRequestHandler[GetLocationCalendarQuery, CachedLocationCalendar]
+):
+    """
+    Devuelve el calendario de la sede ya serializado a JSON, con su ETag.
+
+    Los datos se obtienen con una sola llamada a la base de datos y la respuesta se
+    cachea por sede y rango; las solicitudes concurrentes del mismo calendario
+    comparten una única carga.
+    """
+
+    def __init__(self) -> None:
+        injector = injector_var.get()
+        self.location_repository: LocationRepository = injector.get(LocationRepository)  # type: ignore[type-abstract]
+
+    async def handle(self, query: GetLocationCalendarQuery) -> CachedLocationCalendar:
+        async def load() -> CachedLocationCalendar:
+            calendar = await self.location_repository.get_location_calendar(
+                location_id=query.location_id,
+                start_date=query.start,
+                end_date=query.end,
+            )
+            return CachedLocationCalendar.from_content(_calendar_adapter.dump_json(calendar))
+
+        return await get_location_calendar_cache().get_or_load(
+            (query.location_id, query.start, query.end), load
+        )
@@ -0,0 +1,12 @@
+# Importar los suscriptores para que se registren en el bus de eventos de dominio
+from app.modules.location.application.subscribers.location_calendar_subscriber import (
+    invalidate_calendar_on_created,
+    invalidate_calendar_on_deleted,
+    invalidate_calendar_on_updated,
+)
+
+__all__ = [
+    "invalidate_calendar_on_created",
+    "invalidate_calendar_on_deleted",
+    "invalidate_calendar_on_updated",
+]
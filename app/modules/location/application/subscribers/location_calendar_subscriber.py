@@ -0,0 +1,32 @@
+from app.modules.appointment.domain.events import (
+    AppointmentCreatedEvent,
+    AppointmentDeletedEvent,
+    AppointmentUpdatedEvent,
+)
+from app.modules.location.infra.services.location_calendar_cache import (
+    invalidate_location_calendar,
+)
+from app.modules.share.infra.events import subscribe
+
+# El calendario de una sede también muestra las citas de su personal en otras sedes,
+# así que una cita puede cambiar el calendario de cualquier sede donde trabaje el
+# empleado. Los eventos no traen esas sedes (ni el empleado o la sede anteriores de
+# una cita modificada), por lo que cada cambio invalida todos los calendarios.
+
+
+@subscribe(AppointmentCreatedEvent)
+async def invalidate_calendar_on_created(event: AppointmentCreatedEvent) -> None:
+    """Una cita nueva cambia el calendario de su sede y de las sedes de su empleado."""
+    invalidate_location_calendar()
+
+
+@subscribe(AppointmentUpdatedEvent)
+async def invalidate_calendar_on_updated(event: AppointmentUpdatedEvent) -> None:
+    """La cita pudo cambiar de sede o de empleado: se invalidan todos los calendarios."""
+    invalidate_location_calendar()
+
+
+@subscribe(AppointmentDeletedEvent)
+async def invalidate_calendar_on_deleted(event: AppointmentDeletedEvent) -> None:
+    """El evento de anulación no trae la sede, así que se invalidan todas."""
+    invalidate_location_calendar()
@@ -84,3 +84,56 @@ class LocationEntity:
     review_location: str
     status: bool
     file: FileEntity
+
+
+@dataclass
+class CalendarShiftEntity:
+    shift_id: int
+    start_time: datetime
+    end_time: datetime
+    sede_id: Optional[int] = None
+
+
+@dataclass
+class CalendarDayOffEntity:
+    day_off_id: int
+    start_time: datetime
+    end_time: datetime
+    description: Optional[str] = None
+
+
+@dataclass
+class CalendarAppointmentEntity:
+    appointment_id: int
+    location_id: int
+    start_datetime: datetime
+    end_datetime: datetime
+    service_id: int
+    service_name: str
+    customer_id: int
+    customer_name: str
+    status_id: int
+    status_name: str
+
+
+@dataclass
+class CalendarStaffEntity:
+    user_id: int
+    user_name: str
+    email: str
+    shifts: list[CalendarShiftEntity]
+    days_off: list[CalendarDayOffEntity]
+    appointments: list[CalendarAppointmentEntity]
+
+
+@dataclass
+class LocationCalendarEntity:
+    """
+    Calendario de una sede en un rango de fechas: horario de atención y, por cada
+    empleado asignado, sus turnos, días libres y citas. Resultado del SP
+    'location_sp_get_calendar'.
+    """
+    location_id: int
+    location_name: str
+    schedules: list[ScheduleRequestDomain]
+    staff: list[CalendarStaffEntity]
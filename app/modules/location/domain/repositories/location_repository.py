@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import Any, Dict, Optional
 
 from app.modules.location.domain.entities.location_domain import (
+    LocationCalendarEntity,
     LocationEntity,
     LocationInfoResponse,
     LocationResponse,
@@ -87,3 +89,13 @@ class LocationRepository(ABC):
         self,
     ) -> list[SedeDomain]:
         pass
+
+    @abstractmethod
+    async def get_location_calendar(
+        self, location_id: int, start_date: date, end_date: date
+    ) -> LocationCalendarEntity:
+        """
+        Obtiene en una sola llamada el horario de la sede y los turnos, días libres
+        y citas de su personal en el rango [start_date, end_date].
+        """
+        pass
@@ -1,6 +1,6 @@
 import json
 from collections import defaultdict
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Dict, Optional
 
 from fastapi import HTTPException
@@ -9,7 +9,12 @@ from sqlalchemy.exc import DBAPIError
 
 from app.constants import uow_var
 from app.modules.location.domain.entities.location_domain import (
+    CalendarAppointmentEntity,
+    CalendarDayOffEntity,
+    CalendarShiftEntity,
+    CalendarStaffEntity,
     DayOfWeek,
+    LocationCalendarEntity,
     LocationEntity,
     LocationInfoResponse,
     LocationResponse,
@@ -420,3 +425,102 @@ class LocationImplementationRepository(LocationRepository):
         except DBAPIError as e:
             handle_error(e)
             raise RuntimeError("Este punto nunca se alcanza")
+
+    async def get_location_calendar(
+        self, location_id: int, start_date: date, end_date: date
+    ) -> LocationCalendarEntity:
+        """
+        Llama a 'location_sp_get_calendar', que arma el calendario completo en un
+        único JSONB (NULL si la sede no existe):
+
+            {"location_id", "location_name",
+             "schedules": [{"day", "ranges": [{"start", "end"}]}],
+             "staff": [{"user_id", "user_name", "email",
+                        "shifts": [{"shift_id", "start_time", "end_time", "sede_id"}],
+                        "days_off": [{"day_off_id", "start_time", "end_time", "description"}],
+                        "appointments": [{"appointment_id", "location_id", "start_datetime",
+                                          "end_datetime", "service_id", "service_name",
+                                          "customer_id", "customer_name", "status_id",
+                                          "status_name"}]}]}
+
+        Las citas de un empleado incluyen las de otras sedes, porque también lo
+        ocupan; las anuladas se excluyen.
+        """
+        stmt = text(
+            "SELECT location_sp_get_calendar(:p_location_id, :p_start_date, :p_end_date)"
+        )
+
+        try:
+            result = await self._uow.session.execute(
+                stmt,
+                {
+                    "p_location_id": location_id,
+                    "p_start_date": start_date,
+                    "p_end_date": end_date,
+                },
+            )
+            data = result.scalar_one()
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+        if data is None:
+            raise HTTPException(
+                status_code=404, detail="No se encontró la sede en la base de datos"
+            )
+
+        return LocationCalendarEntity(
+            location_id=data["location_id"],
+            location_name=data["location_name"],
+            schedules=[
+                ScheduleRequestDomain(
+                    day=DayOfWeek(item["day"]),
+                    ranges=[
+                        ScheduleRangeDomain(start=r["start"], end=r["end"])
+                        for r in item["ranges"]
+                    ],
+                )
+                for item in data["schedules"] or []
+            ],
+            staff=[
+                CalendarStaffEntity(
+                    user_id=member["user_id"],
+                    user_name=member["user_name"],
+                    email=member["email"],
+                    shifts=[
+                        CalendarShiftEntity(
+                            shift_id=shift["shift_id"],
+                            start_time=datetime.fromisoformat(shift["start_time"]),
+                            end_time=datetime.fromisoformat(shift["end_time"]),
+                            sede_id=shift.get("sede_id"),
+                        )
+                        for shift in member["shifts"] or []
+                    ],
+                    days_off=[
+                        CalendarDayOffEntity(
+                            day_off_id=day_off["day_off_id"],
+                            start_time=datetime.fromisoformat(day_off["start_time"]),
+                            end_time=datetime.fromisoformat(day_off["end_time"]),
+                            description=day_off.get("description"),
+                        )
+                        for day_off in member["days_off"] or []
+                    ],
+                    appointments=[
+                        CalendarAppointmentEntity(
+                            appointment_id=a["appointment_id"],
+                            location_id=a["location_id"],
+                            start_datetime=datetime.fromisoformat(a["start_datetime"]),
+                            end_datetime=datetime.fromisoformat(a["end_datetime"]),
+                            service_id=a["service_id"],
+                            service_name=a["service_name"],
+                            customer_id=a["customer_id"],
+                            customer_name=a["customer_name"],
+                            status_id=a["status_id"],
+                            status_name=a["status_name"],
+                        )
+                        for a in member["appointments"] or []
+                    ],
+                )
+                for member in data["staff"] or []
+            ],
+        )
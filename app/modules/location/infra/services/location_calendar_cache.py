@@ -0,0 +1,71 @@
+"""
+Caché del calendario de sedes.
+
+Guarda la respuesta ya serializada junto con su ETag, indexada por
+(location_id, start, end), durante LOCATION_CALENDAR_CACHE_TTL segundos. Los
+suscriptores de eventos de citas invalidan todas las entradas, porque el calendario
+de una sede incluye las citas de su personal en otras sedes; los cambios de turnos,
+días libres u horario (y los de otros procesos) se reflejan al vencer el TTL.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import date
+from typing import Hashable, Optional, Tuple
+
+from app.modules.share.infra.cache import AsyncTtlCache
+from config.setting import LOCATION_CALENDAR_CACHE_TTL
+
+CalendarKey = Tuple[int, date, date]
+
+
+@dataclass(frozen=True)
+class CachedLocationCalendar:
+    """Respuesta JSON del calendario y su ETag."""
+    content: bytes
+    etag: str
+
+    @classmethod
+    def from_content(cls, content: bytes) -> "CachedLocationCalendar":
+        return cls(content=content, etag=f'"{hashlib.sha256(content).hexdigest()[:32]}"')
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Indica si el cliente ya tiene esta versión (cabecera If-None-Match)."""
+        if not if_none_match:
+            return False
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or self.etag in candidates
+
+
+_calendar_cache: Optional[AsyncTtlCache[CachedLocationCalendar]] = None
+
+
+def get_location_calendar_cache() -> AsyncTtlCache[CachedLocationCalendar]:
+    """
+    Obtiene la caché de calendarios del proceso.
+
+    Returns:
+        AsyncTtlCache: Caché indexada por (location_id, start, end)
+    """
+    global _calendar_cache
+    if _calendar_cache is None:
+        _calendar_cache = AsyncTtlCache(ttl=LOCATION_CALENDAR_CACHE_TTL)
+    return _calendar_cache
+
+
+def invalidate_location_calendar(location_id: Optional[int] = None) -> None:
+    """
+    Invalida los calendarios cacheados de una sede, o de todas si no se indica.
+
+    Args:
+        location_id: ID de la sede.
+    """
+    cache = get_location_calendar_cache()
+    if location_id is None:
+        cache.clear()
+        return
+
+    def same_location(key: Hashable) -> bool:
+        return isinstance(key, tuple) and key[0] == location_id
+
+    cache.invalidate_where(same_location)
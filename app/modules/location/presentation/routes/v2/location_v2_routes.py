@@ -1,15 +1,25 @@
-from typing import Annotated, Any, Dict
+from datetime import date
+from typing import Annotated, Any, Dict, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Path, Query, Response
 from mediatr import Mediator
 
 from app.modules.auth.presentation.dependencies.auth_dependencies import (
     permission_required,
 )
+from app.modules.location.application.queries.get_location_calendar.get_location_calendar_handler import (
+    GetLocationCalendarQuery,
+)
 from app.modules.location.application.queries.get_location_refact.get_location_refact_handler import (
     FindLocationRefactorQuery,
 )
-from app.modules.location.domain.entities.location_domain import LocationEntity
+from app.modules.location.domain.entities.location_domain import (
+    LocationCalendarEntity,
+    LocationEntity,
+)
+from app.modules.location.infra.services.location_calendar_cache import (
+    CachedLocationCalendar,
+)
 from app.modules.share.aplication.view_models.paginated_items_view_model import (
     PaginatedItemsViewModel,
 )
@@ -33,6 +43,18 @@ class LocationV2Controller:
             },
         )(self.get_locations)
 
+        self.router.get(
+            "/locations/{location_id}/calendar",
+            dependencies=[Depends(permission_required(roles=["admin", "staff"]))],
+            responses={
+                200: {
+                    "description": "Horario de la sede y turnos, días libres y citas de su personal",
+                    "model": LocationCalendarEntity,
+                },
+                304: {"description": "El calendario no cambió desde el ETag enviado"},
+            },
+        )(self.get_location_calendar)
+
     async def get_locations(
         self, query_params: Annotated[FindLocationRefactorQuery, Query()]
     ) -> PaginatedItemsViewModel[Dict[str, Any]]:
@@ -43,3 +65,30 @@ class LocationV2Controller:
             Dict[str, Any]
         ] = await self.mediator.send_async(query_params)
         return result
+
+    async def get_location_calendar(
+        self,
+        location_id: Annotated[int, Path(description="ID de la sede", gt=0)],
+        start: Annotated[date, Query(description="Primer día del calendario")],
+        end: Annotated[date, Query(description="Último día del calendario, inclusive")],
+        if_none_match: Annotated[Optional[str], Header()] = None,
+    ) -> Response:
+        """
+        Obtiene en una sola llamada todo lo necesario para el calendario de la sede
+
+        Devuelve el horario de atención y, por cada empleado asignado, sus turnos,
+        días libres y citas del rango (incluidas las de otras sedes, que también lo
+        ocupan). La respuesta lleva ETag: si el cliente envía If-None-Match con el
+        mismo valor se responde 304 sin cuerpo.
+        """
+        result: CachedLocationCalendar = await self.mediator.send_async(
+            GetLocationCalendarQuery(location_id=location_id, start=start, end=end)
+        )
+
+        headers = {
+            "ETag": result.etag,
+            "Cache-Control": "no-cache",
+        }
+        if result.matches(if_none_match):
+            return Response(status_code=304, headers=headers)
+        return Response(content=result.content, media_type="application/json", headers=headers)
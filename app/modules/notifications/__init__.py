@@ -5,6 +5,10 @@ from app.modules.notifications.application.commands.deactivate_notification_loca
     DeactivateNotificationLocationCommandHandler,
 )
 
+from app.modules.notifications.application.commands.purge_notification_history.purge_notification_history_command_handler import (
+    PurgeNotificationHistoryCommandHandler,
+)
+
 # Command Handlers
 from app.modules.notifications.application.commands.send_appointment_notifications.send_appointment_notifications_command_handler import (
     SendAppointmentNotificationsCommandHandler,
@@ -25,6 +29,7 @@ __all__ = [
     "SendAppointmentNotificationsCommandHandler",
     "UpsertNotificationLocationCommandHandler",
     "DeactivateNotificationLocationCommandHandler",
+    "PurgeNotificationHistoryCommandHandler",
     "GetAllLocationsNotificationStatusQueryHandler",
     "GetActiveNotificationLocationsQueryHandler",
 ]
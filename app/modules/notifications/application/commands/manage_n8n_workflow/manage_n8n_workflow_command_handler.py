@@ -1,11 +1,15 @@
 from os import getenv
 from typing import Any, Dict
 
-import httpx
 from mediatr import Mediator
 from pydantic import BaseModel
 
+from app.modules.notifications.infra.services.n8n_workflow_status_cache import (
+    build_workflow_status,
+    get_n8n_status_cache,
+)
 from app.modules.share.domain.handler.request_handler import IRequestHandler
+from app.modules.share.infra.http import get_http_client
 
 
 class ManageN8nWorkflowCommand(BaseModel):
@@ -45,27 +49,28 @@ class ManageN8nWorkflowCommandHandler(
                 "Content-Type": "application/json",
             }
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, headers=headers)
-
-                if response.status_code == 200:
-                    status = "active" if command.activate else "inactive"
-                    action_text = "activado" if command.activate else "desactivado"
-
-                    return {
-                        "success": True,
-                        "message": f"Workflow de N8N {action_text} exitosamente",
-                        "workflow_id": self.workflow_id,
-                        "status": status,
-                        "action": action,
-                    }
-                else:
-                    action_text = "activar" if command.activate else "desactivar"
-                    return {
-                        "success": False,
-                        "message": f"Error al {action_text} el workflow: {response.text}",
-                        "status_code": response.status_code,
-                    }
+            client = get_http_client(self.n8n_url)
+            response = await client.post(url, headers=headers)
+
+            if response.status_code == 200:
+                status = "active" if command.activate else "inactive"
+                action_text = "activado" if command.activate else "desactivado"
+                self._update_status_cache(response)
+
+                return {
+                    "success": True,
+                    "message": f"Workflow de N8N {action_text} exitosamente",
+                    "workflow_id": self.workflow_id,
+                    "status": status,
+                    "action": action,
+                }
+            else:
+                action_text = "activar" if command.activate else "desactivar"
+                return {
+                    "success": False,
+                    "message": f"Error al {action_text} el workflow: {response.text}",
+                    "status_code": response.status_code,
+                }
 
         except Exception as e:
             action_text = "gestionar" if command.activate else "gestionar"
@@ -73,3 +78,20 @@ class ManageN8nWorkflowCommandHandler(
                 "success": False,
                 "message": f"Error interno al {action_text} el workflow: {str(e)}",
             }
+
+    def _update_status_cache(self, response: Any) -> None:
+        """
+        Actualiza el estado cacheado con el workflow devuelto por N8N para que la
+        siguiente consulta de estado refleje el cambio sin esperar al TTL.
+        """
+        cache = get_n8n_status_cache()
+        try:
+            workflow_data = response.json()
+        except ValueError:
+            workflow_data = None
+
+        if isinstance(workflow_data, dict) and "active" in workflow_data:
+            cache.set(self.workflow_id, build_workflow_status(self.workflow_id, workflow_data))
+        else:
+            # Sin el workflow en la respuesta, se fuerza una consulta fresca
+            cache.invalidate(self.workflow_id)
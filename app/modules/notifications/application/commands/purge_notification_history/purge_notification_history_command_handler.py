@@ -0,0 +1,45 @@
+from mediatr import Mediator
+from pydantic import BaseModel, Field
+
+from app.constants import injector_var
+from app.modules.notifications.domain.repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
+from app.modules.share.domain.handler.request_handler import IRequestHandler
+from config.setting import NOTIFICATIONS_HISTORY_RETENTION_DAYS
+
+
+class PurgeNotificationHistoryCommand(BaseModel):
+    """
+    Comando para depurar el historial de notificaciones (outbox y ledger).
+    """
+
+    retention_days: int = Field(default=NOTIFICATIONS_HISTORY_RETENTION_DAYS, gt=0)
+
+
+class PurgeNotificationHistoryResponse(BaseModel):
+    """
+    Cantidad de registros eliminados por la depuración.
+    """
+
+    outbox_deleted: int
+    ledger_deleted: int
+
+
+@Mediator.handler
+class PurgeNotificationHistoryCommandHandler(
+    IRequestHandler[PurgeNotificationHistoryCommand, PurgeNotificationHistoryResponse]
+):
+    """
+    Manejador para el comando PurgeNotificationHistoryCommand.
+    """
+
+    def __init__(self) -> None:
+        injector = injector_var.get()
+        self.outbox_repository: NotificationOutboxRepository = injector.get(NotificationOutboxRepository)  # type: ignore[type-abstract]
+
+    async def handle(
+        self, command: PurgeNotificationHistoryCommand
+    ) -> PurgeNotificationHistoryResponse:
+        deleted = await self.outbox_repository.purge_history(command.retention_days)
+        return PurgeNotificationHistoryResponse(**deleted)
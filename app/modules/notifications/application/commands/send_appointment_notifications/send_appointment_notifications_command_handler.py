@@ -1,5 +1,6 @@
+import asyncio
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from mediatr import Mediator
 from pydantic import BaseModel
@@ -9,10 +10,33 @@ from app.modules.appointment.domain.entities.appointment_domain import Appointme
 from app.modules.appointment.domain.repositories.appointment_repository import (
     AppointmentRepository,
 )
+from app.modules.notifications.domain.notification_outbox_entity import (
+    NotificationOutboxMessage,
+)
+from app.modules.notifications.domain.repositories.notification_ledger_repository import (
+    NotificationLedgerRepository,
+)
+from app.modules.notifications.domain.repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
 from app.modules.share.domain.handler.request_handler import IRequestHandler
+from app.modules.share.infra.concurrency import get_rate_limiter
+from app.modules.share.infra.templates import get_template_registry
 from app.modules.whatsapp.infra.services.evolution_api_service import (
     EvolutionApiService,
 )
+from config.setting import (
+    EVOLUTION_CALL_DEADLINE,
+    EVOLUTION_MAX_CONCURRENCY,
+    EVOLUTION_RATE_BURST,
+    EVOLUTION_RATE_PER_SECOND,
+    NOTIFICATIONS_CHUNK_SIZE,
+    NOTIFICATIONS_OUTBOX_ENABLED,
+    NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS,
+)
+
+# Tipo de recordatorio con el que se registran los mensajes de esta notificación
+APPOINTMENT_REMINDER_TYPE = "appointment_reminder"
 
 
 # --- Definición del Comando ---
@@ -42,7 +66,15 @@ class SendAppointmentNotificationsCommandHandler(
         """
         injector = injector_var.get()
         self.appointment_repository = injector.get(AppointmentRepository)  # type: ignore[type-abstract]
+        self.outbox_repository = injector.get(NotificationOutboxRepository)  # type: ignore[type-abstract]
+        self.ledger_repository = injector.get(NotificationLedgerRepository)  # type: ignore[type-abstract]
         self.whatsapp_service = EvolutionApiService()
+        # Limitador compartido por todo el proceso para respetar los límites de Evolution API
+        self.rate_limiter = get_rate_limiter(
+            "evolution_api",
+            rate=EVOLUTION_RATE_PER_SECOND,
+            capacity=EVOLUTION_RATE_BURST,
+        )
 
     async def handle(
         self, command: SendAppointmentNotificationsCommand
@@ -59,82 +91,96 @@ class SendAppointmentNotificationsCommandHandler(
         Raises:
             Exception: Si ocurre un error al procesar o enviar las notificaciones.
         """
-        try:
-            # Preparar filtros para la consulta de citas
-            filters: Dict[str, Any] = {
-                "start_date": command.start_date.strftime("%Y-%m-%d %H:%M:%S"),
-                "end_date": command.end_date.strftime("%Y-%m-%d %H:%M:%S"),
-            }
+        # Import diferido: unit_of_work_scope importa la configuración de DI, que a su vez
+        # importa este módulo al registrar los handlers de notificaciones
+        from app.modules.share.infra.persistence.unit_of_work_scope import unit_of_work_scope
 
-            if command.location_id:
-                filters["location_id"] = command.location_id
-
-            # Obtener las citas usando el repositorio de appointments
-            appointments_result = (
-                await self.appointment_repository.find_appointments_refactor(
-                    page_index=1,
-                    page_size=100,
-                    order_by="start_datetime",
-                    sort_by="ASC",
-                    query=None,
-                    filters=filters,
-                )
-            )
-
-            appointments = appointments_result.data
-            sent_notifications = 0
-            failed_notifications = 0
+        try:
+            # Recorrer todas las citas por páginas: la memoria queda acotada al tamaño
+            # de página y los totales se calculan sobre el conjunto completo
+            semaphore = asyncio.Semaphore(EVOLUTION_MAX_CONCURRENCY)
             notification_results: List[Dict[str, Any]] = []
+            total_appointments = 0
 
-            # Procesar cada cita y enviar notificación
-            for appointment in appointments:
-                try:
-                    # Construir el mensaje de notificación
-                    message = self._build_notification_message(appointment)
+            async for appointments in self._iter_appointment_chunks(command):
+                total_appointments += len(appointments)
 
-                    # Enviar mensaje directamente usando el servicio de WhatsApp
-                    await self.whatsapp_service.send_text_message(
-                        number=f"51{appointment.customer_phone}",
-                        text=message,
-                        delay=None,
-                        link_preview=False,
-                    )
+                appointment_ids = [appointment.appointment_id for appointment in appointments]
 
-                    # El servicio devuelve directamente la respuesta, consideramos éxito si no hay excepción
-                    sent_notifications += 1
-                    notification_results.append(
-                        {
-                            "appointment_id": appointment.appointment_id,
-                            "customer_name": appointment.customer_name,
-                            "customer_phone": appointment.customer_phone,
-                            "status": "sent",
-                            "message": "Notificación enviada exitosamente",
-                        }
+                if NOTIFICATIONS_OUTBOX_ENABLED:
+                    # Registrar en el ledger y encolar en la misma transacción: solo las
+                    # citas que no estaban registradas pasan al outbox. Si el mensaje
+                    # agota sus reintentos y queda 'dead', el outbox libera el registro
+                    # y la próxima ejecución vuelve a encolarlo.
+                    new_ids = await self.ledger_repository.register_notifications(
+                        appointment_ids, APPOINTMENT_REMINDER_TYPE, user_create="n8n"
                     )
+                    pending = [a for a in appointments if a.appointment_id in new_ids]
+
+                    # El dispatcher en segundo plano realiza el envío con reintentos
+                    chunk_results = await self._enqueue_notifications(pending)
+                else:
+                    # Reclamar en el ledger antes de enviar, en una transacción propia que
+                    # se confirma de inmediato: una ejecución concurrente (n8n y el
+                    # scheduler) ya no ve estas citas como pendientes
+                    async with unit_of_work_scope():
+                        new_ids = await self.ledger_repository.register_notifications(
+                            appointment_ids, APPOINTMENT_REMINDER_TYPE, user_create="n8n"
+                        )
+                    pending = [a for a in appointments if a.appointment_id in new_ids]
 
-                except Exception as e:
-                    failed_notifications += 1
-                    notification_results.append(
-                        {
-                            "appointment_id": appointment.appointment_id,
-                            "customer_name": getattr(
-                                appointment, "customer_name", "Desconocido"
-                            ),
-                            "customer_phone": getattr(
-                                appointment, "customer_phone", "Sin teléfono"
-                            ),
-                            "status": "failed",
-                            "message": f"Error al procesar: {str(e)}",
-                        }
+                    # Envío concurrente acotado por semáforo y limitado por token bucket
+                    chunk_results = await asyncio.gather(
+                        *(
+                            self._send_notification(appointment, semaphore)
+                            for appointment in pending
+                        )
                     )
 
+                    # Las fallidas se liberan para que la próxima ejecución las reintente
+                    failed_ids = [
+                        r["appointment_id"] for r in chunk_results if r["status"] == "failed"
+                    ]
+                    if failed_ids:
+                        async with unit_of_work_scope():
+                            await self.ledger_repository.release_notifications(
+                                failed_ids, APPOINTMENT_REMINDER_TYPE
+                            )
+
+                pending_ids = {appointment.appointment_id for appointment in pending}
+                notification_results.extend(chunk_results)
+                notification_results.extend(
+                    self._skipped_result(appointment)
+                    for appointment in appointments
+                    if appointment.appointment_id not in pending_ids
+                )
+
+            queued_notifications = sum(
+                1 for result in notification_results if result["status"] == "queued"
+            )
+            sent_notifications = sum(
+                1 for result in notification_results if result["status"] == "sent"
+            )
+            failed_notifications = sum(
+                1 for result in notification_results if result["status"] == "failed"
+            )
+            skipped_notifications = sum(
+                1 for result in notification_results if result["status"] == "skipped"
+            )
+
             return {
                 "success": True,
-                "message": f"Proceso completado. {sent_notifications} enviadas, {failed_notifications} fallidas",
+                "message": (
+                    f"Proceso completado. {queued_notifications} encoladas, "
+                    f"{sent_notifications} enviadas, {failed_notifications} fallidas, "
+                    f"{skipped_notifications} omitidas"
+                ),
                 "data": {
-                    "total_appointments": len(appointments),
+                    "total_appointments": total_appointments,
+                    "queued_notifications": queued_notifications,
                     "sent_notifications": sent_notifications,
                     "failed_notifications": failed_notifications,
+                    "skipped_notifications": skipped_notifications,
                     "results": notification_results,
                 },
             }
@@ -146,36 +192,163 @@ class SendAppointmentNotificationsCommandHandler(
                 "data": None,
             }
 
-    def _build_notification_message(self, appointment: AppointmentEntity) -> str:
+    async def _iter_appointment_chunks(
+        self, command: SendAppointmentNotificationsCommand
+    ) -> AsyncIterator[List[AppointmentEntity]]:
         """
-        Construye el mensaje de notificación para la cita.
+        Recorre todas las citas del rango, página por página, por keyset sobre
+        (start_datetime, appointment_id): cada página continúa después de la última
+        cita de la anterior, así que las citas creadas o anuladas durante el recorrido
+        no hacen saltar ni repetir otras.
 
         Args:
-            appointment: Objeto con los datos de la cita.
+            command: Comando con el rango de fechas y la sede opcional.
+
+        Yields:
+            Lista de citas de cada página (a lo sumo NOTIFICATIONS_CHUNK_SIZE).
+        """
+        # Las citas se guardan en hora local sin zona: se usa la hora de pared recibida
+        start_datetime = command.start_date.replace(tzinfo=None)
+        end_datetime = command.end_date.replace(tzinfo=None)
+        after: Optional[Tuple[datetime, int]] = None
+
+        while True:
+            chunk = await self.appointment_repository.find_appointments_after(
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+                limit=NOTIFICATIONS_CHUNK_SIZE,
+                location_id=command.location_id or None,
+                after=after,
+            )
+            if not chunk:
+                break
+
+            yield chunk
+
+            if len(chunk) < NOTIFICATIONS_CHUNK_SIZE:
+                break
+            last = chunk[-1]
+            after = (last.start_datetime, last.appointment_id)
+
+    def _skipped_result(self, appointment: AppointmentEntity) -> Dict[str, Any]:
+        """Resultado para una cita cuyo recordatorio ya fue registrado anteriormente."""
+        return {
+            "appointment_id": appointment.appointment_id,
+            "customer_name": appointment.customer_name,
+            "customer_phone": appointment.customer_phone,
+            "status": "skipped",
+            "message": "La notificación ya fue enviada anteriormente",
+        }
+
+    async def _enqueue_notifications(
+        self, appointments: List[AppointmentEntity]
+    ) -> List[Dict[str, Any]]:
+        """
+        Encola en el outbox las notificaciones de un bloque de citas.
+
+        Args:
+            appointments: Citas a notificar.
 
         Returns:
-            str: Mensaje formateado para WhatsApp.
+            Resultados individuales con status 'queued'.
+        """
+        messages = [
+            NotificationOutboxMessage(
+                channel="whatsapp",
+                recipient=f"51{appointment.customer_phone}",
+                message=self._build_notification_message(appointment),
+                appointment_id=appointment.appointment_id,
+                reminder_type=APPOINTMENT_REMINDER_TYPE,
+                max_attempts=NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS,
+            )
+            for appointment in appointments
+        ]
+        await self.outbox_repository.enqueue_messages(messages, user_create="n8n")
+
+        return [
+            {
+                "appointment_id": appointment.appointment_id,
+                "customer_name": appointment.customer_name,
+                "customer_phone": appointment.customer_phone,
+                "status": "queued",
+                "message": "Notificación encolada para envío",
+            }
+            for appointment in appointments
+        ]
+
+    async def _send_notification(
+        self, appointment: AppointmentEntity, semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """
+        Envía la notificación de una cita respetando el límite de concurrencia,
+        la tasa permitida por Evolution API y el timeout por mensaje.
+
+        Args:
+            appointment: Cita a notificar.
+            semaphore: Semáforo que acota los envíos simultáneos.
+
+        Returns:
+            Resultado individual del envío (status 'sent' o 'failed').
         """
-        # Formatear la fecha de la cita
-        start_datetime_str = appointment.start_datetime.strftime("%d/%m/%Y a las %H:%M")
+        async with semaphore:
+            try:
+                # Construir el mensaje de notificación
+                message = self._build_notification_message(appointment)
 
-        message = f"""
-🗓️ *Recordatorio de Cita*
+                await self.rate_limiter.acquire()
+                await asyncio.wait_for(
+                    self.whatsapp_service.send_text_message(
+                        number=f"51{appointment.customer_phone}",
+                        text=message,
+                        delay=None,
+                        link_preview=False,
+                    ),
+                    timeout=EVOLUTION_CALL_DEADLINE,
+                )
 
-Hola {appointment.customer_name},
+                # El servicio devuelve directamente la respuesta, consideramos éxito si no hay excepción
+                return {
+                    "appointment_id": appointment.appointment_id,
+                    "customer_name": appointment.customer_name,
+                    "customer_phone": appointment.customer_phone,
+                    "status": "sent",
+                    "message": "Notificación enviada exitosamente",
+                }
 
-Tienes una cita programada:
+            except asyncio.TimeoutError:
+                error_message = "Timeout al enviar el mensaje"
+            except Exception as e:
+                error_message = str(e)
 
-📅 *Fecha y Hora:* {start_datetime_str}
-📍 *Ubicación:* {appointment.location_name}
-👨‍💼 *Con:* {appointment.user_name}
-✂️ *Servicio:* {appointment.service_name}
-💰 *Precio:* ${appointment.service_price}
-⏱️ *Duración:* {appointment.service_duration} minutos
+            return {
+                "appointment_id": appointment.appointment_id,
+                "customer_name": getattr(appointment, "customer_name", "Desconocido"),
+                "customer_phone": getattr(appointment, "customer_phone", "Sin teléfono"),
+                "status": "failed",
+                "message": f"Error al procesar: {error_message}",
+            }
 
-Por favor, llega puntualmente. Si necesitas reprogramar o cancelar, contáctanos con anticipación.
+    def _build_notification_message(self, appointment: AppointmentEntity) -> str:
+        """
+        Construye el mensaje de notificación para la cita a partir de la plantilla
+        'appointment_reminder.whatsapp.j2' (o el override de la sede).
 
-¡Te esperamos! 😊
-        """.strip()
+        Args:
+            appointment: Objeto con los datos de la cita.
 
-        return message
+        Returns:
+            str: Mensaje formateado para WhatsApp.
+        """
+        return get_template_registry().render(
+            "appointment_reminder.whatsapp.j2",
+            {
+                "customer_name": appointment.customer_name,
+                "start_datetime": appointment.start_datetime,
+                "location_name": appointment.location_name,
+                "user_name": appointment.user_name,
+                "service_name": appointment.service_name,
+                "service_price": appointment.service_price,
+                "service_duration": appointment.service_duration,
+            },
+            location_id=appointment.location_id,
+        )
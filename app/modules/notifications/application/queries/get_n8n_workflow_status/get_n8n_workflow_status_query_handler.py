@@ -1,11 +1,15 @@
 from os import getenv
 from typing import Any, Dict
 
-import httpx
 from mediatr import Mediator
 from pydantic import BaseModel
 
+from app.modules.notifications.infra.services.n8n_workflow_status_cache import (
+    build_workflow_status,
+    get_n8n_status_cache,
+)
 from app.modules.share.domain.handler.request_handler import IRequestHandler
+from app.modules.share.infra.http import get_http_client
 
 
 class GetN8nWorkflowStatusQuery(BaseModel):
@@ -34,8 +38,17 @@ class GetN8nWorkflowStatusQueryHandler(
 
     async def handle(self, query: GetN8nWorkflowStatusQuery) -> Dict[str, Any]:
         """
-        Obtiene el estado actual del workflow de N8N
+        Obtiene el estado actual del workflow de N8N.
+        Las consultas concurrentes comparten una sola llamada a N8N y el resultado
+        exitoso se reutiliza durante N8N_STATUS_CACHE_TTL segundos.
         """
+        return await get_n8n_status_cache().get_or_load(
+            self.workflow_id,
+            self._fetch_status,
+            should_cache=lambda result: bool(result.get("success")),
+        )
+
+    async def _fetch_status(self) -> Dict[str, Any]:
         try:
             url = f"{self.n8n_url}/api/v1/workflows/{self.workflow_id}"
 
@@ -44,29 +57,18 @@ class GetN8nWorkflowStatusQueryHandler(
                 "Content-Type": "application/json",
             }
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers)
-
-                if response.status_code == 200:
-                    workflow_data = response.json()
-                    is_active = workflow_data.get("active", False)
+            client = get_http_client(self.n8n_url)
+            response = await client.get(url, headers=headers)
 
-                    return {
-                        "success": True,
-                        "workflow_id": self.workflow_id,
-                        "is_active": is_active,
-                        "status": "active" if is_active else "inactive",
-                        "workflow_name": workflow_data.get("name", "Unknown"),
-                        "last_updated": workflow_data.get("updatedAt"),
-                        "created_at": workflow_data.get("createdAt"),
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "message": f"Error al consultar el estado del workflow: {response.text}",
-                        "status_code": response.status_code,
-                        "workflow_id": self.workflow_id,
-                    }
+            if response.status_code == 200:
+                return build_workflow_status(self.workflow_id, response.json())
+            else:
+                return {
+                    "success": False,
+                    "message": f"Error al consultar el estado del workflow: {response.text}",
+                    "status_code": response.status_code,
+                    "workflow_id": self.workflow_id,
+                }
 
         except Exception as e:
             return {
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class NotificationOutboxMessage:
+    """
+    Mensaje a encolar en el outbox de notificaciones.
+    """
+
+    channel: str
+    recipient: str
+    message: str
+    appointment_id: Optional[int] = None
+    reminder_type: Optional[str] = None
+    max_attempts: int = 5
+    batch_id: Optional[str] = None
+
+
+@dataclass
+class NotificationOutboxEntity:
+    """
+    Entidad que representa un mensaje del outbox reclamado por un worker.
+    Corresponde a una fila de la tabla 'notification_outbox'.
+    """
+
+    outbox_id: int
+    channel: str
+    recipient: str
+    message: str
+    appointment_id: Optional[int]
+    reminder_type: Optional[str]
+    status: str
+    attempts: int
+    max_attempts: int
+    next_attempt_at: datetime
+    last_error: Optional[str]
+
+
+@dataclass
+class NotificationOutboxBatchItem:
+    """
+    Estado de un mensaje del outbox encolado como parte de un envío masivo (batch_id).
+    """
+
+    outbox_id: int
+    recipient: str
+    status: str
+    attempts: int
+    last_error: Optional[str]
+    provider_response: Optional[Dict[str, Any]]
+    insert_date: datetime
+    update_date: Optional[datetime]
@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from typing import List, Set
+
+
+class NotificationLedgerRepository(ABC):
+    """
+    Repositorio abstracto del registro de notificaciones enviadas,
+    identificadas por (appointment_id, reminder_type).
+    """
+
+    @abstractmethod
+    async def get_notified_appointment_ids(
+        self, appointment_ids: List[int], reminder_type: str
+    ) -> Set[int]:
+        """
+        Obtiene, en una sola consulta, cuáles de las citas ya fueron notificadas.
+
+        Args:
+            appointment_ids: IDs de las citas a verificar.
+            reminder_type: Tipo de recordatorio.
+
+        Returns:
+            Set[int]: IDs de las citas ya registradas.
+        """
+        pass
+
+    @abstractmethod
+    async def register_notifications(
+        self, appointment_ids: List[int], reminder_type: str, user_create: str
+    ) -> Set[int]:
+        """
+        Registra las citas como notificadas dentro de la transacción actual.
+        Las citas que ya estaban registradas se ignoran.
+
+        Args:
+            appointment_ids: IDs de las citas a registrar.
+            reminder_type: Tipo de recordatorio.
+            user_create: Usuario o sistema que registra.
+
+        Returns:
+            Set[int]: IDs registrados en esta llamada (los que aún no lo estaban).
+        """
+        pass
+
+    @abstractmethod
+    async def release_notifications(
+        self, appointment_ids: List[int], reminder_type: str
+    ) -> int:
+        """
+        Elimina el registro de las citas indicadas para que vuelvan a notificarse.
+
+        Args:
+            appointment_ids: IDs de las citas a liberar.
+            reminder_type: Tipo de recordatorio.
+
+        Returns:
+            int: Cantidad de registros eliminados.
+        """
+        pass
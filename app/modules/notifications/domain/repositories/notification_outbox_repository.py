@@ -0,0 +1,154 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.modules.notifications.domain.notification_outbox_entity import (
+    NotificationOutboxBatchItem,
+    NotificationOutboxEntity,
+    NotificationOutboxMessage,
+)
+
+
+class NotificationOutboxRepository(ABC):
+    """
+    Repositorio abstracto para el outbox de notificaciones.
+    """
+
+    @abstractmethod
+    async def enqueue_messages(
+        self, messages: List[NotificationOutboxMessage], user_create: str
+    ) -> List[int]:
+        """
+        Encola mensajes dentro de la transacción actual.
+
+        Args:
+            messages: Mensajes a encolar.
+            user_create: Usuario o sistema que encola.
+
+        Returns:
+            List[int]: IDs de outbox generados, en el mismo orden que los mensajes.
+        """
+        pass
+
+    @abstractmethod
+    async def claim_messages(
+        self, worker_id: str, batch_size: int, lease_seconds: int
+    ) -> List[NotificationOutboxEntity]:
+        """
+        Reclama un lote de mensajes listos para enviar (FOR UPDATE SKIP LOCKED).
+        Los mensajes quedan en estado 'processing' a nombre del worker durante el lease.
+
+        Args:
+            worker_id: Identificador único del worker.
+            batch_size: Cantidad máxima de mensajes a reclamar.
+            lease_seconds: Segundos tras los cuales un mensaje no confirmado puede reclamarse de nuevo.
+
+        Returns:
+            List[NotificationOutboxEntity]: Mensajes reclamados.
+        """
+        pass
+
+    @abstractmethod
+    async def renew_lease(
+        self, outbox_id: int, worker_id: str, lease_seconds: int
+    ) -> bool:
+        """
+        Extiende el lease de un mensaje reclamado, justo antes de enviarlo.
+
+        Args:
+            outbox_id: ID del mensaje.
+            worker_id: Worker que lo tiene reclamado.
+            lease_seconds: Nueva duración del lease a partir de ahora.
+
+        Returns:
+            bool: False si el worker ya perdió el mensaje (otro worker lo reclamó).
+        """
+        pass
+
+    @abstractmethod
+    async def mark_sent(
+        self, outbox_id: int, worker_id: str, provider_response: Optional[Dict[str, Any]]
+    ) -> bool:
+        """
+        Registra el envío exitoso de un mensaje.
+
+        Args:
+            outbox_id: ID del mensaje.
+            worker_id: Worker que lo tiene reclamado.
+            provider_response: Respuesta del proveedor (Evolution API).
+
+        Returns:
+            bool: False si el worker ya no tenía el mensaje (lease perdido).
+        """
+        pass
+
+    @abstractmethod
+    async def mark_failed(
+        self,
+        outbox_id: int,
+        worker_id: str,
+        error: str,
+        next_attempt_at: Optional[datetime],
+    ) -> bool:
+        """
+        Registra un intento fallido y programa el siguiente.
+
+        Args:
+            outbox_id: ID del mensaje.
+            worker_id: Worker que lo tiene reclamado.
+            error: Descripción del error.
+            next_attempt_at: Fecha del próximo intento, o None si se agotaron los reintentos.
+
+        Returns:
+            bool: False si el worker ya no tenía el mensaje (lease perdido).
+        """
+        pass
+
+    @abstractmethod
+    async def defer_message(
+        self,
+        outbox_id: int,
+        worker_id: str,
+        reason: str,
+        next_attempt_at: datetime,
+    ) -> bool:
+        """
+        Reprograma un mensaje que no llegó a enviarse, sin contar el intento.
+
+        Args:
+            outbox_id: ID del mensaje.
+            worker_id: Worker que lo tiene reclamado.
+            reason: Motivo del rechazo (circuito abierto, bulkhead lleno).
+            next_attempt_at: Fecha del próximo intento.
+
+        Returns:
+            bool: False si el worker ya no tenía el mensaje (lease perdido).
+        """
+        pass
+
+    @abstractmethod
+    async def get_batch_messages(self, batch_id: str) -> List[NotificationOutboxBatchItem]:
+        """
+        Obtiene el estado de los mensajes encolados con un mismo batch_id.
+
+        Args:
+            batch_id: Identificador del envío masivo.
+
+        Returns:
+            List[NotificationOutboxBatchItem]: Mensajes en orden de encolado; vacía si no existe.
+        """
+        pass
+
+    @abstractmethod
+    async def purge_history(self, retention_days: int) -> Dict[str, int]:
+        """
+        Elimina los mensajes del outbox ya resueltos ('sent' o 'dead') y los registros
+        del ledger con más antigüedad que la retención indicada.
+
+        Args:
+            retention_days: Días de historial a conservar.
+
+        Returns:
+            Dict con 'outbox_deleted' y 'ledger_deleted'.
+        """
+        pass
@@ -0,0 +1,98 @@
+from typing import List, Set
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.constants import uow_var
+from app.modules.notifications.domain.repositories.notification_ledger_repository import (
+    NotificationLedgerRepository,
+)
+from app.modules.share.infra.persistence.unit_of_work import UnitOfWork
+from app.modules.share.utils.handle_dbapi_error import handle_error
+
+
+class NotificationLedgerImplementationRepository(NotificationLedgerRepository):
+    """
+    Implementación concreta del registro de notificaciones usando SQLAlchemy.
+    """
+
+    @property
+    def _uow(self) -> UnitOfWork:
+        """Proporciona acceso a la instancia actual de UnitOfWork."""
+        try:
+            return uow_var.get()
+        except LookupError:
+            raise RuntimeError("UnitOfWork no encontrado en el contexto")
+
+    async def get_notified_appointment_ids(
+        self, appointment_ids: List[int], reminder_type: str
+    ) -> Set[int]:
+        """
+        Llama a 'notifications_sp_get_notified_appointments'.
+        """
+        if not appointment_ids:
+            return set()
+
+        try:
+            query = text(
+                "SELECT * FROM notifications_sp_get_notified_appointments(:p_appointment_ids, :p_reminder_type)"
+            )
+            result = await self._uow.session.execute(
+                query,
+                {"p_appointment_ids": appointment_ids, "p_reminder_type": reminder_type},
+            )
+            return {row.appointment_id for row in result.fetchall()}
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def register_notifications(
+        self, appointment_ids: List[int], reminder_type: str, user_create: str
+    ) -> Set[int]:
+        """
+        Llama a 'notifications_sp_register_notifications'.
+        """
+        if not appointment_ids:
+            return set()
+
+        try:
+            query = text(
+                "SELECT * FROM notifications_sp_register_notifications(:p_appointment_ids, :p_reminder_type, :p_user_create)"
+            )
+            result = await self._uow.session.execute(
+                query,
+                {
+                    "p_appointment_ids": appointment_ids,
+                    "p_reminder_type": reminder_type,
+                    "p_user_create": user_create,
+                },
+            )
+            return {row.appointment_id for row in result.fetchall()}
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def release_notifications(
+        self, appointment_ids: List[int], reminder_type: str
+    ) -> int:
+        """
+        Llama a 'notifications_sp_release_notifications'.
+        """
+        if not appointment_ids:
+            return 0
+
+        try:
+            query = text(
+                "SELECT notifications_sp_release_notifications(:p_appointment_ids, :p_reminder_type)"
+            )
+            result = await self._uow.session.execute(
+                query,
+                {"p_appointment_ids": appointment_ids, "p_reminder_type": reminder_type},
+            )
+            return int(result.scalar_one())
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
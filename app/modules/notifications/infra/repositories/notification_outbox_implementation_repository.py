@@ -0,0 +1,250 @@
+import json
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.constants import uow_var
+from app.modules.notifications.domain.notification_outbox_entity import (
+    NotificationOutboxBatchItem,
+    NotificationOutboxEntity,
+    NotificationOutboxMessage,
+)
+from app.modules.notifications.domain.repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
+from app.modules.share.infra.persistence.unit_of_work import UnitOfWork
+from app.modules.share.utils.handle_dbapi_error import handle_error
+
+
+class NotificationOutboxImplementationRepository(NotificationOutboxRepository):
+    """
+    Implementación concreta del outbox de notificaciones usando SQLAlchemy.
+    """
+
+    @property
+    def _uow(self) -> UnitOfWork:
+        """Proporciona acceso a la instancia actual de UnitOfWork."""
+        try:
+            return uow_var.get()
+        except LookupError:
+            raise RuntimeError("UnitOfWork no encontrado en el contexto")
+
+    async def enqueue_messages(
+        self, messages: List[NotificationOutboxMessage], user_create: str
+    ) -> List[int]:
+        """
+        Encola mensajes llamando a 'notifications_sp_enqueue_outbox'.
+        """
+        if not messages:
+            return []
+
+        try:
+            query = text(
+                "SELECT * FROM notifications_sp_enqueue_outbox(:p_messages, :p_user_create)"
+            )
+            result = await self._uow.session.execute(
+                query,
+                {
+                    "p_messages": json.dumps([asdict(message) for message in messages]),
+                    "p_user_create": user_create,
+                },
+            )
+            return [row.outbox_id for row in result.fetchall()]
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def claim_messages(
+        self, worker_id: str, batch_size: int, lease_seconds: int
+    ) -> List[NotificationOutboxEntity]:
+        """
+        Reclama mensajes llamando a 'notifications_sp_claim_outbox'.
+        """
+        try:
+            query = text(
+                "SELECT * FROM notifications_sp_claim_outbox(:p_worker_id, :p_batch_size, :p_lease_seconds)"
+            )
+            result = await self._uow.session.execute(
+                query,
+                {
+                    "p_worker_id": worker_id,
+                    "p_batch_size": batch_size,
+                    "p_lease_seconds": lease_seconds,
+                },
+            )
+
+            return [
+                NotificationOutboxEntity(
+                    outbox_id=row.id,
+                    channel=row.channel,
+                    recipient=row.recipient,
+                    message=row.message,
+                    appointment_id=row.appointment_id,
+                    reminder_type=row.reminder_type,
+                    status=row.status,
+                    attempts=row.attempts,
+                    max_attempts=row.max_attempts,
+                    next_attempt_at=row.next_attempt_at,
+                    last_error=row.last_error,
+                )
+                for row in result.fetchall()
+            ]
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def renew_lease(
+        self, outbox_id: int, worker_id: str, lease_seconds: int
+    ) -> bool:
+        """
+        Extiende el lease llamando a 'notifications_sp_renew_outbox_lease'.
+        """
+        try:
+            query = text(
+                "SELECT notifications_sp_renew_outbox_lease(:p_outbox_id, :p_worker_id, :p_lease_seconds)"
+            )
+            result = await self._uow.session.execute(
+                query,
+                {
+                    "p_outbox_id": outbox_id,
+                    "p_worker_id": worker_id,
+                    "p_lease_seconds": lease_seconds,
+                },
+            )
+            return bool(result.scalar_one())
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def mark_sent(
+        self, outbox_id: int, worker_id: str, provider_response: Optional[Dict[str, Any]]
+    ) -> bool:
+        """
+        Registra el envío llamando a 'notifications_sp_mark_outbox_sent'.
+        """
+        try:
+            query = text(
+                "SELECT notifications_sp_mark_outbox_sent(:p_outbox_id, :p_worker_id, :p_provider_response)"
+            )
+            result = await self._uow.session.execute(
+                query,
+                {
+                    "p_outbox_id": outbox_id,
+                    "p_worker_id": worker_id,
+                    "p_provider_response": json.dumps(provider_response or {}),
+                },
+            )
+            return bool(result.scalar_one())
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def mark_failed(
+        self,
+        outbox_id: int,
+        worker_id: str,
+        error: str,
+        next_attempt_at: Optional[datetime],
+    ) -> bool:
+        """
+        Registra el fallo llamando a 'notifications_sp_mark_outbox_failed'.
+        """
+        try:
+            query = text(
+                "SELECT notifications_sp_mark_outbox_failed(:p_outbox_id, :p_worker_id, :p_error, :p_next_attempt_at)"
+            )
+            result = await self._uow.session.execute(
+                query,
+                {
+                    "p_outbox_id": outbox_id,
+                    "p_worker_id": worker_id,
+                    "p_error": error,
+                    "p_next_attempt_at": next_attempt_at,
+                },
+            )
+            return bool(result.scalar_one())
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def defer_message(
+        self,
+        outbox_id: int,
+        worker_id: str,
+        reason: str,
+        next_attempt_at: datetime,
+    ) -> bool:
+        """
+        Reprograma el mensaje llamando a 'notifications_sp_defer_outbox'.
+        """
+        try:
+            query = text(
+                "SELECT notifications_sp_defer_outbox(:p_outbox_id, :p_worker_id, :p_reason, :p_next_attempt_at)"
+            )
+            result = await self._uow.session.execute(
+                query,
+                {
+                    "p_outbox_id": outbox_id,
+                    "p_worker_id": worker_id,
+                    "p_reason": reason,
+                    "p_next_attempt_at": next_attempt_at,
+                },
+            )
+            return bool(result.scalar_one())
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def get_batch_messages(self, batch_id: str) -> List[NotificationOutboxBatchItem]:
+        """
+        Obtiene los mensajes del envío masivo llamando a 'notifications_sp_get_outbox_batch'.
+        """
+        try:
+            query = text("SELECT * FROM notifications_sp_get_outbox_batch(:p_batch_id)")
+            result = await self._uow.session.execute(query, {"p_batch_id": batch_id})
+
+            return [
+                NotificationOutboxBatchItem(
+                    outbox_id=row.outbox_id,
+                    recipient=row.recipient,
+                    status=row.status,
+                    attempts=row.attempts,
+                    last_error=row.last_error,
+                    provider_response=row.provider_response,
+                    insert_date=row.insert_date,
+                    update_date=row.update_date,
+                )
+                for row in result.fetchall()
+            ]
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def purge_history(self, retention_days: int) -> Dict[str, int]:
+        """
+        Depura el historial llamando a 'notifications_sp_purge_history'.
+        """
+        try:
+            query = text("SELECT * FROM notifications_sp_purge_history(:p_retention_days)")
+            result = await self._uow.session.execute(
+                query, {"p_retention_days": retention_days}
+            )
+            row = result.fetchone()
+            return {
+                "outbox_deleted": row.outbox_deleted if row else 0,
+                "ledger_deleted": row.ledger_deleted if row else 0,
+            }
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
@@ -0,0 +1,52 @@
+"""
+Caché compartida del estado del workflow de N8N.
+
+La pantalla de administración consulta el estado por polling; con esta caché las
+consultas concurrentes se resuelven con una sola llamada a la API de N8N y el
+resultado se reutiliza durante N8N_STATUS_CACHE_TTL segundos. Activar o desactivar
+el workflow actualiza la entrada de inmediato, y una consulta que estaba en vuelo
+en ese momento ya no la sobrescribe.
+"""
+
+from typing import Any, Dict, Optional
+
+from app.modules.share.infra.cache import AsyncTtlCache
+from config.setting import N8N_STATUS_CACHE_TTL
+
+_status_cache: Optional[AsyncTtlCache[Dict[str, Any]]] = None
+
+
+def get_n8n_status_cache() -> AsyncTtlCache[Dict[str, Any]]:
+    """
+    Obtiene la caché del estado de workflows de N8N del proceso.
+
+    Returns:
+        AsyncTtlCache: Caché indexada por workflow_id
+    """
+    global _status_cache
+    if _status_cache is None:
+        _status_cache = AsyncTtlCache(ttl=N8N_STATUS_CACHE_TTL)
+    return _status_cache
+
+
+def build_workflow_status(workflow_id: str, workflow_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Arma la respuesta de estado a partir del workflow devuelto por la API de N8N.
+
+    Args:
+        workflow_id: Identificador del workflow.
+        workflow_data: JSON del workflow devuelto por N8N.
+
+    Returns:
+        Dict con el estado del workflow
+    """
+    is_active = workflow_data.get("active", False)
+    return {
+        "success": True,
+        "workflow_id": workflow_id,
+        "is_active": is_active,
+        "status": "active" if is_active else "inactive",
+        "workflow_name": workflow_data.get("name", "Unknown"),
+        "last_updated": workflow_data.get("updatedAt"),
+        "created_at": workflow_data.get("createdAt"),
+    }
@@ -0,0 +1,287 @@
+"""
+Worker en segundo plano que despacha los mensajes del outbox de notificaciones.
+
+Cada ciclo reclama un lote con 'notifications_sp_claim_outbox' (FOR UPDATE SKIP LOCKED),
+envía los mensajes y registra el resultado. Varios workers, en una o varias réplicas,
+pueden correr en paralelo sin enviar dos veces el mismo mensaje: cada fila queda
+reclamada a nombre de un único worker mientras dura su lease.
+
+Un mensaje del lote puede esperar turno (semáforo y rate limiter) más que el lease
+con que se reclamó, así que el lease se renueva justo antes de enviarlo. Si otro
+worker ya lo reclamó, el mensaje no se envía; si el lease se pierde durante el
+envío, el resultado no se registra. Ambos casos se registran en el log y se cuentan
+en 'lost_leases'.
+
+Si el circuit breaker o el bulkhead de Evolution API rechazan el envío sin intentarlo,
+el mensaje se reprograma para después de la ventana de recuperación del circuito sin
+contar el intento: una caída del proveedor no agota los reintentos. Se cuentan en
+'deferred'.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from app.constants import injector_var
+from app.modules.notifications.domain.notification_outbox_entity import (
+    NotificationOutboxEntity,
+)
+from app.modules.notifications.domain.repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
+from app.modules.share.infra.concurrency import (
+    BulkheadFullError,
+    CircuitOpenError,
+    get_rate_limiter,
+)
+from app.modules.share.infra.persistence.unit_of_work_scope import unit_of_work_scope
+from app.modules.whatsapp.infra.services.evolution_api_service import (
+    EvolutionApiService,
+)
+from config.setting import (
+    EVOLUTION_BREAKER_RECOVERY_TIMEOUT,
+    EVOLUTION_CALL_DEADLINE,
+    EVOLUTION_MAX_CONCURRENCY,
+    EVOLUTION_RATE_BURST,
+    EVOLUTION_RATE_PER_SECOND,
+    NOTIFICATIONS_OUTBOX_BACKOFF_BASE,
+    NOTIFICATIONS_OUTBOX_BACKOFF_MAX,
+    NOTIFICATIONS_OUTBOX_BATCH_SIZE,
+    NOTIFICATIONS_OUTBOX_LEASE_SECONDS,
+    NOTIFICATIONS_OUTBOX_POLL_INTERVAL,
+)
+
+logger = logging.getLogger(__name__)
+
+WHATSAPP_CHANNEL = "whatsapp"
+
+
+class NotificationOutboxDispatcher:
+    """
+    Despachador asíncrono del outbox. Se inicia y detiene desde el lifespan de la aplicación.
+    """
+
+    def __init__(self) -> None:
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.whatsapp_service = EvolutionApiService()
+        self.rate_limiter = get_rate_limiter(
+            "evolution_api",
+            rate=EVOLUTION_RATE_PER_SECOND,
+            capacity=EVOLUTION_RATE_BURST,
+        )
+        self._semaphore = asyncio.Semaphore(EVOLUTION_MAX_CONCURRENCY)
+        self._stop_event = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._claimed = 0
+        self._sent = 0
+        self._failed = 0
+        self._deferred = 0
+        self._lost_leases = 0
+
+    def start(self) -> None:
+        """Lanza el ciclo del worker como tarea de asyncio."""
+        if self._task is None or self._task.done():
+            self._stop_event.clear()
+            self._task = asyncio.create_task(self._run(), name="notification-outbox-dispatcher")
+            logger.info(f"Dispatcher de outbox iniciado ({self.worker_id})")
+
+    async def stop(self) -> None:
+        """Detiene el worker esperando a que termine el lote en curso."""
+        self._stop_event.set()
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._task, timeout=EVOLUTION_CALL_DEADLINE)
+            except asyncio.TimeoutError:
+                self._task.cancel()
+            self._task = None
+        logger.info(f"Dispatcher de outbox detenido ({self.worker_id})")
+
+    async def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                processed = await self.dispatch_once()
+            except Exception as e:
+                logger.error(f"Error en el dispatcher de outbox: {str(e)}", exc_info=True)
+                processed = 0
+
+            # Si el lote vino lleno probablemente hay más pendientes: seguir sin esperar
+            if processed < NOTIFICATIONS_OUTBOX_BATCH_SIZE:
+                try:
+                    await asyncio.wait_for(
+                        self._stop_event.wait(), timeout=NOTIFICATIONS_OUTBOX_POLL_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+    async def dispatch_once(self) -> int:
+        """
+        Reclama y procesa un lote de mensajes.
+
+        Returns:
+            int: Cantidad de mensajes procesados.
+        """
+        # El reclamo se confirma en su propia transacción antes de enviar
+        async with unit_of_work_scope():
+            repository = self._get_repository()
+            messages = await repository.claim_messages(
+                worker_id=self.worker_id,
+                batch_size=NOTIFICATIONS_OUTBOX_BATCH_SIZE,
+                lease_seconds=NOTIFICATIONS_OUTBOX_LEASE_SECONDS,
+            )
+
+        self._claimed += len(messages)
+        if messages:
+            await asyncio.gather(*(self._process_message(message) for message in messages))
+        return len(messages)
+
+    async def _process_message(self, message: NotificationOutboxEntity) -> None:
+        async with self._semaphore:
+            await self.rate_limiter.acquire()
+
+            async with unit_of_work_scope():
+                renewed = await self._get_repository().renew_lease(
+                    outbox_id=message.outbox_id,
+                    worker_id=self.worker_id,
+                    lease_seconds=NOTIFICATIONS_OUTBOX_LEASE_SECONDS,
+                )
+            if not renewed:
+                self._lease_lost(message, "antes de enviarlo; no se envía")
+                return
+
+            try:
+                provider_response = await self._send(message)
+            except (CircuitOpenError, BulkheadFullError) as e:
+                await self._defer(message, e)
+                return
+            except Exception as e:
+                error = "Timeout al enviar el mensaje" if isinstance(e, asyncio.TimeoutError) else str(e)
+                next_attempt_at = self._next_attempt_at(message)
+                async with unit_of_work_scope():
+                    updated = await self._get_repository().mark_failed(
+                        outbox_id=message.outbox_id,
+                        worker_id=self.worker_id,
+                        error=error,
+                        next_attempt_at=next_attempt_at,
+                    )
+                if not updated:
+                    self._lease_lost(message, f"al registrar el fallo ({error})")
+                    return
+                self._failed += 1
+                if next_attempt_at is None:
+                    logger.warning(
+                        f"Mensaje de outbox {message.outbox_id} descartado tras "
+                        f"{message.attempts} intentos: {error}"
+                    )
+                return
+
+            async with unit_of_work_scope():
+                updated = await self._get_repository().mark_sent(
+                    outbox_id=message.outbox_id,
+                    worker_id=self.worker_id,
+                    provider_response=provider_response,
+                )
+            if not updated:
+                # El mensaje ya salió: otro worker que lo haya reclamado lo reenviará
+                self._lease_lost(message, "después de enviarlo; puede duplicarse")
+                return
+            self._sent += 1
+
+    async def _defer(
+        self, message: NotificationOutboxEntity, error: CircuitOpenError | BulkheadFullError
+    ) -> None:
+        async with unit_of_work_scope():
+            updated = await self._get_repository().defer_message(
+                outbox_id=message.outbox_id,
+                worker_id=self.worker_id,
+                reason=str(error),
+                next_attempt_at=self._deferred_attempt_at(error),
+            )
+        if not updated:
+            self._lease_lost(message, f"al reprogramarlo ({error})")
+            return
+        self._deferred += 1
+
+    def _lease_lost(self, message: NotificationOutboxEntity, detail: str) -> None:
+        self._lost_leases += 1
+        logger.error(
+            f"Lease perdido del mensaje de outbox {message.outbox_id} "
+            f"(worker {self.worker_id}) {detail}"
+        )
+
+    async def _send(self, message: NotificationOutboxEntity) -> Dict[str, Any]:
+        if message.channel != WHATSAPP_CHANNEL:
+            raise ValueError(f"Canal de notificación no soportado: {message.channel}")
+
+        return await asyncio.wait_for(
+            self.whatsapp_service.send_text_message(
+                number=message.recipient,
+                text=message.message,
+                delay=None,
+                link_preview=False,
+            ),
+            timeout=EVOLUTION_CALL_DEADLINE,
+        )
+
+    def _next_attempt_at(self, message: NotificationOutboxEntity) -> Optional[datetime]:
+        """
+        Calcula el próximo intento con backoff exponencial y jitter.
+        Devuelve None si ya se agotaron los intentos.
+        """
+        if message.attempts >= message.max_attempts:
+            return None
+        delay = min(
+            NOTIFICATIONS_OUTBOX_BACKOFF_MAX,
+            NOTIFICATIONS_OUTBOX_BACKOFF_BASE * (2 ** max(0, message.attempts - 1)),
+        )
+        delay *= random.uniform(0.8, 1.2)
+        return datetime.now(timezone.utc) + timedelta(seconds=delay)
+
+    def _deferred_attempt_at(self, error: CircuitOpenError | BulkheadFullError) -> datetime:
+        """
+        Calcula el próximo intento de un mensaje rechazado sin enviarse: cuando el
+        circuito vuelva a aceptar llamadas, o tras la ventana de recuperación si no se
+        conoce (bulkhead lleno o llamada de prueba en curso). El jitter evita que todo
+        el lote reprogramado vuelva a la vez.
+        """
+        delay = EVOLUTION_BREAKER_RECOVERY_TIMEOUT
+        if isinstance(error, CircuitOpenError) and error.retry_after > 0:
+            delay = error.retry_after
+        delay *= random.uniform(1.0, 1.2)
+        return datetime.now(timezone.utc) + timedelta(seconds=delay)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estadísticas del dispatcher para monitoreo."""
+        return {
+            "worker_id": self.worker_id,
+            "running": self._task is not None and not self._task.done(),
+            "claimed": self._claimed,
+            "sent": self._sent,
+            "failed": self._failed,
+            "deferred": self._deferred,
+            "lost_leases": self._lost_leases,
+        }
+
+    @staticmethod
+    def _get_repository() -> NotificationOutboxRepository:
+        return injector_var.get().get(NotificationOutboxRepository)  # type: ignore[type-abstract]
+
+
+_dispatcher: Optional[NotificationOutboxDispatcher] = None
+
+
+def get_outbox_dispatcher() -> NotificationOutboxDispatcher:
+    """
+    Obtiene la instancia única del dispatcher del proceso.
+
+    Returns:
+        NotificationOutboxDispatcher: Dispatcher compartido
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = NotificationOutboxDispatcher()
+    return _dispatcher
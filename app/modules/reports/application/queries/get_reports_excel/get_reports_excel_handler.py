@@ -17,6 +17,7 @@ from app.modules.share.aplication.services.data_shaper_service import DataShaper
 from app.modules.share.aplication.services.filter_parser_service import (
     FilterParserService,
 )
+from app.modules.share.infra.executor import get_executor
 
 
 class GetReportsExcelQuery(BaseModel):
@@ -103,8 +104,9 @@ class GetReportsExcelQueryHandler:
             }
             appointments_data.append(appointment_dict)
 
-        # Generar archivo Excel
-        excel_file = self.excel_generator.generate_excel_report(
+        # Generar archivo Excel en el pool de procesos para no bloquear el event loop
+        excel_file: io.BytesIO = await get_executor().run_in_process(
+            self.excel_generator.generate_excel_report,
             data=appointments_data,
             filename="reporte_citas",
             start_date=query.start_date.strftime("%Y-%m-%d %H:%M:%S"),
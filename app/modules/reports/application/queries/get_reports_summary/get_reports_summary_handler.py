@@ -0,0 +1,96 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from mediatr import Mediator
+from pydantic import BaseModel, Field, validator
+
+from app.constants import injector_var
+from app.modules.reports.domain.entities.report_summary_entity import (
+    ReportSummaryGroupEntity,
+)
+from app.modules.reports.domain.repositories.report_repository import ReportRepository
+
+
+class GetReportsSummaryQuery(BaseModel):
+    start_date: datetime = Field(..., description="Fecha de inicio en formato YYYY-MM-DD")
+    end_date: datetime = Field(..., description="Fecha de fin en formato YYYY-MM-DD")
+    barber_id: Optional[int] = Field(default=None, description="ID del barbero (opcional)")
+    location_id: Optional[int] = Field(default=None, description="ID de la ubicación (opcional)")
+    status_id: Optional[int] = Field(default=None, description="ID del estado de la cita (opcional)")
+
+    @validator("end_date")
+    def validate_date_range(cls, v: datetime, values: Dict[str, Any]) -> datetime:
+        if "start_date" in values and values["start_date"]:
+            if v < values["start_date"]:
+                raise ValueError("end_date debe ser posterior a start_date")
+        return v
+
+
+class ReportSummaryGroupResponse(BaseModel):
+    group_id: Optional[int]
+    group_name: Optional[str]
+    total_appointments: int
+    total_revenue: Decimal
+    average_rating: Optional[float]
+
+
+class GetReportsSummaryQueryResponse(BaseModel):
+    total_appointments: int
+    total_revenue: Decimal
+    average_rating: Optional[float]
+    total_reviews: int
+    by_barber: List[ReportSummaryGroupResponse]
+    by_location: List[ReportSummaryGroupResponse]
+    by_service: List[ReportSummaryGroupResponse]
+    by_status: List[ReportSummaryGroupResponse]
+
+
+@Mediator.handler
+class GetReportsSummaryQueryHandler:
+    def __init__(self) -> None:
+        injector = injector_var.get()
+        self.report_repository = injector.get(ReportRepository)  # type: ignore[type-abstract]
+
+    async def handle(self, query: GetReportsSummaryQuery) -> GetReportsSummaryQueryResponse:
+        filters: Dict[str, Any] = {
+            "start_date": query.start_date.strftime("%Y-%m-%d %H:%M:%S"),
+            "end_date": query.end_date.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+        # Mismos filtros opcionales que el reporte en Excel
+        if query.barber_id is not None:
+            filters["user_id"] = query.barber_id
+
+        if query.location_id is not None:
+            filters["location_id"] = query.location_id
+
+        if query.status_id is not None:
+            filters["status_id"] = query.status_id
+
+        summary = await self.report_repository.get_report_summary(filters=filters)
+
+        return GetReportsSummaryQueryResponse(
+            total_appointments=summary.total_appointments,
+            total_revenue=summary.total_revenue,
+            average_rating=summary.average_rating,
+            total_reviews=summary.total_reviews,
+            by_barber=self._to_response(summary.by_barber),
+            by_location=self._to_response(summary.by_location),
+            by_service=self._to_response(summary.by_service),
+            by_status=self._to_response(summary.by_status),
+        )
+
+    def _to_response(
+        self, groups: List[ReportSummaryGroupEntity]
+    ) -> List[ReportSummaryGroupResponse]:
+        return [
+            ReportSummaryGroupResponse(
+                group_id=group.group_id,
+                group_name=group.group_name,
+                total_appointments=group.total_appointments,
+                total_revenue=group.total_revenue,
+                average_rating=group.average_rating,
+            )
+            for group in groups
+        ]
@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import List, Optional
+
+
+@dataclass
+class ReportSummaryGroupEntity:
+    """
+    Fila agregada de un grupo del resumen de reportes (barbero, sede, servicio o estado).
+    Corresponde a cada elemento de los arreglos JSON devueltos por 'reports_sp_get_summary'.
+    """
+    group_id: Optional[int]
+    group_name: Optional[str]
+    total_appointments: int
+    total_revenue: Decimal
+    average_rating: Optional[float]
+
+
+@dataclass
+class ReportSummaryEntity:
+    """
+    Entidad de respuesta del resumen de reportes.
+    Corresponde al resultado del SP 'reports_sp_get_summary'.
+    """
+    total_appointments: int
+    total_revenue: Decimal
+    average_rating: Optional[float]
+    total_reviews: int
+    by_barber: List[ReportSummaryGroupEntity] = field(default_factory=list)
+    by_location: List[ReportSummaryGroupEntity] = field(default_factory=list)
+    by_service: List[ReportSummaryGroupEntity] = field(default_factory=list)
+    by_status: List[ReportSummaryGroupEntity] = field(default_factory=list)
@@ -1,17 +1,29 @@
-from typing import Any, Dict, List
+from abc import ABC, abstractmethod
+from typing import Any, Dict
 
+from app.modules.reports.domain.entities.report_summary_entity import ReportSummaryEntity
 
-class ReportRepository:
-    async def get_reports(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """
-        Obtiene los datos de los reportes basados en los filtros proporcionados.
-        """
-        # Implementación para obtener datos de la base de datos
-        pass
 
-    async def generate_excel(self, data: List[Dict[str, Any]]) -> Any:
+class ReportRepository(ABC):
+    """
+    Clase Base Abstracta (ABC) que define la interfaz del repositorio
+    para las consultas de reportes.
+    Las implementaciones concretas (que interactúan con la base de datos)
+    deberán implementar los métodos aquí definidos.
+    """
+
+    @abstractmethod
+    async def get_report_summary(self, filters: Dict[str, Any]) -> ReportSummaryEntity:
         """
-        Genera un archivo Excel basado en los datos proporcionados.
+        Obtiene los totales agregados de las citas (ingresos, cantidad y rating promedio)
+        agrupados por barbero, sede, servicio y estado. La agregación se realiza en la
+        base de datos, sin traer las citas individuales.
+
+        Args:
+            filters: Diccionario con los filtros del reporte (start_date, end_date y,
+                     opcionalmente, user_id, location_id y status_id).
+
+        Returns:
+            ReportSummaryEntity con los totales generales y los agrupados.
         """
-        # Implementación para generar el archivo Excel
-        pass
\ No newline at end of file
+        pass
@@ -0,0 +1,92 @@
+import json
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.constants import uow_var
+from app.modules.reports.domain.entities.report_summary_entity import (
+    ReportSummaryEntity,
+    ReportSummaryGroupEntity,
+)
+from app.modules.reports.domain.repositories.report_repository import ReportRepository
+from app.modules.share.infra.persistence.unit_of_work import UnitOfWork
+from app.modules.share.utils.handle_dbapi_error import handle_error
+
+
+class ReportImplementationRepository(ReportRepository):
+    """
+    Implementación concreta de la interfaz ReportRepository.
+    Utiliza SQLAlchemy y el patrón de Unidad de Trabajo (Unit of Work) para interactuar
+    con la base de datos PostgreSQL.
+    """
+
+    @property
+    def _uow(self) -> UnitOfWork:
+        """Proporciona acceso a la instancia actual de UnitOfWork."""
+        try:
+            return uow_var.get()
+        except LookupError:
+            raise RuntimeError("UnitOfWork no encontrado en el contexto")
+
+    async def get_report_summary(self, filters: Dict[str, Any]) -> ReportSummaryEntity:
+        """
+        Llama al procedimiento almacenado 'reports_sp_get_summary'.
+
+        El SP recibe los mismos filtros JSON que 'appointments_get_all' y calcula los
+        agregados con GROUP BY sobre las citas del rango (LEFT JOIN con reviews para
+        el rating). Devuelve una única fila con las columnas:
+        total_appointments, total_revenue, average_rating, total_reviews y
+        by_barber, by_location, by_service, by_status (arreglos JSON de objetos con
+        group_id, group_name, total_appointments, total_revenue, average_rating).
+        """
+        sql_query = text("SELECT * FROM reports_sp_get_summary(:p_filters)")
+
+        params = {"p_filters": json.dumps(filters)}
+
+        try:
+            result = await self._uow.session.execute(sql_query, params)
+            row = result.first()
+
+            if not row:
+                return ReportSummaryEntity(
+                    total_appointments=0,
+                    total_revenue=Decimal("0"),
+                    average_rating=None,
+                    total_reviews=0,
+                )
+
+            return ReportSummaryEntity(
+                total_appointments=row.total_appointments or 0,
+                total_revenue=Decimal(str(row.total_revenue or 0)),
+                average_rating=self._to_float(row.average_rating),
+                total_reviews=row.total_reviews or 0,
+                by_barber=self._parse_groups(row.by_barber),
+                by_location=self._parse_groups(row.by_location),
+                by_service=self._parse_groups(row.by_service),
+                by_status=self._parse_groups(row.by_status),
+            )
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    def _parse_groups(self, data_json: Optional[List[Dict[str, Any]]]) -> List[ReportSummaryGroupEntity]:
+        """Convierte un arreglo JSON de grupos agregados en entidades."""
+        if not data_json:
+            return []
+
+        return [
+            ReportSummaryGroupEntity(
+                group_id=item.get("group_id"),
+                group_name=item.get("group_name"),
+                total_appointments=item.get("total_appointments") or 0,
+                total_revenue=Decimal(str(item.get("total_revenue") or 0)),
+                average_rating=self._to_float(item.get("average_rating")),
+            )
+            for item in data_json
+        ]
+
+    @staticmethod
+    def _to_float(value: Any) -> Optional[float]:
+        return float(value) if value is not None else None
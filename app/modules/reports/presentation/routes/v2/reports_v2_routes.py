@@ -10,6 +10,10 @@ from app.modules.auth.presentation.dependencies.auth_dependencies import (
 from app.modules.reports.application.queries.get_reports_excel.get_reports_excel_handler import (
     GetReportsExcelQuery,
 )
+from app.modules.reports.application.queries.get_reports_summary.get_reports_summary_handler import (
+    GetReportsSummaryQuery,
+    GetReportsSummaryQueryResponse,
+)
 
 
 class ReportsV2Controller:
@@ -30,6 +34,11 @@ class ReportsV2Controller:
             },
         )(self.get_reports_excel)
 
+        self.router.get(
+            "/reports/summary",
+            dependencies=[Depends(permission_required(roles=["admin", "staff"]))],
+        )(self.get_reports_summary)
+
     async def get_reports_excel(
         self,
         query: Annotated[GetReportsExcelQuery, Depends()],
@@ -49,3 +58,14 @@ class ReportsV2Controller:
         )
         response.headers["Content-Disposition"] = "attachment; filename=reportes_citas.xlsx"
         return response
+
+    async def get_reports_summary(
+        self,
+        query: Annotated[GetReportsSummaryQuery, Depends()],
+    ) -> GetReportsSummaryQueryResponse:
+        """
+        Devuelve los totales agregados (ingresos, cantidad de citas y rating promedio)
+        por barbero, sede, servicio y estado, con los mismos filtros que el reporte en Excel.
+        """
+        result: GetReportsSummaryQueryResponse = await self.mediator.send_async(query)
+        return result
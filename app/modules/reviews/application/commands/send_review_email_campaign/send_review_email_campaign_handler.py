@@ -0,0 +1,174 @@
+import asyncio
+from typing import List, Optional, Tuple
+
+from mediatr import Mediator
+from pydantic import BaseModel, Field
+
+from app.constants import injector_var
+from app.modules.reviews.domain.entities.review_entity import ReviewCampaignItem
+from app.modules.reviews.domain.repositories.review_repository import ReviewRepository
+from app.modules.share.domain.handler.request_handler import IRequestHandler
+from app.modules.share.infra.email.email_service import EmailService
+from app.modules.share.infra.persistence.unit_of_work_scope import unit_of_work_scope
+from config.setting import (
+    REVIEW_CAMPAIGN_BATCH_SIZE,
+    REVIEW_CAMPAIGN_LEASE_SECONDS,
+    REVIEW_CAMPAIGN_LIMIT,
+)
+
+
+class SendReviewEmailCampaignCommand(BaseModel):
+    """
+    Comando para enviar en bloque los emails de solicitud de review
+    de todas las citas elegibles.
+    """
+    days_after: int = 7
+    limit: int = Field(default=REVIEW_CAMPAIGN_LIMIT, gt=0)
+    user_transaction: str = "n8n"
+
+
+class ReviewCampaignFailure(BaseModel):
+    """
+    Detalle de un email de la campaña que no pudo enviarse.
+    """
+    review_id: int
+    appointment_id: int
+    customer_email: Optional[str]
+    error: Optional[str]
+
+
+class SendReviewEmailCampaignResponse(BaseModel):
+    """
+    Resumen de la campaña de emails de review.
+    """
+    success: bool
+    message: str
+    total_eligible: int
+    sent: int
+    failed: int
+    unknown: int
+    skipped: int
+    marked_sent: int
+    failures: List[ReviewCampaignFailure]
+
+
+@Mediator.handler
+class SendReviewEmailCampaignCommandHandler(
+    IRequestHandler[SendReviewEmailCampaignCommand, SendReviewEmailCampaignResponse]
+):
+    """
+    Manejador para el comando SendReviewEmailCampaignCommand.
+    Prepara y reclama los reviews en una transacción propia que se confirma antes de
+    enviar, envía los correos por lotes reutilizando sesiones SMTP y registra cada lote
+    al terminarlo. Ninguna transacción queda abierta durante el envío, y el reclamo
+    evita que una ejecución concurrente (n8n y el scheduler) envíe los mismos reviews.
+    """
+
+    def __init__(self) -> None:
+        injector = injector_var.get()
+        self.review_repository: ReviewRepository = injector.get(ReviewRepository)  # type: ignore[type-abstract]
+        self.email_service = EmailService()
+
+    async def handle(
+        self, command: SendReviewEmailCampaignCommand
+    ) -> SendReviewEmailCampaignResponse:
+        async with unit_of_work_scope():
+            items = await self.review_repository.prepare_review_email_campaign(
+                days_after=command.days_after,
+                limit=command.limit,
+                user_transaction=command.user_transaction,
+                lease_seconds=REVIEW_CAMPAIGN_LEASE_SECONDS,
+            )
+
+        # Sin email no hay a quién enviar: se omiten y su review queda pendiente
+        sendable = [item for item in items if item.customer_email]
+        skipped = [item.review_id for item in items if not item.customer_email]
+        if skipped:
+            async with unit_of_work_scope():
+                await self.review_repository.release_email_claims(skipped)
+
+        # Cada lote viaja por una sola sesión SMTP; la concurrencia entre lotes
+        # queda acotada por el tamaño del pool de sesiones (SMTP_POOL_SIZE)
+        batches = [
+            sendable[i:i + REVIEW_CAMPAIGN_BATCH_SIZE]
+            for i in range(0, len(sendable), REVIEW_CAMPAIGN_BATCH_SIZE)
+        ]
+        batch_outcomes = await asyncio.gather(
+            *(self._send_batch(batch, command.user_transaction) for batch in batches)
+        )
+
+        sent = 0
+        unknown = 0
+        marked_sent = 0
+        failures: List[ReviewCampaignFailure] = []
+        for batch_sent, batch_unknown, batch_marked, batch_failures in batch_outcomes:
+            sent += batch_sent
+            unknown += batch_unknown
+            marked_sent += batch_marked
+            failures.extend(batch_failures)
+
+        return SendReviewEmailCampaignResponse(
+            success=True,
+            message=(
+                f"Campaña completada. {sent} enviados, {len(failures)} fallidos, "
+                f"{unknown} sin confirmar, {len(skipped)} omitidos"
+            ),
+            total_eligible=len(items),
+            sent=sent,
+            failed=len(failures),
+            unknown=unknown,
+            skipped=len(skipped),
+            marked_sent=marked_sent,
+            failures=failures,
+        )
+
+    async def _send_batch(
+        self, batch: List[ReviewCampaignItem], user_transaction: str
+    ) -> Tuple[int, int, int, List[ReviewCampaignFailure]]:
+        """
+        Envía un lote y lo registra en su propia transacción: los enviados (y los de
+        resultado desconocido, que pudieron salir) quedan marcados; los fallidos se
+        liberan para la próxima campaña.
+
+        Returns:
+            Enviados, sin confirmar, marcados como enviados y detalle de los fallidos.
+        """
+        messages = [
+            self.email_service.build_review_email(
+                to_email=item.customer_email or "",
+                to_name=item.customer_name or "",
+                review_token=item.token,
+                customer_name=item.customer_name or "",
+            )
+            for item in batch
+        ]
+        results = await self.email_service.send_many(messages)
+
+        sent_ids: List[int] = []
+        unknown = 0
+        failed_ids: List[int] = []
+        failures: List[ReviewCampaignFailure] = []
+        for item, result in zip(batch, results):
+            if result.success or result.unknown:
+                # Un correo sin confirmar no se reenvía: se prefiere no duplicarlo
+                sent_ids.append(item.review_id)
+                unknown += 1 if result.unknown else 0
+            else:
+                failed_ids.append(item.review_id)
+                failures.append(
+                    ReviewCampaignFailure(
+                        review_id=item.review_id,
+                        appointment_id=item.appointment_id,
+                        customer_email=item.customer_email,
+                        error=result.error or result.message,
+                    )
+                )
+
+        async with unit_of_work_scope():
+            marked_sent = await self.review_repository.mark_emails_sent_bulk(
+                review_ids=sent_ids,
+                user_transaction=user_transaction,
+            )
+            await self.review_repository.release_email_claims(failed_ids)
+
+        return len(sent_ids) - unknown, unknown, marked_sent, failures
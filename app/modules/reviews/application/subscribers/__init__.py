@@ -0,0 +1,8 @@
+# Importar los suscriptores para que se registren en el bus de eventos de dominio
+from app.modules.reviews.application.subscribers.appointment_review_subscriber import (
+    process_updated_appointment_for_review,
+)
+
+__all__ = [
+    "process_updated_appointment_for_review",
+]
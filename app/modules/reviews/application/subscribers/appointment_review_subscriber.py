@@ -0,0 +1,41 @@
+import logging
+
+from app.modules.appointment.domain.events import AppointmentUpdatedEvent
+from app.modules.reviews.application.commands.process_appointment_for_review.process_appointment_for_review_handler import (
+    ProcessAppointmentForReviewCommand,
+    ProcessAppointmentForReviewResponse,
+)
+from app.modules.share.infra.events import subscribe
+from app.modules.share.infra.mediator_config import MediatorManager
+from app.modules.share.infra.persistence.unit_of_work_scope import unit_of_work_scope
+from config.setting import REVIEW_TRIGGER_STATUS_IDS, SCHEDULER_REVIEW_DAYS_AFTER
+
+logger = logging.getLogger(__name__)
+
+
+@subscribe(AppointmentUpdatedEvent)
+async def process_updated_appointment_for_review(event: AppointmentUpdatedEvent) -> None:
+    """
+    Al cambiar el estado de una cita (por ejemplo, al marcarla como atendida) se procesa
+    para review. Las actualizaciones que no cambian el estado, y los estados fuera de
+    REVIEW_TRIGGER_STATUS_IDS cuando está configurado, se ignoran sin abrir transacción.
+    'sp_process_appointment_for_review_email' decide si la cita es elegible.
+    """
+    if event.previous_status_maintable_id == event.status_maintable_id:
+        return
+    if REVIEW_TRIGGER_STATUS_IDS and event.status_maintable_id not in REVIEW_TRIGGER_STATUS_IDS:
+        return
+
+    async with unit_of_work_scope():
+        result: ProcessAppointmentForReviewResponse = (
+            await MediatorManager.get_instance().send_async(
+                ProcessAppointmentForReviewCommand(
+                    appointment_id=event.appointment_id,
+                    days_after=SCHEDULER_REVIEW_DAYS_AFTER,
+                    user_transaction=event.user_modify,
+                )
+            )
+        )
+    logger.debug(
+        f"Cita {event.appointment_id} procesada para review: {result.action} - {result.message}"
+    )
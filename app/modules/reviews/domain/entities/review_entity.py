@@ -103,3 +103,20 @@ class ReviewResponse:
     update_date: Optional[datetime]
     user_create: str
     user_modify: Optional[str]
+
+
+@dataclass
+class ReviewCampaignItem:
+    """
+    Review preparado para la campaña masiva de emails.
+    Corresponde a cada fila devuelta por el SP 'sp_prepare_review_email_campaign'.
+    """
+    review_id: int
+    appointment_id: int
+    token: str
+    customer_email: Optional[str]
+    customer_name: Optional[str]
+    service_name: Optional[str]
+    staff_name: Optional[str]
+    appointment_date: Optional[datetime]
+    location_name: Optional[str]
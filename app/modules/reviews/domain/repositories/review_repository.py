@@ -8,6 +8,7 @@ from app.modules.reviews.domain.entities.review_entity import (
     ValidateTokenResponse,
     SubmitReviewResponse,
     ReviewInfoForEmailResponse,
+    ReviewCampaignItem,
 )
 
 
@@ -129,3 +130,59 @@ class ReviewRepository(ABC):
             Lista de ReviewResponse con los reviews obtenidos.
         """
         pass
+
+    @abstractmethod
+    async def prepare_review_email_campaign(
+        self,
+        days_after: int,
+        limit: int,
+        user_transaction: str,
+        lease_seconds: int,
+    ) -> list[ReviewCampaignItem]:
+        """
+        Busca en una sola llamada todas las citas elegibles para solicitar review
+        (sin email enviado ni reclamado por otra campaña), crea los reviews y tokens
+        que falten y reclama los reviews devueltos hasta que venza el lease.
+
+        Args:
+            days_after: Días después de la cita para considerar el envío.
+            limit: Cantidad máxima de reviews a preparar.
+            user_transaction: Identificador del usuario o sistema que realiza la operación.
+            lease_seconds: Segundos durante los que otra campaña no tomará estos reviews.
+
+        Returns:
+            Lista de ReviewCampaignItem con los datos necesarios para cada email.
+        """
+        pass
+
+    @abstractmethod
+    async def mark_emails_sent_bulk(
+        self,
+        review_ids: list[int],
+        user_transaction: str,
+    ) -> int:
+        """
+        Marca varios reviews como email enviado en una sola actualización.
+
+        Args:
+            review_ids: IDs de los reviews cuyo email se envió.
+            user_transaction: Identificador del usuario o sistema que realiza la operación.
+
+        Returns:
+            Cantidad de reviews actualizados.
+        """
+        pass
+
+    @abstractmethod
+    async def release_email_claims(self, review_ids: list[int]) -> int:
+        """
+        Libera el reclamo de reviews cuyo email no se envió, para que la próxima
+        campaña los reintente.
+
+        Args:
+            review_ids: IDs de los reviews a liberar.
+
+        Returns:
+            Cantidad de reviews liberados.
+        """
+        pass
@@ -15,6 +15,7 @@ from app.modules.reviews.domain.entities.review_entity import (
     ValidateTokenResponse,
     SubmitReviewResponse,
     ReviewInfoForEmailResponse,
+    ReviewCampaignItem,
 )
 
 
@@ -315,3 +316,96 @@ class ReviewImplementationRepository(ReviewRepository):
         except DBAPIError as e:
             handle_error(e)
             raise RuntimeError(f"Error de base de datos al obtener reviews: {e}")
+
+    async def prepare_review_email_campaign(
+        self,
+        days_after: int,
+        limit: int,
+        user_transaction: str,
+        lease_seconds: int,
+    ) -> list[ReviewCampaignItem]:
+        """
+        Prepara la campaña masiva de reviews.
+        Llama al procedimiento almacenado 'sp_prepare_review_email_campaign', que en una
+        sola llamada selecciona las citas elegibles, crea los reviews faltantes con su
+        token, reclama los reviews y devuelve los datos para el email. Las citas cuyo
+        cliente no tiene email quedan en 'review_email_exclusions' y no se reevalúan.
+        """
+        sql_query = text(
+            "SELECT * FROM sp_prepare_review_email_campaign(:days_after, :limit, :user_transaction, :lease_seconds)"
+        )
+
+        params = {
+            "days_after": days_after,
+            "limit": limit,
+            "user_transaction": user_transaction,
+            "lease_seconds": lease_seconds,
+        }
+
+        try:
+            result = await self._uow.session.execute(sql_query, params)
+
+            return [
+                ReviewCampaignItem(
+                    review_id=row.review_id,
+                    appointment_id=row.appointment_id,
+                    token=row.token,
+                    customer_email=row.customer_email,
+                    customer_name=row.customer_name,
+                    service_name=row.service_name,
+                    staff_name=row.staff_name,
+                    appointment_date=row.appointment_date,
+                    location_name=row.location_name,
+                )
+                for row in result.fetchall()
+            ]
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError(f"Error de base de datos al preparar campaña de reviews: {e}")
+
+    async def mark_emails_sent_bulk(
+        self,
+        review_ids: list[int],
+        user_transaction: str,
+    ) -> int:
+        """
+        Marca varios reviews como email enviado.
+        Llama al procedimiento almacenado 'sp_mark_review_emails_sent_bulk' (un único UPDATE ... WHERE review_id = ANY).
+        """
+        if not review_ids:
+            return 0
+
+        sql_query = text(
+            "SELECT * FROM sp_mark_review_emails_sent_bulk(:review_ids, :user_transaction)"
+        )
+
+        params = {
+            "review_ids": review_ids,
+            "user_transaction": user_transaction,
+        }
+
+        try:
+            result = await self._uow.session.execute(sql_query, params)
+            updated: int = result.scalar_one()
+            return updated
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError(f"Error de base de datos al marcar emails enviados: {e}")
+
+    async def release_email_claims(self, review_ids: list[int]) -> int:
+        """
+        Libera el reclamo de reviews cuyo email no se envió.
+        Llama al procedimiento almacenado 'sp_release_review_email_claims'.
+        """
+        if not review_ids:
+            return 0
+
+        sql_query = text("SELECT * FROM sp_release_review_email_claims(:review_ids)")
+
+        try:
+            result = await self._uow.session.execute(sql_query, {"review_ids": review_ids})
+            released: int = result.scalar_one()
+            return released
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError(f"Error de base de datos al liberar reviews reclamados: {e}")
@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query
 from mediatr import Mediator
 
 
@@ -12,6 +12,10 @@ from app.modules.reviews.application.commands.mark_email_sent.mark_email_sent_ha
     MarkEmailSentCommand,
     MarkEmailSentResponse,
 )
+from app.modules.reviews.application.commands.send_review_email_campaign.send_review_email_campaign_handler import (
+    SendReviewEmailCampaignCommand,
+    SendReviewEmailCampaignResponse,
+)
 from app.modules.reviews.application.commands.submit_review.submit_review_handler import (
     SubmitReviewCommand,
     SubmitReviewResponse,
@@ -64,6 +68,16 @@ class ReviewsV2Controller:
             description="Marca un review como email enviado.",
         )(self.mark_email_sent)
 
+        # Campaña masiva: procesa y envía todos los emails de review pendientes
+        self.router.post(
+            "/reviews/send-campaign",
+            dependencies=[Depends(permission_required(roles=["admin", "staff"]))],
+            description=(
+                "Busca todas las citas elegibles para review, crea sus tokens en bloque, "
+                "envía los emails y los marca como enviados. Devuelve un resumen."
+            ),
+        )(self.send_review_email_campaign)
+
         # API 3: Validar token (FRONTEND)
         self.router.get(
             "/reviews/validate/{token}",
@@ -121,6 +135,27 @@ class ReviewsV2Controller:
         result: MarkEmailSentResponse = await self.mediator.send_async(command)
         return result
 
+    async def send_review_email_campaign(
+        self,
+        days_after: Annotated[int, Query(description="Días después de la cita para considerar el envío")] = 7,
+    ) -> SendReviewEmailCampaignResponse:
+        """
+        Ejecuta la campaña masiva de emails de review.
+
+        Args:
+            days_after: Días después de la cita para considerar el envío.
+
+        Returns:
+            SendReviewEmailCampaignResponse con el resumen de la campaña.
+        """
+        command = SendReviewEmailCampaignCommand(
+            days_after=days_after,
+            user_transaction="n8n",
+        )
+
+        result: SendReviewEmailCampaignResponse = await self.mediator.send_async(command)
+        return result
+
     async def validate_token(
         self,
         token: Annotated[str, Path(description="Token del review a validar")],
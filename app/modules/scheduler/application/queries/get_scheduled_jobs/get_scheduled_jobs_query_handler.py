@@ -0,0 +1,78 @@
+from datetime import datetime
+from typing import List, Optional
+
+from mediatr import Mediator
+from pydantic import BaseModel
+
+from app.constants import injector_var
+from app.modules.scheduler.domain.repositories.scheduler_repository import (
+    SchedulerRepository,
+)
+from app.modules.scheduler.infra.services.job_scheduler import get_job_scheduler
+from app.modules.share.domain.handler.request_handler import IRequestHandler
+
+
+class GetScheduledJobsQuery(BaseModel):
+    """
+    Query para obtener el estado de los jobs programados.
+    """
+
+    pass
+
+
+class ScheduledJobStatusResponse(BaseModel):
+    """
+    Estado de un job programado. La última ejecución es global (la haya corrido
+    cualquier réplica); la próxima ejecución es la calculada por esta réplica.
+    """
+
+    name: str
+    schedule: str
+    registered: bool
+    running: bool
+    next_run_at: Optional[datetime] = None
+    last_run_at: Optional[datetime] = None
+    last_finished_at: Optional[datetime] = None
+    last_duration_ms: Optional[int] = None
+    last_status: Optional[str] = None
+    last_error: Optional[str] = None
+    last_run_by: Optional[str] = None
+
+
+@Mediator.handler
+class GetScheduledJobsQueryHandler(
+    IRequestHandler[GetScheduledJobsQuery, List[ScheduledJobStatusResponse]]
+):
+    """
+    Manejador para la query GetScheduledJobsQuery.
+    Combina los jobs registrados en el proceso con las ejecuciones guardadas en la base.
+    """
+
+    def __init__(self) -> None:
+        injector = injector_var.get()
+        self.scheduler_repository: SchedulerRepository = injector.get(SchedulerRepository)  # type: ignore[type-abstract]
+
+    async def handle(self, query: GetScheduledJobsQuery) -> List[ScheduledJobStatusResponse]:
+        runs = {run.job_name: run for run in await self.scheduler_repository.get_job_runs()}
+        jobs = {job.name: job for job in get_job_scheduler().jobs}
+
+        result: List[ScheduledJobStatusResponse] = []
+        for name in sorted(set(jobs) | set(runs)):
+            job = jobs.get(name)
+            run = runs.get(name)
+            result.append(
+                ScheduledJobStatusResponse(
+                    name=name,
+                    schedule=job.schedule if job else "",
+                    registered=job is not None,
+                    running=job.running if job else False,
+                    next_run_at=job.next_run_at if job and job.next_run_at else (run.next_run_at if run else None),
+                    last_run_at=run.last_started_at if run else None,
+                    last_finished_at=run.last_finished_at if run else None,
+                    last_duration_ms=run.last_duration_ms if run else None,
+                    last_status=run.last_status if run else None,
+                    last_error=run.last_error if run else None,
+                    last_run_by=run.last_run_by if run else None,
+                )
+            )
+        return result
@@ -0,0 +1,62 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from app.modules.scheduler.domain.scheduled_job_run_entity import ScheduledJobRunEntity
+
+
+class SchedulerRepository(ABC):
+    """
+    Repositorio abstracto para la coordinación de jobs programados entre réplicas.
+    """
+
+    @abstractmethod
+    async def claim_job_run(
+        self, job_name: str, scheduled_for: datetime, worker_id: str
+    ) -> bool:
+        """
+        Intenta reclamar una ejecución programada del job. Solo una réplica obtiene el
+        advisory lock del job y registra la ejecución; las demás reciben False.
+
+        Args:
+            job_name: Nombre del job.
+            scheduled_for: Momento programado de la ejecución.
+            worker_id: Identificador de la réplica que reclama.
+
+        Returns:
+            bool: True si esta réplica debe ejecutar el job.
+        """
+        pass
+
+    @abstractmethod
+    async def finish_job_run(
+        self,
+        job_name: str,
+        worker_id: str,
+        status: str,
+        duration_ms: int,
+        error: Optional[str],
+        next_run_at: Optional[datetime],
+    ) -> None:
+        """
+        Registra el resultado de una ejecución reclamada por la réplica.
+
+        Args:
+            job_name: Nombre del job.
+            worker_id: Réplica que ejecutó el job.
+            status: 'succeeded' o 'failed'.
+            duration_ms: Duración de la ejecución en milisegundos.
+            error: Detalle del error, si lo hubo.
+            next_run_at: Próxima ejecución programada.
+        """
+        pass
+
+    @abstractmethod
+    async def get_job_runs(self) -> List[ScheduledJobRunEntity]:
+        """
+        Obtiene la última ejecución registrada de cada job.
+
+        Returns:
+            List[ScheduledJobRunEntity]: Ejecuciones ordenadas por nombre de job.
+        """
+        pass
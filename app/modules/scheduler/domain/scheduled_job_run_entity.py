@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class ScheduledJobRunEntity:
+    """
+    Última ejecución registrada de un job programado, compartida por todas las réplicas.
+    Corresponde a una fila de la tabla 'scheduler_job_runs'.
+    """
+
+    job_name: str
+    last_scheduled_for: Optional[datetime]
+    last_started_at: Optional[datetime]
+    last_finished_at: Optional[datetime]
+    last_duration_ms: Optional[int]
+    last_status: Optional[str]
+    last_error: Optional[str]
+    last_run_by: Optional[str]
+    next_run_at: Optional[datetime]
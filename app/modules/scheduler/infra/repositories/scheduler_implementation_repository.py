@@ -0,0 +1,110 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.constants import uow_var
+from app.modules.scheduler.domain.repositories.scheduler_repository import (
+    SchedulerRepository,
+)
+from app.modules.scheduler.domain.scheduled_job_run_entity import ScheduledJobRunEntity
+from app.modules.share.infra.persistence.unit_of_work import UnitOfWork
+from app.modules.share.utils.handle_dbapi_error import handle_error
+
+
+class SchedulerImplementationRepository(SchedulerRepository):
+    """
+    Implementación concreta del repositorio del scheduler usando SQLAlchemy.
+    """
+
+    @property
+    def _uow(self) -> UnitOfWork:
+        """Proporciona acceso a la instancia actual de UnitOfWork."""
+        try:
+            return uow_var.get()
+        except LookupError:
+            raise RuntimeError("UnitOfWork no encontrado en el contexto")
+
+    async def claim_job_run(
+        self, job_name: str, scheduled_for: datetime, worker_id: str
+    ) -> bool:
+        """
+        Reclama la ejecución llamando a 'scheduler_sp_claim_job_run'.
+        """
+        try:
+            query = text(
+                "SELECT scheduler_sp_claim_job_run(:p_job_name, :p_scheduled_for, :p_worker_id)"
+            )
+            result = await self._uow.session.execute(
+                query,
+                {
+                    "p_job_name": job_name,
+                    "p_scheduled_for": scheduled_for,
+                    "p_worker_id": worker_id,
+                },
+            )
+            return bool(result.scalar_one())
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
+
+    async def finish_job_run(
+        self,
+        job_name: str,
+        worker_id: str,
+        status: str,
+        duration_ms: int,
+        error: Optional[str],
+        next_run_at: Optional[datetime],
+    ) -> None:
+        """
+        Registra el resultado llamando a 'scheduler_sp_finish_job_run'.
+        """
+        try:
+            query = text(
+                "SELECT scheduler_sp_finish_job_run(:p_job_name, :p_worker_id, :p_status, "
+                ":p_duration_ms, :p_error, :p_next_run_at)"
+            )
+            await self._uow.session.execute(
+                query,
+                {
+                    "p_job_name": job_name,
+                    "p_worker_id": worker_id,
+                    "p_status": status,
+                    "p_duration_ms": duration_ms,
+                    "p_error": error,
+                    "p_next_run_at": next_run_at,
+                },
+            )
+
+        except DBAPIError as e:
+            handle_error(e)
+
+    async def get_job_runs(self) -> List[ScheduledJobRunEntity]:
+        """
+        Obtiene las ejecuciones llamando a 'scheduler_sp_get_job_runs'.
+        """
+        try:
+            result = await self._uow.session.execute(
+                text("SELECT * FROM scheduler_sp_get_job_runs()")
+            )
+            return [
+                ScheduledJobRunEntity(
+                    job_name=row.job_name,
+                    last_scheduled_for=row.last_scheduled_for,
+                    last_started_at=row.last_started_at,
+                    last_finished_at=row.last_finished_at,
+                    last_duration_ms=row.last_duration_ms,
+                    last_status=row.last_status,
+                    last_error=row.last_error,
+                    last_run_by=row.last_run_by,
+                    next_run_at=row.next_run_at,
+                )
+                for row in result.fetchall()
+            ]
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")
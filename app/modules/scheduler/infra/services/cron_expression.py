@@ -0,0 +1,120 @@
+"""
+Intérprete mínimo de expresiones cron de 5 campos: minuto hora día-del-mes mes día-de-semana.
+
+Soporta '*', valores, rangos 'a-b', pasos '*/n' y 'a-b/n', y listas separadas por coma.
+El día de la semana va de 0 (domingo) a 6; también se acepta 7 como domingo. Como en cron,
+si día del mes y día de semana están restringidos basta con que coincida uno de los dos;
+un campo cuyo conjunto cubre todo su rango (por ejemplo '1-31' o '0-6') no lo restringe.
+"""
+
+from datetime import datetime, timedelta
+from typing import FrozenSet, List, Tuple
+
+# (mínimo, máximo) de cada campo
+_FIELD_RANGES: List[Tuple[int, int]] = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+_FIELD_NAMES = ["minuto", "hora", "día del mes", "mes", "día de semana"]
+
+# Límite de búsqueda de la próxima ejecución (expresiones imposibles como '0 0 31 2 *')
+_MAX_LOOKAHEAD = timedelta(days=366 * 5)
+
+
+def _parse_field(value: str, low: int, high: int, name: str) -> FrozenSet[int]:
+    result = set()
+    for part in value.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f"Paso inválido en el campo {name}: {step_text}")
+
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(part)
+            end = high if step > 1 else start
+
+        if start < low or end > high or start > end:
+            raise ValueError(f"Valor fuera de rango en el campo {name}: {value}")
+        result.update(range(start, end + 1, step))
+    return frozenset(result)
+
+
+class CronExpression:
+    """
+    Expresión cron compilada que calcula la próxima ejecución a partir de una fecha.
+    """
+
+    def __init__(self, expression: str) -> None:
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(
+                f"La expresión cron debe tener 5 campos (minuto hora día mes día_semana): '{expression}'"
+            )
+        try:
+            parsed = [
+                _parse_field(field, low, high, name)
+                for field, (low, high), name in zip(fields, _FIELD_RANGES, _FIELD_NAMES)
+            ]
+        except ValueError as e:
+            raise ValueError(f"Expresión cron inválida '{expression}': {str(e)}")
+
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # 7 también es domingo
+        self.weekdays = frozenset(0 if day == 7 else day for day in weekdays)
+        # Se compara el conjunto con el rango completo, no el texto: '1-31' equivale a '*'
+        self._any_day = self.days == frozenset(range(1, 32))
+        self._any_weekday = self.weekdays == frozenset(range(0, 7))
+
+    def _day_matches(self, moment: datetime) -> bool:
+        # datetime.weekday(): lunes=0 ... domingo=6; cron: domingo=0 ... sábado=6
+        cron_weekday = (moment.weekday() + 1) % 7
+        day_ok = moment.day in self.days
+        weekday_ok = cron_weekday in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        Calcula la primera ejecución estrictamente posterior a 'moment'
+        (en la misma zona horaria de 'moment').
+
+        Args:
+            moment: Fecha de referencia.
+
+        Returns:
+            datetime de la próxima ejecución.
+
+        Raises:
+            ValueError: Si la expresión no tiene ejecuciones en los próximos años.
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + _MAX_LOOKAHEAD
+
+        while candidate <= limit:
+            if candidate.month not in self.months:
+                # Saltar al primer día del mes siguiente
+                year = candidate.year + (1 if candidate.month == 12 else 0)
+                month = 1 if candidate.month == 12 else candidate.month + 1
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+
+        raise ValueError(f"La expresión cron '{self.expression}' no tiene próximas ejecuciones")
+
+    def __str__(self) -> str:
+        return self.expression
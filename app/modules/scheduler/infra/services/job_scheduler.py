@@ -0,0 +1,237 @@
+"""
+Scheduler asíncrono de jobs periódicos que corre dentro del proceso de la API.
+
+- Cada job se programa con una expresión cron o con un intervalo fijo en segundos.
+- Todas las réplicas calculan los mismos momentos de ejecución; antes de ejecutar,
+  cada una intenta reclamar la ejecución con 'scheduler_sp_claim_job_run' (advisory lock
+  de Postgres + registro del momento programado), por lo que solo una la ejecuta.
+- Los jobs envían comandos de mediatr, cada uno en su propia UnitOfWork.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone, tzinfo
+from typing import Any, Callable, Dict, List, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from pydantic import BaseModel
+
+from app.constants import injector_var
+from app.modules.scheduler.domain.repositories.scheduler_repository import (
+    SchedulerRepository,
+)
+from app.modules.scheduler.infra.services.cron_expression import CronExpression
+from app.modules.share.infra.mediator_config import MediatorManager
+from app.modules.share.infra.persistence.unit_of_work_scope import unit_of_work_scope
+from config.setting import SCHEDULER_JOB_TIMEOUT, SCHEDULER_TIMEZONE
+
+logger = logging.getLogger(__name__)
+
+# Tiempo máximo de espera entre revisiones, para no depender de un único sleep largo
+_MAX_SLEEP_SECONDS = 60.0
+
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+def _load_timezone(name: str) -> tzinfo:
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.warning(f"Zona horaria '{name}' no disponible, se usa UTC")
+        return timezone.utc
+
+
+@dataclass
+class ScheduledJob:
+    """
+    Definición de un job programado y su estado local en esta réplica.
+    command_factory construye el comando de mediatr en cada ejecución, para que
+    los parámetros dependientes de la fecha se calculen al momento de correr.
+    """
+
+    name: str
+    command_factory: Callable[[], BaseModel]
+    cron: Optional[CronExpression] = None
+    interval_seconds: Optional[float] = None
+    timeout: float = SCHEDULER_JOB_TIMEOUT
+    next_run_at: Optional[datetime] = None
+    last_run_at: Optional[datetime] = None
+    last_duration_ms: Optional[int] = None
+    last_status: Optional[str] = None
+    last_error: Optional[str] = None
+    running: bool = False
+
+    @property
+    def schedule(self) -> str:
+        if self.cron is not None:
+            return f"cron: {self.cron}"
+        return f"cada {self.interval_seconds:.0f} s"
+
+    def compute_next_run(self, after: datetime, tz: tzinfo) -> datetime:
+        """
+        Próxima ejecución estrictamente posterior a 'after'. Los intervalos se alinean
+        a la época Unix para que todas las réplicas calculen el mismo momento.
+        """
+        if self.cron is not None:
+            return self.cron.next_after(after.astimezone(tz))
+        interval = self.interval_seconds or 0
+        slot = (int(after.timestamp() // interval) + 1) * interval
+        return datetime.fromtimestamp(slot, tz=tz)
+
+
+class JobScheduler:
+    """
+    Scheduler de jobs. Se inicia y detiene desde el lifespan de la aplicación.
+    """
+
+    def __init__(self, tz_name: str = SCHEDULER_TIMEZONE) -> None:
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.tz = _load_timezone(tz_name)
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._running_tasks: Dict[str, "asyncio.Task[None]"] = {}
+        self._stop_event = asyncio.Event()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def register(self, job: ScheduledJob) -> None:
+        """
+        Registra un job. Debe tener exactamente una programación (cron o intervalo).
+
+        Raises:
+            ValueError: Si la programación no es válida o el nombre está repetido.
+        """
+        if (job.cron is None) == (not job.interval_seconds):
+            raise ValueError(f"El job '{job.name}' debe tener una expresión cron o un intervalo")
+        if job.name in self._jobs:
+            raise ValueError(f"El job '{job.name}' ya está registrado")
+        self._jobs[job.name] = job
+
+    @property
+    def jobs(self) -> List[ScheduledJob]:
+        return list(self._jobs.values())
+
+    def start(self) -> None:
+        """Calcula las próximas ejecuciones y lanza el ciclo del scheduler."""
+        if self._task is not None and not self._task.done():
+            return
+        now = datetime.now(self.tz)
+        for job in self._jobs.values():
+            job.next_run_at = job.compute_next_run(now, self.tz)
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run(), name="job-scheduler")
+        logger.info(f"Scheduler iniciado ({self.worker_id}) con {len(self._jobs)} jobs")
+
+    async def stop(self) -> None:
+        """Detiene el ciclo y cancela los jobs que sigan en ejecución."""
+        self._stop_event.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        tasks = list(self._running_tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info(f"Scheduler detenido ({self.worker_id})")
+
+    async def _run(self) -> None:
+        while not self._stop_event.is_set():
+            now = datetime.now(self.tz)
+            for job in self._jobs.values():
+                if job.next_run_at is None or job.next_run_at > now:
+                    continue
+                scheduled_for = job.next_run_at
+                job.next_run_at = job.compute_next_run(now, self.tz)
+                if job.running:
+                    logger.warning(
+                        f"Job '{job.name}' sigue en ejecución; se omite la ejecución de {scheduled_for}"
+                    )
+                    continue
+                self._running_tasks[job.name] = asyncio.create_task(
+                    self._execute(job, scheduled_for), name=f"scheduled-job-{job.name}"
+                )
+
+            next_runs = [job.next_run_at for job in self._jobs.values() if job.next_run_at]
+            sleep_seconds = _MAX_SLEEP_SECONDS
+            if next_runs:
+                until_next = (min(next_runs) - datetime.now(self.tz)).total_seconds()
+                sleep_seconds = min(_MAX_SLEEP_SECONDS, max(0.0, until_next))
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=sleep_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _execute(self, job: ScheduledJob, scheduled_for: datetime) -> None:
+        job.running = True
+        try:
+            async with unit_of_work_scope():
+                claimed = await self._get_repository().claim_job_run(
+                    job.name, scheduled_for, self.worker_id
+                )
+            if not claimed:
+                logger.debug(f"Job '{job.name}' de {scheduled_for} ejecutado por otra réplica")
+                return
+
+            started = time.monotonic()
+            job.last_run_at = datetime.now(self.tz)
+            status, error = JOB_SUCCEEDED, None
+            try:
+                result = await asyncio.wait_for(self._send_command(job), timeout=job.timeout)
+                # Algunos comandos informan el error en la respuesta en lugar de lanzar
+                if isinstance(result, dict) and result.get("success") is False:
+                    status, error = JOB_FAILED, str(result.get("message"))
+            except asyncio.TimeoutError:
+                status, error = JOB_FAILED, f"Timeout tras {job.timeout:.0f} s"
+            except Exception as e:
+                logger.error(f"Error en el job '{job.name}': {str(e)}", exc_info=True)
+                status, error = JOB_FAILED, str(e)
+
+            job.last_duration_ms = int((time.monotonic() - started) * 1000)
+            job.last_status, job.last_error = status, error
+            logger.info(f"Job '{job.name}' finalizado: {status} en {job.last_duration_ms} ms")
+
+            async with unit_of_work_scope():
+                await self._get_repository().finish_job_run(
+                    job_name=job.name,
+                    worker_id=self.worker_id,
+                    status=status,
+                    duration_ms=job.last_duration_ms,
+                    error=error,
+                    next_run_at=job.next_run_at,
+                )
+        except Exception as e:
+            logger.error(f"Error al coordinar el job '{job.name}': {str(e)}", exc_info=True)
+        finally:
+            job.running = False
+            self._running_tasks.pop(job.name, None)
+
+    @staticmethod
+    async def _send_command(job: ScheduledJob) -> Any:
+        # El comando corre en su propia transacción, igual que en un request HTTP
+        async with unit_of_work_scope():
+            return await MediatorManager.get_instance().send_async(job.command_factory())
+
+    @staticmethod
+    def _get_repository() -> SchedulerRepository:
+        return injector_var.get().get(SchedulerRepository)  # type: ignore[type-abstract]
+
+
+_scheduler: Optional[JobScheduler] = None
+
+
+def get_job_scheduler() -> JobScheduler:
+    """
+    Obtiene la instancia única del scheduler del proceso.
+
+    Returns:
+        JobScheduler: Scheduler compartido
+    """
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = JobScheduler()
+    return _scheduler
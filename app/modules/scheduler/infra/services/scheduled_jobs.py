@@ -0,0 +1,89 @@
+"""
+Jobs periódicos de la aplicación. Cada uno envía un comando de mediatr existente,
+con los mismos parámetros que antes enviaba N8N por HTTP.
+"""
+
+from datetime import datetime, time, timedelta
+from typing import List
+
+from app.modules.appointment.application.commands.materialize_appointment_series.materialize_appointment_series_command_handler import (
+    MaterializeAppointmentSeriesCommand,
+)
+from app.modules.notifications.application.commands.purge_notification_history.purge_notification_history_command_handler import (
+    PurgeNotificationHistoryCommand,
+)
+from app.modules.notifications.application.commands.send_appointment_notifications.send_appointment_notifications_command_handler import (
+    SendAppointmentNotificationsCommand,
+)
+from app.modules.reviews.application.commands.send_review_email_campaign.send_review_email_campaign_handler import (
+    SendReviewEmailCampaignCommand,
+)
+from app.modules.scheduler.infra.services.cron_expression import CronExpression
+from app.modules.scheduler.infra.services.job_scheduler import JobScheduler, ScheduledJob
+from config.setting import (
+    SCHEDULER_ENABLED,
+    SCHEDULER_HOUSEKEEPING_INTERVAL,
+    SCHEDULER_REMINDERS_CRON,
+    SCHEDULER_REVIEW_CAMPAIGN_CRON,
+    SCHEDULER_REVIEW_DAYS_AFTER,
+    SCHEDULER_SERIES_ENABLED,
+    SCHEDULER_SERIES_INTERVAL,
+)
+
+
+def register_default_jobs(scheduler: JobScheduler) -> None:
+    """
+    Registra en el scheduler los jobs configurados. Los que reemplazan a N8N dependen
+    de SCHEDULER_ENABLED y la materialización de series de SCHEDULER_SERIES_ENABLED.
+    Un cron vacío o un intervalo 0 desactiva el job correspondiente.
+
+    Args:
+        scheduler: Scheduler donde registrar los jobs.
+    """
+
+    def appointment_reminders() -> SendAppointmentNotificationsCommand:
+        # Citas del día siguiente, en la hora local del negocio
+        tomorrow = datetime.now(scheduler.tz).date() + timedelta(days=1)
+        return SendAppointmentNotificationsCommand(
+            start_date=datetime.combine(tomorrow, time.min),
+            end_date=datetime.combine(tomorrow, time(23, 59, 59)),
+        )
+
+    jobs: List[ScheduledJob] = []
+    if SCHEDULER_ENABLED and SCHEDULER_REMINDERS_CRON:
+        jobs.append(
+            ScheduledJob(
+                name="appointment_reminders",
+                command_factory=appointment_reminders,
+                cron=CronExpression(SCHEDULER_REMINDERS_CRON),
+            )
+        )
+    if SCHEDULER_ENABLED and SCHEDULER_REVIEW_CAMPAIGN_CRON:
+        jobs.append(
+            ScheduledJob(
+                name="review_email_campaign",
+                command_factory=lambda: SendReviewEmailCampaignCommand(
+                    days_after=SCHEDULER_REVIEW_DAYS_AFTER, user_transaction="scheduler"
+                ),
+                cron=CronExpression(SCHEDULER_REVIEW_CAMPAIGN_CRON),
+            )
+        )
+    if SCHEDULER_ENABLED and SCHEDULER_HOUSEKEEPING_INTERVAL > 0:
+        jobs.append(
+            ScheduledJob(
+                name="notification_housekeeping",
+                command_factory=PurgeNotificationHistoryCommand,
+                interval_seconds=SCHEDULER_HOUSEKEEPING_INTERVAL,
+            )
+        )
+    if SCHEDULER_SERIES_ENABLED and SCHEDULER_SERIES_INTERVAL > 0:
+        jobs.append(
+            ScheduledJob(
+                name="appointment_series_materialization",
+                command_factory=MaterializeAppointmentSeriesCommand,
+                interval_seconds=SCHEDULER_SERIES_INTERVAL,
+            )
+        )
+
+    for job in jobs:
+        scheduler.register(job)
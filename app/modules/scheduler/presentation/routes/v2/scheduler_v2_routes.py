@@ -0,0 +1,37 @@
+from typing import List
+
+from fastapi import APIRouter, Depends
+from mediatr import Mediator
+
+from app.modules.auth.presentation.dependencies.auth_dependencies import (
+    permission_required,
+)
+from app.modules.scheduler.application.queries.get_scheduled_jobs.get_scheduled_jobs_query_handler import (
+    GetScheduledJobsQuery,
+    ScheduledJobStatusResponse,
+)
+
+
+class SchedulerV2Controller:
+    def __init__(self, mediator: Mediator):
+        self.mediator = mediator
+        self.router = APIRouter()
+        self._add_routes()
+
+    def _add_routes(self) -> None:
+
+        self.router.get(
+            "/scheduler/jobs",
+            dependencies=[Depends(permission_required(roles=["admin"]))],
+            response_model=List[ScheduledJobStatusResponse],
+        )(self.get_scheduled_jobs)
+
+    async def get_scheduled_jobs(self) -> List[ScheduledJobStatusResponse]:
+        """
+        Obtiene los jobs programados con su última ejecución (duración, estado y
+        réplica que la corrió) y la próxima ejecución calculada.
+        """
+        result: List[ScheduledJobStatusResponse] = await self.mediator.send_async(
+            GetScheduledJobsQuery()
+        )
+        return result
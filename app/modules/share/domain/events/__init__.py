@@ -0,0 +1,5 @@
+from app.modules.share.domain.events.domain_event import DomainEvent
+
+__all__ = [
+    "DomainEvent",
+]
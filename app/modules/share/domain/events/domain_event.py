@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+
+@dataclass(frozen=True, kw_only=True)
+class DomainEvent:
+    """
+    Clase base de los eventos de dominio. Un evento describe algo que ya ocurrió
+    y se despacha a sus suscriptores solo después de confirmar la transacción.
+    """
+
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
@@ -0,0 +1,5 @@
+from app.modules.share.infra.cache.ttl_cache import AsyncTtlCache
+
+__all__ = [
+    "AsyncTtlCache",
+]
@@ -0,0 +1,109 @@
+"""
+Caché asíncrona en memoria con expiración (TTL) y coalescencia de cargas.
+
+Cuando varias solicitudes concurrentes piden una clave ausente o vencida, solo la
+primera ejecuta el loader; las demás esperan ese mismo resultado (single-flight).
+Así un endpoint consultado por polling no multiplica las llamadas al servicio externo.
+
+Cada carga en vuelo es la generación vigente de su clave. set(), invalidate() y
+clear() la desligan: su resultado se entrega a quienes ya lo esperaban pero no se
+guarda, porque se empezó a leer antes del cambio, y la siguiente solicitud inicia
+una carga nueva.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncTtlCache(Generic[T]):
+    """
+    Caché por clave con TTL y una única carga en vuelo por clave.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[T, float]] = {}
+        self._inflight: Dict[Hashable, "asyncio.Future[T]"] = {}
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """Devuelve el valor vigente de la clave o None si no existe o venció."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: T) -> None:
+        """Guarda (o reemplaza) el valor de la clave con un TTL nuevo."""
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._inflight.pop(key, None)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Elimina la clave de la caché."""
+        self._entries.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Elimina todas las claves que cumplen el predicado."""
+        for key in [key for key in {**self._entries, **self._inflight} if predicate(key)]:
+            self.invalidate(key)
+
+    def clear(self) -> None:
+        """Elimina todas las claves."""
+        self._entries.clear()
+        self._inflight.clear()
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        should_cache: Callable[[T], bool] = lambda _: True,
+    ) -> T:
+        """
+        Obtiene el valor de la clave, cargándolo una sola vez si no está vigente.
+
+        Args:
+            key: Clave a consultar.
+            loader: Corrutina que obtiene el valor desde el origen.
+            should_cache: Indica si el resultado cargado debe guardarse
+                (por ejemplo, para no cachear respuestas de error).
+
+        Returns:
+            El valor cacheado o recién cargado.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # shield: si un solicitante se cancela, la carga compartida sigue para los demás
+            return await asyncio.shield(inflight)
+
+        future: "asyncio.Future[T]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Evita el aviso de "exception never retrieved" si nadie más esperaba
+            future.exception()
+            raise
+        else:
+            # Si la clave cambió durante la carga, el resultado es anterior al cambio
+            if self._inflight.get(key) is future and should_cache(value):
+                self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
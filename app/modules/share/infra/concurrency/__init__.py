@@ -0,0 +1,29 @@
+from app.modules.share.infra.concurrency.bulkhead import (
+    Bulkhead,
+    BulkheadFullError,
+    get_bulkhead,
+    get_bulkheads_stats,
+)
+from app.modules.share.infra.concurrency.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breaker,
+    get_circuit_breakers_stats,
+)
+from app.modules.share.infra.concurrency.rate_limiter import (
+    TokenBucketRateLimiter,
+    get_rate_limiter,
+)
+
+__all__ = [
+    "Bulkhead",
+    "BulkheadFullError",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "TokenBucketRateLimiter",
+    "get_bulkhead",
+    "get_bulkheads_stats",
+    "get_circuit_breaker",
+    "get_circuit_breakers_stats",
+    "get_rate_limiter",
+]
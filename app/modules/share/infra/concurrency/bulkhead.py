@@ -0,0 +1,90 @@
+"""
+Bulkhead asíncrono: limita las llamadas simultáneas hacia un servicio externo.
+
+Evita que un servicio lento acapare coroutines y conexiones del pool: como máximo
+max_concurrent llamadas en vuelo, y las demás esperan un cupo a lo sumo max_wait
+segundos antes de fallar con BulkheadFullError.
+"""
+
+import asyncio
+from typing import Any, Dict
+
+
+class BulkheadFullError(Exception):
+    """Se lanza cuando no se obtiene un cupo del bulkhead dentro del tiempo de espera."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        super().__init__(f"Demasiadas llamadas simultáneas a '{name}', intente nuevamente")
+
+
+class Bulkhead:
+    """
+    Límite de concurrencia con espera acotada. Se usa como context manager asíncrono.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_wait: float) -> None:
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_wait = max_wait
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._in_flight = 0
+        self._waiting = 0
+        self._rejected = 0
+
+    async def __aenter__(self) -> "Bulkhead":
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.max_wait)
+        except asyncio.TimeoutError:
+            self._rejected += 1
+            raise BulkheadFullError(self.name)
+        finally:
+            self._waiting -= 1
+        self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        self._in_flight -= 1
+        self._semaphore.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Ocupación actual del bulkhead para monitoreo."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            "rejected": self._rejected,
+        }
+
+
+_bulkheads: Dict[str, Bulkhead] = {}
+
+
+def get_bulkhead(name: str, max_concurrent: int, max_wait: float) -> Bulkhead:
+    """
+    Obtiene un bulkhead compartido por nombre para todo el proceso.
+
+    Args:
+        name: Identificador del servicio protegido.
+        max_concurrent: Llamadas simultáneas permitidas.
+        max_wait: Segundos máximos de espera por un cupo.
+
+    Returns:
+        Bulkhead compartido.
+    """
+    bulkhead = _bulkheads.get(name)
+    if bulkhead is None:
+        bulkhead = Bulkhead(name=name, max_concurrent=max_concurrent, max_wait=max_wait)
+        _bulkheads[name] = bulkhead
+    return bulkhead
+
+
+def get_bulkheads_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Ocupación de todos los bulkheads del proceso (para /health).
+
+    Returns:
+        Dict con las estadísticas de cada bulkhead por nombre.
+    """
+    return {name: bulkhead.get_stats() for name, bulkhead in _bulkheads.items()}
@@ -0,0 +1,181 @@
+"""
+Circuit breaker asíncrono para llamadas a servicios externos.
+
+- closed: las llamadas pasan; N fallas consecutivas abren el circuito.
+- open: las llamadas fallan de inmediato con CircuitOpenError, sin esperar timeouts.
+- half_open: pasado recovery_timeout se deja pasar un número limitado de llamadas de
+  prueba; si una tiene éxito el circuito se cierra y si falla vuelve a abrirse.
+"""
+
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Se lanza cuando el circuito está abierto y la llamada se rechaza sin ejecutarse."""
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(
+            f"Servicio '{name}' no disponible temporalmente (circuito abierto). "
+            f"Reintentar en {retry_after:.0f} s"
+        )
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker por servicio. is_failure decide qué excepciones cuentan como
+    falla del servicio (por ejemplo timeouts o 5xx, pero no un 400 del cliente).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        recovery_timeout: float,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[BaseException], bool] = lambda _: True,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.is_failure = is_failure
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._last_error: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: str) -> None:
+        if state == self._state:
+            return
+        logger.warning(f"Circuit breaker '{self.name}': {self._state} -> {state}")
+        self._state = state
+        self._half_open_calls = 0
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        elif state == CLOSED:
+            self._consecutive_failures = 0
+
+    def _before_call(self) -> None:
+        state = self.state
+        if state == OPEN:
+            retry_after = self.recovery_timeout - (time.monotonic() - self._opened_at)
+            raise CircuitOpenError(self.name, max(0.0, retry_after))
+        if state == HALF_OPEN:
+            if self._half_open_calls >= self.half_open_max_calls:
+                # Ya hay una llamada de prueba en curso: las demás fallan rápido
+                raise CircuitOpenError(self.name, 0.0)
+            self._half_open_calls += 1
+
+    def _on_success(self) -> None:
+        self._consecutive_failures = 0
+        if self._state == HALF_OPEN:
+            self._transition(CLOSED)
+
+    def _on_failure(self, error: BaseException) -> None:
+        self._last_error = str(error) or type(error).__name__
+        self._consecutive_failures += 1
+        if self._state == HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            self._transition(OPEN)
+
+    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Ejecuta la corrutina protegida por el circuito.
+
+        Args:
+            func: Función sin argumentos que devuelve la corrutina a ejecutar.
+
+        Returns:
+            El resultado de la llamada.
+
+        Raises:
+            CircuitOpenError: Si el circuito está abierto.
+        """
+        self._before_call()
+        half_open_probe = self._state == HALF_OPEN
+        try:
+            result = await func()
+        except BaseException as e:
+            if isinstance(e, Exception) and self.is_failure(e):
+                self._on_failure(e)
+            elif half_open_probe and self._state == HALF_OPEN:
+                # Prueba cancelada o error no atribuible al servicio: liberar el cupo
+                self._half_open_calls = max(0, self._half_open_calls - 1)
+            raise
+        self._on_success()
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estado actual del circuito para monitoreo."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "recovery_timeout": self.recovery_timeout,
+            "last_error": self._last_error,
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(
+    name: str,
+    failure_threshold: int,
+    recovery_timeout: float,
+    half_open_max_calls: int = 1,
+    is_failure: Callable[[BaseException], bool] = lambda _: True,
+) -> CircuitBreaker:
+    """
+    Obtiene un circuit breaker compartido por nombre, para que todas las instancias
+    del servicio en el proceso vean el mismo estado del circuito.
+
+    Args:
+        name: Identificador del servicio protegido.
+        failure_threshold: Fallas consecutivas para abrir el circuito.
+        recovery_timeout: Segundos en estado abierto antes de probar (half-open).
+        half_open_max_calls: Llamadas de prueba simultáneas en half-open.
+        is_failure: Indica si una excepción cuenta como falla del servicio.
+
+    Returns:
+        CircuitBreaker compartido.
+    """
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = CircuitBreaker(
+            name=name,
+            failure_threshold=failure_threshold,
+            recovery_timeout=recovery_timeout,
+            half_open_max_calls=half_open_max_calls,
+            is_failure=is_failure,
+        )
+        _breakers[name] = breaker
+    return breaker
+
+
+def get_circuit_breakers_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Estado de todos los circuit breakers del proceso (para /health).
+
+    Returns:
+        Dict con el estado de cada circuito por nombre.
+    """
+    return {name: breaker.get_stats() for name, breaker in _breakers.items()}
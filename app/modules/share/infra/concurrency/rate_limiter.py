@@ -0,0 +1,72 @@
+"""
+Limitador de tasa asíncrono basado en token bucket.
+
+Se usa para respetar los límites de APIs externas (por ejemplo Evolution API)
+cuando se envían muchos mensajes de forma concurrente.
+"""
+
+import asyncio
+import time
+from typing import Dict
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket asíncrono: se reponen 'rate' tokens por segundo hasta un máximo
+    de 'capacity'. Cada llamada a acquire() consume un token y espera si no hay.
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        if rate <= 0:
+            raise ValueError("rate debe ser mayor a 0")
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Espera hasta que haya un token disponible y lo consume."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                # El lock se mantiene mientras se espera para conservar el orden de llegada
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> "TokenBucketRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+
+_limiters: Dict[str, TokenBucketRateLimiter] = {}
+
+
+def get_rate_limiter(name: str, rate: float, capacity: int) -> TokenBucketRateLimiter:
+    """
+    Obtiene un limitador compartido por nombre, para que todas las solicitudes
+    del proceso respeten el mismo límite del servicio externo.
+
+    Args:
+        name: Identificador del servicio limitado.
+        rate: Tokens repuestos por segundo.
+        capacity: Ráfaga máxima permitida.
+
+    Returns:
+        TokenBucketRateLimiter compartido.
+    """
+    limiter = _limiters.get(name)
+    if limiter is None:
+        limiter = TokenBucketRateLimiter(rate=rate, capacity=capacity)
+        _limiters[name] = limiter
+    return limiter
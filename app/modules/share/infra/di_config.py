@@ -3,9 +3,15 @@ from injector import Module, provider
 from app.modules.appointment.domain.repositories.appointment_repository import (
     AppointmentRepository,
 )
+from app.modules.appointment.domain.repositories.appointment_series_repository import (
+    AppointmentSeriesRepository,
+)
 from app.modules.appointment.infra.repositories.appointment_implementation_repository import (
     AppointmentImplementationRepository,
 )
+from app.modules.appointment.infra.repositories.appointment_series_implementation_repository import (
+    AppointmentSeriesImplementationRepository,
+)
 from app.modules.customer.domain.repositories.customer_repository import (
     CustomerRepository,
 )
@@ -33,15 +39,37 @@ from app.modules.maintable.infra.repositories.maintable_implementation_repositor
 from app.modules.notifications.domain.repositories.notification_location_repository import (
     NotificationLocationRepository,
 )
+from app.modules.notifications.domain.repositories.notification_ledger_repository import (
+    NotificationLedgerRepository,
+)
+from app.modules.notifications.domain.repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
 from app.modules.notifications.infra.repositories.notification_location_implementation_repository import (
     NotificationLocationImplementationRepository,
 )
+from app.modules.notifications.infra.repositories.notification_ledger_implementation_repository import (
+    NotificationLedgerImplementationRepository,
+)
+from app.modules.notifications.infra.repositories.notification_outbox_implementation_repository import (
+    NotificationOutboxImplementationRepository,
+)
+from app.modules.reports.domain.repositories.report_repository import ReportRepository
+from app.modules.reports.infra.repositories.report_implementation_repository import (
+    ReportImplementationRepository,
+)
 from app.modules.reviews.domain.repositories.review_repository import (
     ReviewRepository,
 )
 from app.modules.reviews.infra.repositories.review_implementation_repository import (
     ReviewImplementationRepository,
 )
+from app.modules.scheduler.domain.repositories.scheduler_repository import (
+    SchedulerRepository,
+)
+from app.modules.scheduler.infra.repositories.scheduler_implementation_repository import (
+    SchedulerImplementationRepository,
+)
 from app.modules.services.domain.repositories.category_repository import (
     CategoryRepository,
 )
@@ -127,12 +155,32 @@ class AppModule(Module):
     def provide_appointment_repository(self) -> AppointmentRepository:
         return AppointmentImplementationRepository()
 
+    @provider
+    def provide_appointment_series_repository(self) -> AppointmentSeriesRepository:
+        return AppointmentSeriesImplementationRepository()
+
     @provider
     def provide_notification_location_repository(
         self,
     ) -> NotificationLocationRepository:
         return NotificationLocationImplementationRepository()
 
+    @provider
+    def provide_notification_outbox_repository(self) -> NotificationOutboxRepository:
+        return NotificationOutboxImplementationRepository()
+
+    @provider
+    def provide_notification_ledger_repository(self) -> NotificationLedgerRepository:
+        return NotificationLedgerImplementationRepository()
+
     @provider
     def provide_review_repository(self) -> ReviewRepository:
         return ReviewImplementationRepository()
+
+    @provider
+    def provide_report_repository(self) -> ReportRepository:
+        return ReportImplementationRepository()
+
+    @provider
+    def provide_scheduler_repository(self) -> SchedulerRepository:
+        return SchedulerImplementationRepository()
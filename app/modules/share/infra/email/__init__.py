@@ -4,6 +4,7 @@ from app.modules.share.infra.email.email_service import (
     EmailConfig,
     EmailMessage,
     EmailResult,
+    close_smtp_pools,
 )
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "EmailConfig",
     "EmailMessage",
     "EmailResult",
+    "close_smtp_pools",
 ]
@@ -1,11 +1,16 @@
+import asyncio
 import smtplib
-import ssl
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
+from app.modules.share.infra.email.smtp_connection_pool import SmtpConnectionPool
+from app.modules.share.infra.executor import get_executor
+from app.modules.share.infra.templates import get_template_registry
+
 from config.setting import (
     SMTP_HOST,
     SMTP_PORT,
@@ -48,6 +53,112 @@ class EmailResult:
     success: bool
     message: str
     error: Optional[str] = None
+    # El envío quedó en curso al vencer el timeout: el correo pudo haber salido o no
+    unknown: bool = False
+
+
+class _Delivery:
+    """
+    Progreso de un lote compartido entre el event loop y el hilo que usa la sesión SMTP.
+    Si el loop deja de esperar (timeout o cancelación), el hilo termina el mensaje en
+    curso, no envía los siguientes y cierra él mismo la sesión.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.results: List[EmailResult] = []
+        self.sending = False
+        self.finished = False
+        self.abandoned = False
+
+    def start_next(self) -> bool:
+        """Hilo: indica si puede enviar el siguiente mensaje."""
+        with self._lock:
+            if self.abandoned:
+                return False
+            self.sending = True
+            return True
+
+    def record(self, result: EmailResult) -> None:
+        """Hilo: registra el resultado del mensaje en curso."""
+        with self._lock:
+            self.results.append(result)
+            self.sending = False
+
+    def finish(self) -> bool:
+        """Hilo: marca el lote como terminado; True si el hilo debe cerrar la sesión."""
+        with self._lock:
+            self.finished = True
+            return self.abandoned
+
+    def abandon(self) -> Optional[Tuple[List[EmailResult], bool]]:
+        """
+        Loop: deja la sesión a cargo del hilo si todavía no terminó.
+
+        Returns:
+            None si el hilo ya terminó; si no, los resultados conocidos y si había
+            un mensaje en pleno envío.
+        """
+        with self._lock:
+            if self.finished:
+                return None
+            self.abandoned = True
+            return list(self.results), self.sending
+
+
+class _SmtpSessionAbandoned(Exception):
+    """El loop dejó de esperar al hilo del lote; conserva lo que se sabe del envío."""
+
+    def __init__(self, results: List[EmailResult], in_flight: bool, error: str) -> None:
+        super().__init__(error)
+        self.results = results
+        self.in_flight = in_flight
+        self.error = error
+
+
+class _SmtpSessionLost(Exception):
+    """La sesión SMTP se cerró a mitad de un lote; conserva los resultados ya obtenidos."""
+
+    def __init__(self, results: List[EmailResult], error: str) -> None:
+        super().__init__(error)
+        self.results = results
+        self.error = error
+
+
+_pools: Dict[Tuple[str, int, str, bool], SmtpConnectionPool] = {}
+
+
+def get_smtp_pool(config: EmailConfig) -> SmtpConnectionPool:
+    """
+    Obtiene el pool de sesiones SMTP compartido para una configuración.
+
+    Args:
+        config: Configuración del servidor SMTP.
+
+    Returns:
+        SmtpConnectionPool compartido por todas las instancias de EmailService.
+    """
+    port = config.smtp_port_ssl if config.use_ssl else config.smtp_port
+    key = (config.smtp_host, port, config.username, config.use_ssl)
+    pool = _pools.get(key)
+    if pool is None:
+        pool = SmtpConnectionPool(
+            host=config.smtp_host,
+            port=port,
+            username=config.username,
+            password=config.password,
+            use_ssl=config.use_ssl,
+        )
+        _pools[key] = pool
+    return pool
+
+
+async def close_smtp_pools() -> None:
+    """Cierra las sesiones SMTP abiertas. Se invoca al apagar la aplicación."""
+    pools = list(_pools.values())
+    _pools.clear()
+    for pool in pools:
+        await pool.close()
 
 
 class IEmailService(ABC):
@@ -58,6 +169,11 @@ class IEmailService(ABC):
         """Envía un correo electrónico."""
         pass
     
+    @abstractmethod
+    async def send_many(self, messages: List[EmailMessage]) -> List[EmailResult]:
+        """Envía varios correos reutilizando la sesión SMTP."""
+        pass
+    
     @abstractmethod
     async def send_review_email(
         self,
@@ -78,6 +194,7 @@ class EmailService(IEmailService):
     
     def __init__(self, config: Optional[EmailConfig] = None):
         self.config = config or EmailConfig()
+        self._pool = get_smtp_pool(self.config)
     
     async def send_email(self, message: EmailMessage) -> EmailResult:
         """
@@ -89,76 +206,186 @@ class EmailService(IEmailService):
         Returns:
             EmailResult con el resultado del envío.
         """
-        try:
-            # Crear mensaje MIME
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = message.subject
-            msg["From"] = f"{self.config.from_name} <{self.config.from_email}>"
-            
-            if message.to_name:
-                msg["To"] = f"{message.to_name} <{message.to_email}>"
-            else:
-                msg["To"] = message.to_email
-            
-            # Agregar cuerpo de texto plano si existe
-            if message.body_text:
-                part_text = MIMEText(message.body_text, "plain", "utf-8")
-                msg.attach(part_text)
-            
-            # Agregar cuerpo HTML
-            part_html = MIMEText(message.body_html, "html", "utf-8")
-            msg.attach(part_html)
+        results = await self.send_many([message])
+        return results[0]
+
+    async def send_many(self, messages: List[EmailMessage]) -> List[EmailResult]:
+        """
+        Envía varios correos reutilizando una misma sesión SMTP autenticada.
+        Si el servidor cierra la sesión a mitad del lote, se reconecta y continúa
+        con los mensajes pendientes.
+
+        Si el lote excede su timeout, el hilo que usa la sesión no se puede detener:
+        termina el mensaje en curso y cierra la sesión por su cuenta, sin que el pool
+        la toque ni la reutilice. Ese mensaje se informa con unknown=True y los que
+        no llegaron a enviarse, como fallidos.
+        
+        Args:
+            messages: Los mensajes a enviar.
             
-            # Enviar correo
-            if self.config.use_ssl:
-                # Conexión SSL directa (puerto 465)
-                context = ssl.create_default_context()
-                with smtplib.SMTP_SSL(
-                    self.config.smtp_host,
-                    self.config.smtp_port_ssl,
-                    context=context
-                ) as server:
-                    server.login(self.config.username, self.config.password)
-                    server.sendmail(
-                        self.config.from_email,
-                        message.to_email,
-                        msg.as_string()
-                    )
-            else:
-                # Conexión con STARTTLS (puerto 587)
-                context = ssl.create_default_context()
-                with smtplib.SMTP(self.config.smtp_host, self.config.smtp_port) as server:
-                    server.starttls(context=context)
-                    server.login(self.config.username, self.config.password)
-                    server.sendmail(
-                        self.config.from_email,
-                        message.to_email,
-                        msg.as_string()
+        Returns:
+            Lista de EmailResult en el mismo orden que los mensajes.
+        """
+        prepared = [(message, self._build_mime(message).as_string()) for message in messages]
+        results: List[EmailResult] = []
+        reconnected = False
+
+        while len(results) < len(prepared):
+            remaining = prepared[len(results):]
+            delivery = _Delivery()
+            try:
+                await self._deliver_in_session(remaining, delivery)
+                results.extend(delivery.results)
+            except _SmtpSessionAbandoned as e:
+                results.extend(self._abandoned_results(remaining, e))
+            except _SmtpSessionLost as e:
+                results.extend(e.results)
+                # Reintentar con una sesión nueva solo si hubo avance o es el primer intento
+                if e.results or not reconnected:
+                    reconnected = True
+                    continue
+                results.extend(
+                    self._failed_results(remaining[len(e.results):], "Error al enviar correo", e.error)
+                )
+            except smtplib.SMTPAuthenticationError as e:
+                results.extend(
+                    self._failed_results(remaining, "Error de autenticación SMTP", str(e))
+                )
+            except (smtplib.SMTPException, OSError) as e:
+                # Lo ya entregado en el lote se conserva; solo falla el resto
+                results.extend(
+                    self._partial_results(delivery, remaining, "Error al enviar correo", str(e))
+                )
+            except Exception as e:
+                results.extend(
+                    self._partial_results(
+                        delivery, remaining, "Error inesperado al enviar correo", str(e)
                     )
-            
-            return EmailResult(
-                success=True,
-                message=f"Correo enviado exitosamente a {message.to_email}"
-            )
-            
-        except smtplib.SMTPAuthenticationError as e:
-            return EmailResult(
-                success=False,
-                message="Error de autenticación SMTP",
-                error=str(e)
-            )
-        except smtplib.SMTPException as e:
-            return EmailResult(
-                success=False,
-                message="Error al enviar correo",
-                error=str(e)
-            )
-        except Exception as e:
-            return EmailResult(
-                success=False,
-                message="Error inesperado al enviar correo",
-                error=str(e)
+                )
+
+        return results
+
+    async def _deliver_in_session(
+        self, prepared: List[Tuple[EmailMessage, str]], delivery: _Delivery
+    ) -> None:
+        """
+        Toma una sesión del pool y envía los mensajes en un hilo.
+        Si se deja de esperar al hilo mientras aún envía, la sesión queda a su cargo
+        (se desvincula del pool) y se lanza _SmtpSessionAbandoned.
+        """
+        async with self._pool.connection() as server:
+            try:
+                await get_executor().run_in_thread(
+                    self._deliver,
+                    server,
+                    prepared,
+                    delivery,
+                    timeout=self._pool.timeout * len(prepared),
+                )
+            except (Exception, asyncio.CancelledError) as e:
+                abandoned = delivery.abandon()
+                if abandoned is None:
+                    raise
+                self._pool.detach(server)
+                if isinstance(e, asyncio.CancelledError):
+                    raise
+                raise _SmtpSessionAbandoned(abandoned[0], abandoned[1], str(e)) from e
+
+    def _abandoned_results(
+        self, prepared: List[Tuple[EmailMessage, str]], error: _SmtpSessionAbandoned
+    ) -> List[EmailResult]:
+        """Resultados de un lote abandonado: conocidos, el que estaba en curso y el resto."""
+        results = list(error.results)
+        pending = prepared[len(error.results):]
+        if error.in_flight:
+            results.append(
+                EmailResult(
+                    success=False,
+                    message="Resultado del envío desconocido",
+                    error=error.error,
+                    unknown=True,
+                )
             )
+            pending = pending[1:]
+        results.extend(self._failed_results(pending, "Correo no enviado", error.error))
+        return results
+
+    def _partial_results(
+        self,
+        delivery: _Delivery,
+        prepared: List[Tuple[EmailMessage, str]],
+        message: str,
+        error: str,
+    ) -> List[EmailResult]:
+        """Lo ya entregado en el lote, seguido de los mensajes restantes como fallidos."""
+        return delivery.results + self._failed_results(
+            prepared[len(delivery.results):], message, error
+        )
+
+    def _build_mime(self, message: EmailMessage) -> MIMEMultipart:
+        """Construye el mensaje MIME con las partes de texto plano y HTML."""
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = message.subject
+        msg["From"] = f"{self.config.from_name} <{self.config.from_email}>"
+        
+        if message.to_name:
+            msg["To"] = f"{message.to_name} <{message.to_email}>"
+        else:
+            msg["To"] = message.to_email
+        
+        # Agregar cuerpo de texto plano si existe
+        if message.body_text:
+            part_text = MIMEText(message.body_text, "plain", "utf-8")
+            msg.attach(part_text)
+        
+        # Agregar cuerpo HTML
+        part_html = MIMEText(message.body_html, "html", "utf-8")
+        msg.attach(part_html)
+        return msg
+
+    def _deliver(
+        self,
+        server: smtplib.SMTP,
+        prepared: List[Tuple[EmailMessage, str]],
+        delivery: _Delivery,
+    ) -> None:
+        """
+        Envía los mensajes por la sesión recibida (bloqueante, se ejecuta en un hilo)
+        y registra cada resultado en 'delivery'.
+        Los rechazos de un destinatario no interrumpen el resto del lote.
+        """
+        try:
+            for message, payload in prepared:
+                if not delivery.start_next():
+                    break
+                try:
+                    server.sendmail(self.config.from_email, message.to_email, payload)
+                    delivery.record(
+                        EmailResult(
+                            success=True,
+                            message=f"Correo enviado exitosamente a {message.to_email}"
+                        )
+                    )
+                except smtplib.SMTPServerDisconnected as e:
+                    raise _SmtpSessionLost(list(delivery.results), str(e))
+                except (
+                    smtplib.SMTPRecipientsRefused,
+                    smtplib.SMTPSenderRefused,
+                    smtplib.SMTPDataError,
+                ) as e:
+                    delivery.record(
+                        EmailResult(success=False, message="Error al enviar correo", error=str(e))
+                    )
+        finally:
+            if delivery.finish():
+                # El loop ya no espera este lote: la sesión es de este hilo y se cierra aquí
+                SmtpConnectionPool.close_session(server)
+
+    @staticmethod
+    def _failed_results(
+        prepared: List[Tuple[EmailMessage, str]], message: str, error: str
+    ) -> List[EmailResult]:
+        return [EmailResult(success=False, message=message, error=error) for _ in prepared]
     
     async def send_review_email(
         self,
@@ -179,87 +406,45 @@ class EmailService(IEmailService):
         Returns:
             EmailResult con el resultado del envío.
         """
-        # URL base para el review desde configuración
-        review_url = f"{REVIEW_BASE_URL}?token={review_token}"
-        
-        subject = "¿Cómo fue tu experiencia? - Déjanos tu opinión"
-        
-        body_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        </head>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-                <h1 style="color: white; margin: 0;">¡Gracias por tu visita!</h1>
-            </div>
-
-            <div style="background-color: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
-                <p style="font-size: 16px;">Hola <strong>{customer_name}</strong>,</p>
-
-                <p style="font-size: 16px;">
-                    Esperamos que hayas tenido una excelente experiencia con nuestro servicio.
-                    Tu opinión es muy importante para nosotros y nos ayuda a mejorar continuamente.
-                </p>
-
-                <p style="font-size: 16px;">
-                    ¿Podrías tomarte un momento para calificar tu experiencia?
-                </p>
-
-                <div style="text-align: center; margin: 30px 0;">
-                    <a href="{review_url}"
-                       style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                              color: white;
-                              padding: 15px 40px;
-                              text-decoration: none;
-                              border-radius: 25px;
-                              font-size: 18px;
-                              font-weight: bold;
-                              display: inline-block;">
-                        Calificar mi experiencia
-                    </a>
-                </div>
-
-                <p style="font-size: 14px; color: #666;">
-                    Este enlace es único y personal. Por favor no lo compartas con nadie.
-                </p>
-
-                <hr style="border: none; border-top: 1px solid #ddd; margin: 30px 0;">
-
-                <p style="font-size: 12px; color: #999; text-align: center;">
-                    Si no solicitaste este correo o tienes alguna pregunta,
-                    puedes ignorar este mensaje.
-                </p>
-            </div>
-        </body>
-        </html>
+        message = self.build_review_email(
+            to_email=to_email,
+            to_name=to_name,
+            review_token=review_token,
+            customer_name=customer_name,
+        )
+        return await self.send_email(message)
+
+    def build_review_email(
+        self,
+        to_email: str,
+        to_name: str,
+        review_token: str,
+        customer_name: str,
+    ) -> EmailMessage:
         """
+        Construye el correo de solicitud de review sin enviarlo.
         
-        body_text = f"""
-        ¡Gracias por tu visita!
-        
-        Hola {customer_name},
-        
-        Esperamos que hayas tenido una excelente experiencia con nuestro servicio.
-        Tu opinión es muy importante para nosotros y nos ayuda a mejorar continuamente.
-        
-        ¿Podrías tomarte un momento para calificar tu experiencia?
-        
-        Visita este enlace: {review_url}
-        
-        Este enlace es único y personal. Por favor no lo compartas con nadie.
-        
-        Si no solicitaste este correo o tienes alguna pregunta, puedes ignorar este mensaje.
+        Args:
+            to_email: Email del destinatario.
+            to_name: Nombre del destinatario.
+            review_token: Token único para el review.
+            customer_name: Nombre del cliente para personalizar el mensaje.
+            
+        Returns:
+            EmailMessage listo para enviar.
         """
+        # URL base para el review desde configuración
+        review_url = f"{REVIEW_BASE_URL}?token={review_token}"
+
+        rendered = get_template_registry().render_email(
+            "review_request",
+            {"customer_name": customer_name, "review_url": review_url},
+        )
         
-        message = EmailMessage(
+        return EmailMessage(
             to_email=to_email,
             to_name=to_name,
-            subject=subject,
-            body_html=body_html,
-            body_text=body_text
+            subject=rendered.subject,
+            body_html=rendered.body_html,
+            body_text=rendered.body_text
         )
-        
-        return await self.send_email(message)
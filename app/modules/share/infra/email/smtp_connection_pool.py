@@ -0,0 +1,131 @@
+"""
+Pool de sesiones SMTP autenticadas y reutilizables.
+
+Cada sesión se abre una sola vez (conexión + STARTTLS/SSL + login) y se reutiliza
+para los siguientes mensajes mientras no supere SMTP_IDLE_TIMEOUT. Las llamadas a
+smtplib son bloqueantes, por lo que se ejecutan en el pool de hilos del executor
+compartido y nunca en el event loop.
+
+Una sesión smtplib no es thread-safe: si el hilo que la usa sigue en curso cuando
+el event loop deja de esperarlo, quien la tomó debe desligarla con detach(). El
+pool entonces no la cierra ni la reutiliza; el hilo la cierra al terminar.
+"""
+
+import asyncio
+import logging
+import smtplib
+import ssl
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Set, Tuple
+
+from app.modules.share.infra.executor import get_executor
+from config.setting import SMTP_IDLE_TIMEOUT, SMTP_POOL_SIZE, SMTP_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class SmtpConnectionPool:
+    """
+    Pool asíncrono de conexiones smtplib ya autenticadas.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        use_ssl: bool,
+        size: int = SMTP_POOL_SIZE,
+        idle_timeout: float = SMTP_IDLE_TIMEOUT,
+        timeout: float = SMTP_TIMEOUT,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_ssl = use_ssl
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max(1, size))
+        self._idle: List[Tuple[smtplib.SMTP, float]] = []
+        self._detached: Set[int] = set()
+
+    def _connect(self) -> smtplib.SMTP:
+        """Abre y autentica una sesión SMTP (bloqueante)."""
+        context = ssl.create_default_context()
+        server: smtplib.SMTP
+        if self.use_ssl:
+            # Conexión SSL directa (puerto 465)
+            server = smtplib.SMTP_SSL(
+                self.host, self.port, context=context, timeout=self.timeout
+            )
+        else:
+            # Conexión con STARTTLS (puerto 587)
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            server.starttls(context=context)
+        server.login(self.username, self.password)
+        return server
+
+    @staticmethod
+    def close_session(server: smtplib.SMTP) -> None:
+        """Cierra una sesión ignorando errores (bloqueante)."""
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    async def _discard(self, server: smtplib.SMTP) -> None:
+        await get_executor().run_in_thread(self.close_session, server)
+
+    def detach(self, server: smtplib.SMTP) -> None:
+        """
+        Desliga del pool una sesión prestada que un hilo sigue usando: al salir de
+        connection() no se cierra ni vuelve al pool, y cerrarla queda a cargo del hilo.
+        """
+        self._detached.add(id(server))
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[smtplib.SMTP]:
+        """
+        Presta una sesión autenticada del pool, creándola si no hay ninguna ociosa.
+        Si el bloque termina con excepción la sesión se descarta en lugar de devolverse.
+        """
+        async with self._semaphore:
+            server: Optional[smtplib.SMTP] = None
+            while self._idle:
+                candidate, last_used = self._idle.pop()
+                if time.monotonic() - last_used > self.idle_timeout:
+                    await self._discard(candidate)
+                    continue
+                server = candidate
+                break
+
+            if server is None:
+                server = await get_executor().run_in_thread(self._connect)
+
+            try:
+                yield server
+            except BaseException:
+                if not self._release_detached(server):
+                    await self._discard(server)
+                raise
+            else:
+                if not self._release_detached(server):
+                    self._idle.append((server, time.monotonic()))
+
+    def _release_detached(self, server: smtplib.SMTP) -> bool:
+        if id(server) in self._detached:
+            self._detached.discard(id(server))
+            return True
+        return False
+
+    async def close(self) -> None:
+        """Cierra todas las sesiones ociosas. Se invoca al apagar la aplicación."""
+        idle, self._idle = self._idle, []
+        for server, _ in idle:
+            try:
+                await self._discard(server)
+            except Exception as e:
+                logger.warning(f"Error al cerrar sesión SMTP: {str(e)}")
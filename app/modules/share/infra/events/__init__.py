@@ -0,0 +1,13 @@
+from app.modules.share.infra.events.domain_event_bus import (
+    DomainEventBus,
+    get_event_bus,
+    publish_event,
+    subscribe,
+)
+
+__all__ = [
+    "DomainEventBus",
+    "get_event_bus",
+    "publish_event",
+    "subscribe",
+]
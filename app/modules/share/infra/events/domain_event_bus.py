@@ -0,0 +1,160 @@
+"""
+Bus de eventos de dominio en proceso.
+
+Los handlers de comandos publican eventos con publish_event(). Si hay una UnitOfWork
+activa, el evento queda pendiente y se despacha solo cuando la transacción se confirma
+(con rollback se descarta). Cada suscriptor corre en su propia tarea de asyncio, fuera
+del camino del request, por lo que la latencia de la respuesta no incluye los efectos
+secundarios. Los suscriptores que usen la base de datos deben abrir su propia
+UnitOfWork (unit_of_work_scope).
+"""
+
+import asyncio
+import contextvars
+import logging
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Type, TypeVar
+
+from app.constants import uow_var
+from app.modules.share.domain.events import DomainEvent
+from config.setting import DOMAIN_EVENTS_MAX_CONCURRENCY, DOMAIN_EVENTS_SHUTDOWN_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+E = TypeVar("E", bound=DomainEvent)
+EventSubscriber = Callable[[Any], Awaitable[None]]
+
+
+class DomainEventBus:
+    """
+    Registro de suscriptores y despacho asíncrono de eventos de dominio.
+    """
+
+    def __init__(self, max_concurrency: int = DOMAIN_EVENTS_MAX_CONCURRENCY) -> None:
+        self._subscribers: Dict[Type[DomainEvent], List[EventSubscriber]] = defaultdict(list)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._max_concurrency = max(1, max_concurrency)
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._dispatched = 0
+        self._failed = 0
+
+    def subscribe(self, event_type: Type[E], subscriber: Callable[[E], Awaitable[None]]) -> None:
+        """
+        Registra un suscriptor para un tipo de evento (y sus subclases).
+
+        Args:
+            event_type: Clase del evento.
+            subscriber: Corrutina que recibe el evento.
+        """
+        self._subscribers[event_type].append(subscriber)
+
+    def publish(self, event: DomainEvent) -> None:
+        """
+        Publica un evento. Con una UnitOfWork activa se despacha tras el commit;
+        sin transacción en curso se despacha de inmediato.
+
+        Args:
+            event: Evento a publicar.
+        """
+        try:
+            uow = uow_var.get()
+        except LookupError:
+            self._dispatch(event)
+            return
+        uow.after_commit(lambda: self._dispatch(event))
+
+    def _dispatch(self, event: DomainEvent) -> None:
+        subscribers = [
+            subscriber
+            for event_type, event_subscribers in self._subscribers.items()
+            if isinstance(event, event_type)
+            for subscriber in event_subscribers
+        ]
+        for subscriber in subscribers:
+            # Contexto vacío: el suscriptor no hereda la UnitOfWork ni el Injector del request
+            task = asyncio.create_task(
+                self._run_subscriber(subscriber, event), context=contextvars.Context()
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_subscriber(self, subscriber: EventSubscriber, event: DomainEvent) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        async with self._semaphore:
+            try:
+                await subscriber(event)
+                self._dispatched += 1
+            except Exception as e:
+                self._failed += 1
+                logger.error(
+                    f"Error en el suscriptor {getattr(subscriber, '__qualname__', subscriber)} "
+                    f"del evento {type(event).__name__}: {str(e)}",
+                    exc_info=True,
+                )
+
+    async def shutdown(self, timeout: float = DOMAIN_EVENTS_SHUTDOWN_TIMEOUT) -> None:
+        """
+        Espera a que terminen los suscriptores en curso y cancela los que superen
+        el tiempo de espera. Se invoca al apagar la aplicación.
+        """
+        tasks = list(self._tasks)
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning(f"{len(pending)} suscriptores de eventos cancelados al apagar")
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estadísticas del bus para monitoreo."""
+        return {
+            "subscribers": {
+                event_type.__name__: len(subscribers)
+                for event_type, subscribers in self._subscribers.items()
+            },
+            "in_flight": len(self._tasks),
+            "dispatched": self._dispatched,
+            "failed": self._failed,
+        }
+
+
+_event_bus = DomainEventBus()
+
+
+def get_event_bus() -> DomainEventBus:
+    """
+    Obtiene el bus de eventos del proceso.
+
+    Returns:
+        DomainEventBus: Bus compartido
+    """
+    return _event_bus
+
+
+def publish_event(event: DomainEvent) -> None:
+    """
+    Publica un evento en el bus del proceso (ver DomainEventBus.publish).
+
+    Args:
+        event: Evento a publicar.
+    """
+    _event_bus.publish(event)
+
+
+def subscribe(event_type: Type[E]) -> Callable[[Callable[[E], Awaitable[None]]], Callable[[E], Awaitable[None]]]:
+    """
+    Decorador para registrar un suscriptor al importar su módulo, igual que
+    @Mediator.handler registra los handlers.
+
+    Args:
+        event_type: Clase del evento a escuchar.
+    """
+
+    def decorator(subscriber: Callable[[E], Awaitable[None]]) -> Callable[[E], Awaitable[None]]:
+        _event_bus.subscribe(event_type, subscriber)
+        return subscriber
+
+    return decorator
@@ -0,0 +1,9 @@
+from app.modules.share.infra.executor.executor_service import (
+    ExecutorService,
+    get_executor,
+)
+
+__all__ = [
+    "ExecutorService",
+    "get_executor",
+]
@@ -0,0 +1,246 @@
+"""
+Executor compartido para trabajo bloqueante o CPU intensivo.
+
+Permite sacar del event loop de asyncio tareas como la generación de archivos
+Excel, operaciones con pandas o preparación de archivos:
+- Pool de hilos para I/O bloqueante o librerías que liberan el GIL
+- Pool de procesos para trabajo CPU intensivo
+- Timeout y cancelación por tarea
+- Métricas de profundidad de cola por pool
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from config.setting import (
+    EXECUTOR_DEFAULT_TIMEOUT,
+    EXECUTOR_PROCESS_WORKERS,
+    EXECUTOR_THREAD_WORKERS,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class PoolStats:
+    """Contadores de uso de un pool del executor."""
+    max_workers: int
+    in_flight: int = 0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    cancelled: int = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Tareas enviadas que aún esperan un worker libre."""
+        return max(0, self.in_flight - self.max_workers)
+
+
+class ExecutorService:
+    """
+    Servicio singleton que administra un pool de hilos y un pool de procesos.
+
+    El ciclo de vida (start/shutdown) lo controla el lifespan de la aplicación;
+    si se usa fuera de él, los pools se crean de forma perezosa.
+    """
+
+    _instance: Optional["ExecutorService"] = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        thread_workers: int = EXECUTOR_THREAD_WORKERS,
+        process_workers: int = EXECUTOR_PROCESS_WORKERS,
+        default_timeout: Optional[float] = EXECUTOR_DEFAULT_TIMEOUT,
+    ) -> None:
+        self.thread_workers = max(1, thread_workers)
+        self.process_workers = max(1, process_workers or os.cpu_count() or 1)
+        self.default_timeout = default_timeout
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, PoolStats] = {
+            "thread": PoolStats(max_workers=self.thread_workers),
+            "process": PoolStats(max_workers=self.process_workers),
+        }
+
+    @classmethod
+    def get_instance(cls) -> "ExecutorService":
+        """
+        Obtiene la instancia singleton del executor, creándola si es necesario.
+        Thread-safe usando double-checked locking pattern.
+        """
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = ExecutorService()
+                    cls._instance.start()
+        return cls._instance
+
+    @classmethod
+    def shutdown_instance(cls, wait: bool = True) -> None:
+        """Cierra los pools del singleton (si existe) y lo descarta."""
+        with cls._lock:
+            if cls._instance is not None:
+                cls._instance.shutdown(wait=wait)
+                cls._instance = None
+
+    def start(self) -> None:
+        """Crea los pools de hilos y procesos."""
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.thread_workers, thread_name_prefix="app-executor"
+            )
+        if self._process_pool is None:
+            # 'spawn' evita heredar el event loop y los hilos del proceso principal
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        logger.info(
+            f"Executor iniciado: {self.thread_workers} hilos, {self.process_workers} procesos"
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Cierra los pools cancelando las tareas que aún no comenzaron."""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=wait, cancel_futures=True)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait, cancel_futures=True)
+            self._process_pool = None
+        logger.info("Executor detenido")
+
+    async def run_in_thread(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Ejecuta una función bloqueante en el pool de hilos.
+
+        Args:
+            func: Función a ejecutar.
+            timeout: Segundos máximos de espera (por defecto EXECUTOR_DEFAULT_TIMEOUT).
+
+        Returns:
+            El resultado de la función.
+
+        Raises:
+            TimeoutError: Si la tarea excede el timeout.
+        """
+        if self._thread_pool is None:
+            self.start()
+        assert self._thread_pool is not None
+        return await self._run("thread", self._thread_pool, func, args, kwargs, timeout)
+
+    async def run_in_process(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Ejecuta una función CPU intensiva en el pool de procesos.
+        La función, sus argumentos y su resultado deben ser serializables con pickle.
+
+        Args:
+            func: Función a ejecutar (definida a nivel de módulo o método de una instancia serializable).
+            timeout: Segundos máximos de espera (por defecto EXECUTOR_DEFAULT_TIMEOUT).
+
+        Returns:
+            El resultado de la función.
+
+        Raises:
+            TimeoutError: Si la tarea excede el timeout.
+        """
+        if self._process_pool is None:
+            self.start()
+        assert self._process_pool is not None
+        return await self._run("process", self._process_pool, func, args, kwargs, timeout)
+
+    async def _run(
+        self,
+        pool_name: str,
+        executor: Executor,
+        func: Callable[..., T],
+        args: Any,
+        kwargs: Dict[str, Any],
+        timeout: Optional[float],
+    ) -> T:
+        stats = self._stats[pool_name]
+        effective_timeout = timeout if timeout is not None else self.default_timeout
+
+        with self._stats_lock:
+            stats.submitted += 1
+            stats.in_flight += 1
+
+        concurrent_future: Future[T] = executor.submit(functools.partial(func, *args, **kwargs))
+        concurrent_future.add_done_callback(lambda _: self._release(stats))
+
+        # Cancelar el future de asyncio propaga la cancelación al future del pool,
+        # lo que descarta la tarea si todavía no empezó a ejecutarse.
+        try:
+            result = await asyncio.wait_for(
+                asyncio.wrap_future(concurrent_future), timeout=effective_timeout
+            )
+        except asyncio.TimeoutError:
+            with self._stats_lock:
+                stats.timed_out += 1
+            raise TimeoutError(
+                f"La tarea '{getattr(func, '__name__', func)}' excedió el tiempo máximo "
+                f"de {effective_timeout} segundos"
+            )
+        except asyncio.CancelledError:
+            with self._stats_lock:
+                stats.cancelled += 1
+            raise
+        except Exception:
+            with self._stats_lock:
+                stats.failed += 1
+            raise
+
+        with self._stats_lock:
+            stats.completed += 1
+        return result
+
+    def _release(self, stats: PoolStats) -> None:
+        with self._stats_lock:
+            stats.in_flight -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtiene métricas de los pools para monitoring.
+
+        Returns:
+            dict: Por pool, workers, tareas en curso, profundidad de cola y contadores.
+        """
+        with self._stats_lock:
+            return {
+                name: {**asdict(stats), "queue_depth": stats.queue_depth}
+                for name, stats in self._stats.items()
+            }
+
+
+def get_executor() -> ExecutorService:
+    """
+    Función de conveniencia para obtener el executor compartido.
+
+    Returns:
+        ExecutorService: Instancia singleton del executor
+    """
+    return ExecutorService.get_instance()
@@ -0,0 +1,9 @@
+from app.modules.share.infra.http.http_client_registry import (
+    HttpClientRegistry,
+    get_http_client,
+)
+
+__all__ = [
+    "HttpClientRegistry",
+    "get_http_client",
+]
@@ -0,0 +1,120 @@
+"""
+Registro de clientes HTTP compartidos para integraciones salientes.
+
+Mantiene un httpx.AsyncClient por host (esquema + host + puerto) durante toda la vida
+de la aplicación, de modo que las llamadas reutilizan conexiones (keep-alive) en lugar
+de pagar un handshake TCP+TLS por mensaje:
+- Pool de conexiones por host con límites configurables
+- HTTP/2 cuando el paquete 'h2' está instalado
+- Cierre ordenado desde el lifespan de la aplicación
+"""
+
+import importlib.util
+import logging
+import threading
+from typing import Any, Dict
+
+import httpx
+
+from config.setting import (
+    HTTP_CLIENT_CONNECT_TIMEOUT,
+    HTTP_CLIENT_HTTP2,
+    HTTP_CLIENT_KEEPALIVE_EXPIRY,
+    HTTP_CLIENT_MAX_CONNECTIONS,
+    HTTP_CLIENT_MAX_KEEPALIVE,
+    HTTP_CLIENT_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 requiere el extra 'httpx[http2]'; si no está instalado se usa HTTP/1.1
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HttpClientRegistry:
+    """
+    Registro singleton de clientes httpx.AsyncClient agrupados por host.
+    """
+
+    _clients: Dict[str, httpx.AsyncClient] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        """Obtiene la clave del pool (esquema://host:puerto) a partir de una URL."""
+        parsed = httpx.URL(url)
+        port = f":{parsed.port}" if parsed.port else ""
+        return f"{parsed.scheme}://{parsed.host}{port}"
+
+    @classmethod
+    def get_client(cls, url: str) -> httpx.AsyncClient:
+        """
+        Obtiene el cliente compartido para el host de la URL, creándolo si es necesario.
+
+        Args:
+            url: URL base o completa del servicio de destino.
+
+        Returns:
+            httpx.AsyncClient reutilizable para ese host.
+        """
+        origin = cls._origin(url)
+        client = cls._clients.get(origin)
+        if client is None or client.is_closed:
+            with cls._lock:
+                client = cls._clients.get(origin)
+                if client is None or client.is_closed:
+                    client = cls._create_client()
+                    cls._clients[origin] = client
+                    logger.info(f"Cliente HTTP creado para {origin}")
+        return client
+
+    @classmethod
+    def _create_client(cls) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=HTTP_CLIENT_HTTP2 and _HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(HTTP_CLIENT_TIMEOUT, connect=HTTP_CLIENT_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=HTTP_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_CLIENT_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_CLIENT_KEEPALIVE_EXPIRY,
+            ),
+        )
+
+    @classmethod
+    async def aclose_all(cls) -> None:
+        """Cierra todos los clientes registrados. Se invoca al apagar la aplicación."""
+        with cls._lock:
+            clients = list(cls._clients.items())
+            cls._clients.clear()
+        for origin, client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error al cerrar el cliente HTTP de {origin}: {str(e)}")
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """
+        Obtiene información de los clientes registrados para monitoring.
+
+        Returns:
+            dict: Hosts con cliente abierto y si HTTP/2 está habilitado.
+        """
+        return {
+            "http2_enabled": HTTP_CLIENT_HTTP2 and _HTTP2_AVAILABLE,
+            "hosts": [origin for origin, client in cls._clients.items() if not client.is_closed],
+        }
+
+
+def get_http_client(url: str) -> httpx.AsyncClient:
+    """
+    Función de conveniencia para obtener el cliente HTTP compartido de un host.
+    El timeout por llamada puede pasarse en cada request.
+
+    Args:
+        url: URL base o completa del servicio de destino.
+
+    Returns:
+        httpx.AsyncClient: Cliente compartido para el host
+    """
+    return HttpClientRegistry.get_client(url)
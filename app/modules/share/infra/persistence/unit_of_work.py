@@ -1,8 +1,11 @@
+import logging
 from types import TracebackType
-from typing import Any, Callable, Coroutine, Optional
+from typing import Any, Callable, Coroutine, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+logger = logging.getLogger(__name__)
+
 
 class UnitOfWork:
     def __init__(
@@ -12,6 +15,7 @@ class UnitOfWork:
             session_factory
         )
         self._session: Optional[AsyncSession] = None
+        self._after_commit: List[Callable[[], None]] = []
 
     @property
     def session(self) -> AsyncSession:
@@ -36,11 +40,25 @@ class UnitOfWork:
             await self.rollback()
         await self.close()
 
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Registra una función a ejecutar solo si la transacción se confirma.
+        Se descarta si hay rollback. Debe ser rápida (por ejemplo, programar una tarea).
+        """
+        self._after_commit.append(callback)
+
     async def commit(self) -> None:
         if self._session:
             await self._session.commit()
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error en callback posterior al commit: {str(e)}", exc_info=True)
 
     async def rollback(self) -> None:
+        self._after_commit.clear()
         if self._session:
             await self._session.rollback()
 
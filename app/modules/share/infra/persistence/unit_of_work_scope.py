@@ -0,0 +1,27 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from injector import Injector
+
+from app.constants import injector_var, uow_var
+from app.database import create_session
+from app.modules.share.infra.di_config import AppModule
+from app.modules.share.infra.persistence.unit_of_work import UnitOfWork
+
+
+@asynccontextmanager
+async def unit_of_work_scope() -> AsyncIterator[UnitOfWork]:
+    """
+    Abre una UnitOfWork y un Injector propios y los publica en las context variables,
+    igual que el middleware HTTP. Permite usar repositorios y handlers fuera de un
+    request (workers en segundo plano, tareas programadas).
+    La transacción se confirma al salir sin excepción.
+    """
+    async with UnitOfWork(session_factory=create_session) as uow:
+        injector_token = injector_var.set(Injector([AppModule()]))
+        uow_token = uow_var.set(uow)
+        try:
+            yield uow
+        finally:
+            injector_var.reset(injector_token)
+            uow_var.reset(uow_token)
@@ -0,0 +1,11 @@
+from app.modules.share.infra.templates.message_template_registry import (
+    MessageTemplateRegistry,
+    RenderedEmail,
+    get_template_registry,
+)
+
+__all__ = [
+    "MessageTemplateRegistry",
+    "RenderedEmail",
+    "get_template_registry",
+]
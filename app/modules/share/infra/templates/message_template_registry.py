@@ -0,0 +1,160 @@
+"""
+Registro de plantillas Jinja2 para mensajes (emails y WhatsApp).
+
+- Las plantillas del repositorio viven en app/templates/messages y se compilan una
+  sola vez al iniciar la aplicación (Jinja mantiene el código compilado en memoria).
+- Un directorio externo (MESSAGE_TEMPLATES_OVERRIDE_DIR) puede reemplazar cualquier
+  plantilla, global o por sede (locations/<location_id>/<nombre>), sin deploy:
+  auto_reload detecta los cambios de archivo y recompila.
+- Los renders no se guardan: el contexto es distinto por cliente, así que lo único
+  reutilizable es la plantilla compilada, que ya cachea Jinja.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, StrictUndefined, Template
+from jinja2.sandbox import SandboxedEnvironment
+
+from config.setting import MESSAGE_TEMPLATES_OVERRIDE_DIR
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEMPLATES_DIR = Path(__file__).resolve().parents[4] / "templates" / "messages"
+
+
+@dataclass
+class RenderedEmail:
+    """Asunto y cuerpos de un email renderizados desde un mismo contexto."""
+    subject: str
+    body_html: str
+    body_text: str
+
+
+class MessageTemplateRegistry:
+    """
+    Registro de plantillas de mensajes con soporte de overrides por sede.
+    """
+
+    _instance: Optional["MessageTemplateRegistry"] = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        templates_dir: Path = DEFAULT_TEMPLATES_DIR,
+        overrides_dir: str = MESSAGE_TEMPLATES_OVERRIDE_DIR,
+    ) -> None:
+        loaders = []
+        if overrides_dir:
+            # Los overrides tienen prioridad sobre las plantillas del repositorio
+            loaders.append(FileSystemLoader(overrides_dir))
+        loaders.append(FileSystemLoader(str(templates_dir)))
+
+        self.templates_dir = templates_dir
+        self.env = Environment(
+            loader=ChoiceLoader(loaders),
+            autoescape=lambda name: name is not None and name.endswith(".html.j2"),
+            undefined=StrictUndefined,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=True,
+        )
+        # Las plantillas enviadas por clientes de la API se compilan en un sandbox
+        self.inline_env = SandboxedEnvironment(
+            undefined=StrictUndefined,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+
+    @classmethod
+    def get_instance(cls) -> "MessageTemplateRegistry":
+        """
+        Obtiene la instancia singleton del registro.
+        Thread-safe usando double-checked locking pattern.
+        """
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = MessageTemplateRegistry()
+        return cls._instance
+
+    def warm_up(self) -> None:
+        """Compila todas las plantillas del repositorio. Se invoca al iniciar la aplicación."""
+        names = [path.name for path in self.templates_dir.glob("*.j2")]
+        for name in names:
+            self.env.get_template(name)
+        logger.info(f"Plantillas de mensajes compiladas: {len(names)}")
+
+    def _resolve(self, name: str, location_id: Optional[int]) -> Template:
+        candidates: List[str] = []
+        if location_id is not None:
+            candidates.append(f"locations/{location_id}/{name}")
+        candidates.append(name)
+        return self.env.select_template(candidates)
+
+    def render(
+        self, name: str, context: Dict[str, Any], location_id: Optional[int] = None
+    ) -> str:
+        """
+        Renderiza una plantilla, usando el override de la sede si existe.
+
+        Args:
+            name: Nombre del archivo de plantilla (por ejemplo 'appointment_reminder.whatsapp.j2').
+            context: Variables de la plantilla.
+            location_id: Sede para buscar un override específico (opcional).
+
+        Returns:
+            str: Texto renderizado.
+        """
+        template = self._resolve(name, location_id)
+        return template.render(**context).strip()
+
+    def compile_inline(self, source: str) -> Template:
+        """
+        Compila una plantilla recibida como texto (por ejemplo desde un endpoint) en
+        un entorno sandbox. Se compila una vez y se renderiza por cada destinatario.
+
+        Args:
+            source: Texto de la plantilla con variables Jinja ({{ nombre }}).
+
+        Returns:
+            Template compilada.
+
+        Raises:
+            jinja2.TemplateSyntaxError: Si la plantilla no es válida.
+        """
+        return self.inline_env.from_string(source)
+
+    def render_email(
+        self, name: str, context: Dict[str, Any], location_id: Optional[int] = None
+    ) -> RenderedEmail:
+        """
+        Renderiza asunto, HTML y texto plano de un email desde un mismo contexto.
+        Usa las plantillas '<name>.subject.j2', '<name>.html.j2' y '<name>.txt.j2'.
+
+        Args:
+            name: Nombre base de la plantilla de email (por ejemplo 'review_request').
+            context: Variables de la plantilla.
+            location_id: Sede para buscar overrides específicos (opcional).
+
+        Returns:
+            RenderedEmail con las tres partes.
+        """
+        return RenderedEmail(
+            subject=self.render(f"{name}.subject.j2", context, location_id),
+            body_html=self.render(f"{name}.html.j2", context, location_id),
+            body_text=self.render(f"{name}.txt.j2", context, location_id),
+        )
+
+
+def get_template_registry() -> MessageTemplateRegistry:
+    """
+    Función de conveniencia para obtener el registro de plantillas.
+
+    Returns:
+        MessageTemplateRegistry: Instancia singleton del registro
+    """
+    return MessageTemplateRegistry.get_instance()
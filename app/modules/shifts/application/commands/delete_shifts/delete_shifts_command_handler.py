@@ -3,6 +3,10 @@ from pydantic import BaseModel
 
 # Importaciones necesarias para la inyección de dependencias y la interfaz del repositorio
 from app.constants import injector_var
+from app.modules.appointment.application.services.affected_appointments_service import (
+    AffectedAppointmentsService,
+    AvailabilityChangeResponse,
+)
 from app.modules.shifts.domain.repositories.shifts_repository import ShiftsRepository
 # Importación de la interfaz base para los manejadores de comandos/queries
 from app.modules.share.domain.handler.request_handler import IRequestHandler
@@ -19,7 +23,7 @@ class DeleteShiftsCommand(BaseModel):
 
 
 @Mediator.handler
-class DeleteShiftsCommandHandler(IRequestHandler[DeleteShiftsCommand, str]):
+class DeleteShiftsCommandHandler(IRequestHandler[DeleteShiftsCommand, AvailabilityChangeResponse]):
     """
     Manejador (Handler) para el comando DeleteShiftsCommand.
     Se encarga de orquestar la lógica para la eliminación lógica de un turno,
@@ -39,8 +43,9 @@ class DeleteShiftsCommandHandler(IRequestHandler[DeleteShiftsCommand, str]):
         # El '# type: ignore' es para suprimir posibles advertencias del linter sobre
         # obtener una clase abstracta, aunque el inyector devolverá una concreta.
         self.shifts_repository: ShiftsRepository = injector.get(ShiftsRepository)  # type: ignore[type-abstract]
+        self.affected_appointments_service = AffectedAppointmentsService()
 
-    async def handle(self, command: DeleteShiftsCommand) -> str:
+    async def handle(self, command: DeleteShiftsCommand) -> AvailabilityChangeResponse:
         """
         Lógica principal del manejador para el borrado lógico.
         Se ejecuta cuando el Mediator recibe una instancia de DeleteShiftsCommand.
@@ -50,9 +55,13 @@ class DeleteShiftsCommandHandler(IRequestHandler[DeleteShiftsCommand, str]):
                                          (ID del turno y usuario modificador).
 
         Returns:
-            str: El mensaje de resultado devuelto por la operación del repositorio
-                 (ej: "Shift ID 123 for user 5 has been successfully annulled.").
+            AvailabilityChangeResponse: El mensaje de resultado devuelto por la operación
+                 del repositorio (ej: "Shift ID 123 for user 5 has been successfully annulled.")
+                 y las citas de la sede que quedaron sin turno que las cubra.
         """
+        # Se lee antes de anularlo para conocer el usuario, la sede y la fecha del turno
+        shift = await self.shifts_repository.get_shift_by_id(command.shift_id)
+
         # Llama al método 'delete_shift' en el repositorio de turnos,
         # que fue implementado para realizar la eliminación lógica.
         # Pasa los datos extraídos del objeto 'command'.
@@ -61,5 +70,14 @@ class DeleteShiftsCommandHandler(IRequestHandler[DeleteShiftsCommand, str]):
             user_modify=command.user_modify   # Pasa el usuario que realiza la anulación
         )
 
-        # Devuelve el resultado (mensaje de texto) obtenido desde el repositorio.
-        return res 
\ No newline at end of file
+        # Citas del turno anulado que ningún otro turno cubre (misma transacción)
+        if shift is None:
+            return AvailabilityChangeResponse(message=res)
+
+        return await self.affected_appointments_service.build_response(
+            message=res,
+            user_id=shift.user_id,
+            start_date=shift.fecha_turno,
+            end_date=shift.fecha_turno,
+            location_id=shift.sede_id,
+        )
@@ -5,6 +5,10 @@ from pydantic import BaseModel, field_validator, model_validator
 
 # Importaciones necesarias del proyecto
 from app.constants import injector_var
+from app.modules.appointment.application.services.affected_appointments_service import (
+    AffectedAppointmentsService,
+    AvailabilityChangeResponse,
+)
 from app.modules.shifts.domain.repositories.shifts_repository import (
     ShiftsRepository,  # Importa la interfaz del repositorio de turnos
 )
@@ -47,7 +51,7 @@ class UpdateShiftsCommand(BaseModel):
 
 # --- Handler ---
 @Mediator.handler
-class UpdateShiftsCommandHandler(IRequestHandler[UpdateShiftsCommand, str]):
+class UpdateShiftsCommandHandler(IRequestHandler[UpdateShiftsCommand, AvailabilityChangeResponse]):
     """
     Manejador (Handler) para el comando UpdateShiftsCommand.
     Orquesta la lógica para actualizar un turno: recibe el comando validado,
@@ -62,8 +66,9 @@ class UpdateShiftsCommandHandler(IRequestHandler[UpdateShiftsCommand, str]):
         # gracias a cómo se configuró la inyección de dependencias en otra parte.
         # El type: ignore es porque el injector devuelve 'Any' pero sabemos que es un ShiftsRepository.
         self.shifts_repository: ShiftsRepository = injector.get(ShiftsRepository)  # type: ignore[type-abstract]
+        self.affected_appointments_service = AffectedAppointmentsService()
 
-    async def handle(self, command: UpdateShiftsCommand) -> str:
+    async def handle(self, command: UpdateShiftsCommand) -> AvailabilityChangeResponse:
         """
         Ejecuta la lógica principal para manejar el comando de actualización.
 
@@ -71,9 +76,13 @@ class UpdateShiftsCommandHandler(IRequestHandler[UpdateShiftsCommand, str]):
             command: La instancia del comando UpdateShiftsCommand con los datos validados.
 
         Returns:
-            Un string con el mensaje de resultado devuelto por el repositorio
-            (ej. "Shift ID 123 updated successfully." o un mensaje de error).
+            El mensaje de resultado devuelto por el repositorio
+            (ej. "Shift ID 123 updated successfully.") y las citas de la sede que
+            quedaron fuera de los turnos del usuario.
         """
+        # Turno antes del cambio: si se mueve de fecha, las citas afectadas están en la anterior
+        previous = await self.shifts_repository.get_shift_by_id(command.shift_id)
+
         # Llama al método correspondiente en el repositorio para actualizar los detalles
         # Pasa los datos directamente desde el objeto 'command' ya validado por Pydantic.
         result = await self.shifts_repository.update_shift(
@@ -84,6 +93,14 @@ class UpdateShiftsCommandHandler(IRequestHandler[UpdateShiftsCommand, str]):
             hora_fin=command.hora_fin,
         )
 
-        # Devuelve el resultado (mensaje de texto) que proviene del repositorio
-        # (que a su vez, lo obtuvo del stored procedure).
-        return result 
\ No newline at end of file
+        if previous is None:
+            return AvailabilityChangeResponse(message=result)
+
+        # Solo la fecha anterior y la nueva cambiaron; los días intermedios no se consultan
+        new_date = command.fecha_turno or previous.fecha_turno
+        return await self.affected_appointments_service.build_response_for_days(
+            message=result,
+            user_id=previous.user_id,
+            days=[previous.fecha_turno, new_date],
+            location_id=previous.sede_id,
+        ) 
\ No newline at end of file
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional
 from datetime import date, time
 
+from app.modules.shifts.domain.entities.shifts_domain import ShiftsEntity
 # Importación de tipo compartido para respuestas con paginación
 from app.modules.share.domain.repositories.repository_types import ResponseList
 
@@ -97,4 +98,18 @@ class ShiftsRepository(ABC):
                  (ej: "Shift ID 123 for user 5 has been successfully annulled." o 
                  "Shift ID 123 for user 5 is already annulled. No action taken.").
         """
-        pass  # La implementación real estará en la subclase concreta 
\ No newline at end of file
+        pass  # La implementación real estará en la subclase concreta 
+
+    @abstractmethod
+    async def get_shift_by_id(self, shift_id: int) -> Optional[ShiftsEntity]:
+        """
+        Método abstracto para obtener un turno activo por su ID.
+        Utiliza el stored procedure 'shifts_sp_get_shift_by_id'.
+
+        Args:
+            shift_id (int): El ID del turno.
+
+        Returns:
+            Optional[ShiftsEntity]: El turno, o None si no existe o está anulado.
+        """
+        pass  # La implementación real estará en la subclase concreta
@@ -9,6 +9,7 @@ from sqlalchemy.exc import DBAPIError
 
 # Asumiendo que estas rutas de importación son correctas para tu proyecto
 from app.constants import uow_var
+from app.modules.shifts.domain.entities.shifts_domain import ShiftsEntity
 
 # Importa la interfaz abstracta que esta clase implementará
 from app.modules.shifts.domain.repositories.shifts_repository import (
@@ -210,4 +211,36 @@ class ShiftsImplementationRepository(ShiftsRepository):
             # y levanta una excepción HTTP genérica (ej. 500 Internal Server Error).
             handle_error(e)
             # Esta línea teóricamente no se alcanza si handle_error siempre levanta una excepción.
-            raise RuntimeError("Este punto nunca se alcanza") 
\ No newline at end of file
+            raise RuntimeError("Este punto nunca se alcanza") 
+
+    async def get_shift_by_id(self, shift_id: int) -> Optional[ShiftsEntity]:
+        """
+        Implementación concreta para obtener un turno activo por su ID.
+        Llama a la función 'shifts_sp_get_shift_by_id', que devuelve la fila de la
+        tabla 'shifts' (ninguna si no existe o está anulada).
+        """
+        stmt = text("SELECT * FROM shifts_sp_get_shift_by_id(:p_shift_id)")
+
+        try:
+            result = await self._uow.session.execute(stmt, {"p_shift_id": shift_id})
+            row = result.first()
+            if row is None:
+                return None
+
+            return ShiftsEntity(
+                id=row.id,
+                user_id=row.user_id,
+                sede_id=row.sede_id,
+                fecha_turno=row.fecha_turno,
+                hora_inicio=row.hora_inicio,
+                hora_fin=row.hora_fin,
+                user_create=row.user_create,
+                annulled=row.annulled,
+                insert_date=row.insert_date,
+                user_modify=row.user_modify,
+                update_date=row.update_date,
+            )
+
+        except DBAPIError as e:
+            handle_error(e)
+            raise RuntimeError("Este punto nunca se alcanza")  # handle_error siempre levanta excepción
@@ -22,6 +22,11 @@ from app.modules.auth.presentation.dependencies.auth_dependencies import (
     permission_required,
 )
 
+# Importa la respuesta con las citas afectadas por el cambio de disponibilidad
+from app.modules.appointment.application.services.affected_appointments_service import (
+    AvailabilityChangeResponse,
+)
+
 # --- Importaciones de Comandos de Turnos ---
 from app.modules.shifts.application.commands.create_shifts.create_shifts_command_handler import (
     CreateShiftsCommand,
@@ -75,7 +80,7 @@ class ShiftsController:
         # --- RUTA PUT PARA ACTUALIZAR DETALLES DE TURNO ---
         self.router.put(
             "/shifts/{shift_id}/details",
-            response_model=str,                           # Se espera un mensaje de texto como respuesta
+            response_model=AvailabilityChangeResponse,   # Mensaje y citas afectadas por el cambio
             status_code=status.HTTP_200_OK,               # Código de éxito para actualización
             summary="Update shift details",              # Resumen breve de la ruta
             description="Actualiza los detalles de un turno existente. Permite actualización parcial de campos. Requiere rol 'admin'.",
@@ -87,7 +92,7 @@ class ShiftsController:
         # --- RUTA DELETE PARA ELIMINAR LÓGICAMENTE UN TURNO ---
         self.router.delete(
             "/shifts/{shift_id}/delete",
-            response_model=str,                           # Se espera un mensaje de texto como respuesta
+            response_model=AvailabilityChangeResponse,   # Mensaje y citas afectadas por el cambio
             status_code=status.HTTP_200_OK,               # Código de éxito para eliminación lógica
             summary="Delete shift",                      # Resumen breve de la ruta
             description="Realiza la eliminación lógica de un turno específico marcándolo como anulado en la base de datos. Requiere rol 'admin'.",
@@ -138,7 +143,7 @@ class ShiftsController:
         shift_id: Annotated[int, Path(ge=1, description="ID del turno a actualizar")],
         payload: UpdateShiftsDetailsPayload,
         current_user: UserAuth = Depends(get_current_user),
-    ) -> str:
+    ) -> AvailabilityChangeResponse:
         """
         Maneja la petición PUT a /shifts/{shift_id}/details.
         Crea y envía el comando UpdateShiftsCommand al Mediator para actualizar
@@ -163,7 +168,7 @@ class ShiftsController:
         # 3. Enviar el comando al Mediator
         #    El Mediator buscará el Handler registrado para UpdateShiftsCommand
         #    y ejecutará su método handle().
-        result: str = await self.mediator.send_async(command)
+        result: AvailabilityChangeResponse = await self.mediator.send_async(command)
 
         # 4. Devolver el resultado obtenido del Handler
         return result
@@ -172,7 +177,7 @@ class ShiftsController:
         self,
         shift_id: Annotated[int, Path(ge=1, description="ID del turno a marcar como anulado")],
         current_user: UserAuth = Depends(get_current_user)
-    ) -> str:
+    ) -> AvailabilityChangeResponse:
         """
         Maneja la petición DELETE a /shifts/{shift_id}/delete.
         Crea y envía el comando DeleteShiftsCommand al Mediator para realizar
@@ -194,7 +199,7 @@ class ShiftsController:
         # 3. Enviar el comando al Mediator
         #    El Mediator buscará el Handler registrado para DeleteShiftsCommand
         #    y ejecutará su método handle().
-        result: str = await self.mediator.send_async(command)
+        result: AvailabilityChangeResponse = await self.mediator.send_async(command)
 
         # 4. Devolver el resultado obtenido del Handler
         return result 
\ No newline at end of file
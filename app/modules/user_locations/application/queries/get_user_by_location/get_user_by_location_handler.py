@@ -17,16 +17,27 @@ class GetUserByLocationQuery(BaseModel):
     end_date: date
 
 
+class UserShiftResponse(BaseModel):
+    shift_id: int
+    start_time: datetime
+    end_time: datetime
+    description: Optional[str] = None
+    sede_id: Optional[int] = None
+
+
+class UserDayOffResponse(BaseModel):
+    day_off_id: int
+    start_time: datetime
+    end_time: datetime
+    description: Optional[str] = None
+
+
 class GetUserByLocationQueryResponse(BaseModel):
     user_id: int
     user_name: str
     email: str
-    event_type: Optional[str] = None
-    event_id: Optional[int] = None
-    event_start_time: Optional[datetime] = None
-    event_end_time: Optional[datetime] = None
-    event_description: Optional[str] = None
-    event_sede_id: Optional[int] = None
+    shifts: list[UserShiftResponse]
+    days_off: list[UserDayOffResponse]
 
 
 @Mediator.handler
@@ -50,16 +61,29 @@ class GetUserByLocationQueryHandler(
 
         response_data = [
             GetUserByLocationQueryResponse(
-                user_id=user_event.user_id,
-                user_name=user_event.user_name,
-                email=user_event.email,
-                event_type=user_event.event_type,
-                event_id=user_event.event_id,
-                event_start_time=user_event.event_start_time,
-                event_end_time=user_event.event_end_time,
-                event_description=user_event.event_description,
-                event_sede_id=user_event.event_sede_id,
+                user_id=user.user_id,
+                user_name=user.user_name,
+                email=user.email,
+                shifts=[
+                    UserShiftResponse(
+                        shift_id=shift.shift_id,
+                        start_time=shift.start_time,
+                        end_time=shift.end_time,
+                        description=shift.description,
+                        sede_id=shift.sede_id,
+                    )
+                    for shift in user.shifts
+                ],
+                days_off=[
+                    UserDayOffResponse(
+                        day_off_id=day_off.day_off_id,
+                        start_time=day_off.start_time,
+                        end_time=day_off.end_time,
+                        description=day_off.description,
+                    )
+                    for day_off in user.days_off
+                ],
             )
-            for user_event in res
+            for user in res
         ]
         return response_data 
\ No newline at end of file
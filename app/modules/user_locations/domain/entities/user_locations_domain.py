@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Optional
@@ -75,7 +75,6 @@ class UserLocationDetailResponse:
 class UserEventEntity:
     """
     Entidad que representa un evento (turno o día libre) de un usuario.
-    Utilizada en conjunto con UserLocationEventEntity.
     """
     event_type: EventType
     event_id: int
@@ -86,20 +85,36 @@ class UserEventEntity:
 
 
 @dataclass
-class UserLocationEventEntity:
+class UserShiftEntity:
+    """Turno de un usuario dentro de UserLocationScheduleEntity."""
+    shift_id: int
+    start_time: datetime
+    end_time: datetime
+    description: Optional[str] = None
+    sede_id: Optional[int] = None
+
+
+@dataclass
+class UserDayOffEntity:
+    """Día libre de un usuario dentro de UserLocationScheduleEntity."""
+    day_off_id: int
+    start_time: datetime
+    end_time: datetime
+    description: Optional[str] = None
+
+
+@dataclass
+class UserLocationScheduleEntity:
     """
-    Entidad que combina información de usuario con sus eventos (turnos y días libres)
-    para una sede específica. Resultado del SP 'user_locations_get_user_by_location'.
+    Usuario asignado a una sede con sus turnos y días libres del rango consultado.
+    Agrupa las filas usuario × evento del SP 'user_locations_get_user_by_location':
+    cada usuario aparece una sola vez y los usuarios sin eventos tienen listas vacías.
     """
     user_id: int
     user_name: str
     email: str
-    event_type: Optional[str] = None
-    event_id: Optional[int] = None
-    event_start_time: Optional[datetime] = None
-    event_end_time: Optional[datetime] = None
-    event_description: Optional[str] = None
-    event_sede_id: Optional[int] = None
+    shifts: list[UserShiftEntity] = field(default_factory=list)
+    days_off: list[UserDayOffEntity] = field(default_factory=list)
 
 
 @dataclass
@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from datetime import date
 
-from app.modules.user_locations.domain.entities.user_locations_domain import UserLocationEventEntity
+from app.modules.user_locations.domain.entities.user_locations_domain import UserLocationScheduleEntity
 
 
 class UserLocationsRepository(ABC):
@@ -79,10 +79,10 @@ class UserLocationsRepository(ABC):
         sede_id: int, 
         start_date: date, 
         end_date: date
-    ) -> list[UserLocationEventEntity]:
+    ) -> list[UserLocationScheduleEntity]:
         """
         Método abstracto para obtener usuarios con sus eventos (turnos y días libres) 
-        para una sede específica en un rango de fechas.
+        para una sede específica en un rango de fechas, agrupados por usuario.
 
         Este método se encarga de llamar al procedimiento almacenado
         'user_locations_get_user_by_location' en la base de datos, el cual:
@@ -96,10 +96,10 @@ class UserLocationsRepository(ABC):
             end_date (date): La fecha de fin del rango de consulta.
 
         Returns:
-            list[UserLocationEventEntity]: Lista de entidades que combinan información
-                                         de usuarios con sus eventos (turnos y días libres)
-                                         en el rango de fechas especificado para la sede.
-                                         Los usuarios sin eventos tendrán campos event_* en None.
+            list[UserLocationScheduleEntity]: Un elemento por usuario, con sus turnos
+                                         y días libres en el rango de fechas especificado
+                                         para la sede. Los usuarios sin eventos tienen
+                                         las listas vacías.
 
         Raises:
             Exception: Si start_date > end_date (validación del SP).
@@ -20,7 +20,12 @@ from app.modules.user_locations.domain.repositories.user_locations_repository im
 
 # Agrega esta importación junto con las otras
 from datetime import date
-from app.modules.user_locations.domain.entities.user_locations_domain import UserLocationEventEntity
+from app.modules.user_locations.domain.entities.user_locations_domain import (
+    EventType,
+    UserDayOffEntity,
+    UserLocationScheduleEntity,
+    UserShiftEntity,
+)
 
 
 class UserLocationsImplementationRepository(UserLocationsRepository):
@@ -144,13 +149,15 @@ class UserLocationsImplementationRepository(UserLocationsRepository):
         sede_id: int, 
         start_date: date, 
         end_date: date
-    ) -> list[UserLocationEventEntity]:
+    ) -> list[UserLocationScheduleEntity]:
         """
         Obtiene todos los usuarios asignados a una sede/ubicación junto con sus eventos
         (turnos y días libres) en un rango de fechas específico.
         
         Llama al procedimiento almacenado 'user_locations_get_user_by_location'
-        que devuelve una tabla con información de usuarios y sus eventos.
+        que devuelve una fila por usuario × evento. Las filas se agrupan por usuario
+        en una sola pasada mientras se leen del cursor (sin cargar antes todo el
+        resultado), sin suponer ningún orden en el SP.
         """
         sql_query = text(
             """
@@ -169,26 +176,44 @@ class UserLocationsImplementationRepository(UserLocationsRepository):
         }
 
         try:
-            result = await self._uow.session.execute(sql_query, params)
-            
-            user_events: list[UserLocationEventEntity] = []
+            result = await self._uow.session.stream(sql_query, params)
             
-            # El SP devuelve filas directamente, no JSON como en find_categories
-            for row in result:
-                user_event = UserLocationEventEntity(
-                    user_id=row.user_id,
-                    user_name=row.user_name,
-                    email=row.email,
-                    event_type=row.event_type,  # Puede ser None
-                    event_id=row.event_id,      # Puede ser None
-                    event_start_time=row.event_start_time,  # Puede ser None
-                    event_end_time=row.event_end_time,      # Puede ser None
-                    event_description=row.event_description, # Puede ser None
-                    event_sede_id=row.event_sede_id,        # Puede ser None
-                )
-                user_events.append(user_event)
-
-            return user_events
+            # Un dict conserva el orden de aparición de los usuarios
+            users: dict[int, UserLocationScheduleEntity] = {}
+            async for row in result:
+                user = users.get(row.user_id)
+                if user is None:
+                    user = UserLocationScheduleEntity(
+                        user_id=row.user_id,
+                        user_name=row.user_name,
+                        email=row.email,
+                    )
+                    users[row.user_id] = user
+
+                # Los usuarios sin eventos vienen en una fila con los campos event_* en None
+                if row.event_id is None or row.event_start_time is None or row.event_end_time is None:
+                    continue
+                if row.event_type == EventType.SHIFT.value:
+                    user.shifts.append(
+                        UserShiftEntity(
+                            shift_id=row.event_id,
+                            start_time=row.event_start_time,
+                            end_time=row.event_end_time,
+                            description=row.event_description,
+                            sede_id=row.event_sede_id,
+                        )
+                    )
+                elif row.event_type == EventType.DAY_OFF.value:
+                    user.days_off.append(
+                        UserDayOffEntity(
+                            day_off_id=row.event_id,
+                            start_time=row.event_start_time,
+                            end_time=row.event_end_time,
+                            description=row.event_description,
+                        )
+                    )
+
+            return list(users.values())
             
         except DBAPIError as e:
             handle_error(e)
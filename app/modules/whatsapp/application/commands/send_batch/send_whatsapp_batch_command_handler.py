@@ -0,0 +1,366 @@
+import asyncio
+import uuid
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from jinja2 import Template, TemplateError, TemplateSyntaxError, UndefinedError
+from mediatr import Mediator
+from pydantic import BaseModel, Field
+
+from app.constants import injector_var
+from app.modules.notifications.domain.notification_outbox_entity import (
+    NotificationOutboxMessage,
+)
+from app.modules.notifications.domain.repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
+from app.modules.share.domain.handler.request_handler import IRequestHandler
+from app.modules.share.infra.concurrency import get_rate_limiter
+from app.modules.share.infra.templates import get_template_registry
+from app.modules.whatsapp.infra.services.evolution_api_service import (
+    EvolutionApiService,
+)
+from config.setting import (
+    EVOLUTION_CALL_DEADLINE,
+    EVOLUTION_MAX_CONCURRENCY,
+    EVOLUTION_RATE_BURST,
+    EVOLUTION_RATE_PER_SECOND,
+    NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS,
+    WHATSAPP_DEFAULT_COUNTRY_CODE,
+)
+
+RECIPIENT_SENT = "sent"
+RECIPIENT_FAILED = "failed"
+RECIPIENT_INVALID = "invalid"
+RECIPIENT_DUPLICATE = "duplicate"
+RECIPIENT_QUEUED = "queued"
+
+WHATSAPP_CHANNEL = "whatsapp"
+
+
+# --- Definición del Comando ---
+class WhatsappBatchRecipient(BaseModel):
+    """
+    Destinatario del envío masivo con sus variables de plantilla.
+    """
+
+    number: str
+    variables: Dict[str, str] = Field(default_factory=dict)
+
+
+class SendWhatsappBatchCommand(BaseModel):
+    """
+    Comando para enviar un mismo mensaje (plantilla) a varios destinatarios.
+    """
+
+    text: str
+    recipients: List[WhatsappBatchRecipient]
+    delay: Optional[int] = None
+    linkPreview: Optional[bool] = True
+    runAsync: bool = False
+
+
+class WhatsappBatchRecipientResult(BaseModel):
+    """
+    Resultado del envío para un destinatario, en el mismo orden de la solicitud.
+    """
+
+    index: int
+    number: str
+    normalized_number: Optional[str] = None
+    status: str
+    message_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class SendWhatsappBatchResponse(BaseModel):
+    """
+    Resumen del envío masivo. Con runAsync se informa el job_id, el estado 'queued' y,
+    en results, solo los destinatarios descartados (inválidos o duplicados).
+    """
+
+    success: bool
+    message: str
+    job_id: Optional[str] = None
+    status: str
+    total: int
+    sent: int = 0
+    failed: int = 0
+    invalid: int = 0
+    duplicated: int = 0
+    queued: int = 0
+    results: List[WhatsappBatchRecipientResult] = Field(default_factory=list)
+
+
+class _PreparedMessage(BaseModel):
+    index: int
+    number: str
+    normalized_number: str
+    text: str
+
+
+# --- Definición del Manejador del Comando ---
+@Mediator.handler
+class SendWhatsappBatchCommandHandler(
+    IRequestHandler[SendWhatsappBatchCommand, SendWhatsappBatchResponse]
+):
+    """
+    Manejador para el comando SendWhatsappBatchCommand.
+    Valida y normaliza todos los destinatarios en una sola pasada, renderiza la plantilla
+    (compilada una vez) para cada uno y envía con concurrencia acotada, respetando el
+    límite de tasa de Evolution API y reutilizando el cliente HTTP compartido.
+    Con runAsync los mensajes se encolan en el outbox de notificaciones con un batch_id
+    (el job_id) y los envía el dispatcher con reintentos, desde cualquier réplica.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor: Inicializa el servicio de Evolution API, el repositorio del outbox
+        y el limitador compartido.
+        """
+        injector = injector_var.get()
+        self.outbox_repository = injector.get(NotificationOutboxRepository)  # type: ignore[type-abstract]
+        self.evolution_service = EvolutionApiService()
+        self.rate_limiter = get_rate_limiter(
+            "evolution_api",
+            rate=EVOLUTION_RATE_PER_SECOND,
+            capacity=EVOLUTION_RATE_BURST,
+        )
+
+    async def handle(self, command: SendWhatsappBatchCommand) -> SendWhatsappBatchResponse:
+        """
+        Lógica para manejar el comando SendWhatsappBatchCommand.
+
+        Args:
+            command: Plantilla, destinatarios y opciones del envío.
+
+        Returns:
+            Resultados por destinatario, o el job_id si el envío es asíncrono.
+
+        Raises:
+            ValueError: Si la plantilla del mensaje no es válida.
+        """
+        try:
+            template = get_template_registry().compile_inline(command.text)
+        except TemplateSyntaxError as e:
+            raise ValueError(f"La plantilla del mensaje no es válida: {e.message}")
+
+        prepared, rejected = self._prepare(command.recipients, template)
+
+        # Sin mensajes válidos no hay nada que encolar: se responde el resumen directamente
+        if command.runAsync and prepared:
+            return await self._enqueue(prepared, rejected)
+
+        return await self._dispatch(command, prepared, rejected)
+
+    async def _enqueue(
+        self,
+        prepared: List[_PreparedMessage],
+        rejected: List[WhatsappBatchRecipientResult],
+    ) -> SendWhatsappBatchResponse:
+        """
+        Encola los mensajes en el outbox dentro de la transacción del request. El
+        dispatcher los envía sin delay ni vista previa de enlaces.
+        """
+        job_id = str(uuid.uuid4())
+        await self.outbox_repository.enqueue_messages(
+            [
+                NotificationOutboxMessage(
+                    channel=WHATSAPP_CHANNEL,
+                    recipient=message.normalized_number,
+                    message=message.text,
+                    max_attempts=NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS,
+                    batch_id=job_id,
+                )
+                for message in prepared
+            ],
+            user_create="whatsapp_batch",
+        )
+
+        invalid = sum(1 for result in rejected if result.status == RECIPIENT_INVALID)
+        duplicated = sum(1 for result in rejected if result.status == RECIPIENT_DUPLICATE)
+        return SendWhatsappBatchResponse(
+            success=True,
+            message=(
+                f"Envío masivo encolado. {len(prepared)} encolados, "
+                f"{invalid} inválidos, {duplicated} duplicados"
+            ),
+            job_id=job_id,
+            status=RECIPIENT_QUEUED,
+            total=len(prepared) + len(rejected),
+            invalid=invalid,
+            duplicated=duplicated,
+            queued=len(prepared),
+            results=sorted(rejected, key=lambda result: result.index),
+        )
+
+    @staticmethod
+    def _normalize_number(number: str) -> Optional[str]:
+        """
+        Deja solo los dígitos y antepone el código de país a los números locales.
+        Devuelve None si el resultado no tiene entre 10 y 20 dígitos.
+        """
+        digits = "".join(filter(str.isdigit, number))
+        if len(digits) == 9 and WHATSAPP_DEFAULT_COUNTRY_CODE:
+            digits = f"{WHATSAPP_DEFAULT_COUNTRY_CODE}{digits}"
+        if len(digits) < 10 or len(digits) > 20:
+            return None
+        return digits
+
+    def _prepare(
+        self, recipients: List[WhatsappBatchRecipient], template: Template
+    ) -> Tuple[List[_PreparedMessage], List[WhatsappBatchRecipientResult]]:
+        """
+        Una sola pasada sobre los destinatarios: normaliza el número, descarta inválidos
+        y duplicados, y renderiza el mensaje de cada uno.
+        """
+        prepared: List[_PreparedMessage] = []
+        rejected: List[WhatsappBatchRecipientResult] = []
+        seen_numbers: Set[str] = set()
+
+        for index, recipient in enumerate(recipients):
+            normalized = self._normalize_number(recipient.number)
+            if normalized is None:
+                rejected.append(
+                    WhatsappBatchRecipientResult(
+                        index=index,
+                        number=recipient.number,
+                        status=RECIPIENT_INVALID,
+                        error="El número debe tener entre 10 y 20 dígitos",
+                    )
+                )
+                continue
+
+            if normalized in seen_numbers:
+                rejected.append(
+                    WhatsappBatchRecipientResult(
+                        index=index,
+                        number=recipient.number,
+                        normalized_number=normalized,
+                        status=RECIPIENT_DUPLICATE,
+                        error="Número repetido en la solicitud",
+                    )
+                )
+                continue
+
+            # Un error al renderizar descarta solo a este destinatario, no el lote
+            try:
+                text = template.render(**recipient.variables).strip()
+            except (TemplateError, TypeError, ValueError, ArithmeticError) as e:
+                error = (
+                    f"Variable de plantilla faltante: {e.message}"
+                    if isinstance(e, UndefinedError)
+                    else f"Error al renderizar la plantilla: {e}"
+                )
+                rejected.append(
+                    WhatsappBatchRecipientResult(
+                        index=index,
+                        number=recipient.number,
+                        normalized_number=normalized,
+                        status=RECIPIENT_INVALID,
+                        error=error,
+                    )
+                )
+                continue
+
+            if not text:
+                rejected.append(
+                    WhatsappBatchRecipientResult(
+                        index=index,
+                        number=recipient.number,
+                        normalized_number=normalized,
+                        status=RECIPIENT_INVALID,
+                        error="El mensaje renderizado está vacío",
+                    )
+                )
+                continue
+
+            seen_numbers.add(normalized)
+            prepared.append(
+                _PreparedMessage(
+                    index=index,
+                    number=recipient.number,
+                    normalized_number=normalized,
+                    text=text,
+                )
+            )
+
+        return prepared, rejected
+
+    async def _dispatch(
+        self,
+        command: SendWhatsappBatchCommand,
+        prepared: List[_PreparedMessage],
+        rejected: List[WhatsappBatchRecipientResult],
+    ) -> SendWhatsappBatchResponse:
+        semaphore = asyncio.Semaphore(EVOLUTION_MAX_CONCURRENCY)
+        sent_results = await asyncio.gather(
+            *(self._send(command, message, semaphore) for message in prepared)
+        )
+
+        results = sorted([*sent_results, *rejected], key=lambda result: result.index)
+        counts: Dict[str, int] = {}
+        for result in results:
+            counts[result.status] = counts.get(result.status, 0) + 1
+
+        sent = counts.get(RECIPIENT_SENT, 0)
+        failed = counts.get(RECIPIENT_FAILED, 0)
+        invalid = counts.get(RECIPIENT_INVALID, 0)
+        duplicated = counts.get(RECIPIENT_DUPLICATE, 0)
+        return SendWhatsappBatchResponse(
+            success=True,
+            message=(
+                f"Envío masivo completado. {sent} enviados, {failed} fallidos, "
+                f"{invalid} inválidos, {duplicated} duplicados"
+            ),
+            status="completed",
+            total=len(results),
+            sent=sent,
+            failed=failed,
+            invalid=invalid,
+            duplicated=duplicated,
+            results=results,
+        )
+
+    async def _send(
+        self,
+        command: SendWhatsappBatchCommand,
+        message: _PreparedMessage,
+        semaphore: asyncio.Semaphore,
+    ) -> WhatsappBatchRecipientResult:
+        """
+        Envía un mensaje respetando el límite de concurrencia, la tasa permitida por
+        Evolution API y el timeout por mensaje.
+        """
+        async with semaphore:
+            try:
+                await self.rate_limiter.acquire()
+                response: Dict[str, Any] = await asyncio.wait_for(
+                    self.evolution_service.send_text_message(
+                        number=message.normalized_number,
+                        text=message.text,
+                        delay=command.delay,
+                        link_preview=command.linkPreview,
+                    ),
+                    timeout=EVOLUTION_CALL_DEADLINE,
+                )
+                key = response.get("key") if isinstance(response, dict) else None
+                return WhatsappBatchRecipientResult(
+                    index=message.index,
+                    number=message.number,
+                    normalized_number=message.normalized_number,
+                    status=RECIPIENT_SENT,
+                    message_id=key.get("id") if isinstance(key, dict) else None,
+                )
+            except Exception as e:
+                error = (
+                    "Timeout al enviar el mensaje"
+                    if isinstance(e, asyncio.TimeoutError)
+                    else str(e)
+                )
+                return WhatsappBatchRecipientResult(
+                    index=message.index,
+                    number=message.number,
+                    normalized_number=message.normalized_number,
+                    status=RECIPIENT_FAILED,
+                    error=error,
+                )
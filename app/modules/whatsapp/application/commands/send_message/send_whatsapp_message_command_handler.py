@@ -4,6 +4,7 @@ from mediatr import Mediator
 from pydantic import BaseModel
 
 from app.modules.share.domain.handler.request_handler import IRequestHandler
+from app.modules.share.infra.concurrency import BulkheadFullError, CircuitOpenError
 from app.modules.whatsapp.infra.services.evolution_api_service import (
     EvolutionApiService,
 )
@@ -66,6 +67,14 @@ class SendWhatsappMessageCommandHandler(
                 "data": response,
             }
 
+        except (CircuitOpenError, BulkheadFullError) as e:
+            # Evolution API no disponible o saturada: se rechaza sin esperar el timeout
+            return {
+                "success": False,
+                "message": f"Error al enviar mensaje: {str(e)}",
+                "data": None,
+                "status_code": 503,
+            }
         except Exception as e:
             return {
                 "success": False,
@@ -0,0 +1,126 @@
+from datetime import datetime
+from typing import List, Optional
+
+from mediatr import Mediator
+from pydantic import BaseModel, Field
+
+from app.constants import injector_var
+from app.modules.notifications.domain.repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
+from app.modules.share.domain.handler.request_handler import IRequestHandler
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+
+OUTBOX_PENDING = "pending"
+OUTBOX_SENT = "sent"
+OUTBOX_DEAD = "dead"
+
+
+class GetWhatsappBatchJobQuery(BaseModel):
+    """
+    Query para consultar el estado de un envío masivo asíncrono.
+    """
+
+    job_id: str
+
+
+class WhatsappBatchJobMessage(BaseModel):
+    """
+    Estado del mensaje encolado para un destinatario del envío masivo.
+    """
+
+    number: str
+    status: str
+    attempts: int
+    message_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class WhatsappBatchJobResponse(BaseModel):
+    """
+    Estado de un envío masivo asíncrono, calculado a partir de sus mensajes en el outbox.
+    Los destinatarios descartados se informan solo en la respuesta del envío.
+    """
+
+    job_id: str
+    status: str
+    total: int
+    pending: int
+    sent: int
+    failed: int
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    results: List[WhatsappBatchJobMessage] = Field(default_factory=list)
+
+
+@Mediator.handler
+class GetWhatsappBatchJobQueryHandler(
+    IRequestHandler[GetWhatsappBatchJobQuery, Optional[WhatsappBatchJobResponse]]
+):
+    """
+    Manejador para la query GetWhatsappBatchJobQuery.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor: Inyecta el repositorio del outbox de notificaciones.
+        """
+        injector = injector_var.get()
+        self.outbox_repository = injector.get(NotificationOutboxRepository)  # type: ignore[type-abstract]
+
+    async def handle(
+        self, query: GetWhatsappBatchJobQuery
+    ) -> Optional[WhatsappBatchJobResponse]:
+        """
+        Obtiene el estado del job desde los mensajes del outbox con su batch_id.
+
+        Returns:
+            WhatsappBatchJobResponse o None si el job no existe o su historial ya se depuró.
+        """
+        messages = await self.outbox_repository.get_batch_messages(query.job_id)
+        if not messages:
+            return None
+
+        sent = sum(1 for message in messages if message.status == OUTBOX_SENT)
+        failed = sum(1 for message in messages if message.status == OUTBOX_DEAD)
+        pending = len(messages) - sent - failed
+
+        if pending == 0:
+            status = JOB_COMPLETED
+        elif all(
+            message.status == OUTBOX_PENDING and message.attempts == 0
+            for message in messages
+        ):
+            status = JOB_QUEUED
+        else:
+            status = JOB_RUNNING
+
+        update_dates = [message.update_date for message in messages if message.update_date]
+        results = []
+        for message in messages:
+            response = message.provider_response or {}
+            key = response.get("key") if isinstance(response, dict) else None
+            results.append(
+                WhatsappBatchJobMessage(
+                    number=message.recipient,
+                    status=message.status,
+                    attempts=message.attempts,
+                    message_id=key.get("id") if isinstance(key, dict) else None,
+                    error=message.last_error,
+                )
+            )
+
+        return WhatsappBatchJobResponse(
+            job_id=query.job_id,
+            status=status,
+            total=len(messages),
+            pending=pending,
+            sent=sent,
+            failed=failed,
+            created_at=min(message.insert_date for message in messages),
+            finished_at=max(update_dates) if status == JOB_COMPLETED and update_dates else None,
+            results=results,
+        )
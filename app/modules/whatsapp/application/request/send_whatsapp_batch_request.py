@@ -0,0 +1,87 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from config.setting import WHATSAPP_BATCH_MAX_RECIPIENTS
+
+
+class WhatsappBatchRecipientRequest(BaseModel):
+    """
+    Destinatario de un envío masivo con sus variables de plantilla.
+    """
+
+    number: str = Field(
+        ...,
+        description="Número de WhatsApp (con o sin código de país, se normaliza en el servidor)",
+        min_length=1,
+        max_length=30,
+    )
+    variables: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Variables de la plantilla para este destinatario",
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class SendWhatsappBatchRequest(BaseModel):
+    """
+    Modelo Pydantic para la solicitud de envío masivo de mensajes de WhatsApp.
+    El texto es una plantilla Jinja que se renderiza con las variables de cada destinatario.
+    """
+
+    # --- Campos del Modelo ---
+    text: str = Field(
+        ...,
+        description="Plantilla del mensaje, por ejemplo 'Hola {{ nombre }}'",
+        min_length=1,
+        max_length=4096,
+    )
+    recipients: List[WhatsappBatchRecipientRequest] = Field(
+        ...,
+        description="Destinatarios del envío",
+        min_length=1,
+        max_length=WHATSAPP_BATCH_MAX_RECIPIENTS,
+    )
+    delay: Optional[int] = Field(
+        default=None,
+        description="Tiempo de presencia en milisegundos antes de enviar cada mensaje",
+        ge=0,
+    )
+    linkPreview: Optional[bool] = Field(
+        default=True,
+        description="Muestra una vista previa del sitio web de destino si hay un enlace dentro del mensaje",
+    )
+    runAsync: bool = Field(
+        default=False,
+        description=(
+            "Si es true encola los mensajes en el outbox y responde de inmediato con un job_id; "
+            "el envío se realiza en segundo plano sin delay ni vista previa de enlaces"
+        ),
+    )
+
+    # --- Validadores de Campo ---
+    @field_validator("text")
+    def validate_text_content(cls, v: str) -> str:
+        """
+        Valida que la plantilla no esté vacía después de remover espacios en blanco.
+        """
+        if not v.strip():
+            raise ValueError("El texto del mensaje no puede estar vacío")
+        return v
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "text": "Hola {{ nombre }}, te esperamos el {{ fecha }}.",
+                "recipients": [
+                    {"number": "987654321", "variables": {"nombre": "Ana", "fecha": "15/11"}},
+                    {"number": "+51 912 345 678", "variables": {"nombre": "Luis", "fecha": "16/11"}},
+                ],
+                "delay": 1000,
+                "linkPreview": False,
+                "runAsync": False,
+            }
+        },
+        extra="forbid",
+    )
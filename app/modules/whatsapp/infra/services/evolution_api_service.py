@@ -1,17 +1,55 @@
+import asyncio
 from os import getenv
 from typing import Any, Dict, Optional
 
 import httpx
 
+from app.modules.share.infra.concurrency import (
+    BulkheadFullError,
+    CircuitOpenError,
+    get_bulkhead,
+    get_circuit_breaker,
+)
+from app.modules.share.infra.http import get_http_client
+from config.setting import (
+    EVOLUTION_BREAKER_FAILURE_THRESHOLD,
+    EVOLUTION_BREAKER_HALF_OPEN_MAX_CALLS,
+    EVOLUTION_BREAKER_RECOVERY_TIMEOUT,
+    EVOLUTION_BULKHEAD_MAX_CONCURRENT,
+    EVOLUTION_BULKHEAD_MAX_WAIT,
+    EVOLUTION_MESSAGE_TIMEOUT,
+)
+
 EVOLUTION_URL = getenv("EVOLUCION_URL", "")
 EVOLUTION_API_KEY = getenv("EVOLUCION_API_KEY", "")
 INSTANCE_NAME = getenv("INSTANCE_NAME", "")
 
+EVOLUTION_API_CIRCUIT = "evolution_api"
+
+
+def _is_service_failure(error: BaseException) -> bool:
+    """
+    Solo los timeouts, errores de conexión y respuestas 5xx indican que Evolution API
+    no está disponible; un 4xx (por ejemplo un número inválido) no abre el circuito.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, (httpx.TransportError, asyncio.TimeoutError))
+
 
 class EvolutionApiService:
     """
     Servicio para interactuar con Evolution API v2.
     Maneja el envío de mensajes de WhatsApp.
+
+    Todas las llamadas pasan por un circuit breaker y un bulkhead compartidos por el
+    proceso: con Evolution API caída se falla de inmediato y nunca hay más de
+    EVOLUTION_BULKHEAD_MAX_CONCURRENT llamadas en vuelo.
+
+    Cada llamada tiene un tope total de EVOLUTION_MESSAGE_TIMEOUT dentro del circuit
+    breaker. Quien limite el envío desde afuera debe usar EVOLUTION_CALL_DEADLINE:
+    un límite externo igual o menor cancelaría la llamada antes de que el breaker
+    registre el timeout, y el circuito nunca se abriría.
     """
 
     def __init__(self) -> None:
@@ -21,7 +59,39 @@ class EvolutionApiService:
         self.base_url = EVOLUTION_URL
         self.api_key = EVOLUTION_API_KEY
         self.instance_name = INSTANCE_NAME
-        self.timeout = 30.0
+        self.timeout = EVOLUTION_MESSAGE_TIMEOUT
+        self.circuit_breaker = get_circuit_breaker(
+            EVOLUTION_API_CIRCUIT,
+            failure_threshold=EVOLUTION_BREAKER_FAILURE_THRESHOLD,
+            recovery_timeout=EVOLUTION_BREAKER_RECOVERY_TIMEOUT,
+            half_open_max_calls=EVOLUTION_BREAKER_HALF_OPEN_MAX_CALLS,
+            is_failure=_is_service_failure,
+        )
+        self.bulkhead = get_bulkhead(
+            EVOLUTION_API_CIRCUIT,
+            max_concurrent=EVOLUTION_BULKHEAD_MAX_CONCURRENT,
+            max_wait=EVOLUTION_BULKHEAD_MAX_WAIT,
+        )
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Ejecuta la petición protegida por el circuit breaker y el bulkhead.
+        Lanza HTTPStatusError para respuestas de error, como raise_for_status().
+        """
+
+        async def call() -> httpx.Response:
+            async with self.bulkhead:
+                # Cliente compartido: reutiliza conexiones keep-alive hacia Evolution API
+                client = get_http_client(self.base_url)
+                # El timeout de httpx es por operación; wait_for acota la llamada completa
+                response = await asyncio.wait_for(
+                    client.request(method, url, timeout=self.timeout, **kwargs),
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+                return response
+
+        return await self.circuit_breaker.call(call)
 
     async def send_text_message(
         self,
@@ -60,15 +130,12 @@ class EvolutionApiService:
             payload["delay"] = delay
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url=url, json=payload, headers=headers)
+            response = await self._request("POST", url, json=payload, headers=headers)
+            return response.json()  # type: ignore[no-any-return]
 
-                # Verificar si la respuesta fue exitosa
-                response.raise_for_status()
-
-                return response.json()  # type: ignore[no-any-return]
-
-        except httpx.TimeoutException:
+        except (CircuitOpenError, BulkheadFullError):
+            raise
+        except (httpx.TimeoutException, asyncio.TimeoutError):
             raise Exception("Timeout al conectar con Evolution API")
         except httpx.HTTPStatusError as e:
             error_detail = ""
@@ -98,10 +165,10 @@ class EvolutionApiService:
         headers = {"apikey": self.api_key}
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url=url, headers=headers)
-                response.raise_for_status()
-                return response.json()  # type: ignore[no-any-return]
+            response = await self._request("GET", url, headers=headers)
+            return response.json()  # type: ignore[no-any-return]
 
+        except (CircuitOpenError, BulkheadFullError):
+            raise
         except Exception as e:
             raise Exception(f"Error al obtener estado de instancia: {str(e)}")
@@ -10,6 +10,18 @@ from app.modules.auth.presentation.dependencies.auth_dependencies import (
 from app.modules.whatsapp.application.commands.send_message.send_whatsapp_message_command_handler import (
     SendWhatsappMessageCommand,
 )
+from app.modules.whatsapp.application.commands.send_batch.send_whatsapp_batch_command_handler import (
+    SendWhatsappBatchCommand,
+    SendWhatsappBatchResponse,
+    WhatsappBatchRecipient,
+)
+from app.modules.whatsapp.application.queries.get_batch_job.get_whatsapp_batch_job_query_handler import (
+    GetWhatsappBatchJobQuery,
+    WhatsappBatchJobResponse,
+)
+from app.modules.whatsapp.application.request.send_whatsapp_batch_request import (
+    SendWhatsappBatchRequest,
+)
 from app.modules.whatsapp.application.request.send_whatsapp_message_request import (
     SendWhatsappMessageRequest,
 )
@@ -41,9 +53,27 @@ class WhatsappV2Controller:
                 },
                 400: {"description": "Error en los datos enviados"},
                 500: {"description": "Error interno del servidor"},
+                503: {"description": "Evolution API no disponible temporalmente"},
             },
         )(self.send_whatsapp_message)
 
+        self.router.post(
+            "/whatsapp/send-batch",
+            dependencies=[Depends(permission_required(roles=["admin", "staff"]))],
+            response_model=SendWhatsappBatchResponse,
+            responses={
+                200: {"description": "Resultados por destinatario, o job_id si runAsync es true"},
+                400: {"description": "Error en los datos enviados o plantilla inválida"},
+            },
+        )(self.send_whatsapp_batch)
+
+        self.router.get(
+            "/whatsapp/send-batch/{job_id}",
+            dependencies=[Depends(permission_required(roles=["admin", "staff"]))],
+            response_model=WhatsappBatchJobResponse,
+            responses={404: {"description": "Job no encontrado o expirado"}},
+        )(self.get_whatsapp_batch_job)
+
     async def send_whatsapp_message(
         self, request: SendWhatsappMessageRequest
     ) -> Dict[str, Any]:
@@ -70,7 +100,7 @@ class WhatsappV2Controller:
                 }
             else:
                 raise HTTPException(
-                    status_code=500,
+                    status_code=result.get("status_code", 500),
                     detail=result.get("message", "Error al enviar mensaje"),
                 )
 
@@ -78,3 +108,32 @@ class WhatsappV2Controller:
             raise
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error interno: {str(e)}")
+
+    async def send_whatsapp_batch(
+        self, request: SendWhatsappBatchRequest
+    ) -> SendWhatsappBatchResponse:
+        """
+        Envía un mensaje con plantilla a varios destinatarios en una sola solicitud.
+        Con runAsync=true responde de inmediato con un job_id para consultar el resultado.
+        """
+        command = SendWhatsappBatchCommand(
+            text=request.text,
+            recipients=[
+                WhatsappBatchRecipient(number=r.number, variables=r.variables)
+                for r in request.recipients
+            ],
+            delay=request.delay,
+            linkPreview=request.linkPreview,
+            runAsync=request.runAsync,
+        )
+        result: SendWhatsappBatchResponse = await self.mediator.send_async(command)
+        return result
+
+    async def get_whatsapp_batch_job(self, job_id: str) -> WhatsappBatchJobResponse:
+        """
+        Consulta el estado y el resultado de un envío masivo asíncrono.
+        """
+        result = await self.mediator.send_async(GetWhatsappBatchJobQuery(job_id=job_id))
+        if result is None:
+            raise HTTPException(status_code=404, detail="Job no encontrado o expirado")
+        return result  # type: ignore[no-any-return]
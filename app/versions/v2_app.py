@@ -5,7 +5,9 @@ from fastapi import FastAPI
 from mediatr import Mediator
 
 # Importar módulos para registrar handlers
+import app.modules.location.application.subscribers  # noqa: F401
 import app.modules.notifications  # noqa: F401
+import app.modules.reviews.application.subscribers  # noqa: F401
 from app.modules.appointment.presentation.routes.v2.appointment_v2_routes import (
     AppointmentV2Controller,
 )
@@ -24,6 +26,9 @@ from app.modules.reports.presentation.routes.v2.reports_v2_routes import (
 from app.modules.reviews.presentation.routes.v2.reviews_v2_routes import (
     ReviewsV2Controller,
 )
+from app.modules.scheduler.presentation.routes.v2.scheduler_v2_routes import (
+    SchedulerV2Controller,
+)
 from app.modules.services.presentation.routes.v2.services_v2_routes import (
     ServicesV2Controller,
 )
@@ -65,6 +70,7 @@ def create_v2_app(mediator: Optional[Mediator] = None) -> FastAPI:
     notifications_controller = NotificationsV2Controller(mediator)
     reports_controller = ReportsV2Controller(mediator)
     reviews_controller = ReviewsV2Controller(mediator)
+    scheduler_controller = SchedulerV2Controller(mediator)
 
     # Incluir rutas sin prefijo adicional ya que están montadas en /api/v2
     app.include_router(test_controller.router, tags=["Test"])
@@ -77,5 +83,6 @@ def create_v2_app(mediator: Optional[Mediator] = None) -> FastAPI:
     app.include_router(notifications_controller.router, tags=["Notifications"])
     app.include_router(reports_controller.router, tags=["Reports"])
     app.include_router(reviews_controller.router, tags=["Reviews"])
+    app.include_router(scheduler_controller.router, tags=["Scheduler"])
 
     return app
@@ -0,0 +1,83 @@
+"""
+Microbenchmark de OccupancyIndex frente a recorrer la lista de citas del día.
+
+Mide is_free y first_free en un día liviano (15 citas) y uno cargado (80 citas).
+No se ejecuta con pytest. Uso, desde la raíz del repositorio:
+
+    python -m benchmarks.day_occupancy_benchmark
+"""
+
+import random
+import timeit
+from datetime import date, datetime, time, timedelta
+from typing import Callable, List, Optional
+
+from app.modules.appointment.application.utils.day_occupancy import OccupancyIndex
+from app.modules.appointment.application.utils.interval_utils import Interval
+
+DAY = date(2026, 10, 20)
+USER = 1
+OPEN = datetime.combine(DAY, time(8))
+CLOSE = datetime.combine(DAY, time(22))
+NUMBER = 2000
+
+
+def _appointments(count: int, seed: int = 7) -> List[Interval]:
+    """Citas disjuntas de 5 a 10 minutos repartidas en la jornada."""
+    rng = random.Random(seed)
+    step = (CLOSE - OPEN) / count
+    appointments = []
+    for i in range(count):
+        start = OPEN + step * i + timedelta(minutes=rng.choice([0, 5]))
+        appointments.append((start, start + timedelta(minutes=rng.choice([5, 10]))))
+    return appointments
+
+
+def _list_is_free(appointments: List[Interval], start: datetime, end: datetime) -> bool:
+    if start < OPEN or end > CLOSE:
+        return False
+    return all(end <= a_start or start >= a_end for a_start, a_end in appointments)
+
+
+def _list_first_free(appointments: List[Interval], minutes: float) -> Optional[datetime]:
+    """Recorre los inicios cada 5 minutos, como hacía la disponibilidad con listas."""
+    duration = timedelta(minutes=minutes)
+    start = OPEN
+    while start + duration <= CLOSE:
+        if _list_is_free(appointments, start, start + duration):
+            return start
+        start += timedelta(minutes=5)
+    return None
+
+
+def _measure(label: str, statement: Callable[[], object]) -> float:
+    seconds = min(timeit.repeat(statement, number=NUMBER, repeat=5)) / NUMBER
+    print(f"  {label:<28} {seconds * 1e6:8.1f} us")
+    return seconds
+
+
+def run(count: int) -> None:
+    appointments = sorted(_appointments(count))
+    index = OccupancyIndex.build(
+        opening=[(OPEN, CLOSE)],
+        shifts={USER: [(OPEN, CLOSE)]},
+        days_off={},
+        appointments={USER: appointments},
+    )
+    probe_start = datetime.combine(DAY, time(15, 2))
+    probe_end = probe_start + timedelta(minutes=40)
+
+    assert index.is_free(USER, probe_start, probe_end) == _list_is_free(
+        appointments, probe_start, probe_end
+    )
+
+    print(f"{count} citas")
+    _measure("is_free (índice)", lambda: index.is_free(USER, probe_start, probe_end))
+    _measure("is_free (lista)", lambda: _list_is_free(appointments, probe_start, probe_end))
+    _measure("first_free 30 min (índice)", lambda: index.first_free(USER, DAY, 30))
+    _measure("first_free 30 min (lista)", lambda: _list_first_free(appointments, 30))
+
+
+if __name__ == "__main__":
+    for appointment_count in (15, 80):
+        run(appointment_count)
@@ -38,10 +38,124 @@ SMTP_PASSWORD = getenv("SMTP_PASSWORD", "")  # La que generaste
 SMTP_FROM_EMAIL = getenv("SMTP_FROM_EMAIL", "")  # Mismo correo
 SMTP_FROM_NAME = getenv("SMTP_FROM_NAME", "")
 SMTP_USE_SSL = getenv("SMTP_USE_SSL", "").lower() == "true"  # Usar false (STARTTLS)
+SMTP_TIMEOUT = float(getenv("SMTP_TIMEOUT", "30") or "30")
+SMTP_POOL_SIZE = int(getenv("SMTP_POOL_SIZE", "2") or "2")  # Sesiones SMTP reutilizables
+SMTP_IDLE_TIMEOUT = float(getenv("SMTP_IDLE_TIMEOUT", "60") or "60")  # Segundos antes de descartar una sesión ociosa
 
 # URL base para los enlaces de review
 REVIEW_BASE_URL = getenv("REVIEW_BASE_URL", "")
 
+# Campaña masiva de emails de review: máximo de reviews por ejecución y correos por sesión SMTP
+REVIEW_CAMPAIGN_LIMIT = int(getenv("REVIEW_CAMPAIGN_LIMIT", "500") or "500")
+REVIEW_CAMPAIGN_BATCH_SIZE = int(getenv("REVIEW_CAMPAIGN_BATCH_SIZE", "25") or "25")
+REVIEW_CAMPAIGN_LEASE_SECONDS = int(getenv("REVIEW_CAMPAIGN_LEASE_SECONDS", "3600") or "3600")  # Reclamo de los reviews de una campaña en curso
+
+# Estados de cita (maintable_id, separados por coma) cuyo cambio dispara el proceso de
+# review al actualizar una cita. Vacío: cualquier cambio de estado
+REVIEW_TRIGGER_STATUS_IDS = frozenset(
+    int(status_id) for status_id in getenv("REVIEW_TRIGGER_STATUS_IDS", "").split(",") if status_id.strip()
+)
+
 # Configuración CORS - URLs separadas por coma
 # Ejemplo: "http://localhost:3000,http://localhost:8000,https://midominio.com"
 CORS_ORIGINS = getenv("CORS_ORIGINS", "")
+
+# Configuración del executor compartido para trabajo bloqueante / CPU intensivo
+# EXECUTOR_PROCESS_WORKERS=0 usa os.cpu_count()
+EXECUTOR_THREAD_WORKERS = int(getenv("EXECUTOR_THREAD_WORKERS", "8") or "8")
+EXECUTOR_PROCESS_WORKERS = int(getenv("EXECUTOR_PROCESS_WORKERS", "2") or "2")
+EXECUTOR_DEFAULT_TIMEOUT = float(getenv("EXECUTOR_DEFAULT_TIMEOUT", "120") or "120")
+
+# Bus de eventos de dominio: suscriptores simultáneos y espera máxima al apagar (segundos)
+DOMAIN_EVENTS_MAX_CONCURRENCY = int(getenv("DOMAIN_EVENTS_MAX_CONCURRENCY", "20") or "20")
+DOMAIN_EVENTS_SHUTDOWN_TIMEOUT = float(getenv("DOMAIN_EVENTS_SHUTDOWN_TIMEOUT", "10") or "10")
+
+# Configuración del cliente HTTP compartido para integraciones salientes
+HTTP_CLIENT_TIMEOUT = float(getenv("HTTP_CLIENT_TIMEOUT", "30") or "30")
+HTTP_CLIENT_CONNECT_TIMEOUT = float(getenv("HTTP_CLIENT_CONNECT_TIMEOUT", "10") or "10")
+HTTP_CLIENT_MAX_CONNECTIONS = int(getenv("HTTP_CLIENT_MAX_CONNECTIONS", "100") or "100")
+HTTP_CLIENT_MAX_KEEPALIVE = int(getenv("HTTP_CLIENT_MAX_KEEPALIVE", "20") or "20")
+HTTP_CLIENT_KEEPALIVE_EXPIRY = float(getenv("HTTP_CLIENT_KEEPALIVE_EXPIRY", "30") or "30")
+HTTP_CLIENT_HTTP2 = getenv("HTTP_CLIENT_HTTP2", "true").lower() == "true"
+
+# Límites de envío hacia Evolution API (recordatorios masivos)
+EVOLUTION_MAX_CONCURRENCY = int(getenv("EVOLUTION_MAX_CONCURRENCY", "5") or "5")
+EVOLUTION_RATE_PER_SECOND = float(getenv("EVOLUTION_RATE_PER_SECOND", "5") or "5")
+EVOLUTION_RATE_BURST = int(getenv("EVOLUTION_RATE_BURST", "10") or "10")
+EVOLUTION_MESSAGE_TIMEOUT = float(getenv("EVOLUTION_MESSAGE_TIMEOUT", "30") or "30")
+
+# Circuit breaker y bulkhead de Evolution API: con el servicio caído se falla rápido
+# en lugar de esperar el timeout completo en cada mensaje
+EVOLUTION_BREAKER_FAILURE_THRESHOLD = int(getenv("EVOLUTION_BREAKER_FAILURE_THRESHOLD", "5") or "5")
+EVOLUTION_BREAKER_RECOVERY_TIMEOUT = float(getenv("EVOLUTION_BREAKER_RECOVERY_TIMEOUT", "30") or "30")
+EVOLUTION_BREAKER_HALF_OPEN_MAX_CALLS = int(getenv("EVOLUTION_BREAKER_HALF_OPEN_MAX_CALLS", "1") or "1")
+EVOLUTION_BULKHEAD_MAX_CONCURRENT = int(getenv("EVOLUTION_BULKHEAD_MAX_CONCURRENT", "10") or "10")
+EVOLUTION_BULKHEAD_MAX_WAIT = float(getenv("EVOLUTION_BULKHEAD_MAX_WAIT", "5") or "5")
+# Límite externo de cada envío: cubre la espera del bulkhead más el timeout de la
+# llamada, para que el timeout interno venza primero y lo cuente el circuit breaker
+EVOLUTION_CALL_DEADLINE = EVOLUTION_BULKHEAD_MAX_WAIT + EVOLUTION_MESSAGE_TIMEOUT + 5
+
+# Envío masivo de WhatsApp (POST /whatsapp/send-batch)
+WHATSAPP_BATCH_MAX_RECIPIENTS = int(getenv("WHATSAPP_BATCH_MAX_RECIPIENTS", "1000") or "1000")
+WHATSAPP_DEFAULT_COUNTRY_CODE = getenv("WHATSAPP_DEFAULT_COUNTRY_CODE", "51")  # Se antepone a números locales de 9 dígitos
+
+# Tamaño de página al recorrer las citas para enviar recordatorios
+NOTIFICATIONS_CHUNK_SIZE = int(getenv("NOTIFICATIONS_CHUNK_SIZE", "100") or "100")
+
+# Outbox de notificaciones (envíos durables con reintentos)
+NOTIFICATIONS_OUTBOX_ENABLED = getenv("NOTIFICATIONS_OUTBOX_ENABLED", "true").lower() == "true"
+NOTIFICATIONS_OUTBOX_WORKER_ENABLED = (
+    getenv("NOTIFICATIONS_OUTBOX_WORKER_ENABLED", "true").lower() == "true"
+)
+NOTIFICATIONS_OUTBOX_BATCH_SIZE = int(getenv("NOTIFICATIONS_OUTBOX_BATCH_SIZE", "20") or "20")
+NOTIFICATIONS_OUTBOX_POLL_INTERVAL = float(getenv("NOTIFICATIONS_OUTBOX_POLL_INTERVAL", "5") or "5")
+NOTIFICATIONS_OUTBOX_LEASE_SECONDS = int(getenv("NOTIFICATIONS_OUTBOX_LEASE_SECONDS", "120") or "120")
+NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS = int(getenv("NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS", "5") or "5")
+NOTIFICATIONS_OUTBOX_BACKOFF_BASE = float(getenv("NOTIFICATIONS_OUTBOX_BACKOFF_BASE", "30") or "30")
+NOTIFICATIONS_OUTBOX_BACKOFF_MAX = float(getenv("NOTIFICATIONS_OUTBOX_BACKOFF_MAX", "3600") or "3600")
+
+# Días de historial del outbox y del ledger que conserva la depuración periódica
+NOTIFICATIONS_HISTORY_RETENTION_DAYS = int(getenv("NOTIFICATIONS_HISTORY_RETENTION_DAYS", "90") or "90")
+
+# Plantillas de mensajes (email / WhatsApp)
+# Directorio opcional con plantillas que reemplazan a las del repositorio sin necesidad de deploy.
+# Las plantillas por sede se ubican en <dir>/locations/<location_id>/<nombre_plantilla>
+MESSAGE_TEMPLATES_OVERRIDE_DIR = getenv("MESSAGE_TEMPLATES_OVERRIDE_DIR", "")
+
+# Segundos que se reutiliza el estado del workflow de N8N antes de volver a consultarlo
+N8N_STATUS_CACHE_TTL = float(getenv("N8N_STATUS_CACHE_TTL", "15") or "15")
+
+# Scheduler interno de jobs periódicos (reemplaza los disparos HTTP desde N8N).
+# SCHEDULER_ENABLED activa los jobs que hoy dispara N8N (recordatorios, campaña de
+# reviews, limpieza); está desactivado por defecto para no duplicar los envíos mientras
+# N8N siga programado. La materialización de series no tiene equivalente en N8N y tiene
+# su propio interruptor, activo por defecto: sin ella las series de citas no se
+# extienden más allá del horizonte inicial.
+# Una expresión cron vacía (o intervalo 0) desactiva ese job.
+SCHEDULER_ENABLED = getenv("SCHEDULER_ENABLED", "false").lower() == "true"
+SCHEDULER_SERIES_ENABLED = getenv("SCHEDULER_SERIES_ENABLED", "true").lower() == "true"
+SCHEDULER_TIMEZONE = getenv("SCHEDULER_TIMEZONE", "America/Lima")
+SCHEDULER_JOB_TIMEOUT = float(getenv("SCHEDULER_JOB_TIMEOUT", "1800") or "1800")
+SCHEDULER_REMINDERS_CRON = getenv("SCHEDULER_REMINDERS_CRON", "0 9 * * *")  # Recordatorios de las citas del día siguiente
+SCHEDULER_REVIEW_CAMPAIGN_CRON = getenv("SCHEDULER_REVIEW_CAMPAIGN_CRON", "0 10 * * *")
+SCHEDULER_REVIEW_DAYS_AFTER = int(getenv("SCHEDULER_REVIEW_DAYS_AFTER", "7") or "7")
+SCHEDULER_HOUSEKEEPING_INTERVAL = float(getenv("SCHEDULER_HOUSEKEEPING_INTERVAL", "21600") or "21600")  # Segundos
+SCHEDULER_SERIES_INTERVAL = float(getenv("SCHEDULER_SERIES_INTERVAL", "3600") or "3600")  # Segundos entre materializaciones de series
+
+# Motor de disponibilidad de citas
+AVAILABILITY_SLOT_STEP_MINUTES = int(getenv("AVAILABILITY_SLOT_STEP_MINUTES", "15") or "15")  # Separación entre inicios de slots
+AVAILABILITY_MAX_RANGE_DAYS = int(getenv("AVAILABILITY_MAX_RANGE_DAYS", "31") or "31")
+AVAILABILITY_TIMEZONE = getenv("AVAILABILITY_TIMEZONE", "America/Lima")  # Hora local en la que se interpretan horarios y citas
+AVAILABILITY_NEXT_MAX_DAYS = int(getenv("AVAILABILITY_NEXT_MAX_DAYS", "60") or "60")  # Horizonte de la búsqueda del próximo horario libre
+AVAILABILITY_NEXT_CHUNK_DAYS = int(getenv("AVAILABILITY_NEXT_CHUNK_DAYS", "7") or "7")  # Días que se cargan por consulta durante esa búsqueda
+
+# Máximo de citas por solicitud en POST /appointments/batch
+APPOINTMENTS_BATCH_MAX_ITEMS = int(getenv("APPOINTMENTS_BATCH_MAX_ITEMS", "100") or "100")
+
+# Series de citas repetidas: días hacia adelante en que se crean sus citas
+APPOINTMENT_SERIES_HORIZON_DAYS = int(getenv("APPOINTMENT_SERIES_HORIZON_DAYS", "56") or "56")
+APPOINTMENT_SERIES_MATERIALIZE_BATCH = int(getenv("APPOINTMENT_SERIES_MATERIALIZE_BATCH", "100") or "100")  # Series por ejecución del job
+
+# Calendario de sede: segundos que se reutiliza la respuesta y rango máximo consultable
+LOCATION_CALENDAR_CACHE_TTL = float(getenv("LOCATION_CALENDAR_CACHE_TTL", "30") or "30")
+LOCATION_CALENDAR_MAX_RANGE_DAYS = int(getenv("LOCATION_CALENDAR_MAX_RANGE_DAYS", "42") or "42")
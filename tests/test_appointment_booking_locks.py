@@ -0,0 +1,175 @@
+"""
+Prueba de concurrencia de los advisory locks de agenda contra un Postgres real.
+Se omite si TEST_DATABASE_URL no está definida. Usa una tabla propia que se crea y
+elimina en cada prueba, así que no necesita el esquema de la aplicación.
+"""
+
+import asyncio
+import os
+import random
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Awaitable, Callable, List, Tuple
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.constants import uow_var
+from app.modules.appointment.application.utils.appointment_validation_utils import (
+    AppointmentValidationUtils,
+)
+from app.modules.appointment.infra.repositories.appointment_implementation_repository import (
+    AppointmentImplementationRepository,
+)
+from app.modules.share.infra.persistence.unit_of_work import UnitOfWork
+
+DATABASE_URL = os.getenv("TEST_DATABASE_URL", "")
+
+pytestmark = pytest.mark.skipif(
+    not DATABASE_URL, reason="TEST_DATABASE_URL no está definida"
+)
+
+CONCURRENT_BOOKINGS = 20
+DAY = datetime(2026, 10, 20)
+
+
+def _engine() -> AsyncEngine:
+    url = DATABASE_URL
+    if url.startswith("postgresql://"):
+        url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return create_async_engine(url, pool_size=CONCURRENT_BOOKINGS, max_overflow=0)
+
+
+class Bookings:
+    """Reservas sobre una tabla temporal con la misma validación que las citas."""
+
+    def __init__(self, engine: AsyncEngine, table: str) -> None:
+        self.table = table
+        self._sessions = async_sessionmaker(bind=engine, expire_on_commit=False)
+        self.repository = AppointmentImplementationRepository()
+
+    async def _session(self) -> AsyncSession:
+        return self._sessions()
+
+    async def book(
+        self, slots: List[Tuple[int, datetime, datetime]], lock: bool = True
+    ) -> bool:
+        """Reserva todos los horarios o ninguno. Devuelve False si alguno choca."""
+        async with UnitOfWork(session_factory=self._session) as uow:
+            token = uow_var.set(uow)
+            try:
+                if lock:
+                    await AppointmentValidationUtils.lock_staff_schedules(self.repository, slots)
+                for user_id, start, end in slots:
+                    conflict = await uow.session.execute(
+                        text(
+                            f"SELECT 1 FROM {self.table} WHERE user_id = :user_id "
+                            "AND start_datetime < :end AND end_datetime > :start"
+                        ),
+                        {"user_id": user_id, "start": start, "end": end},
+                    )
+                    if conflict.first() is not None:
+                        return False
+                # Ensancha la ventana entre la validación y la escritura
+                await asyncio.sleep(0.01)
+                for user_id, start, end in slots:
+                    await uow.session.execute(
+                        text(
+                            f"INSERT INTO {self.table} (user_id, start_datetime, end_datetime) "
+                            "VALUES (:user_id, :start, :end)"
+                        ),
+                        {"user_id": user_id, "start": start, "end": end},
+                    )
+                return True
+            finally:
+                uow_var.reset(token)
+
+    async def count(self) -> int:
+        async with self._sessions() as session:
+            result = await session.execute(text(f"SELECT COUNT(*) FROM {self.table}"))
+            return int(result.scalar_one())
+
+
+@asynccontextmanager
+async def _with_bookings() -> AsyncIterator[Bookings]:
+    engine = _engine()
+    table = f"booking_lock_test_{uuid.uuid4().hex[:8]}"
+    async with engine.begin() as connection:
+        await connection.execute(
+            text(
+                f"CREATE TABLE {table} (id SERIAL PRIMARY KEY, user_id INTEGER NOT NULL, "
+                "start_datetime TIMESTAMP NOT NULL, end_datetime TIMESTAMP NOT NULL)"
+            )
+        )
+    try:
+        yield Bookings(engine, table)
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        await engine.dispose()
+
+
+def _run(scenario: Callable[[Bookings], Awaitable[None]]) -> None:
+    async def main() -> None:
+        async with _with_bookings() as bookings:
+            await scenario(bookings)
+
+    asyncio.run(main())
+
+
+def _staff_id() -> int:
+    # Un empleado distinto por prueba: los advisory locks son globales a la base
+    return random.randint(10**6, 10**9)
+
+
+def test_concurrent_overlapping_bookings_only_one_wins() -> None:
+    async def scenario(bookings: Bookings) -> None:
+        user_id = _staff_id()
+        # Horarios desplazados entre sí que comparten el tramo 9:40-10:00
+        slots = [
+            [(user_id, DAY + timedelta(hours=9, minutes=2 * i), DAY + timedelta(hours=10, minutes=2 * i))]
+            for i in range(CONCURRENT_BOOKINGS)
+        ]
+        results = await asyncio.gather(*(bookings.book(slot) for slot in slots))
+        assert sum(results) == 1
+        assert await bookings.count() == 1
+
+    _run(scenario)
+
+
+def test_without_lock_the_race_double_books() -> None:
+    # Control: sin el lock la misma carga produce reservas duplicadas
+    async def scenario(bookings: Bookings) -> None:
+        user_id = _staff_id()
+        slot = [(user_id, DAY + timedelta(hours=9), DAY + timedelta(hours=10))]
+        results = await asyncio.gather(
+            *(bookings.book(slot, lock=False) for _ in range(CONCURRENT_BOOKINGS))
+        )
+        assert sum(results) > 1
+
+    _run(scenario)
+
+
+def test_multi_staff_multi_day_bookings_do_not_deadlock() -> None:
+    # Cada reserva toma los mismos pares empleado-día listados en distinto orden;
+    # lock_staff_schedules los ordena, así que ninguna transacción espera a otra en ciclo
+    async def scenario(bookings: Bookings) -> None:
+        first, second = _staff_id(), _staff_id()
+        overnight = (DAY + timedelta(hours=22), DAY + timedelta(days=1, hours=2))
+        forward = [(first, *overnight), (second, *overnight)]
+        backward = [(second, *overnight), (first, *overnight)]
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(
+                    bookings.book(forward if i % 2 else backward)
+                    for i in range(CONCURRENT_BOOKINGS)
+                )
+            ),
+            timeout=30,
+        )
+        assert sum(results) == 1
+        assert await bookings.count() == 2
+
+    _run(scenario)
@@ -0,0 +1,87 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Optional
+
+import pytest
+
+from app.modules.appointment.domain.events import AppointmentUpdatedEvent
+from app.modules.reviews.application.commands.process_appointment_for_review.process_appointment_for_review_handler import (
+    ProcessAppointmentForReviewResponse,
+)
+from app.modules.reviews.application.subscribers import appointment_review_subscriber
+
+
+class FakeMediator:
+    def __init__(self) -> None:
+        self.commands: List[Any] = []
+
+    async def send_async(self, command: Any) -> ProcessAppointmentForReviewResponse:
+        self.commands.append(command)
+        return ProcessAppointmentForReviewResponse(
+            success=True,
+            action="created",
+            review_id=1,
+            token=None,
+            customer_email=None,
+            customer_name=None,
+            message="ok",
+            should_send_email=False,
+        )
+
+
+@pytest.fixture
+def mediator(monkeypatch: pytest.MonkeyPatch) -> FakeMediator:
+    fake = FakeMediator()
+
+    @asynccontextmanager
+    async def fake_scope() -> AsyncIterator[None]:
+        yield None
+
+    monkeypatch.setattr(appointment_review_subscriber, "unit_of_work_scope", fake_scope)
+    monkeypatch.setattr(
+        appointment_review_subscriber.MediatorManager, "get_instance", staticmethod(lambda: fake)
+    )
+    monkeypatch.setattr(appointment_review_subscriber, "SCHEDULER_REVIEW_DAYS_AFTER", 3)
+    monkeypatch.setattr(appointment_review_subscriber, "REVIEW_TRIGGER_STATUS_IDS", frozenset())
+    return fake
+
+
+def _event(status: int, previous: Optional[int]) -> AppointmentUpdatedEvent:
+    return AppointmentUpdatedEvent(
+        appointment_id=10,
+        location_id=1,
+        user_id=2,
+        service_id=3,
+        customer_id=4,
+        status_maintable_id=status,
+        start_datetime=datetime(2026, 10, 19, 9, 0),
+        end_datetime=datetime(2026, 10, 19, 10, 0),
+        user_modify="tester",
+        previous_status_maintable_id=previous,
+    )
+
+
+def _handle(event: AppointmentUpdatedEvent) -> None:
+    asyncio.run(appointment_review_subscriber.process_updated_appointment_for_review(event))
+
+
+def test_status_change_is_processed_with_configured_days(mediator: FakeMediator) -> None:
+    _handle(_event(status=2, previous=1))
+    assert len(mediator.commands) == 1
+    assert mediator.commands[0].appointment_id == 10
+    assert mediator.commands[0].days_after == 3
+
+
+def test_update_without_status_change_is_ignored(mediator: FakeMediator) -> None:
+    _handle(_event(status=2, previous=2))
+    assert mediator.commands == []
+
+
+def test_only_configured_statuses_trigger(
+    mediator: FakeMediator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(appointment_review_subscriber, "REVIEW_TRIGGER_STATUS_IDS", frozenset({5}))
+    _handle(_event(status=2, previous=1))
+    _handle(_event(status=5, previous=1))
+    assert [command.appointment_id for command in mediator.commands] == [10]
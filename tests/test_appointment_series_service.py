@@ -0,0 +1,134 @@
+import asyncio
+from datetime import date, time, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+
+from app.constants import injector_var
+from app.modules.appointment.application.services import appointment_series_service
+from app.modules.appointment.application.services.appointment_series_service import (
+    AppointmentSeriesService,
+)
+from app.modules.appointment.domain.entities.appointment_domain import NewAppointmentEntity
+from app.modules.appointment.domain.entities.appointment_series_domain import (
+    AppointmentSeriesEntity,
+    RecurrenceFrequency,
+    SeriesOccurrenceEntity,
+)
+from app.modules.appointment.domain.repositories.appointment_repository import (
+    AppointmentRepository,
+)
+from app.modules.appointment.domain.repositories.appointment_series_repository import (
+    AppointmentSeriesRepository,
+)
+
+
+class FakeAppointmentRepository:
+    def __init__(self) -> None:
+        self.created: List[NewAppointmentEntity] = []
+
+    async def lock_staff_day(self, user_id: int, day: date) -> None:
+        pass
+
+    async def find_overlapping_appointments_bulk(
+        self, appointments: List[NewAppointmentEntity]
+    ) -> Dict[int, Any]:
+        return {}
+
+    async def create_appointments_bulk(
+        self, appointments: List[NewAppointmentEntity], user_create: str
+    ) -> List[int]:
+        first_id = len(self.created) + 1
+        self.created.extend(appointments)
+        return list(range(first_id, first_id + len(appointments)))
+
+
+class FakeSeriesRepository:
+    def __init__(self) -> None:
+        self.materialized_until: Dict[int, date] = {}
+        self.truncated: List[date] = []
+
+    async def truncate_series(self, series_id: int, from_date: date, user_modify: str) -> List[int]:
+        self.truncated.append(from_date)
+        return []
+
+    async def register_occurrences(
+        self, series_id: int, occurrences: List[SeriesOccurrenceEntity], materialized_until: date
+    ) -> None:
+        self.materialized_until[series_id] = materialized_until
+
+
+class FakeInjector:
+    def __init__(self, bindings: Dict[Any, Any]) -> None:
+        self.bindings = bindings
+
+    def get(self, interface: Any) -> Any:
+        return self.bindings[interface]
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> Iterator[AppointmentSeriesService]:
+    monkeypatch.setattr(appointment_series_service, "publish_event", lambda event: None)
+    token = injector_var.set(
+        FakeInjector(  # type: ignore[arg-type]
+            {
+                AppointmentRepository: FakeAppointmentRepository(),
+                AppointmentSeriesRepository: FakeSeriesRepository(),
+            }
+        )
+    )
+    try:
+        yield AppointmentSeriesService()
+    finally:
+        injector_var.reset(token)
+
+
+def _daily_series(start_date: date, materialized_until: Optional[date]) -> AppointmentSeriesEntity:
+    return AppointmentSeriesEntity(
+        series_id=1,
+        location_id=1,
+        user_id=1,
+        service_id=1,
+        customer_id=1,
+        status_maintable_id=1,
+        frequency=RecurrenceFrequency.DAILY,
+        repeat_interval=1,
+        start_date=start_date,
+        start_time=time(10),
+        duration_minutes=30,
+        until_date=None,
+        materialized_until=materialized_until,
+    )
+
+
+@pytest.mark.parametrize("materialized_ago", [None, 10])
+def test_materialize_never_backfills_past_days(
+    service: AppointmentSeriesService, materialized_ago: Optional[int]
+) -> None:
+    today = service.today()
+    series = _daily_series(
+        start_date=today - timedelta(days=20),
+        materialized_until=None if materialized_ago is None else today - timedelta(days=materialized_ago),
+    )
+
+    [materialization] = asyncio.run(
+        service.materialize([series], today + timedelta(days=3), "tester")
+    )
+
+    assert [o.occurrence_date for o in materialization.occurrences] == [
+        today + timedelta(days=offset) for offset in range(4)
+    ]
+    assert materialization.materialized_until == today + timedelta(days=3)
+    created = service.appointment_repository.created  # type: ignore[attr-defined]
+    assert min(a.start_datetime.date() for a in created) == today
+
+
+def test_truncate_rejects_past_dates(service: AppointmentSeriesService) -> None:
+    today = service.today()
+    series = _daily_series(start_date=today - timedelta(days=20), materialized_until=today)
+
+    with pytest.raises(ValueError, match="ya pasó"):
+        asyncio.run(service.truncate(series, today - timedelta(days=1), "tester"))
+    asyncio.run(service.truncate(series, today, "tester"))
+
+    assert service.series_repository.truncated == [today]  # type: ignore[attr-defined]
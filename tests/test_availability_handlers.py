@@ -0,0 +1,279 @@
+import asyncio
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+
+from app.constants import injector_var
+from app.modules.appointment.application.queries.get_availability.get_availability_handler import (
+    GetAvailabilityQuery,
+    GetAvailabilityQueryHandler,
+)
+from app.modules.appointment.application.queries.get_next_available.get_next_available_handler import (
+    GetNextAvailableQuery,
+    GetNextAvailableQueryHandler,
+)
+from app.modules.appointment.domain.entities.appointment_domain import BusyIntervalEntity
+from app.modules.appointment.domain.repositories.appointment_repository import (
+    AppointmentRepository,
+)
+from app.modules.location.domain.entities.location_domain import (
+    DayOfWeek,
+    ScheduleRangeDomain,
+    ScheduleRequestDomain,
+)
+from app.modules.location.domain.repositories.location_repository import (
+    LocationRepository,
+)
+from app.modules.services.domain.repositories.service_repository import (
+    ServiceRepository,
+)
+from app.modules.share.domain.repositories.repository_types import ResponseListRefactor
+from app.modules.user_locations.domain.entities.user_locations_domain import (
+    UserLocationScheduleEntity,
+    UserShiftEntity,
+)
+from app.modules.user_locations.domain.repositories.user_locations_repository import (
+    UserLocationsRepository,
+)
+
+LOCATION_ID = 1
+SERVICE_ID = 7
+MONDAY = date(2026, 10, 19)
+
+
+def _at(day: date, hour: int, minute: int = 0) -> datetime:
+    return datetime(day.year, day.month, day.day, hour, minute)
+
+
+def _shift(shift_id: int, start: datetime, end: datetime, sede_id: int = LOCATION_ID) -> UserShiftEntity:
+    return UserShiftEntity(shift_id=shift_id, start_time=start, end_time=end, sede_id=sede_id)
+
+
+class FakeLocationRepository:
+    def __init__(self, schedules: List[ScheduleRequestDomain]) -> None:
+        self.schedules = schedules
+
+    async def find_location_by_id(self, location_id: int) -> Any:
+        return SimpleNamespace(schedules=self.schedules)
+
+
+class FakeServiceRepository:
+    async def find_services_by_location_v2(self, **kwargs: Any) -> ResponseListRefactor[Any]:
+        service = SimpleNamespace(service_id=SERVICE_ID, duration_minutes=30)
+        return ResponseListRefactor(data=[service], total_items=1)
+
+
+class FakeUserLocationsRepository:
+    def __init__(self, users: List[UserLocationScheduleEntity]) -> None:
+        self.users = users
+
+    async def get_user_by_location(
+        self, sede_id: int, start_date: date, end_date: date
+    ) -> List[UserLocationScheduleEntity]:
+        return [
+            UserLocationScheduleEntity(
+                user_id=user.user_id,
+                user_name=user.user_name,
+                email=user.email,
+                shifts=[s for s in user.shifts if start_date <= s.start_time.date() <= end_date],
+            )
+            for user in self.users
+        ]
+
+
+class FakeAppointmentRepository:
+    def __init__(self, busy: List[BusyIntervalEntity]) -> None:
+        self.busy = busy
+        self.queries: List[Tuple[List[int], datetime, datetime]] = []
+
+    async def find_busy_intervals(
+        self, user_ids: List[int], start_datetime: datetime, end_datetime: datetime
+    ) -> List[BusyIntervalEntity]:
+        self.queries.append((user_ids, start_datetime, end_datetime))
+        return [
+            b
+            for b in self.busy
+            if b.user_id in user_ids
+            and b.start_datetime < end_datetime
+            and b.end_datetime > start_datetime
+        ]
+
+
+class FakeInjector:
+    def __init__(self, bindings: Dict[Any, Any]) -> None:
+        self.bindings = bindings
+
+    def get(self, interface: Any) -> Any:
+        return self.bindings[interface]
+
+
+def _every_day(start: str, end: str) -> List[ScheduleRequestDomain]:
+    return [
+        ScheduleRequestDomain(day=day, ranges=[ScheduleRangeDomain(start=start, end=end)])
+        for day in DayOfWeek
+    ]
+
+
+@pytest.fixture
+def install() -> Iterator[Any]:
+    tokens = []
+
+    def _install(
+        schedules: List[ScheduleRequestDomain],
+        users: List[UserLocationScheduleEntity],
+        busy: Optional[List[BusyIntervalEntity]] = None,
+    ) -> FakeAppointmentRepository:
+        appointments = FakeAppointmentRepository(busy or [])
+        tokens.append(
+            injector_var.set(
+                FakeInjector(  # type: ignore[arg-type]
+                    {
+                        AppointmentRepository: appointments,
+                        LocationRepository: FakeLocationRepository(schedules),
+                        ServiceRepository: FakeServiceRepository(),
+                        UserLocationsRepository: FakeUserLocationsRepository(users),
+                    }
+                )
+            )
+        )
+        return appointments
+
+    yield _install
+    for token in reversed(tokens):
+        injector_var.reset(token)
+
+
+def _availability(user_id: Optional[int] = None) -> Dict[int, List[Tuple[datetime, datetime]]]:
+    query = GetAvailabilityQuery(
+        location_id=LOCATION_ID,
+        service_id=SERVICE_ID,
+        start_date=MONDAY,
+        end_date=MONDAY + timedelta(days=1),
+        user_id=user_id,
+        step_minutes=30,
+    )
+    response = asyncio.run(GetAvailabilityQueryHandler().handle(query))
+    return {s.user_id: [(slot.start, slot.end) for slot in s.slots] for s in response.staff}
+
+
+def test_availability_splits_free_time_around_appointments(install: Any) -> None:
+    ana = UserLocationScheduleEntity(
+        user_id=1,
+        user_name="Ana",
+        email="a@x",
+        shifts=[_shift(1, _at(MONDAY, 9), _at(MONDAY, 11))],
+    )
+    install(
+        _every_day("08:00", "20:00"),
+        [ana],
+        [BusyIntervalEntity(1, 1, _at(MONDAY, 9, 30), _at(MONDAY, 10))],
+    )
+
+    assert _availability() == {
+        1: [
+            (_at(MONDAY, 9), _at(MONDAY, 9, 30)),
+            (_at(MONDAY, 10), _at(MONDAY, 10, 30)),
+            (_at(MONDAY, 10, 30), _at(MONDAY, 11)),
+        ]
+    }
+
+
+def test_availability_clips_shifts_to_opening_hours(install: Any) -> None:
+    ana = UserLocationScheduleEntity(
+        user_id=1,
+        user_name="Ana",
+        email="a@x",
+        shifts=[_shift(1, _at(MONDAY, 7), _at(MONDAY, 11))],
+    )
+    install(
+        [
+            ScheduleRequestDomain(
+                day=DayOfWeek.LUNES,
+                ranges=[
+                    ScheduleRangeDomain(start="09:00", end="09:30"),
+                    ScheduleRangeDomain(start="10:00", end="12:00"),
+                ],
+            )
+        ],
+        [ana],
+    )
+
+    assert _availability() == {
+        1: [
+            (_at(MONDAY, 9), _at(MONDAY, 9, 30)),
+            (_at(MONDAY, 10), _at(MONDAY, 10, 30)),
+            (_at(MONDAY, 10, 30), _at(MONDAY, 11)),
+        ]
+    }
+
+
+def test_availability_ignores_shifts_at_other_locations(install: Any) -> None:
+    tuesday = MONDAY + timedelta(days=1)
+    beto = UserLocationScheduleEntity(
+        user_id=2,
+        user_name="Beto",
+        email="b@x",
+        shifts=[_shift(2, _at(tuesday, 9), _at(tuesday, 10), sede_id=LOCATION_ID + 1)],
+    )
+    install(_every_day("08:00", "20:00"), [beto])
+
+    assert _availability() == {2: []}
+
+
+def test_next_available_skips_days_without_shift(install: Any) -> None:
+    later = MONDAY + timedelta(days=9)
+    ana = UserLocationScheduleEntity(
+        user_id=1,
+        user_name="Ana",
+        email="a@x",
+        shifts=[_shift(1, _at(later, 15), _at(later, 16))],
+    )
+    appointments = install(_every_day("08:00", "20:00"), [ana])
+
+    query = GetNextAvailableQuery(
+        location_id=LOCATION_ID, service_id=SERVICE_ID, after=_at(MONDAY, 8), limit=2
+    )
+    response = asyncio.run(GetNextAvailableQueryHandler().handle(query))
+
+    assert [(s.user_id, s.start) for s in response.slots] == [
+        (1, _at(later, 15)),
+        (1, _at(later, 15, 15)),
+    ]
+    # Un bloque de días sin resultados y el siguiente, donde se completa la búsqueda
+    assert [start.date() for _, start, _ in appointments.queries] == [
+        MONDAY,
+        MONDAY + timedelta(days=7),
+    ]
+
+
+def test_next_available_starts_after_requested_time(install: Any) -> None:
+    ana = UserLocationScheduleEntity(
+        user_id=1,
+        user_name="Ana",
+        email="a@x",
+        shifts=[_shift(1, _at(MONDAY, 9), _at(MONDAY, 12))],
+    )
+    beto = UserLocationScheduleEntity(
+        user_id=2,
+        user_name="Beto",
+        email="b@x",
+        shifts=[_shift(2, _at(MONDAY, 10), _at(MONDAY, 12))],
+    )
+    install(
+        _every_day("08:00", "20:00"),
+        [ana, beto],
+        [BusyIntervalEntity(1, 1, _at(MONDAY, 10), _at(MONDAY, 11, 30))],
+    )
+
+    query = GetNextAvailableQuery(
+        location_id=LOCATION_ID, service_id=SERVICE_ID, after=_at(MONDAY, 9, 40), limit=3
+    )
+    response = asyncio.run(GetNextAvailableQueryHandler().handle(query))
+
+    assert [(s.user_id, s.start) for s in response.slots] == [
+        (2, _at(MONDAY, 10)),
+        (2, _at(MONDAY, 10, 15)),
+        (2, _at(MONDAY, 10, 30)),
+    ]
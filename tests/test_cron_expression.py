@@ -0,0 +1,38 @@
+from datetime import datetime
+
+import pytest
+
+from app.modules.scheduler.infra.services.cron_expression import CronExpression
+
+# 2026-10-19 es lunes
+MONDAY = datetime(2026, 10, 19, 12, 0)
+
+
+def test_day_of_month_or_weekday_when_both_restricted() -> None:
+    # Día 1 del mes o cualquier domingo: el primero que llegue
+    cron = CronExpression("0 9 1 * 0")
+    assert cron.next_after(MONDAY) == datetime(2026, 10, 25, 9, 0)
+    assert cron.next_after(datetime(2026, 10, 31, 12, 0)) == datetime(2026, 11, 1, 9, 0)
+
+
+@pytest.mark.parametrize("expression", ["0 9 1-31 * 1", "0 9 * * 1", "0 9 */1 * 1"])
+def test_full_range_day_of_month_does_not_widen_weekday(expression: str) -> None:
+    # Un día del mes que cubre todo el rango no restringe: solo los lunes
+    cron = CronExpression(expression)
+    assert cron.next_after(MONDAY) == datetime(2026, 10, 26, 9, 0)
+
+
+@pytest.mark.parametrize("expression", ["0 9 15 * 0-6", "0 9 15 * 0-7", "0 9 15 * *"])
+def test_full_range_weekday_does_not_widen_day_of_month(expression: str) -> None:
+    cron = CronExpression(expression)
+    assert cron.next_after(MONDAY) == datetime(2026, 11, 15, 9, 0)
+
+
+def test_sunday_as_seven() -> None:
+    assert CronExpression("30 8 * * 7").next_after(MONDAY) == datetime(2026, 10, 25, 8, 30)
+
+
+@pytest.mark.parametrize("expression", ["0 9 * *", "60 * * * *", "*/0 * * * *", "0 9 0 * *"])
+def test_invalid_expressions(expression: str) -> None:
+    with pytest.raises(ValueError):
+        CronExpression(expression)
@@ -0,0 +1,139 @@
+from datetime import date, datetime, time
+from typing import Optional
+
+import pytest
+
+from app.modules.appointment.application.utils.day_occupancy import (
+    SLOTS_PER_DAY,
+    DayOccupancy,
+    OccupancyIndex,
+    _range_mask,
+)
+
+DAY = date(2026, 10, 20)
+NEXT_DAY = date(2026, 10, 21)
+MIDNIGHT = datetime.combine(DAY, time.min)
+USER = 7
+
+
+def at(hour: int, minute: int = 0, day: date = DAY) -> datetime:
+    return datetime.combine(day, time(hour, minute))
+
+
+def slots(first: int, last: int) -> int:
+    """Máscara con los slots first..last-1 encendidos."""
+    return ((1 << (last - first)) - 1) << first
+
+
+# 9:00 es el slot 108
+@pytest.mark.parametrize(
+    "start, end, inward, expected",
+    [
+        (at(9), at(9, 15), True, slots(108, 111)),
+        (at(9), at(9, 15), False, slots(108, 111)),
+        (at(9, 2), at(9, 13), False, slots(108, 111)),
+        (at(9, 2), at(9, 13), True, slots(109, 110)),
+        (at(9, 1), at(9, 4), True, 0),
+        (at(9, 1), at(9, 4), False, slots(108, 109)),
+        (at(10), at(9), False, 0),
+        (at(22, 0, day=date(2026, 10, 19)), at(1, 0, day=NEXT_DAY), True, slots(0, SLOTS_PER_DAY)),
+    ],
+)
+def test_range_mask_rounding(start: datetime, end: datetime, inward: bool, expected: int) -> None:
+    assert _range_mask(MIDNIGHT, start, end, inward=inward) == expected
+
+
+def _index() -> OccupancyIndex:
+    # Turno 8-13 recortado al horario de la sede 9-12, con un día libre 11:00-11:07
+    # (se redondea hacia afuera hasta 11:10) y citas 9:30-10:00 y 10:30-11:00
+    return OccupancyIndex.build(
+        opening=[(at(9), at(12))],
+        shifts={USER: [(at(8), at(13))]},
+        days_off={USER: [(at(11), at(11, 7))]},
+        appointments={USER: [(at(9, 30), at(10)), (at(10, 30), at(11))]},
+    )
+
+
+def test_free_ranges_apply_opening_days_off_and_bookings() -> None:
+    assert _index().free_ranges(USER, DAY) == [
+        (at(9), at(9, 30)),
+        (at(10), at(10, 30)),
+        (at(11, 10), at(12)),
+    ]
+
+
+@pytest.mark.parametrize(
+    "minutes, not_before, expected",
+    [
+        (30, None, at(9)),
+        (31, None, at(11, 10)),
+        (50, None, at(11, 10)),
+        (55, None, None),
+        (0, None, at(9)),
+        (20, at(9, 1), at(9, 5)),
+        (30, at(9, 1), at(10)),
+        (5, at(11, 58), None),
+        (5, at(23, 59), None),
+    ],
+)
+def test_first_free(
+    minutes: float, not_before: Optional[datetime], expected: Optional[datetime]
+) -> None:
+    assert _index().first_free(USER, DAY, minutes, not_before) == expected
+
+
+def test_first_free_unknown_staff_or_day() -> None:
+    index = _index()
+    assert index.first_free(USER + 1, DAY, 30) is None
+    assert index.first_free(USER, NEXT_DAY, 30) is None
+
+
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [
+        (at(9), at(9, 30), True),
+        (at(9, 2), at(9, 28), True),
+        (at(9, 2), at(9, 31), False),
+        (at(8, 55), at(9, 30), False),
+        (at(10), at(10, 30), True),
+        (at(11), at(11, 30), False),
+        (at(11, 10), at(12), True),
+        (at(11, 10), at(12, 5), False),
+    ],
+)
+def test_is_free(start: datetime, end: datetime, expected: bool) -> None:
+    assert _index().is_free(USER, start, end) is expected
+
+
+def test_is_free_across_midnight() -> None:
+    index = OccupancyIndex.build(
+        opening=[(at(20), at(2, 0, day=NEXT_DAY))],
+        shifts={USER: [(at(20), at(2, 0, day=NEXT_DAY))]},
+        days_off={},
+        appointments={},
+    )
+    assert index.is_free(USER, at(23), at(1, 0, day=NEXT_DAY))
+    assert not index.is_free(USER, at(23), at(3, 0, day=NEXT_DAY))
+
+    index.book(USER, at(0, 30, day=NEXT_DAY), at(1, 0, day=NEXT_DAY))
+    assert not index.is_free(USER, at(23), at(1, 0, day=NEXT_DAY))
+    assert index.is_free(USER, at(23), at(0, 30, day=NEXT_DAY))
+
+
+def test_move_releases_old_slot_and_books_new_staff() -> None:
+    other = USER + 1
+    index = OccupancyIndex.build(
+        opening=[(at(9), at(12))],
+        shifts={USER: [(at(9), at(12))], other: [(at(9), at(12))]},
+        days_off={},
+        appointments={USER: [(at(9), at(10))]},
+    )
+    index.move(USER, (at(9), at(10)), other, (at(9), at(10)))
+    assert index.is_free(USER, at(9), at(10))
+    assert not index.is_free(other, at(9), at(10))
+
+
+def test_day_without_availability_is_never_free() -> None:
+    occupancy = DayOccupancy(DAY)
+    assert not occupancy.is_free(at(9), at(10))
+    assert occupancy.first_free(5) is None
@@ -0,0 +1,166 @@
+"""
+Pruebas del envío por lotes de EmailService contra un servidor SMTP local (aiosmtpd).
+"""
+
+import asyncio
+import smtplib
+import socket
+import threading
+import time
+from typing import Any, List, Sequence
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.modules.share.infra.email.email_service import (
+    EmailConfig,
+    EmailMessage,
+    EmailService,
+)
+from app.modules.share.infra.email.smtp_connection_pool import SmtpConnectionPool
+
+
+class RecordingHandler:
+    """Guarda los destinatarios recibidos; los marcados como lentos demoran el DATA."""
+
+    def __init__(self, slow: float = 0.0, slow_recipients: Sequence[str] = ()) -> None:
+        self.slow = slow
+        self.slow_recipients = set(slow_recipients)
+        self.received: List[str] = []
+
+    async def handle_DATA(self, server: Any, session: Any, envelope: Any) -> str:
+        if self.slow_recipients.intersection(envelope.rcpt_tos):
+            await asyncio.sleep(self.slow)
+        self.received.extend(envelope.rcpt_tos)
+        return "250 OK"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+@pytest.fixture
+def plain_smtp(monkeypatch: pytest.MonkeyPatch) -> None:
+    # El servidor de prueba no tiene TLS ni AUTH: se abre una sesión SMTP simple.
+    # El timeout del socket es holgado para que venza antes el del lote.
+    def connect(self: SmtpConnectionPool) -> smtplib.SMTP:
+        return smtplib.SMTP(self.host, self.port, timeout=5)
+
+    monkeypatch.setattr(SmtpConnectionPool, "_connect", connect)
+
+
+def _start(handler: RecordingHandler) -> Controller:
+    controller = Controller(handler, hostname="127.0.0.1", port=_free_port())
+    controller.start()
+    return controller
+
+
+def _service(controller: Controller, timeout: float = 5.0) -> EmailService:
+    service = EmailService(
+        EmailConfig(
+            smtp_host="127.0.0.1",
+            smtp_port=controller.port,
+            from_email="agenda@example.com",
+            use_ssl=False,
+        )
+    )
+    service._pool.timeout = timeout
+    return service
+
+
+def _messages(*recipients: str) -> List[EmailMessage]:
+    return [
+        EmailMessage(to_email=recipient, subject="Prueba", body_html="<p>hola</p>")
+        for recipient in recipients
+    ]
+
+
+def test_send_many_reuses_one_session(plain_smtp: None) -> None:
+    handler = RecordingHandler()
+    controller = _start(handler)
+    try:
+        service = _service(controller)
+        results = asyncio.run(service.send_many(_messages("a@x.com", "b@x.com", "c@x.com")))
+
+        assert [result.success for result in results] == [True, True, True]
+        assert handler.received == ["a@x.com", "b@x.com", "c@x.com"]
+        assert len(service._pool._idle) == 1
+    finally:
+        controller.stop()
+
+
+def test_timeout_reports_in_flight_message_as_unknown(
+    plain_smtp: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    handler = RecordingHandler(slow=1.5, slow_recipients=["b@x.com"])
+    controller = _start(handler)
+    try:
+        # Timeout del lote: 0.3 s por mensaje; el segundo tarda 1.5 s
+        service = _service(controller, timeout=0.3)
+        closed = threading.Event()
+        original_close = SmtpConnectionPool.close_session
+
+        def close_session(server: smtplib.SMTP) -> None:
+            original_close(server)
+            closed.set()
+
+        monkeypatch.setattr(SmtpConnectionPool, "close_session", staticmethod(close_session))
+
+        results = asyncio.run(service.send_many(_messages("a@x.com", "b@x.com", "c@x.com")))
+
+        assert results[0].success and not results[0].unknown
+        assert results[1].unknown and not results[1].success
+        assert not results[2].success and not results[2].unknown
+
+        # La sesión no vuelve al pool: la cierra el hilo al terminar el envío en curso
+        assert service._pool._idle == []
+        assert closed.wait(5)
+        assert service._pool._detached == set()
+
+        # El mensaje en curso sí llegó; el siguiente no se intentó
+        time.sleep(0.2)
+        assert handler.received == ["a@x.com", "b@x.com"]
+    finally:
+        controller.stop()
+
+
+def test_new_batch_after_timeout_uses_fresh_session(plain_smtp: None) -> None:
+    handler = RecordingHandler(slow=1.0, slow_recipients=["slow@x.com"])
+    controller = _start(handler)
+    try:
+        service = _service(controller, timeout=0.3)
+        first = asyncio.run(service.send_many(_messages("slow@x.com")))
+        assert first[0].unknown
+
+        second = asyncio.run(service.send_many(_messages("d@x.com")))
+        assert second[0].success
+        time.sleep(1.0)
+        assert sorted(handler.received) == ["d@x.com", "slow@x.com"]
+    finally:
+        controller.stop()
+
+
+def test_refused_recipient_does_not_stop_batch(plain_smtp: None) -> None:
+    class RefusingHandler(RecordingHandler):
+        async def handle_RCPT(
+            self, server: Any, session: Any, envelope: Any, address: str, options: Any
+        ) -> str:
+            if address == "bad@x.com":
+                return "550 No such user"
+            envelope.rcpt_tos.append(address)
+            return "250 OK"
+
+    handler = RefusingHandler()
+    controller = _start(handler)
+    try:
+        results = asyncio.run(
+            _service(controller).send_many(_messages("a@x.com", "bad@x.com", "c@x.com"))
+        )
+
+        assert [result.success for result in results] == [True, False, True]
+        assert not any(result.unknown for result in results)
+        assert handler.received == ["a@x.com", "c@x.com"]
+    finally:
+        controller.stop()
@@ -0,0 +1,172 @@
+"""
+Pruebas del circuit breaker de EvolutionApiService contra un Evolution API falso
+(aplicación ASGI servida por httpx en el mismo proceso).
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from app.modules.share.infra.concurrency import Bulkhead, CircuitBreaker, CircuitOpenError
+from app.modules.whatsapp.infra.services import evolution_api_service
+from app.modules.whatsapp.infra.services.evolution_api_service import (
+    EvolutionApiService,
+    _is_service_failure,
+)
+
+CALL_TIMEOUT = 0.1
+BULKHEAD_MAX_WAIT = 0.1
+RECOVERY_TIMEOUT = 0.2
+# Mismo criterio que EVOLUTION_CALL_DEADLINE: espera del bulkhead + timeout + margen
+CALL_DEADLINE = BULKHEAD_MAX_WAIT + CALL_TIMEOUT + 0.2
+
+
+class FakeEvolution:
+    """Evolution API falso: el modo decide cómo responde sendText."""
+
+    def __init__(self) -> None:
+        self.mode = "ok"
+        self.hits = 0
+        self.app = FastAPI()
+        self.app.post("/message/sendText/{instance}")(self.send_text)
+
+    async def send_text(self, instance: str) -> Any:
+        self.hits += 1
+        if self.mode == "slow":
+            await asyncio.sleep(CALL_TIMEOUT * 5)
+        if self.mode == "error":
+            return JSONResponse({"message": "caído"}, status_code=503)
+        if self.mode == "bad_request":
+            return JSONResponse({"message": "número inválido"}, status_code=400)
+        return {"key": {"id": "abc"}, "status": "PENDING"}
+
+
+@pytest.fixture
+def fake(monkeypatch: pytest.MonkeyPatch) -> FakeEvolution:
+    fake = FakeEvolution()
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=fake.app), base_url="http://evolution.test"
+    )
+    monkeypatch.setattr(evolution_api_service, "get_http_client", lambda _: client)
+    return fake
+
+
+def _service() -> EvolutionApiService:
+    service = EvolutionApiService()
+    service.base_url = "http://evolution.test"
+    service.instance_name = "barberia"
+    service.timeout = CALL_TIMEOUT
+    # Circuito y bulkhead propios de la prueba, sin el estado compartido del proceso
+    service.circuit_breaker = CircuitBreaker(
+        "evolution_api_test",
+        failure_threshold=2,
+        recovery_timeout=RECOVERY_TIMEOUT,
+        is_failure=_is_service_failure,
+    )
+    service.bulkhead = Bulkhead("evolution_api_test", max_concurrent=5, max_wait=BULKHEAD_MAX_WAIT)
+    return service
+
+
+async def _send(service: EvolutionApiService) -> Dict[str, Any]:
+    # Los handlers acotan cada envío desde afuera; el límite debe superar al interno
+    return await asyncio.wait_for(
+        service.send_text_message(number="51999999999", text="hola"),
+        timeout=CALL_DEADLINE,
+    )
+
+
+async def _failures(service: EvolutionApiService, count: int) -> List[BaseException]:
+    errors: List[BaseException] = []
+    for _ in range(count):
+        try:
+            await _send(service)
+        except Exception as e:
+            errors.append(e)
+    return errors
+
+
+def test_timeouts_open_the_circuit(fake: FakeEvolution) -> None:
+    async def scenario() -> None:
+        service = _service()
+        fake.mode = "slow"
+
+        errors = await _failures(service, 2)
+        assert all("Timeout" in str(error) for error in errors)
+        assert service.circuit_breaker.state == "open"
+
+        # Con el circuito abierto se falla de inmediato, sin llegar al servidor
+        hits = fake.hits
+        started = time.monotonic()
+        with pytest.raises(CircuitOpenError):
+            await _send(service)
+        assert time.monotonic() - started < CALL_TIMEOUT
+        assert fake.hits == hits
+
+    asyncio.run(scenario())
+
+
+def test_server_errors_open_the_circuit_and_recover(fake: FakeEvolution) -> None:
+    async def scenario() -> None:
+        service = _service()
+        fake.mode = "error"
+        await _failures(service, 2)
+        assert service.circuit_breaker.state == "open"
+
+        # Pasado recovery_timeout se deja pasar una prueba; si responde bien se cierra
+        await asyncio.sleep(RECOVERY_TIMEOUT)
+        assert service.circuit_breaker.state == "half_open"
+        fake.mode = "ok"
+        assert (await _send(service))["status"] == "PENDING"
+        assert service.circuit_breaker.state == "closed"
+
+    asyncio.run(scenario())
+
+
+def test_failed_half_open_probe_reopens_the_circuit(fake: FakeEvolution) -> None:
+    async def scenario() -> None:
+        service = _service()
+        fake.mode = "slow"
+        await _failures(service, 2)
+
+        await asyncio.sleep(RECOVERY_TIMEOUT)
+        assert service.circuit_breaker.state == "half_open"
+        await _failures(service, 1)
+        assert service.circuit_breaker.state == "open"
+
+    asyncio.run(scenario())
+
+
+def test_half_open_allows_a_single_probe(fake: FakeEvolution) -> None:
+    async def scenario() -> None:
+        service = _service()
+        fake.mode = "error"
+        await _failures(service, 2)
+        await asyncio.sleep(RECOVERY_TIMEOUT)
+
+        fake.mode = "slow"
+        probe = asyncio.create_task(_send(service))
+        await asyncio.sleep(0)
+        # Mientras la prueba está en curso, el resto falla rápido
+        with pytest.raises(CircuitOpenError):
+            await _send(service)
+        with pytest.raises(Exception):
+            await probe
+        assert service.circuit_breaker.state == "open"
+
+    asyncio.run(scenario())
+
+
+def test_client_errors_do_not_open_the_circuit(fake: FakeEvolution) -> None:
+    async def scenario() -> None:
+        service = _service()
+        fake.mode = "bad_request"
+        errors = await _failures(service, 3)
+        assert all("400" in str(error) for error in errors)
+        assert service.circuit_breaker.state == "closed"
+
+    asyncio.run(scenario())
@@ -0,0 +1,36 @@
+import asyncio
+from datetime import date, datetime
+
+from app.modules.appointment.domain.events import AppointmentCreatedEvent
+from app.modules.location.application.subscribers.location_calendar_subscriber import (
+    invalidate_calendar_on_created,
+)
+from app.modules.location.infra.services.location_calendar_cache import (
+    CachedLocationCalendar,
+    get_location_calendar_cache,
+)
+
+WEEK = (date(2026, 10, 19), date(2026, 10, 25))
+
+
+def test_new_appointment_invalidates_calendars_of_other_locations() -> None:
+    cache = get_location_calendar_cache()
+    for location_id in (1, 2):
+        cache.set((location_id, *WEEK), CachedLocationCalendar.from_content(b"{}"))
+
+    # El empleado de la cita también trabaja en la sede 2, cuyo calendario la muestra
+    event = AppointmentCreatedEvent(
+        appointment_id=1,
+        location_id=1,
+        user_id=1,
+        service_id=1,
+        customer_id=1,
+        status_maintable_id=1,
+        start_datetime=datetime(2026, 10, 20, 9),
+        end_datetime=datetime(2026, 10, 20, 10),
+        user_create="tester",
+    )
+    asyncio.run(invalidate_calendar_on_created(event))
+
+    assert cache.get((1, *WEEK)) is None
+    assert cache.get((2, *WEEK)) is None
@@ -0,0 +1,127 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+
+from app.constants import injector_var
+from app.modules.notifications.domain.notification_outbox_entity import (
+    NotificationOutboxEntity,
+)
+from app.modules.notifications.domain.repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
+from app.modules.notifications.infra.services import (
+    notification_outbox_dispatcher as dispatcher_module,
+)
+from app.modules.notifications.infra.services.notification_outbox_dispatcher import (
+    NotificationOutboxDispatcher,
+)
+from app.modules.share.infra.concurrency import BulkheadFullError, CircuitOpenError
+
+
+def _message(attempts: int) -> NotificationOutboxEntity:
+    return NotificationOutboxEntity(
+        outbox_id=1,
+        channel="whatsapp",
+        recipient="51999000001",
+        message="Recordatorio",
+        appointment_id=1,
+        reminder_type="24h",
+        status="processing",
+        attempts=attempts,
+        max_attempts=5,
+        next_attempt_at=datetime(2026, 10, 20, tzinfo=timezone.utc),
+        last_error=None,
+    )
+
+
+class FakeOutboxRepository:
+    def __init__(self) -> None:
+        self.failed: List[Tuple[int, Optional[datetime]]] = []
+        self.deferred: List[Tuple[int, datetime]] = []
+
+    async def renew_lease(self, outbox_id: int, worker_id: str, lease_seconds: int) -> bool:
+        return True
+
+    async def mark_failed(
+        self, outbox_id: int, worker_id: str, error: str, next_attempt_at: Optional[datetime]
+    ) -> bool:
+        self.failed.append((outbox_id, next_attempt_at))
+        return True
+
+    async def defer_message(
+        self, outbox_id: int, worker_id: str, reason: str, next_attempt_at: datetime
+    ) -> bool:
+        self.deferred.append((outbox_id, next_attempt_at))
+        return True
+
+
+class FailingWhatsappService:
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+    async def send_text_message(
+        self, number: str, text: str, delay: Optional[int] = None, link_preview: Optional[bool] = True
+    ) -> Dict[str, Any]:
+        raise self.error
+
+
+class FakeInjector:
+    def __init__(self, bindings: Dict[Any, Any]) -> None:
+        self.bindings = bindings
+
+    def get(self, interface: Any) -> Any:
+        return self.bindings[interface]
+
+
+@asynccontextmanager
+async def _no_unit_of_work() -> AsyncIterator[None]:
+    yield None
+
+
+@pytest.fixture
+def repository(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeOutboxRepository]:
+    repository = FakeOutboxRepository()
+    monkeypatch.setattr(dispatcher_module, "unit_of_work_scope", _no_unit_of_work)
+    token = injector_var.set(
+        FakeInjector({NotificationOutboxRepository: repository})  # type: ignore[arg-type]
+    )
+    try:
+        yield repository
+    finally:
+        injector_var.reset(token)
+
+
+def _process(error: Exception, attempts: int) -> NotificationOutboxDispatcher:
+    dispatcher = NotificationOutboxDispatcher()
+    dispatcher.whatsapp_service = FailingWhatsappService(error)  # type: ignore[assignment]
+    asyncio.run(dispatcher._process_message(_message(attempts)))
+    return dispatcher
+
+
+def test_open_circuit_defers_after_retry_window(repository: FakeOutboxRepository) -> None:
+    before = datetime.now(timezone.utc)
+
+    dispatcher = _process(CircuitOpenError("evolution_api", retry_after=20), attempts=5)
+
+    assert repository.failed == []
+    [(outbox_id, next_attempt_at)] = repository.deferred
+    assert outbox_id == 1
+    assert next_attempt_at >= before + timedelta(seconds=20)
+    assert dispatcher.get_stats()["deferred"] == 1
+
+
+def test_full_bulkhead_defers_without_counting_attempt(repository: FakeOutboxRepository) -> None:
+    _process(BulkheadFullError("evolution_api"), attempts=5)
+
+    assert repository.failed == []
+    assert len(repository.deferred) == 1
+
+
+def test_provider_error_still_counts_attempt(repository: FakeOutboxRepository) -> None:
+    _process(RuntimeError("número inválido"), attempts=5)
+
+    assert repository.deferred == []
+    assert repository.failed == [(1, None)]
@@ -0,0 +1,177 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+
+import pytest
+
+from app.constants import injector_var
+from app.modules.appointment.domain.entities.appointment_domain import AppointmentEntity
+from app.modules.appointment.domain.repositories.appointment_repository import (
+    AppointmentRepository,
+)
+from app.modules.notifications.application.commands.send_appointment_notifications import (
+    send_appointment_notifications_command_handler as handler_module,
+)
+from app.modules.notifications.application.commands.send_appointment_notifications.send_appointment_notifications_command_handler import (
+    SendAppointmentNotificationsCommand,
+    SendAppointmentNotificationsCommandHandler,
+)
+from app.modules.notifications.domain.repositories.notification_ledger_repository import (
+    NotificationLedgerRepository,
+)
+from app.modules.notifications.domain.repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
+from app.modules.share.infra.persistence import unit_of_work_scope
+
+FAILING_PHONE = "999000003"
+
+
+def _appointment(appointment_id: int) -> AppointmentEntity:
+    return AppointmentEntity(
+        appointment_id=appointment_id,
+        start_datetime=datetime(2026, 10, 20, 9),
+        end_datetime=datetime(2026, 10, 20, 10),
+        location_id=1,
+        location_name="Centro",
+        user_id=1,
+        user_name="Ana",
+        service_id=1,
+        service_name="Corte",
+        service_price=Decimal("30"),
+        service_duration=60,
+        customer_id=appointment_id,
+        customer_name="Cliente",
+        customer_phone=f"99900000{appointment_id}",
+        status_id=1,
+        status_name="Agendada",
+        insert_date=datetime(2026, 10, 1),
+        update_date=None,
+    )
+
+
+class FakeAppointmentRepository:
+    async def find_appointments_after(
+        self,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        limit: int,
+        location_id: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[AppointmentEntity]:
+        return [] if after else [_appointment(i) for i in (1, 2, 3)]
+
+
+class FakeLedgerRepository:
+    """Ledger en memoria: cada llamada equivale a una transacción ya confirmada."""
+
+    def __init__(self) -> None:
+        self.registered: Set[int] = set()
+
+    async def get_notified_appointment_ids(
+        self, appointment_ids: List[int], reminder_type: str
+    ) -> Set[int]:
+        await asyncio.sleep(0)
+        return self.registered & set(appointment_ids)
+
+    async def register_notifications(
+        self, appointment_ids: List[int], reminder_type: str, user_create: str
+    ) -> Set[int]:
+        await asyncio.sleep(0)
+        new_ids = set(appointment_ids) - self.registered
+        self.registered |= new_ids
+        return new_ids
+
+    async def release_notifications(self, appointment_ids: List[int], reminder_type: str) -> int:
+        released = self.registered & set(appointment_ids)
+        self.registered -= released
+        return len(released)
+
+
+class FakeWhatsappService:
+    def __init__(self) -> None:
+        self.sent: List[str] = []
+
+    async def send_text_message(
+        self, number: str, text: str, delay: Optional[int] = None, link_preview: Optional[bool] = True
+    ) -> Dict[str, Any]:
+        await asyncio.sleep(0.01)
+        if number.endswith(FAILING_PHONE):
+            raise RuntimeError("número inválido")
+        self.sent.append(number)
+        return {"status": "PENDING"}
+
+
+class FakeInjector:
+    def __init__(self, bindings: Dict[Any, Any]) -> None:
+        self.bindings = bindings
+
+    def get(self, interface: Any) -> Any:
+        return self.bindings[interface]
+
+
+@asynccontextmanager
+async def _no_unit_of_work() -> AsyncIterator[None]:
+    yield None
+
+
+@pytest.fixture
+def fakes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[Tuple[FakeLedgerRepository, FakeWhatsappService]]:
+    ledger = FakeLedgerRepository()
+    whatsapp = FakeWhatsappService()
+    monkeypatch.setattr(handler_module, "NOTIFICATIONS_OUTBOX_ENABLED", False)
+    monkeypatch.setattr(handler_module, "EvolutionApiService", lambda: whatsapp)
+    monkeypatch.setattr(unit_of_work_scope, "unit_of_work_scope", _no_unit_of_work)
+    token = injector_var.set(
+        FakeInjector(  # type: ignore[arg-type]
+            {
+                AppointmentRepository: FakeAppointmentRepository(),
+                NotificationOutboxRepository: None,
+                NotificationLedgerRepository: ledger,
+            }
+        )
+    )
+    try:
+        yield ledger, whatsapp
+    finally:
+        injector_var.reset(token)
+
+
+def _command() -> SendAppointmentNotificationsCommand:
+    return SendAppointmentNotificationsCommand(
+        start_date=datetime(2026, 10, 20), end_date=datetime(2026, 10, 21)
+    )
+
+
+def test_overlapping_runs_send_each_reminder_once(
+    fakes: Tuple[FakeLedgerRepository, FakeWhatsappService],
+) -> None:
+    ledger, whatsapp = fakes
+
+    async def main() -> List[Dict[str, Any]]:
+        return list(
+            await asyncio.gather(
+                SendAppointmentNotificationsCommandHandler().handle(_command()),
+                SendAppointmentNotificationsCommandHandler().handle(_command()),
+            )
+        )
+
+    results = asyncio.run(main())
+
+    assert sorted(whatsapp.sent) == ["51999000001", "51999000002"]
+    assert sum(r["data"]["sent_notifications"] for r in results) == 2
+
+
+def test_failed_reminders_are_released_for_the_next_run(
+    fakes: Tuple[FakeLedgerRepository, FakeWhatsappService],
+) -> None:
+    ledger, _ = fakes
+
+    result = asyncio.run(SendAppointmentNotificationsCommandHandler().handle(_command()))
+
+    assert result["data"]["failed_notifications"] == 1
+    assert ledger.registered == {1, 2}
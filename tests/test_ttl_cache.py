@@ -0,0 +1,92 @@
+"""
+Pruebas de AsyncTtlCache: coalescencia de cargas y descarte de cargas desligadas.
+"""
+
+import asyncio
+from typing import List
+
+from app.modules.share.infra.cache import AsyncTtlCache
+
+
+def test_concurrent_requests_share_one_load() -> None:
+    async def scenario() -> None:
+        cache: AsyncTtlCache[int] = AsyncTtlCache(ttl=60)
+        calls: List[int] = []
+
+        async def loader() -> int:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 42
+
+        values = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(5)))
+        assert values == [42] * 5
+        assert len(calls) == 1
+        assert cache.get("k") == 42
+
+    asyncio.run(scenario())
+
+
+def test_set_during_load_is_not_overwritten() -> None:
+    async def scenario() -> None:
+        cache: AsyncTtlCache[str] = AsyncTtlCache(ttl=60)
+        release = asyncio.Event()
+
+        async def stale_loader() -> str:
+            await release.wait()
+            return "inactive"
+
+        load = asyncio.create_task(cache.get_or_load("wf", stale_loader))
+        await asyncio.sleep(0)
+        # Activar el workflow guarda el estado nuevo mientras la consulta vieja sigue en vuelo
+        cache.set("wf", "active")
+        release.set()
+
+        assert await load == "inactive"
+        assert cache.get("wf") == "active"
+
+    asyncio.run(scenario())
+
+
+def test_invalidate_during_load_drops_result_and_starts_new_load() -> None:
+    async def scenario() -> None:
+        cache: AsyncTtlCache[str] = AsyncTtlCache(ttl=60)
+        release = asyncio.Event()
+
+        async def stale_loader() -> str:
+            await release.wait()
+            return "old"
+
+        async def fresh_loader() -> str:
+            return "new"
+
+        load = asyncio.create_task(cache.get_or_load("cal", stale_loader))
+        await asyncio.sleep(0)
+        cache.invalidate_where(lambda key: key == "cal")
+
+        # Una solicitud posterior a la invalidación no se suma a la carga vieja
+        assert await cache.get_or_load("cal", fresh_loader) == "new"
+        release.set()
+        assert await load == "old"
+        assert cache.get("cal") == "new"
+
+    asyncio.run(scenario())
+
+
+def test_clear_during_load_leaves_cache_empty() -> None:
+    async def scenario() -> None:
+        cache: AsyncTtlCache[str] = AsyncTtlCache(ttl=60)
+        release = asyncio.Event()
+
+        async def loader() -> str:
+            await release.wait()
+            return "old"
+
+        load = asyncio.create_task(cache.get_or_load("k", loader))
+        await asyncio.sleep(0)
+        cache.clear()
+        release.set()
+
+        assert await load == "old"
+        assert cache.get("k") is None
+
+    asyncio.run(scenario())
@@ -0,0 +1,113 @@
+import asyncio
+from datetime import date, datetime, time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+
+from app.constants import injector_var
+from app.modules.appointment.domain.entities.appointment_domain import (
+    AffectedAppointmentEntity,
+)
+from app.modules.appointment.domain.repositories.appointment_repository import (
+    AppointmentRepository,
+)
+from app.modules.shifts.application.commands.update_shifts.update_shifts_command_handler import (
+    UpdateShiftsCommand,
+    UpdateShiftsCommandHandler,
+)
+from app.modules.shifts.domain.entities.shifts_domain import ShiftsEntity
+from app.modules.shifts.domain.repositories.shifts_repository import ShiftsRepository
+
+OLD_DATE = date(2026, 10, 20)
+NEW_DATE = date(2026, 10, 27)
+
+
+class FakeShiftsRepository:
+    async def get_shift_by_id(self, shift_id: int) -> Optional[ShiftsEntity]:
+        return ShiftsEntity(
+            id=shift_id,
+            user_id=1,
+            sede_id=1,
+            fecha_turno=OLD_DATE,
+            hora_inicio=time(9),
+            hora_fin=time(13),
+            user_create="tester",
+            annulled=False,
+            insert_date=datetime(2026, 10, 1),
+        )
+
+    async def update_shift(self, **kwargs: Any) -> str:
+        return "ok"
+
+
+class FakeAppointmentRepository:
+    def __init__(self) -> None:
+        self.queries: List[Tuple[date, date]] = []
+
+    async def find_unavailable_appointments(
+        self, user_id: int, start_date: date, end_date: date, location_id: Optional[int] = None
+    ) -> List[AffectedAppointmentEntity]:
+        self.queries.append((start_date, end_date))
+        # Una cita que cruza la medianoche del día anterior aparece en ambas consultas
+        overnight = AffectedAppointmentEntity(
+            appointment_id=1,
+            location_id=1,
+            user_id=user_id,
+            user_name="Ana",
+            service_id=1,
+            customer_id=1,
+            customer_name="Cliente",
+            status_maintable_id=1,
+            start_datetime=datetime(2026, 10, 19, 23),
+            end_datetime=datetime(2026, 10, 20, 1),
+            reason="NO_SHIFT",
+        )
+        return [overnight] if start_date in (OLD_DATE, NEW_DATE) else []
+
+
+class FakeInjector:
+    def __init__(self, bindings: Dict[Any, Any]) -> None:
+        self.bindings = bindings
+
+    def get(self, interface: Any) -> Any:
+        return self.bindings[interface]
+
+
+@pytest.fixture
+def appointment_repository() -> Iterator[FakeAppointmentRepository]:
+    repository = FakeAppointmentRepository()
+    token = injector_var.set(
+        FakeInjector(  # type: ignore[arg-type]
+            {
+                ShiftsRepository: FakeShiftsRepository(),
+                AppointmentRepository: repository,
+            }
+        )
+    )
+    try:
+        yield repository
+    finally:
+        injector_var.reset(token)
+
+
+def test_moved_shift_checks_only_old_and_new_dates(
+    appointment_repository: FakeAppointmentRepository,
+) -> None:
+    command = UpdateShiftsCommand(shift_id=1, user_modify="tester", fecha_turno=NEW_DATE)
+
+    response = asyncio.run(UpdateShiftsCommandHandler().handle(command))
+
+    assert appointment_repository.queries == [(OLD_DATE, OLD_DATE), (NEW_DATE, NEW_DATE)]
+    assert [a.appointment_id for a in response.affected_appointments] == [1]
+
+
+def test_shift_on_same_date_checks_it_once(
+    appointment_repository: FakeAppointmentRepository,
+) -> None:
+    command = UpdateShiftsCommand(
+        shift_id=1, user_modify="tester", hora_inicio=time(10), hora_fin=time(14)
+    )
+
+    asyncio.run(UpdateShiftsCommandHandler().handle(command))
+
+    assert appointment_repository.queries == [(OLD_DATE, OLD_DATE)]
@@ -0,0 +1,92 @@
+import asyncio
+from datetime import date, datetime
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from app.constants import uow_var
+from app.modules.user_locations.domain.entities.user_locations_domain import (
+    UserDayOffEntity,
+    UserLocationScheduleEntity,
+    UserShiftEntity,
+)
+from app.modules.user_locations.infra.repositories.user_locations_implementation_repository import (
+    UserLocationsImplementationRepository,
+)
+
+
+def _row(
+    user_id: int,
+    event_type: Optional[str] = None,
+    event_id: Optional[int] = None,
+    hours: Optional[tuple[int, int]] = None,
+    sede_id: Optional[int] = None,
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        user_id=user_id,
+        user_name=f"Usuario {user_id}",
+        email=f"u{user_id}@x",
+        event_type=event_type,
+        event_id=event_id,
+        event_start_time=datetime(2026, 10, 20, hours[0]) if hours else None,
+        event_end_time=datetime(2026, 10, 20, hours[1]) if hours else None,
+        event_description=None,
+        event_sede_id=sede_id,
+    )
+
+
+class FakeSession:
+    def __init__(self, rows: List[SimpleNamespace]) -> None:
+        self.rows = rows
+
+    async def stream(self, query: Any, params: Dict[str, Any]) -> AsyncIterator[SimpleNamespace]:
+        async def rows() -> AsyncIterator[SimpleNamespace]:
+            for row in self.rows:
+                yield row
+
+        return rows()
+
+
+def _get_user_by_location(rows: List[SimpleNamespace]) -> List[UserLocationScheduleEntity]:
+    token = uow_var.set(SimpleNamespace(session=FakeSession(rows)))  # type: ignore[arg-type]
+    try:
+        return asyncio.run(
+            UserLocationsImplementationRepository().get_user_by_location(
+                sede_id=1, start_date=date(2026, 10, 20), end_date=date(2026, 10, 20)
+            )
+        )
+    finally:
+        uow_var.reset(token)
+
+
+def test_rows_are_grouped_by_user_in_any_order() -> None:
+    users = _get_user_by_location(
+        [
+            _row(2, "SHIFT", 10, (9, 13), sede_id=1),
+            _row(1),
+            _row(3, "DAY_OFF", 30, (0, 23)),
+            _row(2, "DAY_OFF", 20, (11, 12)),
+            _row(3, "SHIFT", 31, (14, 18), sede_id=2),
+            _row(2, "SHIFT", 11, (15, 19), sede_id=1),
+        ]
+    )
+
+    assert [user.user_id for user in users] == [2, 1, 3]
+    user_2, user_1, user_3 = users
+    assert [s.shift_id for s in user_2.shifts] == [10, 11]
+    assert [d.day_off_id for d in user_2.days_off] == [20]
+    assert user_1.shifts == [] and user_1.days_off == []
+    assert user_3.shifts == [
+        UserShiftEntity(
+            shift_id=31,
+            start_time=datetime(2026, 10, 20, 14),
+            end_time=datetime(2026, 10, 20, 18),
+            sede_id=2,
+        )
+    ]
+    assert user_3.days_off == [
+        UserDayOffEntity(
+            day_off_id=30,
+            start_time=datetime(2026, 10, 20, 0),
+            end_time=datetime(2026, 10, 20, 23),
+        )
+    ]